@@ -1,108 +1,1214 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 5.15.18
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x05\xe2\
+\x00\x00\x05\xe3\
 \x00\
-\x002\x1bx\x9c\xed[\xcdr\xe28\x10\xbe\xe7)T\
->\xec-1&$!\xaca\x8aL\x86\xc9T\x91\xcd\
-N\xc8$\xd9\xbdL\x09\xbb1\xaa\xc8\x92K\x96\x09L\
-\xedC\xed3\xec\x93m\xf9\x0f\x0c\x18\xf0\x1f\xecl%\
-9!\xc9\xeeV\xf7\xf7\xa9\xbb%9\xfa\x87\xa9M\xd1\
-\x04\x84K8k+\xdaIMA\xc0\x0cn\x12f\xb5\
-\x95o\x0f\xbd\xe3\xa6\xf2\xa1s\xa4{d\xf1P\xe3\xa4\
-\xa6t\x8e\x90nP\xec\xba\x9d\xe7\xfb\xcf\x1ei\xb5\xae\
-\xa95\x00)\x09\xb3\xdc\xe7{]\x0d\xc7\x8e\x90\xfeJ\
-L\x0b$\x0a\xdam\xe5\xebS\xd0T\x10\xc36\xb4\x95\
-\xb4w}\xd1Hw\x04w@\xc8Y\xf4\xa0\x05\xdc\x06\
-)f\xc1 \xd2\x05\x182\xf8\x85\xf4i\xa7\xa6\xab\xd3\
-\xa81\xf3\x1b\xb3\xa8\xf1JL9\xee4\x9a\x17\xba\x1a\
-\xfe\x0c\xbb\xc7@\xac\xb1\xec\x9c7\x1b\xba\x1a\xfd\x0ed\
-\xaa\xb1P]\x8d\x95\xa7\xcd\xe4\x950\x93\xbf>\x10I\
-!\x9a\x8c+\x05aV\xe730\x10\x98\xeaj\xd4^\
-\x97D\xf1\x8c{\x0bW<^\xf1i?\xe8\x8a\xdd1\
-\x01!\x89\x81i\xd4\x1b\x8a'\x12\xech\xea+\x02z\
-\x5c\xd8\xcb\x02F\x8b\x9e\xf0\x95\xf0u$\xf8k[\xa9\
-)\xc8\xe0\xd4\xb3Y\xfc\xd3u0k+\xf5\xf8\xd15\
-\xac\xfax\x084\x16M\x83F\xfc\xe8\x9a[$L\xe5\
-bt\xee\x94>a\x80\x05\xba\xe5\x13\xb0\x81I4p\
-\x00\xcc\xa4\x8b\xc2\xa7\x97\xfc\x14\xf6\x84s\x89\xadP\x17\
-^H\x9a\xa4\xe55i@\x89\x09bnS0\xbb`\
-N\xd1\xc0F\xfbl<%\xb6g'Md\x9e=\x04\
-\xd1\xd1j5]\x8d~o6hM \x17\x04\x98\xc4\
-\x92p\x96\x14\x0a\xcc\xb3;_e\xabu\xb7\x18o\xb5\
-n\xb8 ?8\x93>\xbd\x82'J{\xae^\x9e\x0c\
-\xdf\xeb\xb9\xe9p\xcfC\x8b0\xdd\x1b%N\xcbQB\
-p\xf9&\xf9\xd0\xa8\x80\x0fZ#7!~'\xc6\x0b\
-a\x16\xba\xc7&\xf1\xdc\xeaXpV\x8e\x05\x0e1^\
-\xc2)\xed\xe2\xc1\x7f\x0c\xdby\x05\xb0\x9d\xe6F\xadk\
-\x0f}\xabP\xdf\xcf\x9e\xe8\x0b\x93\xc0\x5c\x22g\xd5\xc1\
-wQ\x0e>l\x0fI\x9f\xbc\xb5%\xdc\xac\x80\x0b\xf9\
-W\xf05\xf1\xeb\xa60\xa6\xef\x8d\x0f\x97\xe5\xf8`\x12\
-\xf1\xf6\xe8\xa0\xe5\xae\xf7>\x8e\xc1x\xb9\xe2\xd3\xd8m\
-6\x11\xe2\x13\x1b\xd2y\xfffnpN\x1f\x88\x93B\
-\x8f[<C&X\x02\x9b\x80\x1c\x10~\x81\x8a\x99\x01\
-\x19\xa8\x91\x95\x80\x9f\x18\x1eR@\xfed\xb9@ay\
-\x8e\xb0D\xae\xc4BzN\x85\xc5f\xeejs\xd5\xa1\
-&\x0c=+\xa3G\xd3\x8d\x1d\xf8F\xa1W\x22\xc7(\
-\x10\x86\x08\x1b\xf1\x0aM\xcc]\x16\xae\x9a8&\xd6\x18\
-\x5cy\xe7\x00\x9b\x8a\xc2f~s\x01\xc91\xa0H\x1a\
-\xf2\xc5=\xdf\xc7;P\x84'\x98P\x1f\xf5\x0a-_\
-\xaa\x1bsD\xcc\xb3\xfc\xd9\x93Ir\xdc\xa5\x04\xbb\x84\
-Y\xfb\xb1@\xdb\x8c\x17\xb7\x87<\xb9\xc6]\x8c\xe7}\
-\x8bI$T\xec6ln\xd9o\x9c\xadC\x92\xba\xb4\
-\xd5%\x05\x05\xd5\xdd\x0e\xba]T\x9f\x1eZc\xe3\xe0\
-\x1a\x9bE4f\xa5M\xa3 \xf1\xcfs\x13?\xde\xf2\
-U\xc8\xf9F*\xe7W\xceIn\xd6\x0eZ\xc6\xf3l\
-\x1b\xf6\x7f\xd7\xb4\xcd\xd6P\x18\xc9[,,\xc2Rj\
-\x83B\x95\x81\xe4NI\x81+dZA\xcb\xdf\xba\xf0\
-+OJ\xce\xe6\xeb\x9cO\xba\xc2\x18'G\x92l\xdb\
-\xc1\xc6E\xec\xfa\x05\xdb\xce\xaf\xc2\x18\xaf\x132m\x9e\
-\x08\xe9XJA\x86\x9e\x84H\xf40P\xfeYp\xcf\
-I\xd3\x80\x18\x97\xa2\xadH\xe1\x81\xd2I<\x9b\xaao\
-.;\xb9,\x96\x88\xb3s\x19\xeeHg\x94\x1b/=\
-\xcayJ*\xcb\xe1\xb5>7^\x90\xe4h\xe4K\xca\
-\xe8\xb9\x1d\x86\xe8jH\xf2]\x0b\xe4,KRH\xe7\
-KO\x00\xa4\xf2%\xe3r\xef\x85\x5c\x81l\xc5^6\
-\x9e\xe4eI\x0aG\xb2\x86\x96*\xb6\xd6\x17\xb9\x9d\xf6\
- \xb0\xf1\x02&\x92c\x22\xccc\x07\x84\xcb\x99_8\
-\xbb\x8e\xbf\xcb\x9a\x002\xb0\x0d\x02#7://R\
-HcJ,\xe6\x07\xe2%\xfd \x83]I7\x1e\xec\
-QlE\xcd\x8f\xc0$\xf8\xc4]\xa2c\xd1\x98}Q\
-0\xe14\x8b8\x93\xb94\xd8a\x1d\xc4O}\xc0\xfe\
-\xbd\xc9_\x9b\xc7Gr\xe3\xe0\xe3\xde\xbc\x5c&3n\
-\xae\x09W\x00\xbb\xe6\xde\x90\xc2\xc0!,\x11>\xa7\x01\
-\x02q\xe7\x96\xd0\xe9\x08\x18\x91ij\xf0|ng\xce\
-5+B]o\xb4I\xa8m\x17\x15j\x13\xb6rL\
-\x80\x90n\x06\xc6w\x8e\xcfj\xb5\x93\xda\xf2\x9f\xaeF\
-\x83y\xf5\xac\x1dG,\xf4\x14WS2=\xa6\x82<\
-\xab\x00\xe4?\xdeA\xfe\xb9A\xfeQ\x01\xc8\x7f\xbe\x83\
-|0\x90\xb3\xd6\x87\xcd\x82\xc9\xf8\xb2\xf0\xdd\x1f\xc2S\
-R\xe1MO\xd2\x82R[\xc0z\xc9Tw\xef\xdf\x1c\
-\xee\x5c\x1e[I\xa7\x1d\x82r\x95)\xf1\x8f\xaf(\x0c\
-$8\xa9zj'\xdaO\x13\xbdf\xd9\xc0\xd9\x1cf\
-\xd4J\x83\xcb;\xce\xfb\xcaR\xef\x8b\xb0\x1ap\xd6\xf4\
-L0\xf5\xa0RS*J`\x97\x05\x13\x98V+\x91\
-\xc1|\x9fW\x98\xc2.\xb3\x1c\xd2\xa4\x12>\x98I\x1a\
-\xe9w\x86\xb6\xd8\xa8\x7f\xfe.\xb25N\xb9,\x8d@\
-?=\xdf]\xd1\x14\xffj\xa9V\x14\xed-\xe7\xbb\x9b\
-\xaei\x82#\x17$|\xc8\xab\xc3:iA\xa9r\xe5\
-\xb4\x5c\xb9\x82\x03\xeb\x9e\xca\x15\xf4O\x85\x0b\xfam\x11\
-\xb8\xb2\x98\xb5-\x00\xd7\xab\xab\xef\x0f\x1e\x1aw\x01\x9e\
-\xc6\xff\xd3m\x10o<\xb8n\x15\xc57\xed\xe8\xac\xc0\
-!\xe3\xe1*\x87p=\xdc\x94[\x0f7{Y\x0f\x07\
-)H\xfe\xcf\xeb!c\xa9P\xd7\x8a&\x8f\xfc\x1f\xba\
->F_r\xa3\xde\xddc\x85\xc9C+\x5c(\xf8\x9f\
-\x96\xf7\xf8\xe4\xe0u\xc2\x1a\xaf\xb3s\xa1T\x19\xa2]\
-\x14)Cvr\xb9\xcc\xec\xb7\x80\xbc\xc4\xe0\xc5@\xa2\
-;\xf1\xb2.\xc0\xe5\x9e0\xc0U\x83\xff\xc2\xe0\x8c\x85\
-_\xe0\x85\xed\xf0:\xcc\xf2\xaf\xc3\xdc@H\xa2#\xe5\
-n-xG]~IW=\xd29\xfa\x17@\x06L\
-\x09\
+\x002\x1bx\x9c\xedZ\xdbR\xe38\x10}\xe7+T\
+y\xd87p\x1c\x02\x84\xac\xc9\x143L\x86\xa9\x0a\xcb\
+\x0e0\xc0\xee\xcb\x94bw\x12\x15\xb6\xe4\x92\xe5\x90P\
+\xfbQ\xfb\x0d\xfbe+\xf9\x928\x89\x93\xf8Fv\xb6\
+\x80\x17\xac[\xb7\xba\xfb\xf4ER\x8c\x0f\x13\xc7Fc\
+\xe0\x1ea\xf4\xac\xa6\x1f\xd4k\x08\xa8\xc9,B\x87g\
+\xb5\xefw\xdd\xfdV\xedCg\xcf\xf0\xc9|RSN\
+\xea\xec!\xc3\xb4\xb1\xe7u\x1eo\xbe\xf8\xa4\xdd\xbe\xb0\
+\x87\xb7 \x84\x5c\xe6=\xde\x18Z8&'=\x13k\
+\x08\x02\x05\xed\xb3\xda\xb7\x87\xa0YC\x14;pVK\
+[\xabH#\xc3\xe5\xcc\x05.\xa6\xd1\xc4!0\x07\x04\
+\x9f\x06\x83\xc8\xe0`\x8a\xe0\x0b\x19\x93N\xdd\xd0&Q\
+c\xaa\x1a\xd3\xa8!9\x8bQ\xa7\xd9:1\xb4\xf03\
+\xec\x1e\x01\x19\x8eD\xe7\xb8\xd54\xb4\xe8;\xa0\xa9\xc5\
+D\x0d-f\x9e\xb6\x93gB-\xf6|G\x84\x0d\xd1\
+f<\xc1\xe5\xce;_\x80\x02\xc7\xb6\xa1E\xedUJ\
+6\x9e2\x7f\xae\x8a\xfb\x8fl\xd2\x0b\xbabuH\x0d\
+\x0bbb;\xea\x0d\xc9\x13\x01N\xb4\xf5%\x02]\xc6\
+\x9dE\x02\x83yO\xb8$\x5c\x8e8{>\xabI\xcb\
+\x9a\xcc\xf6\x1d\x1a\x7fz.\x96\xdf\x8dx\xea\x8a\xadz\
+\xb8\x0fvL\xda\x0e\x1a\xf1\xd4\x15\xb5\x08\x98\x88\xf9\xe8\
+L)=B\x01st\xc5\xc6\xe0\x00\x15\xe8\xd6\x05\xb0\
+\x92*\x0ag/\xe8)\xec\x09\xf7\x12K\xa1\xcd\xb5\x90\
+\x14I\xcf+\xd2\xadM,\xe03\x99\x82\xdd\x05{\x8a\
+\x06\xd6\xca\xe7\xe0\x09q|')\x22\xf5\x9d>\xf0\x8e\
+^\x97\x98\x8b\xbe\xd7\x0b\xb4B\x90q\x22\x15\x82\x85\xf4\
+\xa8$Q\x90\x94:\xdfD\xbb}=\x1fo\xb7/\xe5\
+\xec\x17&\x9b\x12^\xc1\x8c\xd2\x9ak\x94\x07\xc3\x8fF\
+n8\xdc\xb0P\x22l\xbf\x1a$\x0e\xcbA\x823\xf1\
+&\xf1\xd0\xac\x00\x0fz37 ~'\xe6\x93\xfc\x8f\
+n\xb0E|\xaf:\x14\x1c\x95C\x81+\xb7\x15ni\
+\x1b\x0e\xfec\xb3\x1dW`\xb6\xc3\xdcV;w\xfaJ\
+*\xd4S\xd9\x13}\xa5\x02\xa8G\xc4\xb4:\xf3\x9d\x94\
+3\x1f\x96\xfb\xeb\x91\xb7\xe6\xc2\xad\x0a\xb0\x90\xdf\x83/\
+\x88\xaa\x9b\xc2\x98\xfejx8-\x87\x07\x8b\xf0\xb7\x07\
+\x07=w\xbd\xf7i\x04\xe6\x93,Jc\xb59\x84\xf3\
+\xcf\xb4o\xcf\xfa\xd7c\x831\xfb\x8e\xb8)\xf0\xb8\xc2\
+Sd\xc1\x90c\x0b\x90\x5c\xa1\x0aTLM\xc8\x00\x8d\
+\xac\x00\xfcLq\xdf\x06\xa46\xcb8\x0a\xcbs\x84\x05\
+\xf2\x04\xe6\xc2w+,6sW\x9b\xcb\x0a\xb5\xa0\xef\
+\x0f3j4]\xd8[%\x94\x14R\x8cP@\x0c\x11\
+:`\x15\x8a\x98\xbb,\x5c\x16q$C\x00x\xe2\xda\
+\x05:\xe1\x85\xc5\xfc\xee\x01\x12#@\x115\xa4\xc8=\
+\xde\xc4'P\x84\xc7\x98\xd8\xca\xea\x15J\xbeP7\xe6\
+\x88\x98G\xf9\xb3'\x15d\xff\xdc&\xd8\x93\xad\xd7\x91\
+@_o/\xe6\xf4Y\xd2\xc7=\x8cg}\xf3M$\
+Xl\x17l&\xd9o\x8c\xae\x9a$\xd5\xb5\xb5\x05\x06\
+\x05\xd9]\xdd\x9e\x9f\xa3\xc6d\xd7\x1c\x9b;\xe7\xd8*\
+\xc21+l\x9a\x05\x81\x7f\x9c\x1b\xf8\xf1\x91\xafB\xcc\
+7S1\xbftOr\xb9r\xd12\x9ae\xdb\xb0\xff\
+\x87\xae\xaf\x97\xc6\x86\x81\xb8\xc2|HhJmP\xa8\
+2\x10\xcc-Ip\x09LK\xd6RG\x17\xf6\xd1\x17\
+BV\x1e\xb1\x9f\xb3\xf197G\xc9\x91$\xda\xb6\xa0\
+q\x1e\xbb~\xc1\x8e\xfb\xab$\xb4\x0a\xc8\xb4}\xcaN\
+,\xe4\xbc\xbe/ \x22\xdd\x0f\x98\x7f\xe1\xccw\xd38\
+ \xca\x04\x97\x1b\xe0>\xd4:\x89\xb9\xa9\xfcf\xb4\x93\
+n\xb1\x00\x9c\xadn\xb8%\x9d\xd9\xcc|\xea\xda\x8c\xa5\
+\xa4\xb2\x1cZ\xebI*H04P\x942jn\x8b\
+ \x86\x16\x82|\x9b\x83\x1ceI\x0a\xe9x\xe9r\x80\
+T\xbcdt\xf7n\x88\x15\xc8V\xece\xc3I^\x94\
+\xa4`$kh\xa9\xe2h}\x92[iw\x1c\x9bO\
+`\xc9\xea\x87pk_.\xf0d\xbd\xa3\xfe\xb9\xea\x94\
+5\x06d\xca\xd5\x1c#/\xba//RHc\x9b\x0c\
+\xa9\x0a\xc4\x0b\xfc\xa5F\xd4\xa9\xe4<\x1e\xec\xdax\x18\
+5?\xc9&(\xe0.\xc0\xb1h\xcc>)\x98pZ\
+E\x94I=;8a\xedDO=\xc0\xea\xdd\xe4\xaf\
+\xf5\xe3\x03\xb1v\xf0\xfe\xd5\xb4\x5c&3\xae\xaf\x09\x97\
+\x0cv\xc1|Y\x90\xdf\xba\x84&\xc2\xe7$\xb0@\xdc\
+\xb9!t\xba\x1c\x06d\x92\x1a<\x1f\xcf2\xe7\x9a%\
+\xa2\x9e?XG\xd4q\x8a\x12u\x08]\xba&\x90s\
+\xac@\xf8\xce\xfeQ\xbd~P_\xfc3\xb4h0/\
+\x9f\x95\xeb\x889\x9f\xe2lJ\xa6\xc7T#O+0\
+\xf2\x1f\xefF\xfe\xb9\x8d\xfcR\x81\x91\xff|7\xf2\xce\
+\x8c\x9c\xb5>l\x15L\xc6\xa7\x85\xdf\xfe\x90TG\x85\
+/=I\x09J\x1d\x01\x1b%S\xdd\x8dz9\xdc\xea\
+\x1e\x1bA\xa7\xef\x02r\x951Q\xd7WR\x0d\x02\xdc\
+T>\xf5\x03\xfd\xa7\x89^\xd3l\xc6Y\x1ff\xb4J\
+\x83\xcb\xbb\x9d_\xc9\xce/\xefNX\x8dqV\xf8\x8c\
+\xb1\xedC\xa5\xa2T\x94\xc0N\x0b&0\xbd^\x22\x83\
+)\x9dW\x98\xc2N\xb3\x5c\xd2\xa4\x02>\xd8I\x1a\xe8\
+\xb7\x86\xb6X\xa8\x7f\xfe.r4Ny,\x8d\x8c~\
+x\xbc\xbd\xa2)\xfe\xab\xa5zQko\xb8\xdf]\xf7\
+L\x13\x5c\xb9 \xaeL^\x9d\xad\x93\x12\x94*W\x0e\
+\xcb\x95+8\x90\xee\xa1\x5cA\xffP\xb8\xa0\xdf\x14\x81\
++\x8bY\x9b\x02p\xa3\xba\xfa~\xe7\xa1q\x9b\xc1\xd3\
+\xf0\x7f\xb8\xc9\xc4k/\xae\xdbE\xed\x9bvu\x86\xf2\
+_2\xee\xaer\x08\xfd\xe1\xb2\x9c?\x5c\xbe\x8a?\xec\
+\xa4 \xf9?\xfbC\xc6R\xa1\xa1\x17M\x1e\xf9\x7f\xe8\
+z\x0f\xe1/\xb9Q\xf7\xfa\xbe\xc2\xe4\xa1\x17.\x14\xd4\
+O\xcb\xbbl\xbc\xf3:a\x05\xd7\xd9\xb1P\xaa\x0c\xd1\
+O\x8a\x94![\xb1\x5cf\xf7\x1b\x8c\xbc\x80\xe0\xf9@\
+\xa2;\xb1\xd8\xe0\xe01\x9f\x9b\xe0\xa9S\xa9a2J\
+\xc3_\xe0\x85\xed\xf09l\xa8\x9e\xc3\xbc\x80H\xa2#\
+\xe5m-X\xa3-.24\x9ft\xf6\xfe\x05@\x06\
+L\x09\
+\x00\x008\xe3\
+\x00\
+\x01\xa7\x89x\x9c\xed\x9d[\x93\x1c\xc9q\xa5\xdf\xf5+\
+\xd2\xa0\x07\x91fU\x89\xb8_fg(\xd3\x92\xa2^\
+\xc8\xb5\xb5\x95V\xfb\xb8\x86\x01\x1a3X6\xd0\xb3\x0d\
+\xcc\x85\xfa\xf5{>\x8f\xacFw\x150\x17\x22\xabG\
+e\x9bC\xa3\xa1+\xab\xf2\x16q\xdc\xfd\xb8\x87\x87\xfb\
+\xe7\xff\xf8\xc3\xeb\xeb\xe9\xbb\xab\xdb\xb7\xafn\xde|\xf1\
+\xc4\xcf\xee\xc9t\xf5\xe6\xf9\xcd\x8bWo\xbe\xfa\xe2\xc9\
+\xff\xfc\xb7?\xee\xdb\x93\xe9\xed\xbbgo^<\xbb\xbe\
+ys\xf5\xc5\x9377O\xfe\xf1w\x7f\xf7\xf9\xdb\xef\
+\xbe\xfa\xbbi\x9a\xbe\x7f\xf5\xe2\xdd\xd7_<\x89\xe1\xf5\
+\xeb'|\xfe\xfa\xea\xd5W_\xbf\xbbw\xe0\xbbWW\
+\xdf\xff\xd7\x9b\x1f\xbex\xe2&7\xc5`\xff\x1f_\xbc\
+\xbfe\xb0\x03\xaf^|\xf1DW\xad9\xda\xc7\xb7z\
+\x84o\xf4\xff\xcf^\xdc<\x7f\xf3\xec\xb5\xee\xfc/\xd7\
+\xcf\xde\xbe\xbdz\xfb\xbf_\xbcz\xfb\xec\xcb\xeb\xab\x17\
+\xb3~=\xce|\xf3\x97\xb7\xcf\x9f}s\xf5\xd9\xbdk\
+\xc69L\xbfq\xdd_\x05w\xf5\xd2\xbd\xdcM\xc1\x85\
+\xb8\xf7~\x1f\xf2o\xed$\xbd\xf6\x9b\xb7\x9f\x1dN\xfd\
+\xe2\xc9\xd7\xef\xde}\xf3\xd9\xd3\xa7\xdf\x7f\xff\xfd|8\
+8\xdf\xdc~\xf5\x94{\xbf\xfd\xe6\xd9\xf3\xab\xb7O\x0f\
+\xc7\xef\x9d\x7fx\xca\xbb\xf3\x0f\x07\xe6\xb77\xdf\xde>\
+\xbfz\xa9K\x5c\xcdo\xae\xde=\xfd\xc3\xbf\xfd\xe1\xee\
+\xcb\xbd\x9b_\xbc{\xf1\xfe2\x0f\xee\xfe}\xb4\xfb\x06\
+\xe7\xdc\xd3\xc3\x1b.7\xfb\xee\xab\x9f\xf9\xcb\xdb\x17/\
+?\xf4K\xdf{\x7f\xea\xc2\xd3\x10\xf6\xfa\xc5\xfe\xed_\
+\xdf\xbc{\xf6\xc3\xfe\xcd\xdb\xbf\xbfw\xea\xf3\xe7wg\
+>\xbf\xbdz\xf6\xee\xd5wW\xcfo^\xbf\xbey\xf3\
+v\x0c\xc7\x83\x1f\xbfx\xff\xe3o\xbe\xbd\xbd\xb6_\xbc\
+x\xfe\xf4\xea\xfa\xea\xf5\xd5\x9bwo\x9f\xfa\xd9?}\
+\xf2;\xfd\xfe\xf3\xbb\xe9d<_\x80\x0a\xae2f\xfd\
+\xeeP\xcd\xf9\xc98\xfc\xcd\xb3\xaft\xdb\xeb\x9b\xdb/\
+\x9e\xfc\xfdK\xfbo\xf9\xe2\xcb\x9b\xdb\x17W\xb7\x87\xaf\
+\x9c\xfd\xf7\xe0\xab\x1b\xcd\xd5\xabw\x7f\x15\xe0\xe6p\xb8\
+\xda\x1d@\xde~}\xf3=\x97~\xfb\xf5\xb3\x177\xdf\
+\x7f\xf1$\x1c\xff\x80/\xef]\xc1}\xe8\xfb\xe7__\
+=\xff\xcb\xd5\xed\x977\xcfn\xf5\xf0'?yq\xf5\
+\xf6/\x87\xe7{\xe1\xf9\xdf\xc9/n\x9e\x7f\xcb\xf8\xec\
+\xbf}\xf3\xea\x9d&\x7f\x11\x15a^\x8f\xf7\xd5-C\
+\xf2\xf2\xd9\xf5\xdb\xab\xe3\xf3\xfe\xe3\xe6\xe6\xf5\x17O\xd2\
+\x1c[\xcf%\x9e\xbc\xdcsIY\xedsv\xa5\x96r\
+\xf2\xa5\xde'\xc69\xb5\x96C<\xfe\xf2\xfbWo4\
+\x1c\xfbE\x98}\x0f'/\xb5\xfc\xe2 \xde\xde\xf9\x93\
+\xa1[~\xf2\xc3\x07\x86d\xf9\xea\xaf\x1f\xff\xea\xf5\xb3\
+\x1f^\xbd~\xf5\x1fWz\xf5\x93\xe1z\xfe\xed\xed-\
+\xa3u\xfd\xec\xafW\x1a\xd4\xff\xae)x2=5T\
+\xbd{\xf5\xee\xfa\xea=\x90\xeccx\xf2\xbb?\xde^\
+]\xfd\xfe\x9f\xfe0\xfd\xeb\xbf\xff\xcb\xf4\xcf?|s\
+s\xfb\xee\xf3\xa7\xf6\x9d\x9d\xa4\x09z\xfe\xfe\x1c>\xa5\
+'\xbf\xfb\xc3\xed3=\xcaW\x06\xbc\xcf&\xee1]\
+\xd9\x99W/\xa6\x97\xb77\xaf\xa7\xc35\x0f\x93\xf7\xd9\
+\xf4\xd5\xd0G\x9f?\xe5\x12\xcb\x95_\xbe\xbd\x7f\xe5\x97\
+o\xcb\xe1I\xbfz\x7f\xdc^\xe0\xe8\x1d\xaf\x9f}y\
+u\xfd\xc5\x93\x7f\x13\xb8x\x92\xe3\xaf\xbf\xba\xbd\xf9\xf6\
+\x9b\xd77/\xa4\xa7l\x14L\xa6\xde_U\xc8yw\
+{\xf3\x97\xab\xfd\xf5\xab7W\xff\xe7\xe6\x954\xe0\x97\
+W\xdf]]?9|\xcdm\x977\xfc\xfd\xcd\x9bw\
+z\xfc\xbb\xaf^\xbe\xba\xbeF\xab\xbf\xb9z\xf2\x81\x8b\
+\xe9\xee\xd2\xca\xff\xf7\xdbg\xb7'_\x1f\xd0\xf2\xe0J\
+\xfb\xdbo\xaf\xf5\x90\xba\xf9\x9b\x9b\x17/\x8eN9\x16\
+\xd8izw\xfb\xec\xcd[\xe9H\xc1\xfa\xf5\xb3w\xb7\
+\xaf~\xf8\x8d\x9b}.\xcd\x85\x90w\x8e\xff\xf1\xb1\xd6\
+\x1a\xean_\xc3\xac\xe3\xa5\xb4](sq\xd1\xc5\xdf\
+\xde\xbb\xc1_\xb9/\x8f\xf0\xd9\xdf?o_\xd6/\xeb\
+2F\xf7Gi\x0c\xc4W\xa1\x84\xf4\xe4\xfd\xb1\x1f;\
+\xf7\xe1\xd9zG\x8d\xde~9\xe1\x8d\x9e\xfb\xd9\xf5\x93\
+\x07_\xdb`>\xd4X'oj\x7f^?{w\xf5\
+\x1b\x9f\x9a\x9fS\xd8\xb5\x14\xf4\x9e\xbf=\xb9\xd4\xfeN\
+\x15\xf9''O\xf1\xf2\xd9\xebW\xd7\xfa\xea\x1f\xfe\xdb\
+\xcd\xbb\x9b\xe9_u\xcd\x7fx\xf0\xa3\xc3\x98?\x98\xda\
+\xbb\xb3\xbf_$9\xdd\x9b\x8d\xf7/(I\x94\xba\xc8\
+s\xa8\xb5}\xf3\xc3\x83\x1f\xd8\x08\xfa\xd2\x8f\xee\xf5c\
+C\xa8A\xfc\xe6\xd9\xbb\xaf\xef\x9f0M\xba\xcc\x9f\xa7\
+V\xe7\xe8\xcb.\xcd\xadt?5Wg\xef4\xd3!\
+\xd6\xb9\xa72=\x9fB\x9es+\xbb}\x9bK\xf4S\
+vs\xab\xfa\xbe\xcf\xad\xf9\xa9\xa69e\xbf\xdb\xc7\xb9\
+\xd46]O!\xcc\xa5\xe5]\x9e{\xe9:5\xd79\
+\xf9\xbe\xf3Y\xd7lS\xefs\xf7uW\xe3\xecr\x9a\
+\xbcOs\xd6G\x81k\xf61N\xban\xe6)R\xcc\
+\xfa\x9b\xb3\xdc\x9c\xa7\xbd\x9f\x9b\xe7\x02\xc5\xeb\x9c\xbd\xe0\
+\xe7uu\xef\xb3\xbe\xd2\xbfm\xd7\xe7\x10\xba\xbei\xb3\
+\x9e\xca\x8bt\xe4\xea\xf5 \xfb2\xf7\xaa\xcb\xf9\xd8\xb2\
+\x1eD'&M\xb2\xe7i\xc3\xb4Os\xcf|\xea.\
+\xd4i_\xe7\x10\xb3>E\xe7\xfb\xf4\xa7\xa9W\xd1\xa1\
+\xbe\xdbg=\xa7^J'G=\x83\x06@\xc4\xcc%\
+\xae\x5cR\xda\xedy\xd4\xc2\xc9Er\xb2\xd7\xc3\xc6\xdc\
+\xba\x9eW'\xbb\xb6\xdb\x97\xa0\xe1\xd3\x08\xed\x93\xde\x80\
+\x03\x1a\x81\xb9:=\xdc\xbe\xe9z\x85s4\xb2\xc9g\
+\x1d\x09N\x0f\xa41\xd7\xd0\xea\x92)\xea\x05\xbd\xe4\xae\
+\xeb\xf6\xfb\x92y\x09{\xb5\xd0y\xb3\xea4\x1a.\xef\
+b\xf4\x9a\x18=\x90\xd3#\xf4]\xd7\xc5Z\x9c~?\
+i\xfa\xe6\x16\xc2.&\xbe/\x93.\x10\x8b\xdf%\x8d\
+wr\x81\x9fW\xa7\xdfh\xca\xa3^\xa5U\xbd\xf2\x1e\
+\xb3\xe4[\xdb\xa5T\xe7\x1a\x92\xbdt\x9b{c\x94\xf4\
+49\xd8S;W\xc2\xae\xce9\xe8!}Hs\xed\
+1\xe854\xdb\xa9\xf2d>0[\xdcjv=p\
+\x11\x09U\xd1Lrg\xbdf\x0fz\x07\x0d\x9dhA\
+\xd1sk\xd6gi\x16\xa1\xa7\xcf\xa9d\x1b\xaa\xc0\xd0\
+\xeas\xe0\xf7\xa5\x83\x0ca\xadi\x92\xf5\xe2Y\xc0\xb1\
+\x1b6^\x90\xfb\xcd\xd9p\xa2\x01\xd2 \x969u\x0d\
+\x94\xde\xdeG\xbbX\xaca'DjT\xf4p1\xcc\
+\xd5\xdb8\xbaX\xdf\xbf\xe0\xd1\xfb\x1d\xbd\xde\x8f\xbf\x9d\
+\x90\xdc4\x11\xfai\xebz\x00_4\xe0B\xd9^\xa2\
+S\x92\x1e\xc1w\x04A/\xe4\xf5F\x05tD\x8d\x04\
+\x17u\x02r\xca\x05\x5c2\xef\x0e@\xc60U@\xa8\
+\xef\x05iI\x83\xcb\xba-?\xedA\xc7tj\xd5\x0f\
+%\x1b\xe3\x92\xa9\xccAw\x9cj\xd65\x04T\x9d%\
+\xc4j\xc6\xeeD6=\x94\xd9\xfePh\xeb\x91\xd4\xa6\
+\xf6cb\xdb\x8f\xe4\xb6<\x14\x5co\x92\x9bLp\xf3\
+=\xc9]D\xd7^\xd4\xb9<D\xf7\xbe\xe4\x9a\xe0\xea\
+I\x87\xe4\x1e\x047\x0c\xc9=\x08n\x1a\x82;\xe46\
+\x99\xdc\xc6!\xb6\xcd\xc46p\xdex\x09\x8d\xe6\xe1-\
+Lls\xfb1\xb9-\x8b\xe0\xde\xc9\xad?\x08\xee\x22\
+\xb75\xdc\x09\xee\x22\xb7\xc9 o\x92\x9b\x16\xc1u\xdc\
+\x04\xd9\xad\x07\xd9\xd5l \xbdu\x91\xde\xda\x17\xf9e\
+\xb0\xf7\xd2@\x1a\xb1^\x84\x1b\x9e\x8c\xb7Lz]\xd4\
+\x17C\xd2\xa6\x964/a\xa7Yp\xb1\xd8x\xa3\xa0\
+\xbd+s\x8d\xd2^<i\xe2\xb5\x0a2;\x09\xf6\x1e\
+u\x15\x9a\xa6\xc7Oz\x80\x80\xb6\x96l\xb5\xd8\xb8\xe1\
+\x02\xfc\xfd@>\xb2\xad91\x98\xe9\xd9J\xe0{\xa6\
+F\x9f\xb2To\x92lu\x1b3a\x5c\x0fXrd\
+>{\xeey\x12\xb3\xadR\x5cI0*:Q\xc0\x08\
+U\xd3\xe1\xf4j)iJt\x12\x12\xa7\x01\x0ez\x12\
+\xdd62\xe35\xb9\xa6K\xe9\xb2q\xd7\xf4\xac\xa98\
+\xbdUD\xd33\x92\x1avW\xf4\x9e\x82<\xd3#!\
+\x0b\xe2\xd6:\x00\xc0\x1b#\x0b\x22b\xd4\x91\xe3wY\
+\x90\xee\x06\xd09 \x09\x88\x5c\x96\x81\xcc\x1aI\x8fN\
+\xb4\xd7iAC\xf7\x9d\x1c\xe0?=\xb4xO\x1e\x9a\
+\xc4\x1f!P\xe3?\xb9b\xefnn\xf7W/_\xea\
+\x0f\xb3\xec{\xf1C\xf1\xb4\xaf\xf6\xc3\xda\x1f\xfd\x1e[\
+\x8d\xe5\x95\xc4\x1c}\xf3!\x83=\x98\xeab\xb0\x9f~\
+\xb5Q\xa0\x1f\xa7@5\xaeB\x81dX\xaa\xc4K\x9c\
+V\x8a\x0b\x05)\xd5\xd2\xa2\xdf\xa1\xf0+zG\x22=\
+\xd7\x0c+\xaa\x98\xeef@B9\x09\xcfI:C\xfa\
+\xd2\xc9H\xec\xb3t\x0fzV\x92\xda\x82\xf4\x9c\xe1\x0f\
+\x85%\xf4q\x992\x0f5[\x1a\x06+\xa2\xdb2\xd6\
+\x11r-\xdd1\x00\xff\x1e\xef\xd2U\x19;-\xacK\
+w\x18\xc9\xe9\xa9K\x88\xa24\x5c4\x0b*\x0d\x9d0\
+a\xae\xe6d6U\x1e7J1\xd9\x0dQJz\x0d\
+]%`\x11\xf5\x0e~'\xfd\xe0b7\xc5\xdaPS\
+-K\x87K\xf8S*\xfaTc3\x9d\x1c}\xc6N\
+\xa7\xc2\x83\xc9l\xf7\xce\xc7\xde\x9a=U\x95b\xdf#\
+\x8a\xbc\x86\xf4*:Q\xe2T\x8d\xa1yo\xea0\x96\
+\x5c#J\x98\x9b\xea\xfa\x12H\xd79\xd9\xd8\x90\x94\x95\
+\xf4\xb6\xd9\xc8\xd9\xbe\xd7#\xcb\xc7`\x0c\xd1\xcc\xba^\
+\x97b\x96I\xd1\x11\xd33\xc6\xb1L\xd1H\xccm$\
+\x9b)s\xd1\xbaj\xfc%\xb7\xcagW:CiZ\
+\xcc\x94\x18\xbf\x16\xa7\xd5\xeci\x96[\x1d\xe3\xee\xa2\x11\
+\x85$\x95o:\x1b\x95y\xd0\x98zO\xd9f\x8d\x85\
++Xh\xfd\xdb\xf1\x81P\xbd{\xfe\xe5+\xdfmX\
+\xba^5\xe9\xe1za\x04\xb3\x94\xa1\xee[\xa0.u\
+0L\xbd\xbd7:\xa1\x11\xachF\x9dac\xa2\xfb\
+I\x09\xe7a\x97\xc4B\x8a\xc6\x0b\x0a$\x93,c\xef\
+Q\xacX\x1c\xdd\x9b\xdbE\xf44J\xaf\x8a\x801s\
+!\xda\xfd\xe1\x01\x1a\xdf`\xe3\x9aP|2$\x19:\
+\x0ckI\x00Q\xb4C\xa7J\x88\xb2\xd7\xe7\xac\xd1\xee\
+\x86\xa4\x829\x1acZr0,u\xde\x1f\xdd\xaa\x81\
+\x12O3\x90\xc3{Z\xd7xi\xfe\xa5\xf7k\xf2\x0c\
+\x02\x0c\xe4\x8e\x80\x88\xe4\x14\xec\xae\x865\x14I\xcb\xf3\
+I0\x8d\xdc;\x8bO{ifo\x0a;\x8b<H\
+`\x9a\x99dQ9\x8d\xa7P\x07\xff\xf3\xc6\x1d\xd0\xe9\
+\x0d\xa2#\xbb\xaeO\x05\xebm/T\xe2\x84\xc5\x8c\x03\
+\x90q\xb2\xc7\xe3\x83D\x15\x82\x93\xcd\x5c%~\xe5\x9b\
+\xe1\xd4W\x192\x0d\xb97\xae)\x0f\x00g\xd5\x88\xa7\
+\xb0.ckX\xd1\xf9\x9a\xb7\xee\x99Z\xe3p\x8e\xdb\
+\xe2\xd7\xd6\x9d\x98gOz@\xc6-\xed\x92\x19q\x09\
+\x86\x18O\x90m\x97\xcc\xe9\x5c!K\x9f\x93\xe4_\xb3\
+\xc3\xb45\xd1\x1f\xe7\x02R\x94\xc7\xdf\xfa\x0a\xaed \
+\xd2\xfd5@\xd5@\x14\xf1\x91\x9a\x94\x06\xb4\xd5\x1b\x8c\
+`\x19.\xc2\x8d\x9a\x89\xa2\x87\xef9\x93Z\xcd\xa8\xa4\
+\x16. @\xc8\x9e\x01\xe4<\xe8o\x17\x85i\x83\xfe\
+fL\xeb\x0e\xa3\xcbdj\xa4b\xd2\x0f\x1d\xd8\x80\xc3\
+\xea\xb9\xca\x90P}\x07\x7f\x10\xe3\xcf\x80\x08\x7f*\xc2\
+e\x10\x8b\xcc9\xd9L\xed\xbe\x16\xd3y\xb2\xb0\xb2\xdc\
+\x90\x14\x8f\xfc\xec\x82N\x94`\xb7l\x82,\xab\xed\xba\
+fy\xa1\xcb\x0b[\xd64wq\x1e\x99a\xe9\xc1)\
+K*\x99\x17\xfdV\xe3R\xe1\xb3H\xbc\x98\xf6@\x93\
+\x86i\xafI\x81&z\x1bH\xa9\x07\xcd\x91\xc4!\xe2\
+\xe9\x18$a\xfa]c\x1a\x8b\xf1\x16~+]\xcd\x07\
+\xe8\x90\x9c\x189A\x5cGB\xed\x1c|\x7f8E{\
+\xf3\x8a\x02\x8f\xcf[\xc3\xcd\xc1U\x9d\xf4\xbb@@\xa3\
+\xf0\xc0b\xde\xd2\x01\x05=$n\xdc$\xc7\x13\xf2\x12\
+\x0d\x99Y\xa2\x0ey\xc3\x03\xd4\xe8v\x114o\xf6\xc1\
+>\xea\xa5\xf5[\x97\x98u\x07\xb7\xc5\x1b\xa9|*]\
+\xba\x12\xa6\xe5\xd1\xc0.k\xae\x19A\x09\x837E\x9a\
+1;Q\x93\x04xR\x8e\xd0\xf2\xde\xf0auX\x03\
+\xcd\x14\xe8\x9a\xf0\xa9.\x07\xe0\xa1\x98\xa5\xfeP\xcc\x82\
+\xc9\x99\xeb\x07A+\x0f%M/|_\xd4\x16Y\x0b\
+\x8b\xac\xf5\x87\xc2\xd6x\xa1!-\xcdKe{4 \
+C\xab\xfbv\xde(\x0cF%\xef*\x0fa*\x0f\x84\
+i\xf1\x88\x9cFuH\x93\xe6e\xc8\x937y\x8aR\
+i&Qm\x91\xa7\xb0\x08T\x1c\xf2\xe4\xea\x22P\xe6\
+N\x14\x190i\xad\x98\x0c\xabh>~\xce\xe5\xe2\x90\
+\x95,&\xeb#63\x0fa\x91l\xdd\x93\x16\x81\xe0\
+\xbe\xb8\x1c\xc9Kx(0\xf1\x81\xc4\xc8\x05Bd\xe2\
+Ad\xfc\x91\xcc\xe4\x072S\xffF\x99\x09\x07\xa1)\
+E\x16\x07\xc9\x90'\x83\xceB#d\x84\xa1\xe3\x87\xf9\
+\x89\xb7\x16\xd3G\xe7\x8b\xc1\xfa\x14\x1f\x8d\xba\xd6c\x96\
+\xbcQ\xd7O\xa7\xaeu\x15\xea\x0aH\x92\x0cy\x90q\
+\xce\x12\xec\x9f\xa2\xb2\x92\x07\x81\x0e\x90Eo\x1e\xea\x12\
+,\xa8\x0fb\x05\xedA\xa8 \x1c\x22\x05\x17\x18\xce\xfb\
+\xc9\xd8\xdd!\x04`\xb1;\x09^$\x04\xa0\xa1\xe8p\
+*\xbd\xaf\x11O\xe9\xc7\x8cz\xe9\xa8\x07\x8b\xdcI\x84\
+[\x1dL\xce\x88r\xef\xcb\xf5L5\xd6\x85\xaee\xa2\
+]\xba\xa8\xb1\xc5\xd5b|\x8f'\xf7y\x93\xfb\xb5\xe5\
+\xbe\xf9\x15\xe4\xfe5~S\x22\x0c\xb6\x8b2\xb1\xadW\
+#8\x09\xebQ\xa2\x8e#[y\xf8\xa62\xc8b$\
+DS+\xce\x08\x14\x09Rk\xb1Y\x09\x97\x84\x81\xf8\
+\xb0\xd0\xdee\x8c1\xfb\xba@v\x04\x8a\xbd~\xc1R\
+\x80\x9c)\x17\xda\xf0pp\xaaZ\x0bf\x12\xe5\x13\xca\
+\xf9A\x90<\xa7\xfa\x9d\xb8\x17\x1e\x9c\xc4(I\x85\x14\
+\xd8\x91\x9eC2\x22b\xa2\x9f\xf8\x96\xcdS\x8bR\x13\
+r\xa4-\x88'[G\x10\x96\xe0\x15f\x18\xc2'-\
+\xa0G\xed-\x8e\x8f\x0e\xb98\xd0?\xe8u5\x02'\
+\x99\x1d|\x93p\xb5hG\xe9X\xd9b\xd4\xadc\xb9\
+!\x84\x22\xf0\xd1L\xae\x97\x9b)\xdb:-!\xe4C\
+\x04\xd9\x02\xce\x1a\xc3\x11o\xeeci\x83(j!B\
+5\xa2\xd3Kp:#\xcd\xcd\x08f\xd4\xa3\x11\xa3#\
+\x08W\x89\xdcu,\xbb\x0dm\x22\x00\x10\x1eO@\xfb\
+&\xa0\xab\x0bh^G@\x85K\xf9\xc72D\xcd\x02\
+\x1aG\x02\x1aO\x04\xf4 \xa1\xf1 \xa1\x88\xe0C\x19\
+\xf5\x0f\x844u\xcc\x8a\x09i\xe9\x8b\x94BVmU\
+\x22\x8eU\x89A^q\x98%+\x04\xaf\x9c\xd8\xfe~\
+Yf\xb8[e`U\x22@\xabY\x95\xc0\x09\x0b\xe6\
+s\xfab\x9e\xf2tX\xc68\xacb<\x10\x85\xf0P\
+\x14\xda\x10\x05\xff\xf8\xb2pb\x177Y\xf8tYX\
+c\x89Y\xb2\x90\xe4\x18&W\xccqs\x84\x10\xe5\xc5\
+\x09\x8b}W\x9bE\x1b\x1eK6>\xb0\x9cv\x1c\xbd\
+:Za\x10\x99\xac\xe6\xf8'QT(\x1c\xdf\xc9\xce\
+\xe52\x96m\xce\x14Iz<\xa9\xd9V%V\x97\x9a\
+\xbe\xc6\xaa\xc4\xafB\xf1\x0e\xf2\x91\x0e\xf2\x11N\xc2N\
+G\xf2\xc1\x0a\x08!\x09\xa2\xf8\xfe \x12g\x8b\x07]\
+\xdfi\x8e\xb6\xa8\x8eG\x13\x94\x93\x95\xc2MP>]\
+P\xd6\x88\x81@\xb5*\xb1rV\x9d\x08\xa6\xe7\xc9\x97\
+\x22\x8f^\xa8\x8a\xac\xac-\x8bu\x8dH<!\xf8\xe4\
+\x09\xe0:\xcfB\x5cp\x85\xf8GJ\x95\x95\x9bJ\xc2\
+\xc5\xdd\xf2\xfc\xfe\xfd\xfa| \xed\xad\x84%T\xe0m\
+\xbd\xbeU\xcb\xc2\xd0%\xf2t\xb7\xca\xbf_\x96\xf9E\
+\xc1\xba\xbc\x06\xf9\xf7Y\xa6\xa0\xb2\xac\x96Y\x0c\x88\x93\
+E\x05bd1(HB\x12QpKC\x91\xa8\xca\
+L4B\xcc,\x0f\x14V\x09\xfad\x11\x07\x22\x01\x87\
+\x90\x03\xb1cb&\xd9G\xee\xe2w\x9dW\x9dF\x1a\
+\xd2\x92\xcc@\xfc0\xed,\x22>\x11c\xe4o/\xd9\
+\x1d\x19\x13\xfbC\xca\xc4\xc8\xb4\xd8\x1fR-XB\xb3\
+p\x85\xd7\x0b\x10\xc7\xb4\x85\xcc\x90\xf4P\x96\xa2\xb1_\
+r4\x82\xe5\xc9\x10\xae\xf1\x1a\xbc\xb9,\xe3\xc2H\x8f\
+\x94\x8f\xfd!\xe7\x83\x90P'\xb2\xc4\xfad\xb7\xa5=\
+\xd7I\x1e\xf3\x8c,\x0b\xa4w\xc9$\xfbC\xdc\x08\x7f\
+1\xd7X-\xb2\x1dl\x01\x845\xb5lk[=\xc3\
+o\x97\xf4\x95\x11\x93\xfa\xd3\xc9\xf4?\x9eJ\xd8\xc2#\
+k\xab\x04\xb9\xe1\xeb\xa8\x04\x99\x889F\x16u\x05\xa7\
+N\xd2\xcb/\xf2ZH\x8aZ(\xea\xfe\x1eG]}\
+u\xefz\xe4\x10HB\x87\x01=\xcaR;ZO8\
+JA{<\xa0oa\x86\xf5\x81\xbeR\x98!4\x16\
+\x09\xe3.\xd5@>\xd31\xd0\x7f\x22R%\xf5I\x9e\
+\xaf#\xa1[z6\x16o8\xffe\xabn\x07\x10\xcb\
+\xa8\xddGq\xfdO\x06c\x19\x93\x0d\xc6\xab\xc3x\xad\
+\x08\x81\x18?\x99\xe3\xdeE[\x039\xf1Cl)|\
+\xbf\xac\x85\x83QaS$\x84\xe5[\x0b\x1c\xc79\x8c\
+\xb5\x1c\xf2>pm\x96\xe5\xf4\xfd\xddz:\x8ceY\
+\xb9\xceaD\xb0\x03\xc1\x01\xb2\x81\x0c\x95c\xad~\xbf\
+,\xd6#?d\xb9F#(\x06q\xb9H;\xc4\x85\
+u2>\x07\xb1\x10Q\xcdL\xb0\xe1\xfa\xc1\x1a\xcdx\
+Fr\x02R\x19\xff\xf6\x91\xea\xe0\xbc\xe5\x12\xb1\x1e\x1f\
+\xc6\xcdZdiw\xe4<e\xd2g\xa7%\x9a\xbe\xb7\
+p\xfa\xe3I\xc7\x16\x09X]:\xfcJ\x91\x80\x9fp\
+p\x8eY\xc3q\xc6\xd6i\x8a\xf8\xc3\x8c\xef}\xf5\xac\
+\x0a\xb3l\xac!n\xfe\xd1(\xb4D`\x03\xdd\xea\xa0\
+['\xb3\xe0'3\x07N\xb6\x0a=\xdcI\xb4\xaf\x06\
+B6\x075V\xe6\xfb\x07\xd2h\x8f\xee\xf1x\xb0\xdb\
+<\xb7\xd5a\x17V\xf2\xdcRi\xb3\x85\x1e,v9\
+\xf6\x80\xf4%mC\xffvR\xb9\xaa\x1b\xa6\x5c\x88\xcb\
+\xc4\x15\xf7\x87M\x12\xfb\xbb]\x12$\x7f\x91\x8c\x11\xe7\
+\x82\x86\x93M\xed\x96\xda1\x978\x22\xa7\xc4|\xf6\x87\
+\xa0\xcf\xc9\xee\xa0\x8c\xd9'5[L\xc08\x85\xb8\x88\
+E(\xd2tH\x94\xbd\xcb\x93\xb5m\x09y\xec\xf1\x92\
+>-c\xad\x8f\x1c\xe2\xbd%\x11\x9b\xb78\xf2RI\
+\xb4\x1c9\xc4{K\x22~<\xc4o.\xdc\xfa\x88_\
+\xc3\x85\xfb\xe9\x14\xae\xdfs\xc4\x93b*\xde\xca\xea\x10\
+p+)\xca\xe7\x03\xc6\xe4\xf2\x1fo\xdf\xfb\xd3\x07v\
+\xf9\xfd\xfex#\xe0\xf1>\xc1\xa3\xe7x4h\x86\xcd\
+-[\x1f\x9a+\xb9e\x91\xbc\xe8^\xc6&\xb8\x9cF\
+F\xeb/\xd9\x12vP\xaduQ\xad\xce\xf6\x96>\xc2\
+\xa6\x8fO\xd9\xf7\xf6x\xd0\xdf|\xae\xd5\xa1\x1fW\xf2\
+\xb9Rp\x82[\x16n-Np\xbc\xa1\xe0!\xac\x8f\
+\x9d\xff\xe5\xcb\x05{\x8f\x86\xa7\xb8\xb9S\xeb\xe3i\x9d\
+E\xca&M\x892jm\xd9\xa3\xcd\xca{fi\x1b\
+\xcf\x9e]1E\x9fDzS\x91k5*\x04\xdc\x15\
+\x088l\xd16\x7f\xbd\xd9\xe6\xe63\xe6*?\x1e\x5c\
+77lu\xb8\xa6\xb5\xdc0\xf9\xec\x8d\x0dSI\xce\
+y\x89\xdd\x16\x88\xcf\xb5\xa8}\xd8\xbe?v\x8a\x12\x92\
+\x12[\xd5\x0dH#\xde\xc7\xdcg_#\x0b\x15\x9a\x16\
+\xec=\xe5\x12b8}\xc6\xc7\x03\xee\xe6M\xad\x0f\xdc\
+\x95\x16\xc4b\x0f#\xf8\x99\xbd\x15\x02y\xfe7D\xf2\
+\x1f\xda\xf63\xee\x1d|4\xc4\x9e\xec\x16\xdb\x10\xfb\xe9\
+\x88]\xc9\xc9\xf2=\x92\x95d\x95.\x1c\xce\xcf\x0aU\
+.\xee@\xdc\x17\x14\xfb\xbf\xa9f\xc1\xe3\xe1s\xf3\x84\
+V\xc7g^\xc9\x13\xca%\xd8\x8e\xfbH\x80\xe84\x05\
+T~\xb5\xd5~\xc0t;o)\xa1\xe4p\xc2P\xcb\
+\xa8!C\x1d\xa6\xfd(\xc4D\x5c\x8a\x84j\xea#\xb0\
+\x1bp\xc9\xfdBq\x8e\x8f,\xc8\x8e}<\xe2\xca:\
+#\xd8V\xa1\xe2m\xcb\x5c\xb7D\x07R\xd3\xd8_a\
+\xfb\xc8\xc76\xf2G\xc3\xe9\xc9\x22\xc5\x86\xd3O\xc7\xe9\
+ji\xa0l\xf9\x82\x0eVg\xbb\xba\x8f\xebZ}\xb8\
+,V\xfdh]\xac\xfd\xe1\x02\xefkJ\x8d\xec\xc4\xf6\
+\xf3\x92\x13\x1f\x0f\x95\x9b#\xb5:*\xcb:\x8e\xd4'\
+m\xb8\xbe\xf3\x8b\x8e\x11\x98\x8e\x00x\x84\xbf\xdd\xc3\xca\
+nC\x00\x1e\x0f\x8d\x9bw\xb4>\x1a\xd7J\x17Lc\
+\xaf\x9f\x0c\xb0\xef\xd96\x95\xfc\x82\xaam\xff\x1f\x14\xa4\
+\xba>\x8a\xdd\xba\xc7[\x08+\x9b\x8f\xb6\xbe\xdc\xac\x95\
+\x9fX\xc4j\x09\xa7\x8a\x0b\xc7\x9a\x96\xd2\x94\x97R\xff\
+\xeb$C\xe1\xf10\xbd\xf9u\xabcz\x95\xaa\x87w\
++\x5c\xc5V\xb8\x92;\xecp\xb0\x9ai\x96\xb6z\xf7\
+\xa1\xfb\xf7\x1f|\xfc`\x84\x8c\x9fE\x98v\x1d\x1b\x22\
+\xc2R\xce\xa4\x8d\xa51\xf6J\x8c\xca\x5c\xfdP\xd1\x0b\
+\x1f\x92\x1d\xb5\x16\xb9\x08\x1e\x133-\xc5!\xf6\xa3:\
+\xc4\xa3\x81t\xabot\x06\x90\xae\xb4lV\xc8\x81\xa1\
+n\x0e\xc5\xb3J\x99\x0ee~\x1fV\xf9\xfd\x19\xc5\xb9\
+\xfb\x07V\x19\x9e\x8f\xedt\xe5\xfd~:v\x96\xde\xdb\
+QW\x96-u\x8f\x07\xc5\xcd\x93[\x1d\x8a\xab\x94\xdc\
+\xf9\xf3\xd4{d\xbb\x0b\xe1\x05\x91\x5c\xe9\xc4O*\x14\
+\x7f\xba\xa4\x0b\x14\x83!Q\xf6\xfcnk\xa7m\xdb\xa4\
+L\xd5r\xe2\xe3!q\xf3\xe2\xd6G\xe2J^\x5ca\
+\xbf\xad5\xe1\xa0\xb0\xe9\x07\x22\xb2\x14\x06hf\xae\x05\
+D\x12X\xa2\xd5s\xcc\xa2\x91V\xc0q\xec\x02\xaeq\
+\xe5\xb2\xa1\x8f\x06\xce\xad\xd8\xcb\x19\xc0\xb9V\xce\xa0\x95\
+_\x91_\xdf\xa9zi\xf9~VP\x94\x9dO\xcd\xca\
+`C)\x89\x12X^\xd5~\x00\xd2\x12\x09\xea\xbd\x84\
+\xc1{\xc9\xd8\xfc\x91G\xdf\x88\x10&6\x0b\xb8<6\
+n\xb5i\x81\xdf~\x94\xe0\xb4*\xa7\xe5\xae\xa20\x8b\
+\x0d\xb5\x8e-\xeeV\xba\xd4\x8az\xee\xad\xaa\xe7\xe3a\
+us\x81V\xc7\xeaZ%V\x82+\x941\xd8\xc5\xc2\
+\x8a\xea\x07\x14\xa9\x15\x94%\x1cKA\xd9Q}yo\
+\xf5d\xf34\xea\xc9\x129\xb2\xaa\x94\xfbQeKV\
+<,}`\xa2\xd4e\x90\x92\xc4\x1f_*\xec.\x05\
+v\x872\xedC\x99z\xcb\x87\xd5Y;]\xbf\xb3\x04\
+\xbb\xd4\xee]J\xf7>\x1aP\xb7\x12'g\x00\xeaJ\
+k[\xa2\x88B\x1d\x9a\x8d\xe2l\xe6\xac\x13\xf2\xb1\xc0\
+mlV\xeb\x98\x95,6\x0a\xdc\x95:^*\x1d\x7f\
+`w\xcb\xea\x05\xda\x1f\x0f\xa3\x9b\x7f\xb46F\xe3Z\
+57|\x8ds\x94\xff\x1cH\xb37\xef\xfa\xe7k\xcf\
+_Pr\xfc\xa8f\xc6\xe3Aos\x88\xd6\x87\xdeZ\
+I\x7f\x9f\xc89\x0f\xf5+\xee\xea\x98\xfd\xfcJ\xf2\x8f\
+\x85\xbf\xb8\x95\xaf8\x03\xfeV\xf2yr\xa5\xfb\x964\
+\x1f\xab@\xe1\x978\xe0\x18qK\x07\xc5\x8a\x0f#\xbe\
+\x1fV|i\xef\xb1\xbf\xb3\xe2\xbf\x86\xd6\x8b[Y\x88\
+\xf5Q\xb7VY\x88\xd2\xfcR\xb5*D+\xf06\x16\
+%\x1d^H\x18\x8b\xe8d\xe2\xb1\x8dt\xda\x8fN9\
+\xa3Q\xce\xcf\xa7\x8e\x0f\xea\x9f\xda&k[U\xac\xe1\
+\xd1b=q\xab\x11q\x06\x04\xae\xe6\x96\x1c!p\xbf\
+`\xc4 rR0\x97\xfdE>ZY\x1ck\xd6\x92\
+\xbc5\xd3\xa2\xfb\xc3\xe8\xd0D\x83\xa6\xc7\x03\xd6\x8a\xbe\
+\xc4\xd2\x90\xf9#\x13\xfe\x13\xad\xa1\xdfO\xdcO \xf3\
+\x04\x0b\xc7m\xa2oo\xbe}\xf3\xe2\x13\x81\xfb\xf3\xc1\
+y\xe8?\x1d\xe6c\x1a\xf7\xe1V\xd3w\x97\xffD\xf4\
+\xaeTj\xe2SR\xf3>\x1d\xa4\x1f\x87\xe5\x8a~\xc6\
+\x06\xcb\x93o\xcf\x08\xcbu\x9c\x19\xb9)\xd6\x95B\xb0\
+\xccs\xc9\xf9\x97\xf5\xd1>#0\xd7,\xd4\xb0\x01\xf3\
+\xe4\xdb\xf3\x01s\xa5-\xf1\x9f\xd2\x1b\xfe\x8c\xb0\x5cs\
+\xd3\xfb\x06\xcb\x93o\xcf\x08\xcbuH\xa8w\x9e\x02\xd5\
+;\x0a\x8e\xe5\xa5\xd1\xcaj\xbd\xc7\xce\x89\xdb\x8d~^\
+&nW\xd9b\xff\xe7\xa3ry\xc7\xca\xf5\x9c\xc0\xdb\
+\x08\xe6\x85\x02o%\x82\xf9\x09ykg\x84\xe5\x9a[\
+\xd47X\x9e|{FX\xae\x13D\xff\x94\x0a9\xe7\
+\x84\xe5\x8a\x01\xf0\x0d\x96'\xdf\x9e\x0f\x96+m\x7f\xf7\
+\xce5\xd8!\xb5\xc6s\xea\xf9A/\xda3\xe2n\xcd\
+\x9d\xe6\x1b\xeeN\xbe=#\xee\xd6rk\x9c\xcc\xb4\xb7\
+\xde\x5ci\xacI\xff\xdc\xae\xc7\xe7D\xe5\xe6\xb4\x5c&\
+*W\xda\xce~\xb2\x09\xe2g\xb0\xc7\xf2\x18\xecq\xcd\
+M\xe7\x1b0O\xbe=#0\xd7\xa9\xa2\xdc|ZZ\
+\x91\xd5J1\xba\xc9z\x8dB\x1f3\xf5a\xcf\xc9\x10\
+\xd7\xdc\xb7\xbdA\xef\xe4\xdb3Bo%\xc7\xe5\x18z\
+\xcf\xa7Ph\xc8i5\x90B\xefS\xa6#\xba%\xd5\
+\xc6^\xa7Z\xc6\xcf\xe9\x8f\xb0\xc2N\xec\x8f\xe3r\xf3\
+\x5c.\x13\x97+m\xf0n\xdd[\xdf\x02\xb9\xd4e\xce\
+\xb6\x90He\xce\x87e9\xd3(\xca\xd9\xa6\xa5^\xec\
+R\x92\xf3\x8c\xb0\x5cs\xb7\xf5\x06\xcb\x93o\xcf\x08\xcb\
+\xc7i,sN\xe8m\xde\xcbeBo\xa5-\xdc\xc7\
+\xad5V\xef?\xf4q\xe4m\xee\xc9\x85\x22o\x1d\x8e\
+x\xdc\xe4\xe5~7\x81s\xe6\xec\xac\xb9\xf9t\xc3\xdd\
+\xc9\xb7\xe7\xc3\xdd*;\x5cO\x9b\x0b\xfd\xfe\xa4\xed\xcf\
+QW\xa0\x93\xc6Ag\x04\xe7\x9a\x1bN7p\x9e|\
+{Fp\xae\xc4\x04?\xb9\xd3\xd59\xc1\xb9q\xc5\x8b\
+\x04gZe;\xeb\x9fO\x9b\xaa\xfd\xdejN'\x97\
+v\xa9\x90\xe8HY?_4Py\x97\xb2\x9e\x87\x0c\
+\xb3L+\x81 \xd5\xe9\xa9<qNtn|\xf2B\
+\xd1\xb9\xd6\x8eWG5H\xbf\xa3\xff\x8fk\xedA\x7f\
+\xec\xf3\xe1.\xad\xb9\x09u\xc3\xdd\xc9\xb7g\xc4\xdd\x1a\
+~\xccq\xd2\xe2I\x8f\xdfs\x22o\xf3d.\x13y\
+g\xeaG}\xd2M\xfa\x8c\xd8\xdbv\x0a^(\xf6\xd6\
+jJ\xed\xf1P\x02\xb5o\xea\xec\xe8\x01\xf5\x0b{\xf2\
+\x9c\x13\x9b\x1b\x13\xbcPl\xaeU\xd2\x1f_Y>2\
+\xcd\xca]\x22#\x87\x8c\xd9l\xeb~R\x8c\xa9\xe5)\
+\xd2\xfd\x5c\x07\x22\xeb\xd0rTr\x9fc\xa7D>;\
+\xb1\xdb95\xe7\xb6g\xf0R\xd1y\xae\xe6f\x8b\xe6\
+\xcc\x8b\xe6,\x1f\xd4\x9ciQ\x9cg\x5c\x92Ik6\
+_\xde\xa0y\xf2\xed\xf9\xa0\xb9V\x87\xe7O\xea\x85r\
+F`n\x1bZ/\x14\x98k\xf5\xde\xd5\x0d(X\xbb\
+\x8b\xc2\xa1w\x0b.\xb3\xf5\x0fq\xd9\xa7\x89\xc6z\x82\
+e))O\xa3}\xcd\xa1{\x8d\xb7\x9ex\x1a\xbc\xe2\
+\x00l\x10-\x88t1O\xd3h\x8a3z\xe2\x04\xbc\
+wJ\xa19/\xf5+=[w\xd6\xa4t\x1amv\
+F\x97\x9ds\x02|\xa3\xac\x17\x0a\xf0\xd5(k\x9d#\
+MF\xe5\xd3\xbbf\xf8nV-\xad\x80Bj\xf9Y\
+\xff\xdc\xdaB\x9bF\x93\xa8\xfd\xe8\x12uFPn\xdb\
+\x0f/\x15\x94k\xd5-\xff\xc4\xc6\xd1\xe7\xc4\xe6FU\
+/\x13\x9bk\xb5\xe0\x1d\xad\x9a\xb2\xb5j\xa2\x80\xe9\xfd\
+\xf4\xa1\xb3\xae\xf7l\xbb\x10/\x15y+U\xf8\xcb\xd1\
+\xcd\xce\xa7]\xe8\xd4\xa0\x0a\xbf\xa8\xdb\xf39q\xb9E\
+\xe4/\x13\x97+\xedC\xfc\x9b\x9b\xd7\x9d\x13\x93\x9b[\
+s\xa1\x98\x5c\xc9\xad\xa95Q\xaa\x02\xed\xe7\xe9o\xef\
+\xc5\x0cc\xce\xbb\x14\xe7Z\xcf\xb9\x06\xb4\xed@\xbcT\
+\xe4\xad\x93\x95a\xedii\x89Th\xad\xec\x1b\xb9j\
+\xd9\xa5\xd9\xbbx\xe8\x18B\x91\xb3,\xcbM\x0b\x06_\
+\xf8\xaaO\xfb\xe2\x9a\x00\xca\x91\xdaf\x7f\xce*}i\
+\xdb\x8cx\xa1\x10]\xab\xdbl\x94\x16,\xddj\x01\x08\
+\xab\xd6\xa2\x81\x162\xcdZ\xc8$\x8a\x92\xc78\x8a\xef\
+\xa6\xd9\xd5\xd1\xd8\x9e \xa5\xeb\xe7\xd4\x9c\xdbf\xc4K\
+\x85\xe5J\xfe\xcd),\xe5\xc2\x14\xe9D:eg\x19\
+\xf1\xda\xe7Zd\xc3;\xedg\x03\xc5w\x83\xbc\x1f\xef\
+\xe8\xefu\x9a\x0e\xb9*67\x1f\xe72\xb1\xb9\xcan\
+\xc5Ok\xa8tNXnn\xce\x85\xc2\xf2?C\xb3\
+\xa53\x02s\xcd\xa6\xb0\x1b0O\xbe=#0WZ\
+\xc1\xf9\xdb\x9b$\x9e\x13\x95\x9b\xe3s\x99\xa8\x5c\xab\xc7\
+\xec\xdf\xdc\x1b\xec\x8c\xa0\xdcv\xde^&(\xf3Z\xbd\
+:S\x96\xdb\xe3\xc2\xce\x07JF\x96\xc7[P\xdc6\
+.^*\xf2Vb\x8f\xa5Q$M\xfa\xb0\xeb\x0d\x5c\
+\x18\x0ewmu\x17`\x93qj\xd92\xda(C\xd5\
+\xbb\xbc\x9a$\x9b\x1di\xdb\xd0O\xb2 V\xc4e\xde\
+66^*.\xd7j\xe1YH\xf7\x0d\xbbH\xc5\x0c\
+\xeb\xa5\x18\xda\xdc\xbb\xb5\xff\xaa-L\x94\x91lR\x91\
+\x02f\xb6j\xe4dZ\xca\xb8\xcf9\x9d1K=o\
+\xdb\x1e/\x14\x97k5\xf9L\x02^p\xd2\x80\xb1\xc9\
+Rw[\xe8\x8e\xc5\xe2>\xc5c\xb83\x1f\xbc|\xed\
+V1\xe3\xact\xfb*\x7f\xfc\x8cV\xfc\xb4\x01\xed\x86\
+\xca\xe92P\xb9R\xd8<Q\xc4\x94^_\xa9Q\xcc\
+4\xd8r\x0e\xd5MIR\xef\xbeQ\x15\xba\xb6\x22_\
+;\xe6Q\x15\xba\xe5]\x11p\xcb\x19C\x93y\xdb\xa7\
+{\xa1\xb0\x5ck\x9fnjQ\xe4\x12XRx7\xd7\
+Q\x9e\xbc\x84H,\xb2\xa6J\x08\xc8u\xb68D_\
+\x88\x01QD\xc3\xeaf\xa4\x10\xabU\xd8\xb7\xc4\xf3\x1c\
+\xfa4\x96%w\xd6\x09\x9e\xb6`0Pk~\x5c\xda\
+9\x97$\xf3\xb6\xa1\xf7RA\xbcR2G\xa6\xf1C\
+\x8c\x96\x88\x9e\x5c+\x96\xcd\x11\xcb\x5c\xad\x86\xb4\xa7\xce\
+\xbe\xa0\x9a\xf1\xa3\x0a\xc6\x9e>N\xc5K\xc7&\xb6\xaf\
+q\xa4\xd4\xd9\x9f\x95\x95n{'/\x14\xa3k\xed\x9d\
+l\xd1\xcd\x9e]\xbd\x96\xc3\x11&\xdf\xac\x12\x0c\xcb\xe4\
+\xf5\xac\xc8\xdb6G^*\xf2\xd6)\x03s\x92d\xb9\
+\x97\x7f\xd4=\x09\xe9\xa9$R5\xce\x09\xbe\x8d_^\
+&\xf8V\xd9\xb8\xf8\xe7S\xb5'4\x12F\xa7\x94F\
+us\x8dg,H\x99\xb7\x0d\x8a\x97\x0a\xbe\xb5\x22\x94\
+G\x8a\xee\xae\xffvz\xd8\x80\xbb\x1f\xb5\xe0\xaeg\xef\
+\xc1\x9d\xb7\x0d\x8a\x17\x8a\xcd\xb5\x9a$\xf69[\x11\x17\
+\x12\xd1I\xe6}>e\xf6\x8bu\x16n\xbck\xa4M\
+v/`V\xf9*9M\xde'\xdbS\xab\xaf\xcb\xec\
+\xe39C\x95\xdb\x0e\xc6K\x85\xe6J}\x14c\x12\xe4\
+\xa8 \xe0\xc3\x1c\xfd\xd2\x1e\xde[\x7f\xf8d\xed\xe1\xf3\
+\xbd\xfe\xf0K\x83\xf8b\xfd\xe1]\x1e\x0d\xe2\xef\xf7\x87\
+\xb7$\x22i\xdc\xd1\x1f\xfe\x9c\xb8\xdd\xb8\xe6e\xe2v\
+\xa5\x1d\x8e\xde\xd6\xc3\x8b\xb8f\xcbs$8I\xdf\xd9\
+0\x1a\xcf\x9e\x13w[\xf8\xf1Bq\xb7N\x82\x065\
+\xcd\xad\xb0e\xd0h\xf8\xde\x0f\x8dg\xd3h<;\xfa\
+\xce&\xeb;\x1bG\xdb\xd9fmg\xcf\x19\x12\xdf\xf6\
+7^*&\xd7\xea\x9e#\xdb[\xd0\x85\xf4\x88\xef\xf5\
+\xd0u6\xffH\xd7\xd9\xbct\x9d=c\xcd\xa0\xbcm\
+j\xbcP\x5c\xae\xb2\xa9\x91`\xa4U\x1b\x00x`\x8d\
+\xbd\x0f\xb9\x05iFr\xd0K\x97V<\xa7g\xb3\xed\
+]\xbcT\xf4\xad\x94\x84Q\xb0\xd0\xc1\xda\xcc\xc6\xd9'\
+\xb6\xda$\xa10\xed\xca\x5c\xc3\x19+T\xe6mg\xe2\
+\x85\x22o\xad\x9d\x89'z\xef\xd0\xf2\xf8\xa8\xe7\xb1%\
+\xa3\xdd\xebz\xecc>{\xdf\xe3\xbcmP\xbcTt\
+\xae\xe3\xc1\x08hR\x86\xd4\x15\xf0\x9d\xd2\xd2K\xdf\xe3\
+\xd4\xdb\xc3\xd6\xc7\x91\x944\x9a\x1f\xf7\xd1\xfc\xb8\xb8G\
+h\x7f\x9c\xb7]\x8a\x97\x8a\xce\x95\x96q\x8e\x97\x0c?\
+\xba\x8c\xf3\xe8\xab8\xdbV\xc5\x0b\x85\xe6J[\x15i\
+\x13oN5!\xc7V\xca\x9d\x9b\xdd~\xcc\xcf.\x8f\
+\xe0ho\xfb\x15/\x15\x99k\xe5\x9b\xcb\xa9\xd6\x10\x90\
+\xd8\xeb\xa5#\xad\x16F\xa0(\xba\x0f;\xda\x9d\xb8\xca\
+\x96\x9c\x92\x8b\x14k\x11\xf3\x14x[\xa4\xfbId\x8f\
+c\x9e\x93?gj\xc6\xd6+\xf42\xe1Y\xd6\xdaN\
+\x1b\x9c\xbc\x1f_v\xb1@8Ag\x9b\xa9a.\x85\
+\xea;\xd9\x912\xf9\xddv\xe9\xe4,\xc5\x19\xda\xdcL\
+\xa9RC\xd5\x9f\x93mn\xdbm/\x15\x99+e\xac\
+y\xfa\xe6\x09k\xec\xf3\x8e!\x90KN\xed*\xcb\x1c\
+\xb7\x8de\xa3\x95\xde\x9ck\xea\xbb\xdc\xe7\x9e\xe4\xcd\x87\
+(bJ\xf2FI\xf4\xe8\xa1_\x94\x8bM\x17)\xc4\
+\xe13\xbe~\xe8\xbaB\x145mr\xa7\xf6\xa9\xcfI\
+\xbe\xbe\xdeU\xf8?#\x9e\xcb\xb6M\xf7R\xf1\xbc\x92\
+\xf7\xf4\x10i\xb6\xed\xcc\xcdAc\xb3\x8b\xf2\x92\xd8\xc2\
+\xe3\xd9tF\xd2F\x84 $}:\xce=^\x19\x92\
+\x9b\xd7t\x99\x90\x5cm\x87n\xd7(\xf8\x9d\xb7\x94\xa0\
+f\x09F)J\xbd\x16!/\x85D\xbb\x13\xdb\x0b\xb9\
+\xf7T\xb8t\xec%\x93\x1eM\x09B\xd0\x08\xa4\xb2]\
+\x922\x84\xc5\x12\xe8\x04W\xe9\xe9}\x17g\xa8\xe3*\
+>\x90j\xec\x93.\xe3\xa1\xc0R\xc2\xf9\x9c[\xd0\xca\
+\xb6\xbd\xf7R!\xbd\x92\xbbU\xc5g\xb3m%\xf3U\
+\x94 \xbe\xd7\xb3\xa6f\x1b}\xfd\xe6\x1eh<\x95z\
+\xb4N(\x10Z\xe3\xb3g\x05\xe6\xe6h]&0\xd7\
+\xda\xe0[\x84\xc2Z`\xa2\x05\x97\x8av\x14\xde\xac\xfc\
+^\xe8\x94\xda\xa4;4\xab\xef2\xfd\xb5O\x0b\x03\xd8\
+C\x01\xce\xb8\x1eZ\xb6-\xbb\x97\x0a\xcb\x95\x8a\x1aQ\
+\xe3\xad\xd2%\xa5\xb0\x05\xd7\xd2\xdf\x03\x15\x0f\xa8\xc4\xd1\
+B'\xb2\xda\xe4O\xedk\xa1}\xf4\xd4\xea\x1cI\xb1\
+\xf3l\x97<\xd1ik\x22s\xeb\xbf{\xa9\xc8\x5c\xab\
+\xab\x99 \x97\x84\xcc}\xaf\xe2\x9e1\x1e\x17\xb8\xee\x0f\
+\x0b\x5c\x97Q\xe0:\x1f\x0a\x5c\x9f\xd5s\xdav\x91_\
+(8\xd7\xdaE\xfe\x01p\x8e\xa6\x00i4\x05\x08\xf5\
+AW\x80\xd2\x1f\xf6\x058'6\xb7}\xe6\x97\x8a\xcd\
+\xb5V\x9c\xac\xea:\xd8\x04\xa3\xa3\x98\xb0\xd8\xa5n\xbb\
+\x93\xf5f\x81i\x1f\xd1\x9cu\x17\x80f\xa1B\x8c\x95\
+m\xdd\xa5:\xd7\xd4\xce\xb8\xdeT\xb6}\xe8\x17\x0a\xce\
+\xb5:D\xb7\x08\xcf\x148\xab\x9bK\xc94\x84\xec\xc5\
+\x08e\x99\x83/\xc7\xbakU\xecm\xbe\xce\x85bo\
+\xad\xf2\xff\x95\xf4\xe2fq\xc8z(\xfd\xe6\xe7\x90+\
+nw/D3C\x98c\xb7\xbaZ\xd5\xb3gR\x8e\
+x\xeei\xe78\xf1\x9c\xee\xceV#\xe1R\xc1\xb9\xd6\
+\xf2\x90\xebs\x0c#H\xee\xd85\x89\xd5\x96\x01\x0fi\
+\xd7\xe6\xeeS\xb0H\xbb~\xb5\x8bmv\x89\x94&\x22\
+\xef\xd9\xefX\xca\xcc\xf5\x9cV{+\x92p\xa1\xe0\x5c\
+\xab\x8b\xf3\x074'\xb5\xaf\x8b7_\xbc\xb5<U\xb6\
+\xfa&2\x98\xa4\xae#\x99\x9f]\xbe\x8f'\x85\xbe\x9e\
+3+\xb9lU\x12.\x15\x9bk\xad\xf8\xc8\x8b\x09>\
+\xef|#\xa93\x8cUL\xf6\x16\x958v\xfa\x06\xda\
+V\xb0\x22D\x09\xa4\xcaV\xb7\x22?\xc7[\xf3H\x16\
+:i\xa9\x92\xc2X5J\xc2k\xe9\xfa\x89|\xa7\x80\
+\x0fU\xacePe\x113\xe0\xc7[\xddX\x17\xce\xd9\
+\xe3\xa2l\x05\x14.\x14\xd2k\xb5\x88\xeeQ\xd0\xa5\x18\
+R\xa4tk\xa6^\xd2\xbe\xc6\xb9\xb9\x88\xcb\xdez\x8d\
+,j\xe6\xb9\xc6\xb8\xf3\xa1\xea\x0b\xb6\xd0U6\xb3\xeb\
+\x17\xa1\x8b\x0f\xb8<\xc5\xa4\xa1\x0c\xd2\xd0\xc1\x1aK[\
+k\xa1<R\xa3r\xab\x93\xef\xd9\x5c/\x1f;\x85a\
+\xcf\x89\xe7\xcd\xf1\xbaP<\xaf\xe4x5\xb8m,\xbb\
+HH\xb4\xb3o$\xfb9\xc3'|\x9dc\x0bSK\
+\xa2\x0d\xfa(\xda\xe0k\xa3\x93\xc6\xd8\x1d*u\xdc\xcf\
+\xd9\x7f\xbal\xf5\x19.\x15\x9a+\xb9]\xbe\x93\xa0\x1f\
+wQ\xbe\xd6\xa8\xcfp\x9f=\xa4\x13\xf6\xb0\x90\x87p\
+ \x0f\xc7\xd4\xe1\x01s\xc8\xce\xda\xb5\xc1\x1c\xeaB\x1c\
+\xce\xb8\x0b\xaalE\x1d.\x14\xccku\xaaNNz\
+\x94\xbd\xa2.\xce1\xf4;\xda\x90\x06mh\x0bk\x90\
+\xe2\x1d\xac!/\xa4!-\xa4\xc1\x0f\xce\x90\x16\xce\x90\
+\x07g\xc0\xcb3\xceP\x16\xceP\x1e\x813l%\x22\
+.\x15\xcb+\xb9u\x81\x04\xd3\xc0\x9aT\x98\x9b\xb5\x10\
+~\xc0\x19\xe2C\xce\xd0\x07gx\x0c\xca\xb0\x95\x90\xb8\
+Pd\xaeTB\xa25\xf6BQ\xc6\x9bt\x94\x90&\
+\xe9H\x94.\x9a\xf1\xac\x1aq\xf3\xa2.\x14w\xebl\
+\x88\xea]\x8c\xb4R\x1c\xa2\xce\xdeu?u\xd9nZ\
+_\xd2E\xe3\x9c\xbb\xeb\xcbV\xf8\xe1R\x91\xb7R_\
+\x17\xfa\xa6\xfb\xd6v\x89\x04\x11\xf6\x85\xb8\xb9:\xefj\
+\xd9\xa5HW\xa1s\xc6\xf7\xb7\xd2\x0e\x17\x0a\xbe\xb5\xba\
+P{\xe9\xbd\x80\x07.\x0f\xdd\x09\x81\xe4\xc6W\xdfl\
+O\xb2;k\x96\xe7V\xbb\xe1R\xa1\xb7\x92\x0fr\xdc\
+Y\xf5\xf1\x90\xb7\xf9\x18\x17\x89\xbc\xbaRY\x86\x93\xae\
+\x04{s2pw\xcf\xedflu\x17.\x15z\xeb\
+,\xd6\x9c\x94R\x1a\xc8;\xbb\x7f[\xb7\x02\x09\x97\x0a\
+\xbc\xb52\xe0\x8e\xf3\xd6\x1f\x9a\xdb3&\xb8\xd5\xad\x12\
+\xc2\x85bo\xadJ\x08\xc7+\xd4!\xf7\x19kK\xab\
+\xd2s6\xf9\xa9[\xc1\x82KE\xdeJ>\xc6I\xae\
+\xcfC\xe8\x9d1\xe7\xfct\xff\xee\x86\xbd\xe9\x22\xb0\xb7\
+JM\x82?\x9f\xae\xb1\xed\x83\x9bs\x8ay\x17\xads\
+\xcf\x19\x0b\x0f\xd4\xad\xf0\xc0\xa5bo\xa5\xf2n\xc7\xb9\
+\x0a\xb6rK\xe2\x8c\xcfs\xed\xe7\xac\xc9Z?\xb1\xb4\
+\xc0\xf1\x1b}\xe0\xec\xffr\x7f\x8e>s\x94\x9e\x8dG\
+\xb9\xf8\xa6\xfdC\x15\xb5\xf5.\xe4]\xa2\xd9\x9b\xfc,\
+\x0a\xd2'\x1aRw\xdbI\xeck\x08u\xa2\x0a\x88\xf7\
+V\x951&\xd1\xe4\xa9\xcd\xd9g\x0a\x85\xfb0'q\
+\xe36Q\xc3\xbe\xd6hGr\xf29\xe87\xb1\xb7N\
+E\x91L\x13$\x17\xa7\xaa{\xc5\xca\x16\x137\xd7\xe4\
+\xd8\x08\xea\xe7\xee3\x15\x9e\x82\x17\x183)\x22\xb2>\
+1V\x0cR\x9f\x8b\xae\xe9-\xf8\x90\x92\xe6d\xb7\xcf\
+P\xf4fet\xe8\xe0\xd0m\xc9]\x13X\xa8M\xce\
+\x9d\x9c\x8b.\xd8\xe5rl1\xd9V\xd3\x9295\xf0\
+3\xddl\xba\xa6+]\xd6\x0b6j\x9f\x94^j\x9a\
+\xd8\xca\x222\x07\xd9\xb7&\xc9b\xff\x1f:$\x0b\xe9\
+t\x9ac\xcd\xc1\xb3\xb15V=\xb6\x0b\x95vw\xfa\
+u\x98J\x9d\x9bT\x99\x0e\xa49\xe9\xcae*\x9e\x14\
+\xc3\x18v\xbd\xcd)ca\xf7\xd4\xf9\x0f\xc1\xaa\xfed\
+\x86\x84z\xc0\xba\x95\xeb\xbbP(\x0e\xc4s{\xfe\x92\
+\xf7!Y(rqx\xea\xc8\xde\x07MC$\xe1\x0b\
+uI\xeaW\xb0t\x1a\xbaW\xc8a\xb6M;z\xcf\
+\xbe\xd3c\xd4\xa0G\xe67\xa5j@\xed7\xae\xc6\x91\
+l\xde\xb2\xefq\x1cr\xb9\xb0\xa0\xe2k\xa3 \xb1\x14\
+\xb2\xab\x93\xd7\xd9=\xd0\xcaj\x0e\xad\xe9\x01\x93n\xa9\
+\xbf\x08\xff\xb8*\xbcL\xffq\x22\x9a\xc0\xd2\xfb\x10>\
+\xa6\x81\xde>\x7fv}\xf5\x1b\xdb\x9f\xd1Ds\x7f\xfb\
+\x10\xe1k\x82\x9a-\x9e\xce%\x81:%\xca-V2\
+>\xf7 4R\x08\xd7\xf3\x08\x06>\x09|\x0c\xa1\x80\
+k\x9f}\xaaf\x80\xaa\xa3\x9a\x185\x9bz\x0f\x03*\
+\xa4$Q\xf31RT\x1c\xbc\x09\xfbq\xa0_3\x9c\
+8V\xe7\x12C\xb1\xc2d\xeca&\x1dz\xf6>\xf9\
+q\xa9\x5cKkv\xa6\xf0IlC\x88j\x9dR{\
+z\x86T=\xa16AIt\xab\xf23]+\x22\x14\
+\x12!=\x8c5X\xec\x028b\x12\x903\xf6\x10\x80\
+\xc1dq\x12\x1a;5\xdd1rM\x138\xdd\xa6\x17\
+\x81\xd1\xb38\x96\x05=\xa4 6!\x96\xfc*c{\
+Bw.=\xf5)\x1b\x04\xd8\x01;\x87T\x5c\x9b\xf4\
+\x90B0e\xd8\x1c\x99,\xc4\x02k\xc0(\xeb\x8e\x1a\
+\xcc4u\x1d&\xf3\x9b\xd84\xabqzc\x1d\xb6}\
+b\x1a\x81.\x06\xa9\xc1\xa8\x1d|Uv\x8a\xe9\xd1<\
+\x0bx\x99~g\x96\x94\xa8\x11\xd3\x8b\xe4\xa6\xbfv\xd1\
+2\xbcz\xa5\x94{\x93h\xc7]\xd6W\x99b\x99\x98\
+\xa9\x9a\xfc\xaeKo\x88\x8a\xdaV]\x9f\xd2\x8e\x94H\
+=\x22c a\xe9\x9ek\x84D\xb3\xd4=MR[\
+\x094\x99L\xde;o\xbd\xffR\xa3?A\xb3\xfcJ\
+\xd3\x16Q\xdfq\x95\xa2\xb9+\xf4\xa5t\x9d\xed\xe7\x8d\
+y\xaa\xd9dO\xea.X\xd3\x83\xa8\xc9a_\xa6f\
+'\x17*u1\xe7\xb6#C#'y.\x1a\x97\xe0\
+\xd0R\x92\xe1\xe6\xfc\x22CCCI\xa1E\x1bZ\x17\
+\x8a\x8f\x1f\x17\x9a\xf4\xab\x0b\x8dt\xae\xbe\xd30\xecR\
+\xaf\xe2\xff\xfa\xd1\xb2=\xb5\xc4Dz):\xcb\xb0H\
+\xa1\xa8,A0x\xe6\x10\xcbR/\xd2\x03\x19\xb0\xd0\
+\x92\x14\x11\xe3\x1e\xd9\x0e`\x8d\xee\x02jg\xd4JE\
+\xebj\x0e\xba\x8f\x8b\x08\xea\x9e\xa3)=\x15T\xedw\
+l,\xc8\xd8\x096\xbf\x96@\xf8\x99Q\xf7]\xe2e\
+\xf5\xff4i\xba\xaa\x81r\xdf\x1a\x85\x83}\x97\xbd\xd1\
+\x03\xe6\xcc\x0d\x85\x80&\xe0\x0aP\x22;\xcd$\xb0e\
+\xa7\xeb\x04{\x18\xdb\xef\xadCA\xd7!\xd4\xd3\x82\xe6\
+P3\x17tU=\x8b\xc4\xdf\xf13\xcd\xb1g\x87c\
+\x95Z\xd6\xb55B\x93\xd4\x83\x1e\xb1\xd4\x1d\x1d%\x05\
+\x16\xf4\xbffF\xd8\xa1\xb0k\x10v\x92\xa0#\x8d#\
+\xfdO\xd9X\x8fxD\x9d,\xe9e\xdf\xa4\x97\x11\xf3\
+\x93\xddZP\xaa\x95\x07\xf4\xdd\xd0\xa5\xb3%1M\xcf\
+\xd3$\xbc\xa0K\xe6\x83J\xb2$:\x86\x01\x5c\xbd\xb9\
+^Y\x02#-R\xac\x92\x9c\x93\x22bw\xb0\x06=\
+\xfd\x08\xbe\xca\xaf\x8f\xaf\xaa\xa13qI\xec\x93\xf2\xb1\
+\xc34\xa8\x95g3]4\xe5\xddK\xf9\xd8\x00\x9bf\
+-\x96\xf0\x19i\xdaY\xb2Yt\xd9U\x8d\xa7LQ\
+wu\x98ei\xc7\x84Y\x96\x81\x8c\x12<a\xb8I\
+\x06\xd9\xd4\x1fz[*>\xb6\xd1\x866x\xea\xee\x02\
+\xd0\x96+&\x17\xe8I\xcf\xea,\x8dy\x0f\x94\xa1\x08\
+\xcdT\x82\xb7\x1c\x17\x97\x9di{]+S\x81J\xda\
+!\x848\x9c\x94\xa2\xff\xb2\xe1XO\x8bPDk\x81\
+ku\xff\x12\x85\xaady\xaf\xa9\xbd^S\xa4\x1d\x85\
+\x83%\xe9j\xa3V\xa5\xd5\xaf\xe4;\xd9\xd1\xe3#\xd2\
+\xc8\x09\xd7G\x08\xb2\x93\xac|\x06\x0dM\x93\xcc\x05S\
+/\x94T\xba\xb2D\xf1\xb6N^\xad,\x8bp\x9c\xe5\
+\xadgv@f\xa3\x02RY\xfa\xb7\xf2D\x0c%u\
+15\x04\x19\xab\xa5\x11\x08\x09\x0a\x05\xdd5\x5cJi\
+6J\xc2\xee\xad\xa4&e\xdfe\x0e\x97<\x0b\xddO\
+VM/Zu;F\x8d\x89b\xdbO\xa7 \xa7\xed\
+P\xd7\x18t\xc9\x1d\xaaB\x94#\xd9\x90y8\xe0N\
+\xcf]\xbaku\xb0\x99j\xba\xbb\x93,d\xc6\x90F\
+2\x1d\x80'q\x8f\xba\xc8x\xf4p\xa9X4\xe7\x1a\
+\xbfD\xb6\xaf\xb3B\xf52-\xb9\x1b\xbbI\xa1\xe9G\
+U*\xa41\xf4\x09;D\x8de\xd8\x8cn\x12\xedP\
+\x97\xc9\xa8\xcb\xa1h\xe6\xd23\xa6\xba\xe9\xd5^29\
+\x17\xf18k\x82\xd83\xfb\xed\xa4\x90bC\xbf\xe8\x84\
+$x}\x5c\x94\xda\xaf.J\x99\x9ee\xe2&]\xa2\
+\x04\xd9\xe8q\xd0\x1b\xe7\x0d\xba\x8e*@\xa4V\x0b\xa7\
+R\x83P\xb6\xe6)\xafzw\xa0\xc2\xf1\x84dg&\
+>HKc|\xc5p\xc9*l\x8c\xa6\xc65\xc2\xa0\
+S\xb5\xaeS-\xb8\xe0M6]\xa5!\xb4F\xd1A\
+.5-0\xca2\xdaZ\xc0A\xf4h9\xd74\x9a\
+Y%\x19=\xaa\x0c\x96\xe4\xa0\x1c\xfa\xab\xb2Q\x9c\xd3\
+j\xb1\xbd\x8cl0\xd7%\xa3\x1d\x0a\x98\x012|r\
+\xa2\x8c+*\x19\xfd\x8ei)\xf6Y,6\xdbe\x84\
+\xa9`\xac(U\xa3o\xb0/Q\x07\xb3:\xb5'^\
+#\xd2\xed\xd7/B\x1d\xa4\xcb\xb1\x1d\xb2\xc3\xcd\x0cV\
+6\xdf\xcf<\x1a\xbd\xafl\xcc(\xe5]\xa81K\xb7\
+\x18\x09\xadUD\xa6&\x883s\x01[\x81vA\xa0\
+\xc4\x97d&Q\x0b\x05\xd3$-D\xb3\x041\xc7l\
+8\xd6x\xb13\x19= \xf3oj:\x0b\xb1A\x90\
+\x95\xf7\x10M3\xf0\xc4\x09:Q\xa0\x06i\xbc^7\
+E\x87\xdb\x91\x8bQVO\xae\xbc\xb98\x98It\x8f\
+h\x1c\xae\x98\xb1>\x89V\x18\xd3,\xa3\x9a\x83)2\
+\xb1\xa1\x94\x86(\xd5dmqB'W\x0f\x0b#\xd3\
+\xd6\xacv\xb9\xe8V\x1a\xaf\x22oN\xaa\xc7\x96x\xb1\
+\xbcz\xf1,\xf5\xbc\xa3B\xa4&\x8f\x03EL\x0bf\
+\xa4!G\x22%'\x8d\x84|\x9d[\xe5B\xd9\xbb0\
+1}\xe8\x22o\x9a\x86\xe2\x15\x85=)\x09\x9e\xb6\xa0\
+3$\xb9*\xa2rIf\xd3\xb6\x0f\xea\x1e\xde6\x06\
+\xc8\x03\xcfCk\xc8=\x13\x01\xc1\xe3\xe9n\x08\xadc\
+C\xa1\x14\xbf\xec\xf8\xb8\x11\xedt\xc1X\xaf\xc9\x1eO\
+\xca$\xee0(\x22\xdb\xd6d\xa5S\xc5\xd2^\xdb\x0d\
+\xbd\xa3\xa9\xd4\xb0J\x13\xc8\xe3c\xa0\x03M/\x98g\
+O2\x99\x01\x09\x15&\xad\xa2)\xd4K:\x83\x91$\
+\xc8\xa1.\xa4\xdb\xc2`\xeez\x95F\xf7^\xef0\xfc\
+\xa6\xe4\x12\xe4\x93\xa7\xcc0M\xf6\x9a\xc7\x00\xe5\xe14\
+)5\xd3Vz\xc2\xe1JKo\xcbD\x0f\xab\xe0\xac\
+\x86\xf1`\xbe\xc6\x8e\xa5\xe4 F\xa4\x94G\xbc8(\
+\x98\x8fV\x8eSJ[\x12\xee\x93\x8d\xdc\xfb\xdf\x98\xef\
+\x18h\x95\xb0\x1c\xb0*\xde\xd2i\x0e\x91\xabe\x9c\xeb\
+(\xa3\xacA\x90 w;W\xfaTf\xf6\xc0\xd8\xf7\
+&\x07Ev\x97\x9c\xf6\xd4\x173$\xb0R\x0fTt\
+\xaa\x0d!\x95\xee\xd4\xa4E\xb3q\x15\x8d\xa0\xb9\xecf\
+\x8ak,\xc3\xe8\x09\xda:KGR5\x1f\xa4C\xa1\
+\xfd0*&\xa3R\x11\x95m\xa2\x8e\x0d!\xfc\xc2Q\
+\x88\x07f\x833\x94-\x04\x8d:6\x19\xaa\xd8f\xd0\
+JA\xfd\xea\xe2\x18KYp\xc6$1_%\x8e\xbd\
+O\xf2Ny\xb3\x0c+\xad\xd8\x15\xcdj\xb4\x1b\xdc\xb9\
+\xc9\x1a\x0f\xc1\xb0\x1b\xf6\x13\xcfgB\xa3\x91\x18\x0dy\
+l\xd8\x10\xad \xc57\xe6\x93m\xdbz\xe0\xd0\xcc\xf8\
+\xcc\x01\xbbd'\x89L8\xca\xa4\x07\x9bqy\x07\xc5\
+u\xba8\xcbG\xe0\xb2\x9ew\x12\x83\xd8aw\xd2\xe2\
+P\x0a@\x0e\xe7\xc8iXM=\xa4\xcc\xa0\xe9%r\
+1\x8cb\xcc\xab\xc5\x10jl\xc6\x80a\x95!\xf7\xf7\
+G\xa8 ,\x06\xaa\xc9%BZ-\x14\x120\xf0\x1d\
+\xb7\x08\xd5\x14\xed\x88\xee\x9d8\xe2%\xfd\x91W\xf1-\
+\xeb@\xa5Y\x9b\x0c\x86l\xbf\xd4\xb5$\x85M\x0b\x9a\
+\xcclv\x5c|\xcaf\xae\x12\xae\xd1\xbb\x88\x01Oh\
+\x90,R\xb9#\xfc@\x5cF\xa7\x8at\xd6\xb2c\x9c\
+Z\xad\x98\x03\x11q1\x0e\x99\x93\x88\x93G\x08'B\
+G\xf5S\xa9\xf0\x96\xa6@\xd3\x83&\xd0FFHg\
+M\x01\xaa%\xcf\x5cs)l\x82 A+0\xa0\xbd\
+\x88\xb2\xb3\xf6/\x96w\xf79X\x0c\x84\xd7\x8e\x16 \
+\x09\x16\xb1\xd1M\x088Eo\x1b\xe32q+L\x88\
+\x99'\x12\x925|!aC\x02\x11\x17\x02-\xb0G\
+={\x8d\xf0sa\xae\x0es\x14D<D\x9dt\x01\
+\xd9\xb7\x1d\x0eH\x0a&j(\xab\x06\xa3\x91'A8\
+\xc4*\x9e@1\xc4\xb2\xbc\xf4\xd6\xc4V\x90$?3\
+\x80\x0d\x8b\x0c\xc9]\x14\xe8*|#\xf0trO\xa4\
+\x13\xa9l\xde\xf1\xbb%\xf3\xd14U\xed2\xa6\xbag\
+\xd1\xd8i,\xbb\xde\x82X\x99\xe0s\xf7\x89&\x13\xc5\
+$Y\x13\xda-\x86\xe0x|\xe3\x86]o\x1b\xad^\
+P\xd2\x03 \xebI\x0e\xbc\x1f\xe6U\xd7l89)\
+P\xfd\xc2\xac\x8c.\x90\xe9\xf8\x93\x06\xb8q\xaed\x06\
+\x9a\x0d\xad3\x96)Gl\xec\x22\x90\x1e\x96\xda`8\
+\xe0\x14\x9cS+\x0d\xcb10\x22t\xd2]\x84\xbbJ\
+u\x80@_\x95\x118\x92\xc9H\xbbd\x86\xdfY\x04\
+\x8ac\xd2\xba;\xd1\xb7\x84\x0fd\xc1\x0a\x94\xe5.[\
+\x87A\x93\x0b\xfc&\x19-+\xf5n\x0d\xb2d|\x84\
+\xe6\x04\xd7\x137X\x22\x81\xd2x2,\x8dv\x1b&\
+\xc9\x02T\x13Y\xdd\xe9A\xba(\xff\xf0\xb2\x05P\x9a\
+\xacc\xbf\xa5\xa2\xcd\xd6yM\xa8]\x0a\xea2J\xd5\
+\x04\x0bs\x98\x1e\x95\xaa\xfb(\xc1;\xca?\xfaU\x08\
+^\xc1\x1d\xe45\x13eo}\xce\xe6\x04\x08:\x85p\
+\xa4\x05\x9dDv$\x01\xc2X\xc5y\x12\xe1\xabx\xaf\
+\xd2r\xd1\xda\x84v\xbc\x1e\xfc\xa30\xbc+'\x85]\
+\x04\xb3\x1a<5~40\x11\xaa\x8f\xd0\x14\xcd\xff\x08\
+\x1a%G\xf4\xc3\x8c!j\x96\x01\x0d8$P\xeeb\
+\xbc\x0f\x96&\xa1\x99\xcc\x7f'\xb2!\xfaD\x13\xd3k\
+v\xad\x22\xf3\xb6\xcb\xd4'lo\xa4\x1a\x80\x91Eg\
+:\xe89QE\xa1\x070g9\x15}*\xc5\x8a]\
+\x04s\xfe\x09\xe1J\xae\x92\xb9:\xc6S\x1a5\x01E\
+2]\xc2'&1\x83u\x81\x0cY\xf0T\x7fq\x89\
+\xc2Y4\xa8\xcc\x8c\x90Up+m\xd9\xe9\x8aG`\
+\xfe\xbb&\xdb\xcakE\xa2w\xf4_\x91R3\xafC\
+\xc4\x8aw\x13\x90\xaa\x81GJZZ\x84\xe2\xec\xd5\x18\
+\x84\x1e\xac\x99\xda\xab\x04\x1cp\xf0%.\x928=k\
+\xc8\x94,N\xb6p\x10\xcc\x99`c\x84\xae$\xaa\x9a\
+'c6\xcdbP\xc4CiQ  \xc3\xd7\xd1,\
+\xd2\xeb\x16\xa7\x92\xd2\xc5\x1d\xc2/\xc5\x94\xb0\xef\x11\xc3\
+\x81\xb1)\x83\xc9&\xbf\x84O\xf4V\x16n\xd2$\xe0\
+\xb3\x10:#H9,\x87\x9e\x1e\xd2HD\x9e\xeb\xc8\
+\x99c\xae\xa2YI\xfd\xca\xea6A\xa1\xcd7E\xfb\
+7\xe3IN:\xcf\x8e\x88\x1c\x0d\xdf+G\xa3 \xd0\
+~_\xed7D9Q\x10\x8eV\xa0\xfbfeE!\
+I2\x8bf\xec\x88\xce\x10_A\xf1T\xe8W\xb0h\
+\x09\x11\xb1.Wy\xa2\x03Ch\x9d \x9f\x83\x0c\xf3\
+\x13vnz\xd9\xab\xbe+t\xc0\xc9\xc1\xd8\xb0QQ\
+tM1\x7f?\x18M\x90\xbe\xd4\xebZ\x8dH)\xdb\
+\xa1X\xe4\x19wk\xc9\xe35K\xe6\xa0\xe2\xf5\x8e\xed\
+\xa5\xc5\xae/\xc5$\x9f\x95;\xb6jK\x0c\xc4\x04\x18\
+jBS(-{p\x87:\xc5\xf3\x85\xe34#\x17\
+\x99\xf8\xa4\x06\xcd\x11.g\xd0<\xb4Z\x96J\x96\xcc\
+\x8c\xb2\xee\xd5\xd8\x9aM\xc8?\xa0\xc3\xcc\x13\x91\x99z\
+\x7f\xc4\xfaW\xf8\x06\x07\xa3,k7\x92\xa7o\xbc\xb9\
+\xe3\xa2\x15V\x8e\xb5C\x05?\xa6\x80\xc2Q\x0a\xe7\xaf\
+\xa2\x802Ug\xe4\xbd\xc8p\xb3\xe4\xa3\x09\xb0\x8e\x86\
+\xfa;\x1b\xd3`\xf7\xad\x1fjUPG\xe7`M\x1d\
+d\x96\x90\x0b\x0av\xe4M\xc9\xf1\x0ae\xac]tS\
+\x0f\x90e\xe2f3z\xa4\x8e\xee\x88n\xb4\xf2\xc4\x1c\
+\xe3\xe0\x11\xd9nD\xe6\x5c4.\xed|)\x15B\x12\
+\x84?; e\x06\x93\x96\x9e\x0b\xae\xc7qQ!\xc4\
+\x9a\x84\x88\x1d\x98\xbb\xe2\x13\xcf\xacI\x87\x89hb\x05\
+\x10\x09\x1e\xab\x5c\xb2\xe9\xe3':\x97\x03\x15*2\x0e\
+\x04BG\xf2\x93\xcc[\x9c\x13\xa1\x02z\xe2\xd5\xdd\x08\
+\xfa\x10$\xf2\xb1\xda\x8cF\xdbq\xdf\xa5\x9c+l\x8a\
+\x85\xaahk]\x92p\xf8:\xd1\xbeh\xae\x1a\x94C\
+\x0aU\x8a\x82u\xaf\xee\xdd\xd0Z\xae\x13\x91\xc4\x95\xcf\
+\xa6\x13u\x05\xd93\xd6\xc8r0\x8f\x93\x7f\xcd\x7f\x96\
+F\xf0\xf6\xe2b\x1a\x91X\x85\xd4\xa9\xd5\x04t\x182\
+dY\xf4yg\x96XwfA\x01\xa9\x15\x7ft&\
+G\x92\xe7\xf1\xb54\xfepv\x12F\xc0\xd9:]G\
+\xb1\xd4\xde\x01-\xe1~o1t\xf1J\xae\x9f\xba\xc9\
+K\xae\x88q+\x88\x90\xaem>-\xc5\x84E\xc2\x13\
+\xd5\xaf\x05\x0a\xdb\xca\x8dd\x13\x09\xc2\xc3\xf2\xc1$-\
+!F\x98\x81d\x9c\xb0\xe7q,Fh4\xc7dp\
+\x07\x8b\xe8\xc9F\xc1\xfc>(\x80<\x0dsX\xa4\xfd\
+\xf0\xfd\x22e\x10\xa4_\xc1\x9eT\xf9Gc\x9d\xe1(\
+\x8d\xf3W\x89uf\xac\x07\xc2\x1e\x09\xd5D?tW\
+\xf7\x8b\xf5C[\x0eo[\x9a\xcebNr]\xc6\x8a\
+B\x16\xf6\xcc\xc1\xb2\xa8\x0c\xff\x8aEb\x8b;\x1a\x9b\
+\xf5(\xb3\xd3pd\xbc%\xcc>Wjc\x19sD\
+@\x8by\xac\xc1\xc2}v\xbf8\xbcr\xc6\xb2\x16\x8b\
+F\xca\xc7Jftx\x02\x13 I\xe7\xa0s\xf0t\
+k\x0aa\x7f\x882$b6fA\x8dd\x108o\
+\xbd\x96aSE\xc6p\x0b\x1b\x90\xc5\xd1\x93N\xb6\xb6\
+\x12A\xde\x07^\x97\xc5p\xb3E\x80\x0a\x11\x91J\x13\
+\x1f\x0b\xc7C\xcbm\xd1\xb4\x13U\x0f\x82\x08\xcbq\x01\
+\xc0\x89\xbf\xe9\x0d\xf5\xa4\x04\x0be\x96X\xb2M\xac\xf6\
+\x0a\x2280\x86@\xd3\xe1\x89\xe8\x80\xecD\x1d\xb54\
+\x19\x05\xb94\xc4\xf4l\xe9S\xa6\x90\xd2\x1a\xa2E\x19\
+me\xcb}\x22\xedw\x07\x1c\x06Z\x04\xc9\xd9\xf4$\
+\x1b\x1aX\xa9\xc59\xf5\xec\xb1\x9b\xcd\x14q\xec\x1f\xc7\
+[\xfe\xd5\xf1F3\xb9@\x0f\xa4\xe8\xa4,$\x94\x8b\
+\xb1\x14\x91\x086\xb9\x11\x9d7\xd6\x8f\x87\xe2\xb2\xb2\xcb\
+\xc5\xe2%\xd5\xf5\xb1\x92\xe3\x88jH\xb1\xcb\xe8fs\
+\xd7\xa5\xa1\xdd\x92\xf9\x9f\xac\x1c\x0e\xe1\xb0\xc5\xa6f\x0c\
+\x9d\xc5\xd9\xf0\xc0S\x19\xcb_\xb2\x85\x16>\x93\xae\xe0\
+~,\x1cb\x8b\xf7\xf8\x96\xbd\x8cnw\x12\x876\xc2\
+\x0c\xa2\x90m\xb8\xbf\xddnI\xe0\xa1@\x1b\xc8\xbbu\
+\xe3\xb1Dn\x98\xa8{G:\xeal\x84.%\x07,\
+6Zx\x8d\x08}\x97 \x89\x9a\xe1\xf7\x91r\xa0\xbf\
+-\x977v\xa2\xddz\x06?\xea\xa6\x10\xd3cm\xa7\
+H#ZD,\x10:\xa5\xda\xc4\xdd\x11\x98\x9b\x15\x07\
+\xc6=b\xd1j\x84\xab\xa5\x05\x89\x11\x09n}\x84\xc2\
+\x12\xd1\x01\x8dH4@\x86\x16L\x8d\x8ai\xe6\x11\xe2\
+b\xbd\x07\x92\x97]7u\xc8\x1a\x82^\xc8\xfa\xac\x15\
++\xcd\x22U\xa9A*\xa8\xd1\x94\x0b\xfa1P\xc3P\
+NK\xd8\xb5F\xa8\x8eKqLc\xe4\xecX\xd3\x09\
+q\xc4\xe6\x8b\xe3~\xf6\xef\x88\xdew\x96ie`Y\
+d\x22t\xc8\xc7&y\x0d\x13\xdci\xf1\xf7\xfc\xb2:\
+&\xd9#\xf3C\xcf$w\x13K(\xd3TqJ\x05\
+!\xdd\x81\xd6D\x8dm\x97\x95\x01Nc\xf1\xd8W\x9d\
+\xd2\x89\xa8\x8a6%\x8cJ\x09\xe6\xe6va\xb3\xe3;\
+\xf3:\x90a\x07\x05\x0c\xd6\xe8\x18_\xba\x01_)\x1d\
+#\xdc\x842\x22M\x14\xe5o\x5c\xcb\xf27?\x22\xa6\
+\x01\x18\x9a 7\xd6\x8f#\xd9a\xe5\xa0>%\xff\x84\
+'\x04-h\x86\x86[\xbf.;\xdc\x0c\xd3\x8b\x1a\x17\
+\xbd\xf8\x8e\x15\xbb%:\x1cY<\xb4\xd2\xb9\xb9\xd9\x0c\
+zs\x878P\x88\x02\x07f\xd0\xe5\xc3\x82\xedG%\
+\xbc\xfe\xfa\x12\xde:\x8b\xcd\xd0\xd1\xcc\x1a\x95\xb7\xa8*\
+\xa4\x9a\x5c\x05\x96\xc3\x83\xe6\x07\x9b\x9f-DN*'\
+\xd1\x0eMv-\x18\x1d\x82gD\xec\x01gE)\x98\
+RfI\x0a\xbeS\xebX\x19\xf3\x04\xae\x91\x94F\xd0\
+\x86,\x85\xe6\xf0\xc4q=\x87s\x87\x8ck\xa8:\xc1\
+!o\x86\xaa\x87b~V*\x16\xe6#9\x80\x80\xb3\
+\xa5\xcc\x0f6\xe7X\x05\x85\x5c\x10\x80\xb0\x070\xf4f\
+O\xb8\x09\xd93\xcdc\x05b,\x14\x84\x14Y$_\
+\xc3jK\xf0\x02!3\x8e\xa8\x10\xb9\xb1\xa6\xc4\x16%\
+d\xde\x00\xb0\xb02\x04B\x9c5\x8f\xac\x96\x16\xfc\xb0\
+f\x84\x02!o]\xa8\x1b\xd1\xea\x14,\xfa\x8bwK\
+\xe8\x06U\xef\xc4bM\x92e\xf3\x16\xb4A\x0fwF\
+\xf9\xb9\x13I\x03\xb5\x11#J\xf2X\x877\xe6\xcd\x09\
+d\xd0b\x1a\x14W~b\xaf\x04\xf6B\xec\x1fM\x91\
+\x09\xee\xd7\x8f0\x88\x7f\xd9\xb4kh2NL\x8c#\
+uHO^\xa2e0\x10\xdd\x19\xca9\x17\x8b\x0f$\
+&\xb6\xd6\xb1l0\xc8\x99)\x0a\x8b\xc1\x14S\xd4\xc1\
+\x96\xcf:K\xbb\xfbhA#\x1cXxp^\x8e\xe8\
+aFZ\x8bXt\x05\xbf\x16\xc1\xe3\xa7\xa4\x84\x94\x02\
+\xed!\x82\xd7-\x1f\x89u\xa9\x1a\x88W\xc1\x90;:\
+\x06jC\xc4\xb2v\xd3\xdb\xe8%\xe2\x8e.\x22\xfa\xe8\
+\xe8\x06\x9f$%\xc6Q\x9c\x85\xc2WE\xdc\x94*\xb1\
+z\x1aT\x8c\x94\xa2^\x8c<\x1a2\x10\xac\x05\xb6<\
+\xb6\x8a\xb6\x93\x9f!-\xa4\x93\x85\xf9@\xacMj\x11\
+<Y\xfb\xb6D\x86\x81\xa0]-\xff$\xb1l=\xe1\
+\xf1\x07[\xd3\xacR\xa5\x0b\xaa1\xa8\x04O\xa1\xeaX\
+Z\xb9\xd5\x9d\x15\x95L\xbc\x05\xafZ:\x96@a\xe8\
+\xc1\x82U\xe2/\x22\xbb@M\x12b\xa1\x81\x94S\xb2\
+I@\xfbZ\xf8 K\x09\xd9J\x1e\xf6\xc4\x84\xa5\xb2\
+87\xb2&\x06\x9bd\x855\xdb\x8aYd\xc1\x0e\xf5\
+lf\x93\xdc\x94Q\x1c\xac\x06\x92\x8bl\xf5\x17\xcb(\
+\xb9\xea\xdd\xea\x83\x11\x16j#\xc7\xa3\xb6\x8cH\x10B\
+\xd4X\xefl\x1d}\x84\xeb\x22\xd1A\xac\x89'L\xc2\
+\x05a\x17\x1d\xd9\xd2h\xa5l\x85\xc701\x91\xb8\x1f\
+\x0a]BB\xd8\x92\x0c\x980(\x17?\x22-.\xe8\
+}\x09\x0e:\xd6\xa9iabn\xe2\x8e6\x8d\x98\xb0\
+\x91\xa1G\x5c\x91\x00k,M#\xf91a\xf2\xff\x09\
+\xbc\xe5N\xe8\xd2\x22\xc8\xae\x13z\xedy\xb0Q\x88\xa9\
+\xc1\xbbXr\x09&\xcb\xa7j\x14D\xa6\xbc\xd8\xb0\xea\
+\x8f\xd8G\xb9\xf78\xd6B\x04v\x9b\x0b\xa4\xc2\x10b\
+\xd7\x84\xb6E\xb3\xf0V|\x93)\xb3\xd0\x1e\x89]\xc9\
+\xd8.\xd1\x986V}J\x8f\x06\x92\xe4\x17b%\xda\
+\x97\xed\x88\x17\xf5\xe9\xef\x8f\xf0\x8c\xbdZ\xbc\x02\xda\xd0\
+\x89\xc0h\xa6\xa0\x03\xa4\xad \xd2\xd4\xe5\xd2lB\xc0\
+%\x04\xac{J\x01\x16[B\xea\x16c\x05c\x16\x06\
+\x1bm\x8f\xa2eZ\xe9.\xd8\x00\xa9t\xa1\x08\xaa\x97\
+,\xccN{\xa4\xc2\xe2\x89f\xf4\xf0\x19\xfd\xc0\xd2\xaa\
+cm\xcd\x13B\xde\x9b\x91O\xd5z\xd5X\x93d\xe2\
+V\x8b\xa3\x8fY\xfb(\x18~}\xdf\xaf\xc3\x9a\x18\x07\
+i\x05\xd4\x03\x9du\x0d\x0c\x81\x0c\x10#\xe3\x92\xd2\x11\
+\x00?\xc0\xa3-\xc4\x8f\xf4NK\xaaE\x0d\x8f\xa5\xb3\
+0\xd20\x1d\xe9\x0f\xb6H\x8d\x88E[%\xae\x9d\x82\
+iHf\x84\x88\xd7Ylt\x98*\x89\xdc\xb0\xf0\x81\
+5\x1eD\xbef\x0b\xb6`\xd0e\xf5\x87^\x97\x1c\xb7\
+\xe11\x06)XcTBY00J\x99U\xcb\x9a\
+\x19.+t\x95\x14+3\xd2%\x8d#\xae\x13`\xd5\
+\x83\x0d\x96\xe9\xf4=\xcb\xf0\xfa\xb83\x07?\x0dWP\
+\x9e\x1d\xcb\x1e\x84\x93\xd0\xa0\x10Z\xb4_'\x06h\xab\
+\x9a\x8d:\xdd#\xc5\xcfr\x09]\x15\xb0,4\xd7)\
+\xb3e\xb9\xb6\xdd\xdb*p\xe7\x14\x02,\x15\xdf\x11#\
+P\xec\xb3\x08\xac-\xa4\x07\x8b\xbe\xc2\x09\xf0\xb6-\xf8\
+\xe1I\x09\xb1\x80\xa4\xb7L5\xcc\xf6x\xde\xfc\xf1,\
+\xd6\x10~} \xc5Q\xf2.j4\xc9\x8c\x94i(\
+\x16B'!\xc6\xc2\xb4\x22\x81\xe6\xd64\x0b\xd4a$\
+2\xab\xe4\x05\x13\x94-\xa7\xd5\xfe0~\x0d{\xabc\
+ET\xbcp\xfa\x8e\xb0S\x92\xea\x81D\xc2\xb2\xd30\
+^,J\x064\x99\x05\x814\x97\xe6\xa2\xb3,`\xb0\
+J\x1d}\x8f\xb1\xae\x86*\xb9\xf0Y\xda\x9e/\x88&\
+\x8c\xa0E{\x7f\x00\x0f\xad\x13ib\x89\x92\x9c\xdb\x11\
+\x81\x966\x83\xf2G\xcb\xb3]\x9e\xed\xe33\xf1\xb7\xb8\
+\xd7w\xf9\xf2\xef\xff\xb8?3\x0ffelSx8\
++\xcbE\xef\xeel;\x06X\xa3\x10f\xb3lR\x0b\
+\x84\xb3\xb3\xa8G\xb3\xe4>Wh]$2\xd3\xefe\
+\xda\x1d\xde!\x17w\xf7h\x9f\xdf^=\x7f\xf7\xc1\xc7\
+x\xf9\xf2\xf41\x08\xcf\xa4{\xbd\xba\xb8\x22\x17(\xfe\
+}\xbe\xe8\xb2\x0b\xc3\xf2\xab\xf4l\xef\x7f\xfc\xf5a\x9b\
+\x05^\x1b+\xb8w\xdf\xfc\xf0\xc5\x93`\xbf\xbf\xbf\xed\
+\xf4\xaf_<\xd9\x07\x16N\xe3\xbd\xfar\xb7:\xfa~\
+\x93\xc6\xbd\xb1\x7f\xfd\xec\xdd\xed\xab\x1f~\x83\xef\x90Y\
+\x9e\xc7\x0b\xad\xae%\x92\xfa\x8d=~\xe0\xb0|\xe9\xdf\
+\xae?\x10\xfb\xf8\x89CA\x82Q1P>\x18\x8bd\
+I\x06\xfe^\xcd\xb6\x9f\x1a\x8c\xfd\xfdw}?\x02\xfb\
+\x8f\x8d\xcc\xfb\xe1XP\xfa\xf9\xeb\xabw\xcf^<{\
+\xf7\xec\xef\xee^\xf2pD\xfe\x7fyr\x18\xb9\x17/\
+?\xfb\x1f\x7f\xf8\xe3\x1d\xd6\x9f?\xff\xec\x7f\xdd\xdc\xfe\
+\xe5\xbd\x94\xf0\x83g_\xde|\xab7\xbe\xb7\x15\xe6\xf3\
+\x17\xcf?{\xf7\xea\xdd\xf5\xd5\xef\xfex{u\xf5\xfb\
+\x7f\xfa\xc3\xf4\xaf\xff\xfe/\xd3?\xff\xf0\xcd\xcd\xed\xbb\
+\xcf\x9f\xde}y'A\xcbe\x0frt\xef\xae\x9f?\
+=<\xd6\xef\xfe\xee\xf3\xa7o\xbf\xd3\xc3\xff?\x95\xc8\
+\x9a\xcb\
+\x00\x00\x0b\xe6\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22UTF\
+-8\x22 standalone=\x22\
+no\x22?>\x0a<svg\x0a   wi\
+dth=\x2232mm\x22\x0a   he\
+ight=\x2232mm\x22\x0a   v\
+iewBox=\x220 0 320 \
+320\x22\x0a   version=\
+\x221.2\x22\x0a   id=\x22svg\
+753\x22\x0a   sodipodi\
+:docname=\x22Displa\
+y_disabled.svg\x22\x0a\
+   inkscape:vers\
+ion=\x221.3.2 (091e\
+20ef0f, 2023-11-\
+25)\x22\x0a   xmlns:in\
+kscape=\x22http://w\
+ww.inkscape.org/\
+namespaces/inksc\
+ape\x22\x0a   xmlns:so\
+dipodi=\x22http://s\
+odipodi.sourcefo\
+rge.net/DTD/sodi\
+podi-0.dtd\x22\x0a   x\
+mlns=\x22http://www\
+.w3.org/2000/svg\
+\x22\x0a   xmlns:svg=\x22\
+http://www.w3.or\
+g/2000/svg\x22\x0a   x\
+mlns:rdf=\x22http:/\
+/www.w3.org/1999\
+/02/22-rdf-synta\
+x-ns#\x22\x0a   xmlns:\
+cc=\x22http://creat\
+ivecommons.org/n\
+s#\x22\x0a   xmlns:dc=\
+\x22http://purl.org\
+/dc/elements/1.1\
+/\x22>\x0a  <sodipodi:\
+namedview\x0a     i\
+d=\x22namedview755\x22\
+\x0a     pagecolor=\
+\x22#ffffff\x22\x0a     b\
+ordercolor=\x22#000\
+000\x22\x0a     border\
+opacity=\x220.25\x22\x0a \
+    inkscape:sho\
+wpageshadow=\x222\x22\x0a\
+     inkscape:pa\
+geopacity=\x220.0\x22\x0a\
+     inkscape:pa\
+gecheckerboard=\x22\
+0\x22\x0a     inkscape\
+:deskcolor=\x22#d1d\
+1d1\x22\x0a     inksca\
+pe:document-unit\
+s=\x22mm\x22\x0a     show\
+grid=\x22false\x22\x0a   \
+  inkscape:zoom=\
+\x224.3895635\x22\x0a    \
+ inkscape:cx=\x2279\
+.73458\x22\x0a     ink\
+scape:cy=\x2233.716\
+336\x22\x0a     inksca\
+pe:window-width=\
+\x221920\x22\x0a     inks\
+cape:window-heig\
+ht=\x221012\x22\x0a     i\
+nkscape:window-x\
+=\x220\x22\x0a     inksca\
+pe:window-y=\x220\x22\x0a\
+     inkscape:wi\
+ndow-maximized=\x22\
+1\x22\x0a     inkscape\
+:current-layer=\x22\
+Page\x22 />\x0a  <titl\
+e\x0a     id=\x22title\
+2\x22>FreeCAD SVG E\
+xport</title>\x0a  \
+<desc\x0a     id=\x22d\
+esc4\x22>Drawing pa\
+ge: Page exporte\
+d from FreeCAD d\
+ocument: glasses\
+</desc>\x0a  <defs\x0a\
+     id=\x22defs6\x22 \
+/>\x0a  <g\x0a     id=\
+\x22Page\x22\x0a     inks\
+cape:label=\x22Tech\
+Draw\x22\x0a     inksc\
+ape:groupmode=\x22l\
+ayer\x22>\x0a    <path\
+\x0a       style=\x22f\
+ill:#000000;stro\
+ke-width:2.64583\
+\x22\x0a       d=\x22M 22\
+.301952,282.0895\
+4 283.29506,47.0\
+14926\x22\x0a       id\
+=\x22path560\x22 />\x0a  \
+  <rect\x0a       s\
+tyle=\x22fill:#c8b7\
+b7;stroke-width:\
+2.64583\x22\x0a       \
+id=\x22rect1003\x22\x0a  \
+     width=\x22259.\
+7876\x22\x0a       hei\
+ght=\x22200.71756\x22\x0a\
+       x=\x2229.535\
+019\x22\x0a       y=\x226\
+5.700348\x22 />\x0a   \
+ <rect\x0a       st\
+yle=\x22fill:#241f1\
+c;stroke-width:2\
+.66074\x22\x0a       i\
+d=\x22rect1007\x22\x0a   \
+    width=\x22215.7\
+8644\x22\x0a       hei\
+ght=\x22162.74397\x22\x0a\
+       x=\x2251.836\
+971\x22\x0a       y=\x228\
+4.385757\x22\x0a      \
+ ry=\x220\x22 />\x0a    <\
+rect\x0a       styl\
+e=\x22fill:#c8b7b7;\
+stroke-width:2.6\
+4583\x22\x0a       id=\
+\x22rect1009\x22\x0a     \
+  width=\x22180.826\
+63\x22\x0a       heigh\
+t=\x2216.877153\x22\x0a  \
+     x=\x2268.11136\
+6\x22\x0a       y=\x22283\
+.8978\x22 />\x0a    <r\
+ect\x0a       style\
+=\x22fill:#c8b7b7;s\
+troke-width:2.64\
+583\x22\x0a       id=\x22\
+rect1011\x22\x0a      \
+ width=\x2239.78186\
+4\x22\x0a       height\
+=\x2219.288176\x22\x0a   \
+    x=\x22136.22273\
+\x22\x0a       y=\x22265.\
+2124\x22 />\x0a    <re\
+ct\x0a       style=\
+\x22fill:#ff0000;st\
+roke-width:4.384\
+27\x22\x0a       id=\x22r\
+ect614-3\x22\x0a      \
+ width=\x2216.97952\
+7\x22\x0a       height\
+=\x22434.47598\x22\x0a   \
+    x=\x22-8.063242\
+9\x22\x0a       y=\x22-44\
+3.13181\x22\x0a       \
+ry=\x220\x22\x0a       tr\
+ansform=\x22matrix(\
+-0.70844066,0.70\
+577038,-0.708440\
+66,-0.70577038,0\
+,0)\x22 />\x0a    <rec\
+t\x0a       style=\x22\
+fill:#ff0000;str\
+oke-width:4.3842\
+7\x22\x0a       id=\x22re\
+ct614\x22\x0a       wi\
+dth=\x2216.979527\x22\x0a\
+       height=\x224\
+34.47598\x22\x0a      \
+ x=\x22216.97707\x22\x0a \
+      y=\x22-217.23\
+75\x22\x0a       ry=\x220\
+\x22\x0a       transfo\
+rm=\x22matrix(0.705\
+77038,0.70844066\
+,-0.70577038,0.7\
+0844066,0,0)\x22 />\
+\x0a  </g>\x0a  <metad\
+ata\x0a     id=\x22met\
+adata2626\x22>\x0a    \
+<rdf:RDF>\x0a      \
+<cc:Work\x0a       \
+  rdf:about=\x22\x22>\x0a\
+        <dc:titl\
+e>FreeCAD SVG Ex\
+port</dc:title>\x0a\
+      </cc:Work>\
+\x0a    </rdf:RDF>\x0a\
+  </metadata>\x0a</\
+svg>\x0a\
 \x00\x00\x1d\x9b\
 <\
 ?xml version=\x221.\
@@ -579,882 +1685,6 @@ Q 15,3 14.5,3 14\
    id=\x22path786\x22 \
 />\x0a    </g>\x0a  </\
 g>\x0a</svg>\x0a\
-\x00\x006\xa0\
-\x00\
-\x01\x82ex\x9c\xed}[s\x1cWr\xe6\xfb\xfc\x8a\
-\x0a\xf8\xc1vD\xd5\xe1\xc9\xcb\xc9<\xa9\x15\xc7\xe1\xd5\
-\xd8~\x99\xd9\xd8X{\xbd\x8f\x1b\x18\x10\xa4\xb8\x03\x12\
-Z\x00\xba\x8c\x7f\xfd\xc6\x97\xa7\x1ad\x03\xa4P\xba4\
-\xd4\x8emMLH\xe8Ku]\xbe\xbcg~\xf9\xe5\
-?\xfc\xf0\xeej\xfa\xee\xf2\xe6\xf6\xed\xf5\xfb\x97gT\
-\xea\xd9t\xf9\xfe\xe2\xfa\xd5\xdb\xf7o^\x9e\xfd\xcf\x7f\
-\xfb\xe7\xa5\x9fM\xb7w\xe7\xef_\x9d_]\xbf\xbf|\
-y\xf6\xfe\xfa\xec\x1f~\xff\xbb/o\xbf{\xf3\xbbi\
-\x9a\xbe\x7f\xfb\xea\xee\xeb\x97g\xc2\xef\xde\x9d\xe1\xef\xaf\
-/\xdf\xbe\xf9\xfa\xee\xa3\x17\xbe{{\xf9\xfd\x7f\xbd\xfe\
-\xe1\xe5Y\x9d\xea$\x9c\xff\x1fo|\xf8I\xce\x17\xde\
-\xbezyv\xfb\xdd\x1bo\x92\x7f\xde^\xbfz\xfb\xcd\
-\xf5\xab\xb7_\xbc\xba\xbex\x7f\xfe\xee\xf2\xe5\xd9\xbf\xde\
-]~\xf3\xf6\xf2\xfd\xff\xfe\x97\xab\xf3\xdb\xdb\xcb\xdbr\
-\xfb\xdd\x9b\xf1\xc5\xf7\x7f\xb9\xbd8\xff\xe6\xf2\x8b\x8f\x0e\
-)\x85\xa7\xbf\xabA\x97\x5c/_\xd7\xd7\xf3\xc4\x95e\
-!Z\xb8\xfd}~\xe9\x87wW\xefo\xbf\xd8}\xf5\
-\xe5\xd9\xd7ww\xdf|\xf1\xe2\xc5\xf7\xdf\x7f_v/\
-\x96\xeb\x9b7/\xf0\xd3\xb7\xdf\x9c_\x5c\xde\xbe\xd8\xbd\
-\xfe\xd1\xf7w'y\xff\xfd\xdd\x0b\xe5\xf6\xfa\xdb\x9b\x8b\
-\xcb\xd7\xd77o.\xcb\xfb\xcb\xbb\x17\x7f\xf8\xb7?\xdc\
-\xbf\xb9\xd4\xf2\xea\xee\xd5\x87\xc3\xec\xfd\xfa\xf7\x92\xbf\xcb\
-\xb5\xd6\x17\xbb+\x5c\x7f\xec\xbb7\x1b?y\xf3\xea\xf5\
-\xa7>I\x11\xf1\xa2\xf2\x0b\xe6\xe5\xe6\xd5\xeb\xe5\xf6\xaf\
-\xef\xef\xce\x7fX\xde\xdf\xfe\xcdG_\xbd\xb8\xb8\xff\xe6\
-\xc5\xcd\xe5\xf9\xdd\xdb\xef./\xae\xdf\xbd\xbb~\x7f;\
-n\xc7\xde\x87_}\xf8\xf07\xdf\xde\x5c\xe5'^]\
-\xbc\xb8\xbc\xba|w\xf9\xfe\xee\xf6\x05\x15zq\xf6\xfb\
-\xdfM\xd3\x97\xf7O\x13\xf7\xf3\x15@\x81\xa3\x8c\x87~\
-\xff\x92\xb7v6^\xfe\xe6\xfc\xcd\xe5\xc5\xf5\xd5\xf5\xcd\
-\xcb\xb3\xbfy\x9d\xff\xaco\xfc\xf9\xfa\xe6\xd5\xe5\xcd\xee\
-\xad\x9a\xff\xec\xbdu\xfd\xcd\xf9\xc5\xdb\xbb\xbf\xbe<\xab\
-\x85wG\xbb\x07\xc8\xed\xd7\xd7\xdf\xe3\xd0\xb7_\x9f\xbf\
-\xba\xfe\xfe\xe5\x19?\xfc\x00\xde\xfc\xe8\x08\xf5S\xef_\
-|}y\xf1\x97\xcb\x9b?_\x9f\xdf\xbczy\xf6\xe8\
-#\xaf.o\xff\xb2;\xbfW\x84\xff=\xfa\xc4\xf5\xc5\
-\xb7\xb8?\xcb\xb7\xef\xdf\xde\xdd\xbe<[%e\x9ap\
-zonpK^\x9f_\xdd^>\xfc\xde\x7f\x5c_\
-\xbf{yf\x85\xab{\xaf\x8f\xce\xfd\xe2\x87\x97ga\
-\xc5\x1aG\xf5Go\xfe\xf5\xe5\x99\xd7\xe2\xe4\xfe\xe8|\
-\xbe\x7f\xfb\xfe\xd5\xf5\xf7\xcb*\xca\x14\xfc\xe8\x9a\xd6O\
-\xec\x84\x9b*=\xfa\xf5\xf5#?|\xe2\x8e\xaco\xfd\
-\xf5\xf3o\xbd;\xff\xe1\xed\xbb\xb7\xffq\xf9\xea\xe5\xd9\
-\xa3\xb3\xbb\xf8\xf6\xe6\x067\xeb\xea\xfc\xaf\x977/\xcf\
-\xde\xb0\xb1\x9eM/\x12Uwo\xef\xae.?\x00)\
-\xff\xe4\xb3\xdf\xff\xf3\xcd\xe5\xe5W\xff\xf8\x87\xe9_\xff\
-\xfd_\xa6\x7f\xfa\xe1\x9b\xeb\x9b\xbb/_\xe4{\xf9\xa5\
-W\x97\xb7\x17\x1f\xbe\x83\xbf\xf4\xec\xf7\x7f\xb89\xff\xfe\
-\xed\xfb7\x09\xbc/\xa6\xff~\xfe\xe6r\xba\xcco^\
-\xbe\x9a^\xdf\x5c\xbf\x9bv\xc7\xdc=\xbc/\xa67C\
-\x0d}\xf9\x02\x87X\x8f\xfc\xfa\xf6\xe3#\xbf\xbe\xb5\xdd\
-\x99\xbe\xf9\xf0:\x0e\xfe\xf0\x22\xaf\xce\xff|y\xf5\xf2\
-\xec\xdf./\xbe\xc6\x99<|\xfb\xcd\xcd\xf5\xb7\xdf\xbc\
-\xbb~u\xf9\xf2,oC\xca\xd4\x87\xa3N\xd3\xed\xdd\
-\xcd\xf5_.\x97\xab\xb7\xef/\xff\xcf\xf5\xdb\xf7/\xcf\
-\xfe|\xf9\xdd\xe5\xd5\xd9\xeem\xfc\xecz\x85_]\xbf\
-\xbf\xbb|\x7fw\xff\xd6\xeb\xb7WWP\xea\xef/\xcf\
->q\xb0\x8b\xf3o^\x9e\xdd\xfe\xdfo\xcfo\x1e\xbd\
-\xbd\x83\xcb\xde\x91\x96\x9bo\xaf._\x9e]~w\xf9\
-\xfe\xfa\xd5\xab\x07_y(\xb0\xd3tws\xfe\xfe\xf6\
-\xf5\xf5\xcd\xbb\x97g\xef\xce\xefn\xde\xfe\xf0w\xb5P\
-\xb3^\x99\xdb\x5c\xf1?\xfc\xe9\xee\xec\xf3\xe2\x5c*\xb3\
-Y\x9f\xd9\x8aU\xa9\xf2\xf7\xeb}\xf8\xf8N\x8c\x8b\x1d\
-(\xf9\xfd\xfd\x8b\x1f\xbf?M\xaf\xaf\xdf\xdf-\xb7w\
-\x7f\xbdJsv\xf3\xee\xfc\xc3\x9d\xfapK\xf6\xf5\xce\
-\xa3\xf3\xcd\xff\xbc:\xbf\xbb\xfc;\xd2NEy\xee\xca\
-\x85V\xeb\xf2\xf1\xa1\x96{\x85Bg\x8f\xce\xe2\xf5\xf9\
-\xbb\xb7W\x7f}y\xf6\xb7\xff\xed\xfa\xeez\xfa\xd7\xf3\
-\xf7\xb7\x7f\xbb\xf7\xa1\xdd\x9d\xdb{@\xf7\xdf\xfe~\x15\
-H\xfd\xe8\x9e~\xb8\xc0\xb7\xffq\xf9\xf2LZa\xf7\
-\xfe\xcd\x0f{\x1f\xc8{D\x16\x1f\xdd\xa2i\xfa\xf2\x9b\
-\xf3\xbb\xaf?\xfe\xd44\xbdzy\xf6\xa7\xa9{\x11\xb2\
-YK\xb7\xa0\xa9W/T}^X\xbc\x84\xdat1\
-q+\xad\xdb\xbc\xf4bBS\xab\xa5\xbb\xcfK\x94\xde\
-ir-\xdah^\xa4\x98\xf7\xe9jb.\xd6\xdb\xdc\
-JXL\x17S\xf3\xa2\x143\xb5B\xb5O\x11%\xc8\
-g\x97R\x9bNDZ\x1a\xf9L\xcd\x0a\x89L\xb5\xf4\
-\x86\xb3PiS-\xf8V-mZ\xa8t\xc2\x01\x8c\
-\x9aN\x0b\x97Js+D\xadMK+\xd4\xe7(\xcc\
-\xa1\xd3\xd2\x8b\xfbLT\xa49MW\xd3b%|\xd6\
-B\xd2\xdbt\x81/\xaa\xf2L8[\x9e\x16-\xd1\xf0\
-WT\xf6i\xf1\xc2\xd2f*R)\xa6?N\xe1T\
-8\xe6\xa5I\xa9\xde\xf1e)\x9dl^\xa8\xd4\xaa8\
-\xb2\xa9\xce\x0bN\xd5\xf0e\xe36/T\x8b\xb4\x1e\xd3\
-BT\xb8\xf6y1.\xa1\x9d\xa6E\xa9t\xbc@\xb5\
-\x17\xafN\xd3\xd2\xa5t\xc3w\xb8\x15\xa5F\xd3\xc2\xb5\
-D\x9b\x17.\xddmZT\x0a\x11\xcd\xb5\x84\xf7i\xb1\
-\x86\x8b\xc8K\xe3\xc0\x95ym\xc5j\x9bE\xa8\xb4\xae\
-\xd3R\x8bq\xcc\xd1\x8av\x99\xbe\x9a\xa8z\xe9\xcc\xb3\
-(\xde\xb7\xc9Z\x11\xa3YI\x8bV\xc6\xc7\xbdRu\
-\x9bU\xacX\xf7\xe9\x8f\xd3\x22R\x94z\x9fU\xbd8\
-k^t/\xd1q\x97\xa4P\xe3<\xebZ\x8dg/\
-\x8dmZ\x88\xb5x\x08\xcf\x0b\xb5\x12\xea83b<\
--\xfcT\xa9\xc18\x88r\xb1\x98\xf3\x97iZ\x82\x8b\
-\xb0\xceK-l:-$R\x9a\xf9\xbcH\x14\xb5\x96\
-\xb7\x8aqk%\x0a\xe3\xf3\x16@\xc6\xbcD/\xcc\xd3\
-\xe2\xad\xd4\x96?\xd8q\x81\xf8\xbd\xd2\x12'$}Z\
-\xd8\x8aF\x9f\xc9K'\xc9\x83\x89\xf3\xcc\x5c\xba\xe0\xe4\
-\x84\x8bS\xde\xc7*\xfe\xe1\x02\x1f\x5c\xdf\x83\xcb\xfb\xf1\
-\xabs)\xbd\xb6\x99\xb5\xf4\xe8\xd3BF\xa5)\xcf\x8b\
-x1\x95i\xa1\x80 \xe8\xbc\x90D1\xa0C\xb4(\
-\x0eZ\xb9Tm\x06\x5c\xe2\xb9W\x00Rxr\x80P\
-\xe6\x859Jo\xb5MW\x13>\x1a,3\xbe\xea\x5c\
-u\xaa\xeb!\xd5\x0a\x93\xd1\xe4\x8dK\xab\xde\xe7\x85\x9b\
-\x94\xde\xf8^du_fc_h\xfd\x81\xd4j\xff\
-1\xb1\x8d\x07rk\xfb\x82K)\xb9\x9a\x82\xdb>\x92\
-\xdcUt\xf3BkmCt?\x96\xdc\x14\x5c\xd3U\
-rw\x82\xcbCrw\x82\xabCp\x87\xdcj\xca\xad\
-\x0c\xb1\xed)\xb6\x8c\xef\x8d\x8bh\xf3\xb2\xbb\x8a\x14\xdb\
-\xd6\x7fLnm\x15\xdc{\xb9\xa5\x9d\xe0\xaer\xeb|\
-/\xb8\xab\xdcjB>%WW\xc1\xad\xf8\x11\xc8\xae\
-\xefd\xd7{J\xaf\xaf\xd2\xeb\xb1\xca/n\xf6\xd2\x88\
-Koa3\x03I\x15W\xa9Z\x08\xea\x0b\xb7\xa4O\
-]\x8b9\xcf\xcdK\x15\xcb\xfb\x0d\x05M\xd5\x8a\x0b\xf1\
-\x843U\x5c\x96Af'\xb6BPW\xdcKm4\
-\xa9\x14\x86\xb6\x16)]:~p\x05\xfe2\x90\x0f\xd9\
-\xa66`\xd6\x0a\x19\xe3}<\x9a\xa5\x95&m\xd2^\
-z\xe4=\x0b\x9e\x94\x8a5\xc1\xf3\x8c\x16m\xf2(n\
-m\xd6(\xdd\x8c\x01\x0cv\x9d\xa9R\x11\xd5*\x13\x15\
-\xdc0.]\xb9\xd1\xc4\xc5\x05O\xdc\xb5v\x9e #\
-2\xf7B\xacVm\x22\x81\xa6\xc7\x9d,\x5c\xab\x89M\
-\x1c\x05\x8f\x87\xa9p\x8f&6\x01\xe0\x1dw\x16\x88\x10\
-\x11{t-+\xd2\xeb\x00:^hR\x04\x87\xc5\x8d\
-l}\x82\xe9\xee\x92\x97\xd3\x99x\xfan\xaa\xd3\x1f\xf7\
--\xde\xd9\xbeI\xfc\x117g\xfc\xf3\xdd\xe5\xc5\xdd\xf5\
-\xcdr\xf9\xfa\xf5\xe5\xc5]Z\xee\xe5\xf6\xe2\xfc\xea\xed\
-\xfb7\xcb\xb0\xe6\x0f>\x0f[\x0c\xcbK\xe6\xab\xb7\xb8\
-\x9a\xe3\x17oN\x0e\xcc\x8f;0.\x9b\x1c\x18o\xc5\
-\xa9\xda\xccVK\x83z\xf3\xc2]h\x86\xbavh\x0d\
-\x22*\xde\xe0\xd38\x0coO\x18@\xb5\xf4BJ\xf3\
-\xe2E\xab\xfa\xb4\xb4V\x02Z\xd2\x8awn\xd3\x92\xe8\
-\x81\xba\xe9L8\x8c\x95\xa1$\xad\xc3\xdc\x084S\x83\
-m\x83\x03;-+\x5c?\xa0u\xd1\xd2`eK\x15\
-\xe1\x9e.Jh\xcc\xbdHXH\xda\xbfBUa\x80\
-\xaa7M\x8bX\xb8A\xa5i\xfe T\x0a\xcd\x5c\x9a\
-3\xecY\xf1F\xb3\x14\xae\x12\xa9\x16;\x94Lo\x22\
-\xd0\xa7\xaa6\xd7\xe2\xd2S\xa3\x0a5XY5\x9c\x18\
-\x17\x89\xc0\x9f\xd1{\x9e\x95\x13A_yZM+\x06\
-\x8d\xa6\xa5{\xfaWD\xa9\xcc\xc4\x9a\x0bT(~t\
-i\x10\xa7\x1a\xf8r\xfa2\xbdT\xa9\x9c\x16\xae\xe4\xfb\
-T\xd4\x1d\xfa\xaeA\xaf\xf2\xbcD-\xd2\x15w5\xb5\
-DzH\xa9&\xc4\xc7\x9d\xec\xa9\x8aUq\x86\xf0\x03\
-\xba\xe3\xefj\x81[\x99:(U\x10>\xed\x85\x9aC\
-\x91t\x1f\xf7\xbdJ\x9ay\xe5\xdaS\xe3B\xe1\xed\xf4\
-\xddRaY\xe7Z\xaa\xc1\xbe\xd6R\x03q\x06\x14\xe7\
-\x82\x7f\xe3-\x8a\xbc-A}\xd6\xc2\x1e\x86;\xd8\x5c\
-\xe7^\xba\xc1\xf1\xf0\xe1\x1fJqJg\xa0H8\xf4\
-ZP\xcf{\xd2mnE\xda\xb0*\xbd\xcdV\xc4\xe0\
-\xc0H1\x96\x99\xa0\x16a/J\x0d\xfc\x9c@\xcbB\
-e\xb91\xee\xad\xb2\xe4\xef\xc3\x8a\x17o\x9c\xf7U\xa1\
-\xb6\xb4P\x833\x0b\x9fC\x01D\xeb\xc1\xd3\x22\xad4\
-\xd2yiQZ$\x92\x0c\xc6d\xdcSk\x9cX\x0a\
-\x5c?4c+.\xac\x09rx-=J\x85\x0a\xd4\
-(\xae\x84\x9b\x00\xff\xe1\xde}\x88V\x0cVS\xb8\xb0\
-5\x9a.\xa6^\xe0\xf7Xi\x14\x13\xf5b\x94\xea\xb6\
-5\x9d\xb8\x97\x9e\x06\xb5\x95J<\xb5\xa2\xf0\xde(-\
-?4r\x87\x9bRXt\xc2\x13\x06\x06\xb5\x90\xc9\x04\
-{'\x03\x902\xe5\xe9\xe1\x8fN\x13\xdc\x93\x96\xc6F\
-\xf1)\xea\x89S\xf26i\x91\xa0\xf4\x14{\x9b\x10\x10\
-\xa6\xdb(\x02S\x99X\xa9\xa5\x87MAx\xb4\xe9\x81\
-U\xfc,bG\x9f-J(\xf1\x84\xfb\xa6\xb3\xa6\x09\
-\xee15+\xec}\xa6\x0a[\xc4\x8e\xbfUi&c\
-<\xb6>\xd5R+C\x8a\xda\xf8o\x9a\x09\x9eN\x82\
-\xa8\xea\xcc\x85=A$\x88pzQ\xa0\x8f)a\x04\
-\x1f\xa1\x0a<\x9b\x9e\xa2H\xf0\xd6jJ-\xb5\x98%\
--\xf9\xd2a\x8d\x00\xe46\x9c\xd7h\x06\x8b\x081l\
-0\x8c3L&\x1ef-*:\xb7R\x81\x0dx\xa0\
-\x95g\x1b\x12J5\xad\xbf\x14m\x00\x11\xa2!\x81'\
-\x02\xb1h\xf8NKC\xb9\xb8\xa5\xce\xe3\x06\xbb\x0b\x17\
-\x83 ?3KQ\x97\xa9\xb7\x14d\x8eR#\xa6\x9d\
-\xb3\xbb\xfa\xba\xdcKD\x87\x11\xf5\xceS\xd3R\xf1\x5c\
-8J\xeb\x93\xc3\x1b\x85\xc4{i\x03M\x95\xe6E5\
-\x9d<\xca\x1b9/]K\xb3\x86\xdbo\x19\xf9\xa4\x9f\
-\x1eS-b\xe9u\xe0\xb3\xb54\xfc\x01g\xa6\xfbT\
-\x8b\xe18\xe4\xa5Vx\xeb#\xa4Y2\xa6a\x9c>\
-\xae\x1a\x9e5p\xe5\x13ya$\x0d\x0c',\x0c\xa7\
-\xc7\xa0\x87\x5cKo\xae\x13\xe4E\x12\x99-\x1c\xd0\x84\
-\xbd\x87\xca\x0b\xee\xf9e \x95\x8b{\x00\x8fU\xf1\xd4\
-+<S\xc4\x12\x8e\xbf,\xba\xa5\x9fD\xd0\xc0\xb5\xd5\
-\x9ew\xd0(\x9d\xa1\xde\x1b\xcc\x8e\x88\xce\x00\x8f6\x81\
-S\x1d\x1d\x11h+\xe2==\xd9Z*\xbc\xa1\x08\x96\
-}1\xd3\xd8\x173N9\xab\xb1\x134\xdb\x974\xf2\
-=Q[e\x8dWY\x8b}a\xeb\xb8\xa0!-\x9d\
-j\xe0\x8a*$\x89\x0a[\xe0\x8ax\xf8C\xe2\xdc\x86\
-0\xd9\x9e0\xad\xf1L\x15^\xa5\xa9\xd2*O\x94\xf2\
-$\xd1\x86D\xf5U\x9ex\x15(\x19\xf2T}\x15\xa8\
-\x0c\x06\xccinQD\x13\xab\xd0|\xf88\x0e'C\
-VZ\x95\x99\x046\xb3\x0da\xe9\xedci\xe1\xd8\x13\
-\x97\x07\xf2\xc2\xfb\x02#{\x12C\x91\x22#;\x91\xa1\
-\x072\xd3\xf6d\xc6\x7f\xa6\xcc\xf0Nh\xccJ5H\
-\x06s\xea,h\x84\x06a\x08DQ4\xe1\xaa\x89\x03\
-:\xbf{!\x95gs<\x9dN\x8e\xe7\xde\x05>\xed\
-x\xfa&\xc7\x13\x8fX\xb9\xcf\xacQ\x9a\xea\x93\x8eh\
-\xe7(\x0eYd\xa1\x8c\x0e\xd7@\xdd\xf7\xe2\xf4\xbe\x17\
-\xa6\xf3.J\xffO\x98J{2of\x1f\xe7\xcd\xb8\
-\xb0 \xfc\xee\xc5\x02\x1e\x91\x17M\xb7\x91\xac4(\x87\
-\x80pg\xd6,J\xed>\xfc\xb0ts#\xd6\xe3\xa5\
-b\xf3\xd5\xd9j\xc84q\xe1\xf4\xf5~\xb5\xfc\xda\xf3\
-Im;I\xed\xde\x05>)\xb5\x9d6H\xed;\xc4\
-,\x8a\x04\xd2,l\xa5\x87\xa7s\xa1\xd0\xdc&%\x00\
-Tn#.$\x817\x80<\xa4#\x10\x80{\x02\x87\
-2\xb3\x9a\xcd\xe1\xf6 \xb3\x1a\xd3\x12\xa8\xdai\x1e\xa0\
-U\xa4XI\xb9 \x89\xae\xbdT\xee#\xba@@\xd3\
-;\xa79\x8a@\xe0\x011 |\x95f/\x15\xd1\x13\
-qQ\xef\xb3\xc13\x99\x16\x96\xe25f\xb2B\xbde\
-\x94$\xe43\xfbH\x7f1g\xfa\x12i\x1f\x98@8\
-[\xd4g\xf3\x12]\xc6\x9f\x15\xa8\xde\xb9^pm=\
-\x9d\xa7Zd\xf8zH\xf4R!\x0bX8K\xb7)\
-`5\xe1\x8c\xf1\x84\x80*\x8f\x10\xc5\x18i\xc6L\xbe\
-\xeer\xaf\x99\xaa\x95y\xcd\xd4\xc6(\x0a \xffh\xc8\
-\xed\x8c\xbc\xee\x9a\xd6m\x90\xc5\x9e\xce\x9dt\xc9\xec\x16\
-\xd2W\x8e\x9cW\xc0\xaa\xe6\xadU\x04\xdf\xfc|\xe2\x15\
-'\xf1\xda\xbb\xc0\xa7\xc5\xabm\x13/g-Lm\x86\
-\x9bc\xcc\x0f\xc4K\x1e\x89\xd7N\xbed'_\x10\xa0\
-}\x09\xa3=\x11\xd3\x80JO\x11\xb3Xe\x0cn^\
-f\xe3ed\xe3\x87\xdb\x87PSfB\xda\xa7jL\
-\xcb\x9a^\xbf\xcf\xae#\x1b\xcfpH\x91\x8dG\xf8\xc2\
-\x19\xad\x91e\x8c9\xed\xd2\xf7\xbb\xec\xfd\x1e\x90y\x1f\
-\xc8}\x00\x99\x9e\x1f\xc9]NH\xde\xbb\xc0\xa7\x91\xbc\
-\xa50\xfanZ4\xa8h\xb5\x0cX*Rg,\x5c\
-z\x8d\xd9{F\xd9\xcf\x85\xecO\x14\x81\x1efm\x1e\
-\xe4\xc5\xbd\xb0g\xc0\xab\xadMp~\xf0\x9e\x97\xdal\
-\x14\x1b\x0e\x94Ay>\xcc\x9fr\xe9\xfb\x17\xf8$\xe6\
-cK.\xfd7q\x8ev\xe8\xd6\x1d\xba\xf9Q\xb2\xe4\
-\x01\xba\x91\xb7G \x8d\xdc3\xed\x00}\xb0,\xc6\xd5\
-\xbd\xdc\xf7U\xf0\x9f\x0d\xe6q\x8a\xdc\xf7/\xf0i\x98\
-o\x89\xdc\xe1\xa48\xf2\xb3\xa8t \x81\xdb&2+\
-\xd2\xda\xac\x82j\xceZ \xea\xc8\xfe\x22\xed\xab\x84\xa4\
-a%\x14\x7f\xb8\x1a\xa2vUG\xb5\xc0Q\xa2\xbf/\
-\xe8.\x1f*\xba\x8cv&\xe35\xc0\xa5\xac\xf0v\xcf\
-\xba}\xe1\xda\xa6\xfb\xba\xf0\xb2\x16\x86\xa5\xf4PC\xb9\
-\xa0\x89N\x8eRNC\x02Z\xa6\x8ceEP\x80\xe0\
-\xb0I\x91y\xcd\xc6\x05.\x88\xc0;\xd2\x9aHI\x1b\
-2\xd31e\x9c\x8c\xf8u\x17(#_\x89H\xbf\x91\
-\xe0Wh\x0e\x5c\xea4\x1aW\xd6\xf27rV:g\
-\x16vB^\x0b\xffM\x1a\xd3\xa8\xb1/\xbb\x22\xfb\xa8\
-\xcd/\xbb\xe2<\xca6\x19d\x13\xf7\x09\xb9\xb3,\x9e\
-\xb1\xf24\x8a\xfa\xcbZ\xd5\xe7\xec\xac@\x92\x81l\xe2\
-b\xeb}\xc1\x9d\x1eM\x02\xcb\xaeK\x00\x89\x8c@>\
-\x045\xb1\xc8rR\x0d\xb4\x1b\x11\xee,\x8ar\xf7\xed\
-\x07\xcb.\xdb\x818\xa9\xb9xfS9\x93\xee\xa8\xe3\
-\xb4\xac\xa7D\x83g\xb86<\x8cL\xca\x1f\x1f=\xfe\
-\xe7\x13\xe8SP\xbf\x7f\x81O\x094\xd7\x8dA}\xaf\
-QDP\x06\x94\x82\x12\xda\xc5O\xf3\xd6\xd1\x04\xb3:\
-w\xcbG\xde\xdd\xaf^\x0f\xba\x1aU\xe7\xd0y\x18\xaf\
-\x07]I\x0f2\xd0\x0fZ\x8e\x9e\x0f\xa6\xa7\xe0x\xff\
-\x02\x9f\x86\xe9\xc6\xe0\x98;\x8aB2\xab3\xbaO\x1e\
-\xc2\xf4\x89\xec\xc8\xf4\xc7\x09]\x99\x15M\xb2\xda\xd1\xd5\
-\x97(\xfdiU\x96\x1d\x04\xc5\xf70\xe8G\x06B\xae\
-\xa7\xb8v\xff\x02\x9f\x06\xe1\xd6\xb8\xb6jv\xe9R\x95\
-\xccy?\xf2\xbf\xb3p\xb9\xac\x95K L\xd4\xe7\xa5\
-\xa1\xd8\x96\xa9F)<r\xf7\xa8\xd2\xc3\xa5_\x8b\x9f\
-\xcb}\xf5\x13\xb6~\xad36\x1e9OFH\x8b\xde\
-\x8d\xc4\xd4\xa8\xac.ki\x15\xe8GG\xa1\xa4iO\
-\x80V\xee3\xc0\x8e\xba\x08\xfef\xf2\xd9\x0c\xc9\xcc\xb5\
-\xb6z\x9f\x93\x1f\xe7\x88\x0a\xae\xda\xf8w\x8c\xc2t\xa5\
-\xec\xfc@\xf5\x94\xc7\x8fuA!nt\xa84\xb4*\
-Nk\xfeu\xc9\x04\xec\xf3a\xfb\x14\xbf\xee_\xe0\x93\
-\xd8\xa6\x8d\xf1\xeb\x13\x8e\xfdC{\xfb\xb0;\xe6q3\
-\xed~o\xec\xe2\x84\x1a\x1e\x8a|\xca\xa8\xba?\x1bd\
-\xe8\x14\x0b\xee_\xe0\xd3\x90\xd9V\xc5}\xb2J\xfbh\
-$b\x7fbb\xf1\x84\x10\x86 :\xaa\xa0\xf1\x89\x86\
-\xc3\x07\xbf\xf1|\xa09\xc5\x1b\xfb\x17\xf8$hxc\
-\xbc\xa1\xd6K\x86\xbb\x99\xed\x1a\x9d\xea\xb1\x16\xb8\xa3X\
-\xa0e\xc5\xeb0\x82\xddKC&j\xd9\xb5r/\xf7\
-\xbd\xdchrA\xd9Z\x8aA\xbb\x90\x95\xc8\x22x1\
-\x19\xb96\xe4\x19\x96]\xa2\xe1\xd1\x0cC\x83\xc1D\x0b\
-j\xedSZc\xd69\xa3b\x9dv\x0d\x81\xf7\xfd\x80\
-\xd9<\xdd\xc6$J\x09\xf4og\x84\xa3YB\xaf6\
-b\x9c\xd1\x7f\x87\x86\xb2\xd1+\xb9d\xb3\xe4\xf3\xe1\xf5\
-\x14x\xec_\xe0\xd3x\xdd\x12x<\xdd\xaa\xf2\x15^\
-!4\xc2I\xcb\x5c>\xc0b*2+@\x88\x8e\xe3\
-\x87#B\x7f\xfc\xc4$\xd1W\x0f\x87\x8d\x1e\xce\x22=\
-8\x8fg\x03\x16\x9f\x82\x89\xfd\x0b|\x1aX\x1b\x83\x09\
-A\xefe\xd8\x18\x93i:\xba\xe6~\xca\xd0\xc8N\xad\
-\xf9\xaa\xd6jN\x9f=Cc\xf9/\x99\x8cy>\xe0\
-\x9e\x22\x85\xfd\x0b|\x12\xb8\xb21RP\xae\xa5#\x0a\
-\x1e\xb1\xe9\xc3\x96\xe3}P>\x0c8\xd77W\xe4<\
-\x1b\x1a\xe4\x14\x04\xec_\xe0\xd3h\xd8V\x10\xea\x1e\x05\
-\x8a\xa0\xf7u\x82\x125\xca\x86\x22 \xa2It\xbd[\
-s\xf4z\xab\xf9\xb4\xce\xef\xde\x8f\xef\xee\x06(3F\
-\xec9zx\xc0n\xc6\xe7\x03\xdb)x\xd8\xbf\xc0'\
-\xc1\xa6[\x83\x87\x12\xb5c\x9cA\x99\x8aId)\xed\
-P\xe5\xbf\xddh\xec\x98\xe3B\x12\xe3\xab\x095{4\
-\x1a.\xd2\xa2\x90\x0b\xd2\xca\xa4i)1\x8a,\xfc\xf8\
-\x1c\x9f\x0fv\xa7\x18`\xff\x02\x9f\x86\xdd\xc6\xe2\x83\x04\
-\x8fdW\xa3\x1c\x91\xbf\xf8\x19y\xd7}\xabx\xc0\xb9\
-\x9cg\xc3\x9b\x9eB\x83\xfd\x0b|\x1ao\x1bC\x03\x0a\
-A\xefDNpW\xb8\xec\xbf\xc2\xf4\xf6=\x04c\xc5\
- \xfd\xaci\xde\xe7C\xd7\xc9\x7f\xdf\xbf\xc0'\xd1\xd5\
-6\xfa\xef\xcd8'I\x05)\x85\xc7Mb\x17\x13\xe5\
-L3\x8c^\xa5l\x1aC\x97\x17<3\x1b\xcc\x06`\
-\x07Y\x06=\x082\x19h\x98\xc4\xdc/\xe6d\xd6\xfe\
-\x12(\xad\xf1'JW\xa3G~\xa1^\xbap\xb6\xe1\
-\x1b\xe50IdA\x17\xed/\xe8~\xce\xf9\xc81\x1e\
-\xf9l(k\xa7\xb8`\xff\x02\x9fF\xd9\xe6F1\x0c\
-C\xc0\x0d\x02\xbf\x9a\xe8#\xae\x94OS\xad\xf8g\xb9\
-V\x96\xdd\x01>\xf0\x94\x8c\xfe\xa5\xbe\xad}\xe9\xf90\
-ur\xff\xf7/\xf0IL\xd96\xf7\xff\x17\x8d\x01\xde\
-{\xf3\x0f\xf1\xa3\x0f\xe0\xf3\x00=\xf3>\xd7\xcf\x80\xef\
-\xf3a\xe9\xe4\xd3\xef_\xe0\xd3X\xda\xdaP\xa4c\x86\
-eq\xb43d\xc3\xf6O`\xe1\xf9\xff\x80\xa2\xe4\xea\
-A\xae\xae>_\xd1\xc1N\x91\xc5\xfe\x05>\x8d\xfa\xad\
-\x1dL\xd6\x8b#}f\x5c\xc4u%\x0a\xfb\xcf\xc2\xe7\
-\xf2\xa8\x12\xfb|\x88<E#\xfb\x17\xf8$\x227q\
-P\xddW\x13,\xab\x09Zw\xdd\xc3\xc9`\x93mi\
-\xf7\x7f\x04}\xf8\x83\xe4\x939\x15|L\xe0a\xfah\
-6\xe6u<\xbd\x8f2\x04\xfa\x90\x07OJ\xec\xf8U\
-\x10\xf9`\xce+\xa3e&\xa8\xf7i\x1d\x17^\xc6\xbc\
-\xf0\xb3A\xec\xc46\xf1\xe0\x02\x9f\x86\xd8\xc6\x12\x85\xa1\
-R\x0f\x16\x03\x10\x91\x98M;\xc2\xc3}\xbe\xc3\x0d4\
-\xa5\xf1\x89\x9c\xf0\xc5\x18\x13\xb1\x0fs\x22\x98w\xfah\
-R\xc4\xd6Q\x91\xe7\x03\xd2)\xfe\xd8\xbf\xc0'\x81\xb4\
-\x89\x00\xe1OS\x84\xa0\x11\x1c!m!\xe8\xa3_D\
-x\xfb\xb8\xf8\x05 q\xe2\x88\xe3\xc3\xc0Q\x0e\x13\x81\
-\xf2c\xfd\xe2\xf3\xe1\xe8\x14{\xec_\xe0\xd38\xda\x18\
-{\x18f\xb8\x92\xb0\x1b\x04m\x9f\xc8\xc0aT\xb4\xa7\
-\xa1\xab\x8a\xbek\x96\xe4\xa5j\xc6\x83\x88jL\x96\xb9\
-\xfc\xca\xf4g\xcf\x06\xad\xd3\xe8\xfd\x83\x0b|\x1aZ[\
-\xbb\x8ar\x18\x9ef\x09poeGP\xd2\x9a\xa1\xa3\
-\xbf'\x19'\x5c)D\xa6\xd9\xbb\xb1\x0c8e\xc1\xd4\
-?j)\xfa\xa8U\x12\xff\xd1\x06\xf74\xf3\x84F\xdc\
-\xda\xc6@B\x9fV\xf0,\x83\x08,\xb9\xd6\xec\x9e\xd7\
-\x10\xa9a\xf71\xf4\x98\x04jI-\xb6$\xb7\xd8\xf3\
-!\xed\xe4\xb8\xef_\xe0\x93H\xdb:\xf0\xce\xd50\x96\
-:\x8b\xa1\xf6\xf4\x09%\x96\xa4tH\xbf\x81\x94n0\
-8.\xc9I\xd7\xa6\xc1I\x87\x5cCrc-\x83o\
-\xa4\x96\xe0\x95\x09^\xb4\xcf\x5c\x84\x10\x03\xae,}+\
-I\xdfPd1\x14\x19e\xbf[p\x9f{\xd1@\xb1\
-j\xe5\xff[\xe9\xff\x9e\x0df\xa7\x81\xf3\x07\x17\xf84\
-\xcc6\xd6\x11\xacG\xf1\xe4\x1b\x07\xc9L\x06\x88H\x12\
-d\xa2Nz\xb2\x1d\xa2j\x80&\xdc{\xb2\xc3\x95\xeb\
-\xf0\x13}\xdf\xbf:E\xeb\xf3!\xec\xe4\xd5\xef_\xe0\
-S\x08\x93\xad\x13\xd0\xe4R$:\xc66\xa5fD\xb7\
-]s\xfd\x04\xca\xd0\x07\x13\xcc\xcf\x07\x9c\x93\x1b\xbf\x7f\
-\x81O\x03gk[\xd0/\xf4\xb5v\xd3\xc4\xf7|,\
-\xdby\x5c\x9f\x0b=r\x1a&~p\x81O\xa3g\xa3\
-\xa7\xde\x1c{'fn\xc8\xb8\xf3O\x09\xfa`\xfe\xb2\
-\xdd\x0b\xf6o\x98\xbfe\xd8\xbf\x95\x1a{\xb9\xb7\x7f\xbf\
-\x85\xc6\x91\xd3\x90\xee\x83\x0b|\x123[\x87t\xad\xd3\
-\xca\xbe\xc1\x9243\xa3|S\xe1;\xf3(\x16\xa2W\
-\x07\xa3I\xd328\xe2\x07E\xfcv\x97i\x8f\x01-\
-\xc7\xee\xb2\xfe\xe2\xfcl\xd9\x019M\xec>\xb8\xc0\xa7\
-\xf1\xb3\xd9\x99~\x80\x9fe}\xc2\xf9\x80\x1f\x11\xde\xa1\
-o\x9e$\x09\x02\x92d\x5c)\x97@\x80\xf7xl\x16\
-\xc0b\x81\xe7\x83\xc5f\x0fx]\xc5\xf7\x99\xc7\xf5\xc4\
-R\xc0i+\xae\x1e=\xc9\x87\x0b\x02o\xae\xbf}\xff\
-\xea\x17\xc2n;\xb4v\x9b\x07\xb9\xb4O\x02\xef\xe1\x92\
-\xc1\xe9W\xc2\xde\xc6\xc1\xdf_\xd2\xbc\xf3\xcb!\xf6y\
-Pm\xf6\x8eO\xa0z\xf4\xee\x01A\xb5\xcd\x05\x8f\xaa\
-\xc9\xa6\xbc0h\x9b[\xfbi\x9b\x13\x0f\x08\xab\xedc\
-\xb3'X=z\xf7p\xb0\xda8\xe2\xf8Kvy\x1e\
-\x10T\xdb\x87\x18O\xa0z\xf4\xee\x01A\xb5\xcd\xf9\xa2\
-J w\x9cA{\xd2Vz\xef_m\xdb\xc4!Q\
-wr\xbb\x8e\x11u\x9bF&\x9fZR|H\xd8\x9c\
-\x1c\xab\xa3\x84\xcdF\xc7\xea\x17t\xb6\x1c\x10T\xdbG\
-\x0eO\xa0z\xf4\xee\x01A\xb5-\xe5\xf9K\xb8\x02\x0e\
-\x09\xaa\xcd\xe9\xca\x13\xa8\x1e\xbd{8Pm\x1cg\xa4\
-Z;\xbc\x22\xb0l6\x8d\xb6\xb7u\xeb\x80\xa8\xd9>\
-9xB\xcd\xa3w\x0f\x88\x9a\xad\xcex\xa5\x82D\xa8\
-\xf6\xa2\xa3\xf6\xb6u;\xdb!1ur\xb5\x8f\x11S\
-\x1b\xc7\x13\x1f\xb5\x07o\xf0\x9a\xec9\xbc\xa6\xedC\x84\
-'X=z\xf7\x80\xb0\xda\xc6@\xd8I\xd7\xc5\x0f\xee\
- \xb4\xc9\x85\xa8\xe96a\xc1\xb0\x1d\xd23\xda>\x87\
-w\x02\xce\xa3w\x0f\x08\x9c\x8d\xee\xf6C\xe0\x5cLl\
-X=\x94\x5c\x0e\x1c15lM\xcc\x967\x09\x9f\xdc\
-\xc6\xc7\xc1\xca\xfb+L\xd6}\x1eU'\x7f\xfb\x18Q\
-\xb5q`\xaf\x07%[\xeeB\x98\xab\xca\x92\x0b\x98\xb5\
-\xf6i\xb5t\x90j\xf5iek[)\xb5\x0e\x08\xaa\
-\xed\xd3s'P=z\xf7\x80\xa0\xfau\xa8\xc4\x0f\x09\
-\x9c\x93\xcf}\x8c\xc0\xd98\x92\xf7\xc4\xe6\xf0C\xe2\xe6\
-\xe4T\x1f%n\xb6\xf9F\x0fi\xbd?\xe6\xb0=d\
-_\xc0\xf6q\xa4\x13j\x1e\xbd{8\xd4l\x9ayz\
-L\x06\xff\xd5#\x9a\xf6\x07,\xee\x8f\x88\xde\x0f\x08\xad\
-\xed#H'h=z\xf7\x80\xd0\xda\xe8\x01\xfd\xe2\xbd\
-\x02\x87\x84\xd6\xc9G:Bh\xe9\xa6\x01\xa7?=^\
-@\xf1U\xb2-j\xd5Y\x0d\x8dL \xf6!+\xca\
-X\xed\xdbJ.\x0bm \xb0\xe5Y\x850\xc5{H\
-l\x9d\xfc\xa8\xa3\xc4\xd6\xd6\x19\xa8\x0a6'\x9a\xc1\xd7\
-^{\xdf\xdb\x80w8\xd4\xe8\xf6\xb1\xa4\x13j\x1e\xbd\
-{@\xd4l\xf1\xbe\x1f6%=\xda\x03vH\xdc\x9c\
-\xfc\xefc\xc4\xcd\xcf\xdc8\xf7h_\xdc\x01\x91s\x9a\
->9J\xe4l];G\xf0\xab\x193\xfc^*\x18\
-\xf7\x7f\x22\x87\xfa!\x91u\xf2\x80\x8e\x12Y[\x89d\
-\x11\x9f\x89\xe42\xc1\xaa\xa8\xfa\xa3\x9f\xade\x85\xa4t\
-\xd3\xde&,\x90\xc60\xaf\xa0\xde\xc6m\xc2\xca\xe9\x00\
-1+&\xeb\xfa!\xb5\xd6i\x0e\xe58\xb1\xf5s\x17\
-A\xacZ\xab\xadZ\xcb>\xa9\xb5tUZ\x07L\x7f\
-\xeb\xf6\xf5j'`=z\xf7p\xc0\xda\xba\xc3\xed\x17\
-\xb1_\x1f\x10V\xa7\x11\xa7\xa3\x84\xd5\xd6\xfd\x5c\xec\x9e\
-\x9b{\xa5t\xa5\xba\xa2\xaa%ctm\xa4\x13V\x88\
-\xcc\xad\x98i\x9b\x06\xdd\xf8\x8em\x9cr\xfb\x07\x17\xb2\
-\x0a\xb8\xb1\x08\x0e\xd2\x9bN\x83\xc4|p\x983\x22F\
-\xd0\xa9T\xb2\xa9\x95\xce>\xe7*\xa4i\xd0\xa2\x0fV\
-\xf4C\xc2\xf3\xe4\xaa\x1d%<7\xbbj\x8e\x1d\xa8`\
-\x81\xe6\xda\x13\x9d=\x19W\x0c\x18\x02\x9bO\xee\xd8\xf2\
-\xce}\x1a\x94\xfc\xcb\xe0\xe4? \xa4N#-\xc7\x09\
-\xa9\xad|\x9b\xbfp5\xdc!\x91ur\xd1\x8e\x11Y\
-[\xd7t\xfd\xf8\x9a\xdd\x03\xe2\xe64\xd9r\x9c\xb8\xd9\
-\xc8\xf1\xd3\xa4\x96J:s\x80\x09\x83\x7f\xd2>\xb7C\
-\xa2\xea\x94?=FTm\x9cm\xf9\xd9k:\x0e\x89\
-\xa8\x933~\x94\x88\xda\xe8\x8c\xbb+\xc6~\xa1y\x08\
-\xdb#\xc9\x0cK3f\x95\xe2~\xc8|\xfbi\xaa\xe5\
-8q\xb3\xadv\x9c+\xac@@oX\x9eF\x1d\xdd\
-,\xadj\xa1*;\x8eh\x10\xa54-\x1d\xb4\xbdd\
-x+\xa6\xc5j/\x82\xdd\x90\xe4\xbd\xd0!yz\xf4\
-4\xe0r\x94\x00\xdb\xba\x91J\xb0|;r2\xb3\x97\
-\x96\xb4\xbe\xa0\xfc\xeeI\xf9\xad \xd3\x14\x19\xc4uZ\
-\xaa\x8f\xb5\x91HJ\xd58\xa4\xd6:\x0d\xb8\x1c'\xa8\
-6z\xe5\x8fA\xa5T\xb0\xab\x16\x9b\xecZ\xb4\xc9\xa3\
-\xb8\xb5Y\x03+\xaa\x18\xc4u\xec:S\xc5.\x04\xfd\
-5\xd6\x90}\x1eY'\xcf\xfc\x18\x91\xb5i\x02\xe6\x97\
-\xd1\xd7\x1f\x12T'\xe7\xfc(A\xf5\x1c\xd4\xf6\x07\x84\
-\xd5\xf6\xc5Q'X=z\xf7\x80\xb0\xda\x98-\xff\xf9\
-\xcb\x5c\x0e\x89\xa9\x93\xbb~\x8c\x98\xda\xba\x87\xeag\xef\
-Q8 \xa4N\xb3X\xc7\x08\xa9\xb6u#\x906)\
-Vy&\x06\xe5\x93=_\xe9\xe54\x0cs\x9c\xb8\xd9\
-\xba\xd7\xb3\x83h\xa5\xcd\x1cXS\xce#\xc8\xf3\xee3\
-\xc3\x8b\x92\x09\xfb\x87k\x9fA\x86\x111\x11k\xf1\x10\
-P\xfd\x86\x1e0Q\xdeN\xc32\xc7\x89\xaa\xad\x8b\x82\
-\x0c\xcdx<\x0b\xa6\x8fs\xe7\x0b\xf7\x12\x91\xab\x12\xbc\
-\xf3\x04\x1a\xa8\x8e\x8d\x9c\x81\xb5/\xce\xd9I\xb54/\
-M\x0f\xd8\x01\xdaN\xa34G\x89\xaa\xad\xab\x84\xb4)\
-Z\x9bf\x92^\xa4\x8e\xf5\xd3b\x99)0\x82\xc9k\
-\xf8\x83\xa8pw\x18@T\xf4\xc8K=d*\xaam\
-\xdf\xfcs\xc2\xd4\xa3w\x0f\x88\xa9\x8dIN\x05\x85X\
-\xae\xfc\xed\xa0\x12\xe3L\x9d\x83[\x0c\x0d\xa0A\x1d|\
-\x88\xde\x0d\xab\xa7\xdb\xe0C\xecm\xb6\x22f\x07LE\
-\xb5\xd3\xe4\xd6Q\x82j\xeb\xe4\x96v)\x8d\x01*.\
-\x1c\xcd\x07\xad\xa6\xb1 \xf7\xe4\xeaH\x1a\xd4@\xf3\xaf\
-\x90qn\x0fv\xcb\x19de\xf1\xe4u\xcd\xa6\xce\x86\
-\x9d\xe8Y\xc0\xc9\xd5\xad\x0d+\x14\xe0y\xe5z3\xeb\
-\x87,\xde\xb4\xd3\x88\xd7qBpc\xc9\xb9\x81,X\
-$\x9b<\xb5v\xcb\x9a\xb3X\xf1dO\xc4v`\xd4\
-\x01\x1b\xbc\xff\xdc(\x0c\xd6|\xa3i1\xc5P\x05^\
-1/tPo\xec4\x8fs\x94\x08\xdb:\x8f\xd3\xa5\
-\x16\xc2\x9cWV\x9ay\xa2\x9e3\xf1(\x07\xfaAq\
-s\x1a\xb89N\xdcl\x1b\x88\x7f\xd4D\xb54\xc5\xc2\
-3\x90L\x9b\xa2\xa0|H\xe8\x9c\xfc\xaac\x84\xce\xa6\
-a\x98?=V9\x8b;\x92\x9e\x18K\xf6Z\x5c\x0e\
-H(\xd5NC/\xc7\x09\x9d\xad\x19\xa9\x07J\xe6~\
-?\x9e\xee/\xc8\x8b\x07+\xf2\xfc\xe0;\xf2\xdai\xe8\
-\xe5(\x91\xb5u\x99K\x94\x96\xe3\xech\xf2D\xab\xdd\
-'\xf7y\xc6\x83\x85\x9e\xf6\x0c\x1b=\xdbi*\xe68\
-\x81\xb5q\xdf\x8bh\xa99\xcfI\x5c\x84\xd6\xe5\x8b\x94\
-\xdb\x175\x97/\xb6\x8f\xb6/\xae\xeb\x17-\xb7/\xd6\
-6\xd6/~\xbc}1\x1b\x15L\xd7\xed\x8b\x87D\xdd\
-\xc9\xc7:F\xd4m\x9c\x9a\xa1\xac\xfb\xd9\xbcpoE\
-\x90\x8c\xc2n*\x1e\xcb\xa9\x0e\x89\x9aS\xba\xe9(Q\
-\xb3\xad\x8c\x0c.\xce$\xa6\xe2N\x85\x22v\xcb\xa9t\
-,\xa7\x1a\xbb\xa94wS\xc9XM\xd5s5\xd5!\
-\x13\x98\xa7\x99\x99\xe3D\xd4V\xb6\xf3(l\xd0C\xd8\
-\xc0\x18\xbe\xdbL\xd56\xec\xf3< \xf7A;\x0d\xca\
-\x1c%\xaa6\x0d\xca \xf9\x94\xb3\x9f\x80\x0d\x90\x82\xae\
-\xe0\xd6\xb9DE\x7f\xa7E\x91\x83\x96\x8aO\xf30\xc7\
-\x89\x9d\x8d\xa5b\x83m\xe3\x5cE%\x85\x14-\xe4Z\
-\x84t\xb6\xe2|@\x86\xa9v\x9av9J\xdcl\x9d\
-vy\xa4svK\xcd\x1el5\xcbv\x95\x8f\xf6\x9a\
-\x91\xb4\x83o6k\xa7\xa1\x97\xe3\xc4\xd66\xbf\xdb\x8a\
-\x91\x06\xa6<)@\xaa\xb8n6\xd3\xe8\xfb\xcb\xcd\x04\
-M+Xo\x16c\xbd\x99\xd5gXp\xd6N\x93/\
-\xc7\x89\xad\x8d)\xf3\x87\xc5\x95\xcf\xa6\xcc\x9f=c~\
-\x1a\x7f9J`m\x1c\x7f\xc1\x12\xc6\x0c\xe4\x90b\xea\
-f\xf7\xa1]\xff\xb1\xd8\xce\x9e!\xb8;\xcd\xc0\x1c'\
-\xae\xb6\xf6r\x96\xa8]\xa1\xb0\x98\x8aI\xce\x153\xc8\
-<\x89g\x10\x5cWG\xab\xb95c\x9e\x8d\x8b\x9aM\
-]\xc0w-\x98\x9biE\xe9\x90\x05\xe4\xd3F\xa2c\
-\x04\x97m\x1d\xb0\xe2j\x85\xc8f18Z\xc0V/\
-\xe0\xde\xb4\xd2(\xd0\xfdT\xacFv\x9f\xb7\xa6\x86y\
-\x87\x9e\x0a\x0d\x0cftH/\xeb4\x80u\x9c\xb8\xda\
-\xd8\xd3\x82M\xd7\xdc:\x16\x84\x880\xa3O\x13\x0c\x1a\
-\xd9\x95\x99\xe3\x0eciHi\xae1\xb7(\xa1D\x13\
-KqA\x89\xd9\x14\x9c\xea`\xe7\xaf\xd2\xfb\xcc\x86\xac\
-iC|\xc9a4\x8bk\xe9\xc4\xd3\xa2Q\xb4\xd2\xac\
-\xb5\x169\xe4\xe0\x96\x9d\x06\xb7\x8e\x13\x8d\x1b}\xfe}\
-\x9c\xe40D-\xac\x9df)\xda\xd0\x9aN\x18\x85@\
-iY`Zun\xa5\x1d\x922\xcfN3[G\x09\
-\xa8\xcd3[AEi\xa6l;\xe8\xd9\xc4\xa0B\xf3\
-b\xad4e\x05\xc1u\xce\xd7,\x04\x86\xaa\x8a\x09\x07\
-\x0b\xcc\x0cb\x17\x09\x12g\x18\xc1\x01\x11\x91e\x8bM\
-i\xd0\x91K\xf4b>\x8eB\x8cF@R,\xa3\x84\
-\xeb\x17\x85\xdb!\x07#\xec4\xf0u\x9c\x80\xdc\x18$\
-x5\x90\xf0\xc1S\xf3\x12*\x1ft\x5c\xaa\xb8\x8e\x0d\
-&%\x184\xff\x1a\x92\xdc\xd7p\xe4\xd2\x8f;(\xac\
-N\xe1\xc11\xc2j\xeb\xc8\x97Q-n\xf0\xc0\x0c\x81\
-\x00(\x8c)\xed\xe3R\x0b3O\xd8\xff\x86*#\x97\
-\xea1\xad\xb6s\x81\xf1<`\xe5\xc8NC\x5c\xc7\x09\
-\xaa\x8d\xe4\x0c\xe0\x89q\xf0b\x1b\x86\xb2\xb2\xb5\x941\
-\x7f\x8a\xa9\xe6\xce\x81LZ\xa7\x98\x177,\x88\xcb\x1d\
-\x95h\xc2!\x8c\xe0\xd0\x01\xe7(\xec\xb4\xa3\xeb8q\
-\xb5u\x03\x84\x1b\x92]\xf3\x12^Z\x15yH\xed\x18\
-\xfb\xd4\x8e6\xa8\x1d\xdb\x8e\xda\xf1\xa0\xfe\xfei*\xf0\
-(\xa1\xb5u*\xf0\x13\xd0\x1aT\xb4:\xa8h\xd9\xf7\
-\xb8h-\xf6\xd9h\x0f\x89\xac\xd3\xdc\xe0q\x22kk\
-v?\xd9B\x81, l\x10\xf11V\xbd\xf7\xd9\x8b\
- \x99\xbf\x08\xb4\x96\xcf\x0c`\x19f\xe5\x934m\xc6\
-\x0ey\xed\x07\xcc\xed\xdbi\xae\xf0(\xa1\xb5u\x07\x5c\
-\x17\xf8W:\xa3U\xc7\xacaqMX:RV\x98\
-\xec\x80\xc3\xccvZ\xcfv\x9c\xc8\xd9J:\xebh\xfe\
-\xeb\x99w\xf2\x1d}\x0c\x15\xce\x05\xdf%\x0c\xd9+\xe6\
-\xb1:\x97\x91\xa1\x8aL\x9c\xb6\xd0\xb9\xe2\x8b\x87t\xd2\
-O\x13\xab\xc7\x09\xad\xad\xa9\xf8\x1aEx\xa44+&\
-q`\xef\xac(\xeb\xdcK\x90r\xe6E\xb5\xc6,\xbd\
-TE\xdb\x04\xf2\xa4\x8df\x14}\x9a\x1f\xd2\xde\x9dF\
-V\x8f\x12Z[\xf7\xb4}Bk\x81\xf5\xd1(\xe3\xbf\
-\xde\xdb\xe4\x18\xfeRtI\x986AgWt\x9f\x09\
-\xed\xa9~\xc8\x9eA;\xcd\xac\x1e'\xb2\xb6f\xd7Y\
-\x0bS\x9b\xa9\xa3i\x8bG\xbd\x07=\xf3&c\xf6\x8b\
-Au\x8c\xec;\xa8\x1c\x1c\x03\x18\xe6\xc5)\x97\xdc\xa0\
-$\x04\x12m\xe5\x91\xa1\xd7V\xc4\x82&x\xfc\x0c\xcf\
-\xdf\x92\xe2\xddQ\xeea\xc4\x8e\xc9\xdaV\xf9\x90\xbc\xc8\
-v\x1ag=J@n]\x02\x17\x22%@\xea  \
-Nk\xe0}X\x5cJ\xaf\x820\xb1\x87\x0b\xca?\xad\
-\xb8\xc8L\xec\xa5W\x0cv8\x86\x13ef\x8e\xd2[\
-m\x93\x8c\xd5\xe3T9W\xc7%\x15|\x1b\xed\x17\xad\
-\xfbD\xd12` \x09\xd0\xb2\x1d\x12\x8d\xa7p\xe1(\
-\xd1\xb81\x5c\xe8\xf0\xe9\xc4fA\x0a,\xd0Q\xdd\xa8\
-4Xb\xc2\x9ag\x9e\xba\x16\x03\x13\xbc+\x16~\x81\
-}yL\x1ci\xc3\x14\xf6\x01\x81u\x9a\x96=N`\
-m\x0c\x16(\xd0\xfc*\xb3\xb0\xad\xd3\xb2\x1f\xdb]}\
-dwW\xb3\xcb;\xb3\xfb\xd0\xe8\xee\xd9\xdcVs\xb5\
-\x05l\xae\xaf&\xf7\x80\xdd\xfdv\x1a\xb1=J(n\
-\xddE\xa7U\x8ba\xfe\xa8J\x11\x8e{\x83\xab\xc3\xe0\
-\xf6\xd5\xder_\xedm[\xcd\xad\xae\xe6\x96\x86\xb5\xd5\
-\xd5\xda\xb6am\x11\x9b\xa4\xb5\xb5\xd5\xda\xda3X\xdb\
-\xd3\xc0\xeeq\x22qc0\xc2h c\xe4\xff\xb9\xf4\
-\x5c3\xb6gme\xdf\xda\xc6\xb0\xb6\xcfalO\x03\
-\xbdG\x89\xab\x8d\x03\xbd\xbd\xa3\xc7\x1f\x04\x96(\x9a\xb3\
-N\xcc\xa9\xf0\xa0\x95\x0e\xaa\x8dN\xbe\xffQ\xa2f[\
-\xa3\x7f\x84\x94p\x8c\xea:\xb6\xfb\xd2\x14N\x05+z\
-\xc0\xbc|\xc8iI;\x8d\xe1\x1e'n62yc\
-\xaf!\xf5>+\xca\xd8\xe8\x98\xae\xc5+U\xb7Y\x05\
-,\xf0\x87\xcc\xc6\x9e\x06m\x8f\x12:[\xf7\xccQH\
-aD}l\xa5\xaa:\xfaN\x9dzN\xa9\xd5\x83v\
-q\x9d&i\x8f\x138\x1b=\xe7\x87\xfb\x9b\x9e\x0f7\
-'\xcf\xf8\x08q\xe3\x1b\x87d\x1fq\xe1.\xe9\x1a#\
-\xc4:\xb4s|\x9a\x82=N\xe0lK\x8c?\xa2\x84\
-\x18\xb89xL\xe5\xa7q\xd5\xe3\x84\xcd\xd6\x1e\x99\x87\
-=\xa1\xfb\x86\xea\x80-0~\x9aK=J\xe4l\x9d\
-K}X\x89\xe3\x16\x05v\x0a\x0b\x91\x0eI\xca\xee\xa7\
-\xf1\xd1\xe3\xc4\xcdF\xcf\xf8Q?\xc1>p\x0e\xd8\xcf\
-\xe9\xa7\x09\xd1\xa3D\xce\xa6\x09\xd1?=\xaeF,\x5c\
-KSi\xb3$\xd3\xfa\x01\xc7@\xfd4\x06z\x9c\xc8\
-\xd9H\x11\xf3\xb0\xa2\x9a\x15*\x14\xe7\xa9\x15\x8fC2\
-\xa2\xf9\x8f\x0ez><\xdf\xf5\xb1\xe3\xf7\xbf\xf8\x9b\xcb\
-\x0b\xfc\xef\xbf||\x87\xbf\xa8\xa0u\x93\xb6o^S\
-\xaf\xb2S\xa9T\xb9\xcd\x8a\xb5\x17\xd6\x154\xa9\x8a\x85\
-r\x91\x93c\xe4\xcc>a^\x9a(Y\x97D\x95\xdb\
-\xd4K\xa3\x06\x02L\xe2\xa2U\xbcO`Vu\x97|\
-\xa5)5\x9ez\x91\xe8\x81\xd9\xeb\x06J\xfa*\x93\x97\
-J\xe2h\xad\xae\xc5\xb5bt\x88JP\x03\x0f\x05S\
-\xa1\xd6P\xa6\x8e\xa2\x22X\x0d\x8b:\xb3;\x9a&\x18\
-\xa4\xf6\xd1\x90\xb5\x87\xe3\xd9\x93.\x00\xac\xc0\x91\x85C\
-)b\xe0\xdc\xc4/\xd5*\x95\xf3pM\xbah\x0e'\
-Y\xc3W\x19\x1f\xa3\xd6\xa7+\xec\xe7h\x110\x1f\xb5\
-X\x98\xeb\x84\x16n'\x81\x0b\x9bk\xd2\xaa}\xf2\xa5\
-\x12Z\xb5\xcf\x15\xf9_\xc2(\x94x\xa1V\xd9\xb1\xf8\
-\xc3\x9cx2/\xbd[\xf8\xdc\xb4\xa8\xb9\xdad\x84\x16\
-#\xe19z\xd1\x06\xdb\xb5p\xe1`Nv\x83\x86[\
-\x02\xae='\xa91\xb3\x81\x04\x01\xe7M\xf8/\xea\xb3\
-\xb4b^\x03g-\xe8\x1a&\x99\x05-#Peh\
-\x1e\xe1,\xe9\x83\x11\x99{\xb6\xd9\xe1:c\xf6\xd2\x9d\
-\xab\xe5g\xccE<?S]F\xa3go\x84}\xf2\
-x\xa96Cr\x9b\xbc\x83\xec\xaf\xe6\x86J*\xdd\x83\
-\xb1X\xa0p\xef\xe2\x93\x96\xe6\xdc3\xa1P\xbdr\x9b\
-\xfe\xe3\x91`\x01\x96D\xcc\x9f\xd3\x1f\xb7\x17\xe7W\x97\
-\x7f\x97\x9d\xcd]D\xfe~\x1f\xe1?\x0a\xea\xd7\xf9\xcf\
-fPc\xac\xa8Vm\xb3\xaa\x82\x90\xc9\xd1\xf1\xb5\x00\
-\xa1\x02\x9a:\xc2)$\xf8Zaa6\xe0\x9a\x1aa\
-A,#\xcb\x9f\xeb\xac+\x18\x82y@\x05m\x11`\
-\x85\x12\xd0m\x02o-\x9a\x0c\xf4\xbb\x9a\xe25/&\
-lI\x9f\x82\xa9743\x16\x22\xa5q\xa8\xe6\xd6{\
-~\xb3V|\x91\xb5x\x0f\xd0\xf9P+\xea\x84\xe4\x8d\
-x\x11i\x8e\x8f\x15\x13\x81P`\xdf\xb6I\xae\x9a\x89\
-F8Q\xf4dx\xf6\xef\x02\x83\x9a\xb1;\x88\xfa{\
-\x8f\x09\x1b\x93#\x05NJ\x0d#\x9e\x08\x85\x8a&\x9c\
-\xb2$\x9d,{<\xd2\x8fR)\xcdBcj\x09\x81\
-\x5c|\xcbj\xb5O$@0\xc8b*\xea\xf1\xc8.\
-9\xc3`\xd6b\x1c\xa6S\x94p\xf4m\x22W\x89\xca\
-\x08uta\xe6|\x04[D\x9b\xd8\x8by\x00_\x8e\
-\x09\x89\x1e8\xa6R\xc3\xf6\x89lkRB\xa6\xa1\xf5\
-Zu\x96\xec2\x09\x07\xc9i\xaf\xbd\xc9\xdc\xb8\xb4\x06\
-:-\x18\x19W\x9a\xa3Tj\x229\x1eF\xaa3\x9a\
-\xaazO\xd4\x06\xf7 \x1c\x83\x15K\x9f\x16,{\xea\
-\xc6X\xb7\xa3D\x95r\x8f\x8av\xf0\xee\xf6\xec\xd0J\
-m!J\x84\xa3\x98)V\xf7`+0\x06\x16;\x9e\
-\x93\xb7\x94=\x22\xe1$\xf3\x15R\xc14\x91\x17i\x06\
-F\x12<\xf3\xec\x86nE\xb4\xa9\xcd\xb5p\x85\x96\xf2\
-\xe2\xbd\xd2*CCC\xb5\xe8\x92\xb7\xb6\xb2\x91|^\
-h\xf47\x17\x1a\x15)\xa6!>kx\xd1.M\xd6\
-\xa1*\x13E\x83\x1atVb\x11\x94\x1a\xadwJx\
-6\x16[9\xa9\x08\x90\x01\x16\xba\xf6\x96\xf7]\xd0\xcc\
-\x9bkGXx\xc7\xa6\x06\xadKR\x82d\x15\xc1\x90\
-u-%8\xd6\xf2sh\x0bn\xb0\x13\x18\xd92F\
-B\x13w\x9d\x22\xe6\xc1RD6y\xe1\x04\xe5\xd2;\
-\x88\x01)\xa6\x8e\x13l\x0d?\xd8\x0d\xecD\xd4J'\
-\x85\xd2\x22\xacp\xaa*@&\x0b\xe7\x8ca-\x9d\xc9\
-&$0:\xcf\xb5T\xac\x84v(z\x13<R\xe1\
-p\xe0\xd6\x9a\xc7\x8c\x8bW\x91\x89k!a\xf3\x19\xdb\
-y\x9a\x1b\xf4\xbf\xb6\xee\x02\xc5\xcd\xecmR+\x14\xd8\
-l\x8e!X!\x88\x87`\x1951\xe6\x85(Z\xd0\
-\x94?\xdd\xfa\xec\x8e\x13\xa4Ht1{\xc8\xdc\xadh\
-\xafa@\x97\x9a\x83k.7N\x0f\xe0\xaa\x82\x9c\x9c\
-\x0b\xd5\x8a\xdbN\x81u\xd6\x82\x99\xb6\xe8\xc8\xfb~\x16\
-_v\x00|]\x1a\xfe\xb7\x19_^\x0b\xa5\xb8(f\
-\x14H\x02\x9e\x068\x81\xf2I[q\xc1\xdaw\xca\x1b\
-\x9c\x9a\xd5\xb2\xe9L\xb0\x00\xc9ZZ\xf4n\xc1\x0aS\
-\x14\xd5\x87Y\xae&\x0a\xb3\xec5\xc4f\xd4l\xbb\xf7\
-\x8aAR\x8e\xbe\xf2R\xf5\xb1\x90\x8b)l\x00\xb47\
-\x87\xc9\x05\xf4\x0c\xab\x9a\xc5\x8a\x06cp\x99{\xaa\x04\
-\xcan\x81\xdajj\xfbZ\xb8\x81\xed\xa3\x97\xc6,#\
-\x8003\x9cS\x9e\x1dC($\x97\x81%\xbf\x91\x82\
-\x14\xa4\x1a\x0c\xb6\x16W\x01Qs\x85\x97\xd4i\x1a\x8c\
-Z\xc9\xb2\x85\xf7\xb8=zEcR\x84%\xees~\
-)\x07\xae\xb1\x1cJ\x83\xf2\xd1{\xc0\x1c\x83r\x84\xe0\
-/\xc0E\x85bo^Z\xc3\xecPKW@:\x0e\
-\xe38#\xdcJ\xb0w\xb5\xc2\x0dV\x8b:X\x97Z\
-\xc7\x0b5q)\xa5v\xd0\xce-I\xfc\x05R\xd6B\
-m\xady\x93\x87\x05\xd4\xb6SM\xf5\x89\x07\x85\xa6\xfd\
-\x00mX\xceU\x16\x92h\x0d*\xd7\x9c\xd1\xf4\x8a\x87\
-\x08\x1fpf)\x16\xb5\xfb\xf0f<uw\xa0\xed\x22\
-\x8d!\x08\xd2\x03\x00W\xf2\xfc\x0cd\x5c\x08\xbe\x94X\
-\xb76-\xaa\xe88\xacI#\xcb\x16-\xd2\xbbQ\xee\
-\xe4\xb3\x97\xa0\x8e[\xaf\xb0C`a\x847\x13N\x92\
-/E\xa5\xe6\xebK\x92\xe6\x92pO\xa9\xf8\xe5\xa2\x13\
-\x15\xab\x9a\x8c.%\x1af]\xa4\x84t\xe8\x17-\xa2\
-Q\xfd\xf3\xa2\xd4\x0f J\xb5\xf6\xda\xebVQj\xd8\
-\x83\x11\xc11k\x87\xb3\x112\xdc\x9bJ\x09\xdd\x0a\xd6\
-\x07\xb4wr-\xdc\x19.['\x90\xc0\xdd\xbf\xe0\xf0\
-\xf1$\xa6\x9a&\x9e\xa5\x0a\x8co\xed\x15\xddU\x1dw\
-S\xda$\xf0\xa0\xd5s\x17B\xe7\xca\x94\xb2Y\x1d\xab\
-\xf1\xa8x\x85sI\x06~\x1c\xf8%\xa0\x8c\x86\x0f\xc2\
-RZs\x1d+\x16\x94\x8d\xc0\xc7dZ#\xd7\x9f\x17\
-\xc7\x80$\xbe\xe6\x96sD\x18\xac\xac\xde$_b\x98\
-\x01t[4\x05\xd9\x1cT2\xf4;L\x8b\xe5\xdf\x22\
-8\x1d\xc2:\xab\xce\xe9\x15\xa9\xa7\xfb\x06\xef\xab\xf6\x96\
-V\xc7Cq\x19\x82\xcdi\xb4\x0a5s@\x0aA\xe7\
-\xd3\xd3`\xb5\x8c\xec2\xa2\xe9\xc5\x9b\xf1 \xfb40\
-\xe1\x81G]<\x92u\x11s\xe85\xcd\x05\xbc\x15\xb8\
-]p\xa0jm>+\xd4\x82\xc14\x95\x9aT\xc6\xb5\
-xK\x1cG\xe9\x98\xe9\x83\x1e\x88.\xa9\xa6['\xe7\
-\xd9\x8bV\x95\xd4\x0c8c\x85;ap\x0dt\x5c^\
-\xa4\xa2C\xd8\xd1,]VB\xbfn\x8680\x93\xd0\
-=Q\x04\xa1Xz}\x16p\xc4\xf1TU{\xe3T\
-d=Hu\x88\x92k\x12\xc6s\xa0\xeb\x09\x16\xc6k\
-Zm-F\xa1\xe3RDA\xf9\x97ECX^)\
-\xd2\xb4\xc3\xbaYU\x86a/F\xbd\xc33\x8a\x9a\x12\
-)%:\x9a\x82E\x8b\xb7\x88\xbc\x16<\x98\x18\xba\x88\
-R\xd3`\xe4\xda\xd0\xd5\xae\xf0\xd3Vt\xb26\xf69\
-@g\x99w\xad\x16\xab\x94\xcd\xc9T\xa5\x0d\xada\xd4\
-\xc43\xe2\x89:\x84\xb6b\x1c\xa8t#\xed\xe3\x87\xb0\
-\xdc\x0c\x18\x0b\xd7<\xbd\xea]f\x18\x14\xa2A`\x1e\
-\xe0\xfb\xca\xcb\xaeC\xefx4k\xd0\x04\x11\x8a\x1b\xcd\
-\xa0\xa4\xc6s&4\xf6$\x90\xa0\xc2\x94\x11\xd7u\xc3\
-\xdc\xd1\x02X\xb6\x0auA\x12<<w\xea`S\xa1\
-B\x15\x86?\x95\x9c\xc2\xf9\xc4Y6x\x9a\x98\xd2\x14\
-\x86\xcb\x83\xaf)yj+\xab>B\xe9\x10WY\xad\
-BM\xa6\xc5\xe1\xf9\xa6wl\x15Lxx6*\x88\
-\xe2\xe0\x82\x91$qYk\x122\x91\xe6\x9d\xfb\xf0\x99\
-\x8c\x1d\x19T\xc8\xeb\x0b\xc9\x14\xda\xdb\x5c!rn\xe3\
-\xbb\x15d\x8fdE\xbdE~7\x0c\xc3\xf1;\x8f}\
-I9\xb0>eg\xae\xc6j\x86\xc8\x939-\xac\xf5\
-!\xa4dxh\x926.7\xf56\xf6HS\xecb\
-\xc3\xe8iUg\xbc\xa2\x9e1H\xc0\x85\xa6aTR\
-F\xb5t\xc7\x90WES:>QA\xfe\x00\xcf\x06\
-\xc1P\xcb\xe4.\xd4q\xca\x90\xc36\x03\xad\xa0\xdc\xf5\
-*\xe3^\x86\xe5=Q</\x931=\xd1\xc5qe\
-\x0d^\xa9\xc3\xaexq\xc9\x1f\xb8\x0f\x93\x89J\xef\x12\
-\x89}\xc5\xf9\xa5\xd0\x84\xadd\xf7y\xdb Z,2\
-\xc2\x9e\x8a\x91I\xd2\xc2=\x8dOa\xd8\xa5\xfcR\xa7\
-VA\xc5\xca\xf9\xc4\xb9\x88\xd5\xc0N=\x95\x8e\xc3\x12\
-\xae\xc9\x14\xc8\x97\xd05\xa0\x0cF\x17~/\x95\x9cS\
-=h\xc3M\x93B\xcd\x12\xa30\xe6\x9e9\x04\x97\x9e\
-\x1e0\xbcJn\xf1\xe1\x150%\x86\xca\x5c'd/\
-=S!\x0c\x03\x1f\x08\x8b\xa0\x9a$_1%\xc5+\
-\xe4\x8a\x98\xb2\x16\xeaMer,!\xe1\x80\xed\x176\
-RL\x16S'L\x8c\x06\x84\xa9\xe6\x93s\xa4k\xa8\
-h7\x99\xa0AZW\x10\xcd\x1a\xb0\x83(\xaf\x8a\xb9\
-a\xad\xa9tw\x98\x03%\x13\x9d\xbdTA\x90\x87\x14\
-\x8e\xc0\x1d\xa5\x0e\x92\xd1\xae\x13\x83\x16\xb9[\x9f\x05w\
-H\xbaO\x0cWK\xdb,%ZU \x88\xcc\x197\
-4\xac3\xfcAdO\xee\xff\xe6\xcc\x81\xe0\xb2%\x13\
-$\x9c\x19\x1bi\x82\x84\x93P\x8e\xd64\xe4\xad`B\
-\xd2<\xa1\xb5\x93\xbc\xb0\xc2\x8602.H\xb4\xc0{\
-47\x17\xf8\xe7\xca\xee\xc3\x1c1y\xb7\x09\x07\xa8L\
-3\x02\x10\xe5\x145(\xab\x0e\x8f\xa6\x1b#\x1d\x92\x93\
-\xfep1\x1cK\x84+MhhWc\x04\x06N\x99\
-\x19\x12\x86s\xeb\xf07\x18g\xc7\x0c\x8e\x00\xf0\xaf\x06\
-\xe2\xee\xe2URSyp\x853fd2G\x09!\
-l\x8bA\xbe\xe5\xfe/\xd0P[J2\x17\x8b\xcc!\
-T\x9c~\xfa\x86Q\xadK\xb2\x5c\xa8\x1aC\xd6Uj\
-\xee0\xa2\xe2d\xd2\x11\xe4(cn<\xad\x8c\x856\
-\xf0\xf1\xeb\x007\x82\xab\xde\xa9\xe7\xad\xad\xe9e\x8a\xad\
-\xdd\xd4U\x9a\xd9\x8c\xdb\x01\x9f\x02\xdfq\xc7\xfaH\x18\
-\x18j:]e\xba\xcb\xbc\x02\x04\xee\x99CIW\xaf\
-\xeb\xaci\xf8kf\xa0\xf0\x9a\x07\xd2/\xf8UJ\xf8\
-B\x83\xc7\xdcrsN\xca\x05\xe2\xa6\xc6s\x12\xd2\xe6\
-\xf2\x09)B\x01\xf4\x18f\x8c\xd7L\xa0[\x8f\x19\x16\
-\xbc\xe6t\x14E\xe1^\xbb\xcc\xe2%BlD\xd9\xe6\
-Ms\xc3\xae\xb5\xde5m\x1dU\xa6<\x14\x5c\x97A\
-\xd1\xc0\x99\xe6H=*]?\xeb\xe0E\xfc\xf6\x0e\x9e\
-!\x1c\xc4e*(\x06\xa9\xb5\x0c\x02\x8aC'&\xa1\
-\x89Zk\x90\x00V\x8c\x86Y\xe9Z\x1d\xd1k\x17\x18\
-\x04\x84\x85\x88z\x10\x1f\xf1\x88\xaejc\xb7\xa9\x17g\
-\x02\xb7\x05\x19\xea\xf7\x80\x1a\xc4\xc9l$\x8d\xb4\x22\xfb\
-\x91\xc6\x10j\x167\x94\x11\x90\xc0\xe5\xb6\xf4\xfb\xe0\xa5\
-1\xf9\x94\xf1;2\x1b\xd6s\xb5\xd6\x15\xe6\xde \xf3\
-9\xa7F\x0a\xdb+\x98\xe5Mg\xb1\xa6\x0e\xba@V\
-\x11\x1b\xb8\x97ZZX\xc4d\x96\x83\xe6\x9c\xc1?R\
-\xb84\x91f\xa8\x93~J\x07\x8b\x94MT\x1511\
-\xda\x0d\x90\xd5op\x16\x08\xbc\x09UA\xf7\x82\xc5K\
-\x0dw(Y\x83\xac\xaf\xb3r\x88\x082~o\xd2\x93\
-\x14F\x90\xbd\x03C{W\xcd\xa8\xa3S^\x9b\x97\xf0\
-\x04O\xaf\xa0\x5c\x00\x09\xad\xa7\x07\x11\xc4=\xd5\x9e#\
-\xe1\x80\x00\xbf\xba\x1bCP\xb8\x81\x1eR\xb3,\xc0\x19\
-L\xa0\xc5\xdcK\xd4FmJ\xcf\xa6g\x0e\x0a\xf9P\
-\x10)\x17u\xf8\xeb\xd0,\x8d[\xe6\xa9ZT\x84C\
-\x88KknjU\x86\xe1\x80\xb1\xb1\xe1\xc9*\xad\xe9\
-\x13\xb6\x9e\xe9&\xb6\x86\x98\x05\xa93$)\x87\xe5\x08\
-W8\x8d\xc8\xc8\xe38\x22\xf8\x18T\x86B\xe7\xa4k\
-\x99\x0b\xad36\x85\xf6\xef\xe9'\xd5j\xa94J\xb3\
-6b\xaf&\xe9\x82\xc0\xed'\xcf\xcf \xcb\x09\x05Q\
-\xb1\xe2j\xe9I#\x07'\x89\xbb\xa5\xb1Cv\x06\xf9\
-\x15(\x1e\x87\xfb\xc5\x99-AF,\x98e\x02O4\
-\xf7@\x92\xaf\xc2\x19\xc6G0=F\xbdR\xcc\x06\x8e\
-\xfc\xc6\xe9\x0d\xa7+\x0a]c\x19\xefs\xba\x09\xd2\xb1\
-?+Y\xc5\x1a\xebP,\x22\x16I\xdaO\xec5\x03\
-TD\xbdc\xc4\xcd\xf2\xf8\xc5\x9d<\xf0\x8b\xdd\xb3\xc4\
-\x80\x9c\x00n5RSPZy\xe2\x15\xea\x14\x91/\
-|\x9c\x9e\xceEC~R\x05o\x09b\xc8Bp\xab\
-g)\xdc5\x8dr-\xadc\xb8\x13)\x7f\x86\x0e\xcb\
-H\xc4:\x7fx%Y\xb6\xa9\xc3\x07\x03\x0d_\xa4\x93\
-\xc7\xea\x94\xe1x\xad\x92\xf4{\x01W\xf0s\x0a\x88+\
-\x1d@\x01I\xfe\xb3Y\x0150>\xf4\x80\xe1F\xc9\
-\xa7Z\xeau\xec\xe0h\xe9i`\x02\x90\x86Z\xad\xd4\
-\xa1s`M+\x9cY\xa4\x5c\xa0`G7\x10\x87\xb3\
-\x8d\xdaE\xa4z\x80\xb3\x8c\xbcY\x81\x1e\xf1\xb1y\xa8\
-\x8e%W0\xc7\x08\xf0\x90\xd9\xee\xc8\xccUI_\xba\
-\x92\x99\xc3!a\xe5\xf1\x8d\xc6\x0eO:J\xe5\x1a2\
-\x0e\xca:%\x95\xb9I\xcbp\x85\x14\xe7L\x1d\xe9\x02\
-\xedX\xdf\x1e\xad#\xff];V\xd6\xe2#5\x04/\
-8\x5c\x91\xf1\x02#u\xe4\xb5g\xb4X\x14\xa9\x02l\
-\xac\xf1y$}\x90$\x22\xf1|\xa2\x923\xbbA\xad\
-9\xbc)\x14\xaa$k]\xdc\x18\xfe:\xb2}\x92\xa1\
-\x1a\x5c\x0e\x15\xd8j\xd4\xbd\x82\xea\xd0Z5\x90\x91D\
-(\xdfR'\xba\xbb\xf5\xac\x915\xce\x88\x13\xff\xce\xf8\
-\x99\xdd(/\x9c*\xd6\x7f\x09\xea\xd7\xc9dUa\xc8\
- \xcb\xbd\xc5\x9c\x968dBA\x01R\xcb-j\xca\
-Q\x13\x1aoW\xa5\x11\xec(\x8c@\xcd:]@\xb1\
-x\x04@\x8bt?e\x0e\xdd)\x8f\xaf\x91\xf2\xd2\x1c\
-b\xdc\x0d\x22\xa4\xee\x19\xd3\x82<\x92\xc4\x14\x5c\xa5\xd2\
-(\xc7I!\xd9\xc8\x04!\xc2\x22NIS\x88\x11\xcc\
-\x80\xa6O\x18m\xbc&\x027\x1a\xaf\x11\xc5\xf0\x22B\
-\xf3.d\xdc\x07\x17\x80\xc83`a6\xc4~\x82A\
-\xea\xa8\x99\x8e\x10\x96\xcf\xe6:\xf9\xc1*\xd9\xdfB|\
-\xb4\xc1z@\xd8\x05\xa9\x1a\xa1\xa1\xbb\x82V\xeb\x07m\
-9\xa2\xed\xce#\xe7\xd4\x9b\x8f\x8aB\xab}\x04X\x99\
-\x95\xc1\xbf\xb5\x22\x9cB\xaa\xb7\x1a\xeaQi\xa7\xe1#\
-#Z\x82\xd9\xc7\x91\xfa(c\x8e\x0c\xa8e\xc4\xca\x99\
-\xee\xcb\xdf\x93\x11\x95\xe3^\xbae6\xd2\xbbk\x1a\x1d\
-\x9cA\x0aP(\x0fw\x0e~z\xd2g\xe7\x7fL\xbd\
-(r6iA\xd3\xc9@\xe2\xbcG\xae\xaa/\x02g\
-\x0caa\x07d\x11\xe8U\x1d\x04\xdc\xac\x02\x13\xdb3\
-\x87\xdb2\x03d\xc8\x888V\x0dd:\x1eny\x16\
-M\x03Yu\x16B5\x14)t\x83\x03[\xbbYd\
-\xb2\xb0\x09\xa3d\xab\xa8\xf6\xaa\xcf\x08`\x12\x81\xa9\xc3\
-\x15\xd9\x01\xe9\xe2\x83\x01\x0ew\xa1\xcd\x99\xd3\xcb\xd2g\
-a\xc3p~\xe9\xd2\xa0\xad\xb2\xdcg\xfc\xe1\x85\x0a\x03\
-\xed<\xd7|<\x9a\xb7\x06^i\xe69{\xeb\x12i\
-3km\xf1y\xbc\xb5\xdf\x1coX7\xc3\xd8\xd4 \
-\x95\x0a\x8b\xe9j,\xdd\x1a\xe7\xc3\x15\xe8\xbcQ?\x1e\
-\x8a+\x89:-\xf3%^cTr*\xb2\x1aQL\
-:\x8a(pU\x98\xea\xdaK\xaeI\x87\x81t\xd8j\
-S\x1b\x0c]\xe6\xd9\x10\x81\xab\x8d\xf2\x97u\xce\xf4Y\
-t\xc3\xef\xa1p\x08[\xbc \xb6\x0c\x1b\xfbpH\xa8\
-\x8f4C\x90\xf4\x11\xfeF\xfe$\x12\x0f\x06\xb7\x01\xdd\
-\xa4u\x9c\x96k>\xa8\x8f^\x09\xa8\xb3\x91\xba\xd4\xda\
-Ql\xcc\xf4\x1a2\xf4\xa1\xa5sC\xee\xa2\xa3\xe5\xa0\
-c3y\x18\xf2j\x0d\xf6\x17>P\x96\x7f9S\xd9\
-(\xf2\x8d\x8c\x18#u\x8a\x89\xf7\xfbW\xe0\xb9%!\
-%\xc2#\x14\xadF\xba\x9a;\xf4(\xe0\x16#\x15\xa6\
-\xc8\x0eT3I@r\xe7T\xa3,\x88G3C\x14\
-\xa0\x1cD\x1e&R\x1d\xa2\x86\xd0Hs\x97\x8b%\xb9\
-\x83\x15w&\x83\x1a\xd5f\xd0\x8f\x0c\xf6\xaf\xca\xe8\xaf\
-\xe9H\xd5\xe1Px\xad\xb7V\xf3\xb5\xee\x8c$7\x82\
-|\xab\xf8\xbd\xfc\xf7\xc8\xde\x07\xca\xb4\xcd\x0dE&\xa4\
-\x0e\xf1g\xef=x\x82\xef\xb4\xc6{\xb4V\xc7\xcc\x03\
-\x9d\x1f\xa5\xb1Y\x9aF\xaah\xe1\x88\x22\xa6$\xb9K\
-\xabc\x04\xceq\x83u\x14\x8f\xc9\xb9!\x05\xc0\xd1\xfb\
-\xa40*\xc6\x19\xe6\x86J\x0b\xc4\xce\xb8\x1c8\xc3\x15\
-. \xe7\x12A\xc4\xd2\x1d\xf0U\x1a\x0e7R\x19\x82\
-5K\xde\xa6\xab\x89K\xa7\x911e\xc00\x05\xb9\xa3\
-~,\xe8\xdc\xb2\x9d\xfa\xe4P\xa4'\xcc\xb0\xba\x17\xb7\
-\x9b\xa5\xd9\x8c0#\xf5b\xe9\xa8\xc8\xcd\xa8\xd8\xad\xd9\
-aA\xf10\x09\x1f[\xcf'H\x19\x0e\xe1\x05C\x16\
-\x98\xf1\x04k\xdb\x15l?+\xe1\xfe\xdbKx\xc7\x9e\
-Yx\xff\xd2P\xa3\xa2\xcc\xaa\xc2\xa9F\xaf\x02\xca\xe1\
-\xac\x86G\xdeZ\xa6\xc8\xd1$\x89lG-\xe2\x06\xa3\
-\x83\xe4\x192\xf6\x00\xa7C)\xa4RFI\x0a\xfe\x8e\
-\xfb\xa8\x8c\x11\x12\xd7\x90\x94\x8e\xa4\x0d\xba\x14zE$\
-\x8e\xd0s\x04w\x90\xf1\xda\xa7@r\x88\xd2P\x05[\
-\xc6Yj\x99\xe6Cs\x00\x12\xce\xd9\x08>\xbc\xb9\x8a\
-*(\x9c\x0b$ \xf2\x04\x12\xbd\x8d\x90n\x82\xec\xa5\
-\xe6I\x92\x8aL\x05A\x8a2\x93o\xda\xb2\x04\xdf\xa9\
-\xe3\x89CT\x90\xb9\xc9\x95\x81\x99%\xc4s\x03\x80#\
-d\x08D\xf4h\xa3\xab\xa53\x0dk\x86T \x9c\xb7\
-\x08\x8f\x91\xadV\xce\xec/\xa2[\xa4n\xa0\xeak\xa5\
-\x9e\x92,\xd2W\xb4\xc1=\x9c\xd3\xe5\xc7/\xa1i\xc0\
-;rDjA#\x1a\xa3\x0c\x02q\xd3D\x87\x8b\xab\
-\x84\xce\x1f)\xc4\x12\x9fm\x91\xe1\xfa\xdbg\x18DZ\
->v\x9b\xb9!\x88\x11\x19\xadC\x85 \x19\xe9!4\
-8\xddP\xce\xcd2?\xa0x\xb0\xee\xa3l0\x9c\xb3\
-T\x14\x99\x83\xb1T\xd4\x9c\xe5\xb3@iw\x91L\x1a\
-!\x80\x85\x1f\xdc\xd6W\xa4\xc9hk!q\x07~3\
-\x83\x87\x8f\xa2%\xc4\x0cn\x0f2x\x91\xfdH\xa8K\
-9#_\x05\x0f9\xa0c\xe0\xda c\xe9\x91z\x1b\
-z\x09y\xc7*\x10}\xe8\xe8\x0e\x7f\x12-1\x15\x14\
-\x13\xa0\xce\xb1\xda\xe0q\x84\x12\x5cN\x84\xfd\xe6\x08\xe2\
-\x09\x1d\x08\xb9\xa0\x92\x08\x99\xc9^\xc8\xcc\x08NG\x04\
-BP-f\x89\xa7\x5cS\xa3\xe80\xf0\x8ad\x01\x00\
-\x88\xb2\xf5\x84\x88\x9f\xb3\xa6\xe9\x1e\xbc\xa2\x1a\x06\x15\xc9\
-S\xb8\xea\xb0\xb4\xc2\x1a\xa8\xa84\xe4[\x10U\xbb\x0b\
-\x12\x85\x1c\x9c\xc9\xaa\x22H\xdf\x02j\xe1\x92\xa9\x01m\
-\xaa\xf9\x10\xa0}3}\xd0\xb8zV\xf2`ORX\
-\x1c\xc5\xb9\xd151\xbcITX[V\xcc\x04\x05;\
-\xa8\xe74\x9b\xe8M\x19\xf4B\xceh.\xca\xea/,\
-#\x97\x1e\x91\x0cCH\x0b\xf5\xd1\xe3\xe1\xbdA$\x90\
-B\xd4\x80\xaa\xe4\xe8#]'\xc8\x0e\xc2\x9a\x10\xd2$\
-8 \xbc\x8b\x80lEgmI]\x04\x13#\xc8\xfb\
-A\xa1OKC\xda\x12\x1d0<\x5c.|\x08mq\
-L\x94\xc9\xc1\x8a:5(\xeb3L\x9c\xb1L\x0a&\
-lt\xe8!\xaf\x88\x04\xabX\x17\xfa\xac0\xd1\x11D\
-\xcb\x81\xd4ef\x90k \xf5\x1amx\xa3pL\x13\
-\xde\x96\xcd%0Y\xa4\x9e.H\xab@aVhp\
-\x13\x93\xa4XF-\xa4\xb7T\xc7Y\xd6K\x84\xe41\
-\xe1\xb6IZ\xf8\xa4\xce\xc3#\xcb\xd4\x1e\x1a\xbb4\xbd\
-]dc\xfa\xa8\xfaXH\x82Diu\xac\xcc\xa9\xe5\
-+DuD\x1c\xe3\x15\x9ccx\xe6+\xe06\x042\
-0\xa5\x0b\xdc\x01\xb4\xad@\xa4\xc1\x0d\xd4\x09\x1d\x80\xa4\
-]Q\xf7\xb4 \xcb\x12Rd\x8e\x15\x18\xcb4\xd8X\
-R!\xd9iU#m@\x8f\x1e\x0c\x05M\x9aiv\
-,\xb30\x14O\xb0\xc5z\xfd\x1b\xfa\x01\xa5\xd5\x8a\xda\
-\x1a!\x85\xbc\xa4\x91W\xcf\xdd\x04\xb9F\x11y\xab5\
-\xd0\x87Y\xfb,\x18~\xfb\xd8/\xe05\xe1>\xcc\x1c\
-P\x0f\xd8\xde\x97``t\x80\xa43\xde*\x8d\x04\xf8\
-\x0e\x1e}u\xfc\xd0\xde\x99M\xb5P\xc3\xa3t\xc6\xa3\
-\x0d\xb3\xa2\xfd!\x8b\xd4\x101\xc9*\xb1\x07H\x9b \
-\x99\x02G\xdcKW\x1e\xa6\xca\xbb\x0c\x0b\xcf\xa8\xf1@\
-\xe4\xbde\xb2\x05\x06\xddT\x86^'m}D\x8c\xdc\
-{\xb6V\xc0#\xe7\x04c\xb0xv\xcd\x8c\x90\x15\xee\
-*Z\xac\xd2H\x9b\x8eWj \xc1Z\xd8\x86\x97Y\
-)&\x94\xe1\x8d\xf0\xc0E\x9a\x8eP\x90\x85P\xf6@\
-:\x09\x1a\x14\x0e-\xb4_ \x07\x98U\xcd\x0e\x86\xdb\
-\xd1\xe2\x97\xbd\x84\xd5#\xb2)%\x02dA\xd9k\x1b\
-\x94U\xe0\xc0W\x90`q\xc4\x8e0\x02\x96\x7f7\xb6\
-,\xa4sf_\xe1\x13 \xda\xce\xe4\x07\xa1%$\x13\
-\x92\x94\x9dj0\xdb\xe3|\xdb\xe7\xbbX\x99\x7f{ \
-\xc9\xa0\xdd\x12\x9e1m\xd7]\xbae\x0a\x1d\x0d1\x99\
-\xa65\x1aaM\xcfD\x1d\x8cDC\x95\x1c\x8bq\xbd\
-\xd9\xd8\x90\x8bh\x1a\xfe5\xbc7\x1f\x15Q5\x9f\xbe\
-C\xdaI[M\xa2Xx\xd9:\x8c\x17\x8a\x92\x0cM\
-\x96I \xab\x96!:\xca\x02\x09+\x0d\xe8{\x18k\
-OT1\xa3]\x13mK\xd9O0\x92\x16\xfd\xc3\x0b\
-\x88\xd0\x02\x99&\x94(\xd1s;2\xd0\xca\x01\x97_\
-\xb2\xcfv=\xb7\xcf?\x89\x9f\x13^\xdf\xf7\xcb\xaf\xff\
-\xb1\xfb\xd7\xbb\xcb\xbb\xf3W\xe7w\xe7\xbf\xbb\xff\x91\xdd\
-+ll\xebT\xc0\x977\xaf^\x7f\xf1?\xfe\xf0\xcf\
-\xf7\x07\xbb\xb8\xf8\xe2\x7f]\xdf\xfc\xe5\xc3i\xe0\x03\xe7\
-\x7f\xbe\xfe\xf6\xee\xe5\xd9G\x93\x04_\xbe\xba\xf8\xe2\xee\
-\xed\xdd\xd5\xe5\xef\xff\xf9\xe6\xf2\xf2\xab\x7f\xfc\xc3\xf4\xaf\
-\xff\xfe/\xd3?\xfd\xf0\xcd\xf5\xcd\xdd\x97/\xee\xdf\xbc\
-?\xc5\xf5\xb0\xbb\x13\xfd\xe8W\xbf|\xb1;\xad\xdf\xff\
-\xee\xcb\x17\xb7\xdf\xbd\xf9\xfd\xef\xfe\x1f\xe2#\x90*\
 \x00\x00-\xa1\
 <\
 ?xml version=\x221.\
@@ -2188,895 +2418,7 @@ c -6.973928,-0.8\
 scale(0.26458333\
 )\x22 /></g></svg>\x0a\
 \
-\x00\x007\x5c\
-\x00\
-\x01\xa7\x89x\x9c\xed}[s\x1cYr\xde\xfb\xfe\x8a\
-\x0a\xe8A\xbb\x11U\x87'/'\xf3\xe4x\xb8\x0ay\
-V\xd2\xcb\xae\xc3a\xc9\xf2\xa3\x03\x0b\x82\x1czAb\
-\x0c`n\xfa\xf5\x8e/O5\x08\xa0\xc9\xd9\x99e5\
-F\x1d\xeeU(\x86\xe8Ku]\xbe\xbcg~\xf9\xe5\
-?\xfc\xf0\xeej\xfa\xee\xf2\xe6\xf6\xed\xf5\xfb\x97gT\
-\xea\xd9t\xf9\xfe\xe2\xfa\xd5\xdb\xf7o^\x9e\xfd\xcf\x7f\
-\xfb\xe7\xa5\x9fM\xb7w\xe7\xef_\x9d_]\xbf\xbf|\
-y\xf6\xfe\xfa\xec\x1f~\xff\x9b/o\xbf{\xf3\x9bi\
-\x9a\xbe\x7f\xfb\xea\xee\xeb\x97g\xc2\xef\xde\x9d\xe1\xef\xaf\
-/\xdf\xbe\xf9\xfa\xee\xc1\x0b\xdf\xbd\xbd\xfc\xfe\xbf^\xff\
-\xf0\xf2\xacNu\x12\xce\xff\x1fo|\xf8I\xce\x17\xde\
-\xbezyv\xfb\xdd\x1bo\x92\x7f\xde^\xbfz\xfb\xcd\
-\xf5\xab\xb7_\xbc\xba\xbex\x7f\xfe\xee\xf2\xe5\xd9\xbf\x5c\
-\x9d\xdf\xde^\xde\xfe\xefWoo\xcf\xff|u\xf9\xaa\
-\xdc~\xf7f|\xf3\xfd_n/\xce\xbf\xb9\xfc\xe2\xc1\
-1\xa5\xf0\xf4\xdb\x1at\xc9\xf5\xf2u}=O\x5cY\
-\x16\xa2\x85\xdb\xef\xf2K?\xbc\xbbz\x7f\xfb\xc5\xee\xab\
-/\xcf\xbe\xbe\xbb\xfb\xe6\x8b\x17/\xbe\xff\xfe\xfb\xb2{\
-\xb1\x5c\xdf\xbcy\x81\xdf\xbe\xfd\xe6\xfc\xe2\xf2\xf6\xc5\xee\
-\xf5\x07\xdf\xdf\x9d\xe5\xfd\xf7w/\x94\xdb\xeboo.\
-.__\xdf\xbc\xb9,\xef/\xef^\xfc\xe1\xdf\xfep\
-\xff\xe6R\xcb\xab\xbbW\x1f\x0e\xf3\xe8\xd7\xbf\x97\xfc]\
-\xae\xb5\xbe\xd8]\xe1\xfac\xdf\xbd\xf9\x99\x9f\xbcy\xf5\
-\xfac\x9f\xa4\x88xQ\xf9\x05\xf3r\xf3\xea\xf5r\xfb\
-\xe3\xfb\xbb\xf3\x1f\x96\xf7\xb7\x7f\xf7\xe0\xab\x17\x17\xf7\xdf\
-\xbc\xb8\xb9<\xbf{\xfb\xdd\xe5\xc5\xf5\xbbw\xd7\xefo\
-\xc7\xedx\xf4\xe1W\x1f>\xfc\xcd\xb77W\xf9\x89W\
-\x17/.\xaf.\xdf]\xbe\xbf\xbb}A\x85^\x9c\xfd\
-\xfe7\xd3\xf4\xe5\xfd\xe3\xc4\xfd|\x05T\xe0(\xe3\xa9\
-\xdf\xbf\xe4\xad\x9d\x8d\x97\xbf9\x7fsyq}u}\
-\xf3\xf2\xec\xef^\xe7\xff\xd67\xfe|}\xf3\xea\xf2f\
-\xf7V\xcd\xff=z\xeb\xfa\x9b\xf3\x8b\xb7w?\xbe<\
-\xab\x85wG\xbb\x07\xc8\xed\xd7\xd7\xdf\xe3\xd0\xb7_\x9f\
-\xbf\xba\xfe\xfe\xe5\x19?\xfd\x00\xde|p\x84\xfa\xb1\xf7\
-/\xbe\xbe\xbc\xf8\xcb\xe5\xcd\x9f\xaf\xcfo^\xbd<\xdb\
-\xfb\xc8\xab\xcb\xdb\xbf\xec\xce\xef\x15\xe1\xff\xf6>q}\
-\xf1-\xee\xcf\xf2\xed\xfb\xb7w\xb7/\xcfVQ\x99&\
-\x9c\xde\x9b\x1b\xdc\x92\xd7\xe7W\xb7\x97O\xbf\xf7\x1f\xd7\
-\xd7\xef^\x9ei\x91\x1e\xcdd\xef\xe2.~xy\xe6\
-QZ57\xdb{\xf3\xc7\x97g\x22E{o,O\
-\xdf\xfc\xfe\xed\xfbW\xd7\xdf/\xab0S\xf0\xdeE\xad\
-\x9f\xd8\x897U\xda\xbbu\xebG~\xf8\xc8-Y\xdf\
-\xfa\xf1\xd3o\xbd;\xff\xe1\xed\xbb\xb7\xffq\xf9\xea\xe5\
-\xd9\xde\xed\xba\xf8\xf6\xe6\x06w\xeb\xea\xfc\xc7\xcb\x9b\x97\
-g\xff\xfd\xfc\xcd\xe5\xd9\xf4\x22Qu\xf7\xf6\xee\xea\xf2\
-\x03\x90\xf2O>\xfb\xfd?\xdf\x5c^~\xf5\x8f\x7f\x98\
-\xfe\xf5\xdf\xffe\xfa\xa7\x1f\xbe\xb9\xbe\xb9\xfb\xf2E\xbe\
-\x97_zuy{\xf1\xe1;\xf8K\xcf~\xff\x87\x9b\
-\xf3\xef\xdf\xbe\x7f\x93\xc0\xfbb\xc2oL\x97\xf9\xcd\xcb\
-W\xd3\xeb\x9b\xebw\xd3\xee\x98\xbb\x87\xf7\xc5\xf4f\xe8\
-\xa3/_\xe0\x10\xeb\x91_\xdf><\xf2\xeb[\xdb\x9d\
-\xe9\x9b\x0f\xaf\xe7\x05<\xb9\xc6\xab\xf3?_^\xbd<\
-\xfb\xb7\xcb\x8b\xafq&O\xdf~ss\xfd\xed7\xef\
-\xae_]\xbe<\xcb\xbb\x902\xf5\xe1\xa8\xd3t{w\
-s\xfd\x97\xcb\xe5\xea\xed\xfb\xcb\xffs\xfd\xf6\xfd\xcb\xb3\
-?_~wyu\xb6{\x1b?\xbb^\xe1W\xd7\xef\
-\xef.\xdf\xdf\xdd\xbf\xf5\xfa\xed\xd5\x15\xb4\xfa\xfb\xcb\xb3\
-\x8f\x1c\xec\xe2\xfc\x9b\x97g\xb7\xff\xf7\xdb\xf3\x9b\xbd\xb7\
-whyt\xa4\xe5\xe6\xdb\xab\xcb\x97g\x97\xdf]\xbe\
-\xbf~\xf5\xea\xc9W\x9e\x0a\xec4\xdd\xdd\x9c\xbf\xbf}\
-}}\xf3\xee\xe5\xd9\xbb\xf3\xbb\x9b\xb7?\xfc\xb6\x16j\
-\xd6+s\x9b+\xfe\x0f\x7f\xba;\xfb\xbc8\x97\xcal\
-\xd6g\xb6bU\xaa\xfc\xee\xc1\x0f\xfc\x88\xdf\xc5)|\
-\xf1w\x17\xfd\xcf\xfeg_\xef\xd1\xc3\xbb4n\xc4\x1b\
-6\xd6\xb3\x0f\xaf\xfd\xd4w\x1f\x7f{\x9a^_\xbf\xbf\
-[\xd6/\xbc\xbf\xbeyw~u\xf6\xe8\xed\xbc\x99\x8f\
-5\xd6\xde\x95\xe6?\xaf\xce\xef.\x7fK\xda\xa9(\xcf\
-]\xb9P\xfb\xdd\xde\xa1\x96{UDg{g\xf1\xfa\
-\xfc\xdd\xdb\xab\x1f_\x9e\xfd\xfd\x7f\xbb\xbe\xbb\x9e\xfe\xf5\
-\xfc\xfd\xed\xdf?\xfa\xd0\xee\x9e?z\xb4\xf7\xdf\xfe~\
-\x95d}\xf04>\x5c\xe0\xdb\xff\xb8|y&\xad\xb0\
-{\xff\xe6\x87G\x1f\xc8;H\x16O~\xeb\xa7n\xe1\
-4}\xf9\xcd\xf9\xdd\xd7\x0f\xbf0M\xaf^\x9e\xfdi\
-\xea^\x84l\xd6\xd2-h\xea\xd5\x0bU\x9f\x17\x16/\
-\xa16]L\xdcJ\xeb6/\xbd\x98\xd0\xd4j\xe9\xee\
-\xf3\x12\xa5w\x9a\x5c\x8b6\x9a\x17)\xe6}\xba\x9a\x98\
-\x8b\xf56\xb7\x12\x16\xd3\xc5\xd4\xbc(\xc5L\xadP\xed\
-SD\x09\xf2\xd9\xa5\xd4\xa6\x13\x91\x96F>S\xb3B\
-\x22S-\xbd\xe1,T\xdaT\x0b\xbeUK\x9b\x16*\
-\x9dp\x00\xa3\xa6\xd3\xc2\xa5\xd2\xdc\x0aQk\xd3\xd2\x0a\
-\xf59\x0as\xe8\xb4\xf4\xe2>\x13\x15iN\xd3\xd5\xb4\
-X\x09\x9f\xb5\x90\xf46]\xe0\x8b\xaa<\x13\xce\x96\xa7\
-EK4\xfc\x15\x95}Z\xbc\xb0\xb4\x99\x8aT\x8a\xe9\
-\x8fS8\x15\x8eyiR\xaaw|YJ'\x9b\x17\
-*\xb5*\x8el\xaa\xf3\x82S5|\xd9\xb8\xcd\x0b\xd5\
-\x22\xad\xc7\xb4\x10\x15\xae}^\x8cKh\xa7iQ*\
-\x1d/P\xed\xc5\xab\xd3\xb4t)\xdd\xf0\x1dnE\xa9\
-\xd1\xb4p-\xd1\xe6\x85Kw\x9b\x16\x95BDs-\
-\xe1}Z\xac\xe1\x22\xf2\xd28pe^[\xb1\xdaf\
-\x11*\xad\xeb\xb4\xd4b\x1cs\xb4\xa2]\xa6\xaf&\xaa\
-^:\xf3,\x8a\xf7m\xb2V\xc4hV\xd2\xa2\x95\xf1\
-q\xafT\xddf\x15+\xd6}\xfa\xe3\xb4\xc0,Q\xef\
-\xb3\xaa\x17g\xcd\x8b\xee%:\xee\x92\x14j\x9cg]\
-\xab\xf1\xec\xa5\xb1M\x0b\xb1\x16\x0f\xe1y\xa1VB\x1d\
-gF\x8c\xa7\x85\x9f*5\x18\x07Q.\x16s\xfe2\
-MKp\x11\xd6y\xa9\x85M\xa7\x85DJ3\x9f\x17\
-\x89\xa2\xd6\xf2V1n\xadDa|\xde\x02\xc8\x98\x97\
-\xe8\x85yZ\xbc\x95\xda\xf2\x07;.\x10\xbfWZ\xe2\
-\x84\xa4O\x0b[\xd1\xe83y\xe9$y0q\x9e\x99\
-K\x17\x9c\x9cpq\xca\xfbX\xc5?\x5c\xe0\x93\xeb{\
-ry?}u.\xa5\xd76\xb3\x96\x1e}Z\xc8\xa8\
-4\xe5y\x11/\xa62-\x14\x10\x04\x9d\x17\x92(\x06\
-t\x88\x16\xc5A+\x97\xaa\xcd\x80K<\xf7\x0a@\x0a\
-O\x0e\x10\xca\xbc0G\xe9\xad\xb6\xe9j\xc2G\x83e\
-\xc6W\x9d\xabNu=\xa4Za2\x9a\xbcqi\xd5\
-\xfb\xbcp\x93\xd2\x1b\xdf\x8b\xac>\x96\xd9x,\xb4\xfe\
-Dj\xb5\xff\x94\xd8\xc6\x13\xb9\xb5\xc7\x82K)\xb9\x9a\
-\x82\xdb\x1eH\xee*\xbay\xa1\xb5\xb6!\xba\x0f%7\
-\x05\xd7t\x95\xdc\x9d\xe0\xf2\x90\xdc\x9d\xe0\xea\x10\xdc!\
-\xb7\x9ar+Cl{\x8a-\xe3{\xe3\x22\xda\xbc\xec\
-\xae\x22\xc5\xb6\xf5\x9f\x92[[\x05\xf7^ni'\xb8\
-\xab\xdc:\xdf\x0b\xee*\xb7\x9a\x90O\xc9\xd5Up+\
-~\x04\xb2\xeb;\xd9\xf5\x9e\xd2\xeb\xab\xf4z\xac\xf2\x8b\
-\x9b\xbd4\xe2\xd2[\xd8\xcc@R\xc5U\xaa\x16\x82\xfa\
-\xc2-\xe9S\xd7b\xces\xf3R\xc5\xf2~CAS\
-\xb5\xe2B<\xe1L\x15\x97e\x90\xd9\x89\xad\x10\xd4\x15\
-\xf7R\x1bM*\x85\xa1\xadEJ\x97\x8e\x1f\x5c\x81\xbf\
-\x0c\xe4C\xb6\xa9\x0d\x98\xb5B\xc6x\x1f\x8ffi\xa5\
-I\x9b\xb4\x97\x1ey\xcf\x82'\xa5bM\xf0<\xa3E\
-\x9b<\x8a[\x9b5J7c\x00\x83]g\xaaTD\
-\xb5\xcaD\x057\x8cKWn4qq\xc1\x13w\xad\
-\x9d'\xc8\x88\xcc\xbd\x10\xabU\x9bH\xa0\xe9q'\x0b\
-\xd7jb\x13G\xc1\xe3a*\xdc\xa3\x89M\x00x\xc7\
-\x9d\x05\x22D\xc4\xf6\xaeeEz\x1d@\xc7\x0bM\x8a\
-\xe0\xb0\xb8\x91\xadO0\xed]\xf2r:\x13O\xdfM\
-u\xfa\xe3c\x8bw\xf6\xd8$\xfe\x84\x035\xfe\xf7\xdd\
-\xe5\xc5\xdd\xf5\xcdr\xf9\xfa\xf5\xe5\xc5]Z\xf6\xe5\xf6\
-\xe2\xfc\xea\xed\xfb7\xcb\xb0\xf6O>\x0f[\x0d\xcbK\
-\xe6O\xde\xf9\x98\xc1\x1e\x9e\xeaj\xb0_\xbc9\xb9@\
-?\xed\x02\xb9l\xe2\x02y+N\xd5f\xb6Z\x1a\x14\
-\xa4\x17\xeeB3\x14\xbeC\xef\x10Q\xf1\x06\xaf\xc8a\
-\xba{\x02\x09\xca\xa9\x17R\x9a\x17/Z\xd5\xa7\xa5\xb5\
-\x12\xd0\xb3V\xbcs\x9b\x96\xc4\x1f\x14Vg\xc2a\xac\
-\x0c5k\x1d\x06K\xa0\xdb\x1a\xac#\x9c\xebiY\x01\
-\xff\x01\xef\x8b\x96\x06;]\xaa\x08\xf7trBc\xee\
-E\xc2B\xd2\x82\x16\xaa\x0a\x13V\xbdi\xda\xd4\xc2\x0d\
-JQ\xf3\x07\xa1\x94h\xe6\xd2\x9ca\x11\x8b7\x9a\xa5\
-p\x95H\xc5\xda\xa1\xa6z\x13\x81FV\xb5\xb9\x16\x97\
-\x9e:Y\xa8\xc1N\xab\xe1\xc4\xb8H\x04\xfe\x8c\xde\xf3\
-\xac\x9c\x08\x1a\xcf\xd3\xeeZ1\xe8D-\xdd\xd3C#\
-Ju(\xd6\x5c\xa0\x84\xf1\xa3K\x83@\xd6\xc0\x97\xd3\
-\x1b\xea\xa5J\xe5\xb4\x91%\xdf\xa7\xa2\xee\xd0\x98\x0d\x9a\
-\x99\xe7%j\x91\xae\xb8\xab\xa9g\xd2\xc7JE#>\
-\xeedOe\xae\x8a3\x84'\xd1\x1d\x7fW\x0b\xdc\xca\
-\xd4b\xa9\xc4\xf0i/\xd4\x1c\xaa\xa8\xfb\xb8\xefU\xd2\
-QP\xae=u6T\xe6Nc.\x15\xb6y\xae\xa5\
-\x1a,t-5\x10\x03A\xf5.\xf8/\xde\xa2\xc8\xdb\
-\x12\xd4g-\xeca\xb8\x83\xcdu\xee\xa5\x1b\x5c\x17\x1f\
-\x1e\xa6\x14\xa7t'\x8a\x84C3\x06\xf5\xbc'\xdd\xe6\
-V\xa4\x0d\xbb\xd4\xdblE\x0c.\x90\x14c\x99\x09\x8a\
-\x15\x16\xa7\xd4\xc0\xcf\x09\xf44\x94\x9e\x1b\xe3\xde*K\
-\xfe>\xfc\x80\xe2\x8d\xf3\xbe*\x14\x9f\x16jp\x87\xe1\
-\xb5(\x80h=xZ\xa4\x95F:/-J\x8bD\
-\x92\xc1\x1c\x8d{j\x8d\x13K\x81\xeb\x87nm\xc5\x85\
-5A\x0e\xbf\xa7G\xa9P\xa2\x1a\xc5\x95p\x13\xe0\x81\
-\xdc; \xd1\x8a\xc1\xee\x0a\x17\xb6F\xd3\xc5\xd4\x0b<\
-'+\x8db\xa2^\x8cRa\xb7\xa6\x13\xf7\xd2\xd3$\
-\xb7R\x89\xa7V\x14\xfe\x1f\xa5\xef\x00\x9d\xde\xe1\xe8\x14\
-\x16\x9d\xf0\x84\x81A-d2\xc1b\xca\x00\xa4Ly\
-z\xf8\xa3\xd3\x04\x07\xa7\xa5\xb9R|\x8az\xe2\x94\xbc\
-MZ$(}\xcd\xde&\x04\xab\xe9x\x8a\xc0\xd8&\
-Vj\xe9aS\x10\x1em\xfap\x15?\x8b\xb8\xd6g\
-\x8b\x12J<\xe1\xbe\xe9\xaci\xc4{L\xcd\x0a{\x9f\
-\xa9\xc2\x9a\xb1\xe3oU\x9a\xc9\x18\x8f\xadO\xb5\xd4\xca\
-\x90\xa26\xfeM3\xc1WJ\x10U\x9d\xb9\xb0'\x88\
-\x041R/\x0a\xf41%\x8c\xe0eT\x81o\xd4S\
-\x14\x09\xfe^M\xa9\xa5\x16\xb3\xa4/\xb0t\xd83\x00\
-\xb9\x0d\xf77\x9a\xc1\xa6B\x0c\x1bL\xeb\x0c\xa3\x8b\x87\
-Y\x8b\x8a\xce\xadT`\x03>l\xe5\xd9\x86\x84RM\
-\xffA\x8a6\x80\x08\xf1\x94\xc0\x97\x81X4|\xa7\xa5\
-\xa9]\xdcR\xe7q\x83\xe5\x86\x93B\x90\x9f\x99\xa5\xa8\
-\xcb\xd4[\x0a2G\xa9\x11\xd3\xce]^\xbde\xee%\
-\xa2\xc3\x0c{\xe7\xa9i\xa9x.\x1c\xa5\xf5\xc9\xe1\xcf\
-B\xe2\xbd\xb4\x81\xa6J\xf3\xa2\x9an\x22\xe5\x8d\x9c\x97\
-\xae\xa5Y\xc3\xed\xb7\x8c\x9d\xd2\xd3\x8f\xa9\x16\xb1\xf4[\
-\xf0\xd9Z\x1a\xfe\x80;\xd4}\xaa\xc5p\x1c\xf2R+\
-\xfc\xfd\x11\x14-\x19\x151N\x1fW\x0d\xdf\x1c\xb8\xf2\
-\x89\xbc0\x12\x1a\x86\x13\x16\x86\xdbd\xd0C\xae\xa57\
-\xd7\x09\xf2\x22\x89\xcc\x16\x0eh\xc2c\x80\xca\x0b\xee\xf9\
-e \x95\x8b{\x00\x8fU\xf1\xd4+|[D#\x8e\
-\xbf,\xba\xa5\xa7E\xd0\xc0\xb5\xd5\x9ew\xd0(\xdd\xa9\
-\xde\x1b\xcc\x8e\x88\xce\x00\x8f6\x81[\x1e\x1d1l+\
-\xe2=}\xe1Z*\xfc\xa9\x08\x96\xc7b\xa6\xf1X\xcc\
-8\xe5\xac\xc6N\xd0\xec\xb1\xa4\x91?\x12\xb5U\xd6x\
-\x95\xb5x,l\x1d\x174\xa4\xa5S\x0d\x5cQ\x85$\
-Qa\x0b\x5c\x11\x0f\x8fJ\x9c\xdb\x10&{$Lk\
-DT\x85Wi\xaa\xb4\xca\x13\xa5<I\xb4!Q}\
-\x95'^\x05J\x86<U_\x05*\xc3\x09s\x9a[\
-\x14\xd1\xc4*4\x1f>\x8e\xc3\xc9\x90\x95Ve&\x81\
-\xcdlCXz{(-\x1c\x8f\xc4\xe5\x89\xbc\xf0c\
-\x81\x91G\x12C\x91\x22#;\x91\xa1'2\xd3\x1e\xc9\
-\x8c\xff\x8d2\xc3;\xa11+\xd5 \x19\xcc\xa9\xb3\xa0\
-\x11\x1a\x84!\x10\x87\xd1\x84\xab&\x0e\xe8\xfc\xee\x85T\
-\x9e\xcdu\xf5\xa7^\xf2\xc9u\xfd|\xd7\xd57q]\
-\x01\x12\xe5>\xb3Fi\xaa\x7f\xd5\x95\xed\x1c\xc5!\xcd\
-,\x94\x11\xea\x9a,\xf0G\xb9\x82\xfe(U\xc0\xbbL\
-\xc1\x11\xa6\xf3\xfej\xee\xce\x1e\xe6\xee\xb8\xb0 \x05\xd0\
-\x8b\x05|*/\x9a\x8e'YiP/\x01\xf5\x90\x99\
-\xbb(\xb5\xfb\xf0\xe4\xd2Q\x8eX\x8f\x97\xaa\xd1Ww\
-\xad!\xdb\xc5\x85\xd3[\xdc,\xc7\xf7|r\xdfNr\
-\xbf\xb5\xdcw\xda@\xee\xdf!nR\xa4\xc1fa+\
-=<\x1d\x1c\x85\xf50)\x01\xa8s\x1b\xb1)\x09<\
-\x12dS\x1d\xc1\x08\x5c$8\xb5\x99\x9bm\x0e\xd7\x0b\
-\xf9\xe1\x98\x96\xb0\xc20\xfb&\xa5U$\x8aI\xb9\xa0\
-\x14\xa0\xbdT\xee#\xc2AP\xd5;\xa7I\x8c@\xf0\
-\x03A\x22|\x95f/\x15\x11\x1cqQ\xef\xb3\xc1;\
-\x9a\x16\x96\xe25f\xb2B\xbde\xa4&\xe43\xfbH\
-\xe21g\x12\x16\xc9+\x98a8|\xd4g\xf3\x12]\
-\xc6\x9f\x15r\xb1s\xff\xe0^{:p\xb5\xc8\xf07\
-\x91\xae\xa6B\x16\xb0\xb2\x96\xae[\xc0r\xc3!\xe4\x09\
-A]\x1e!\x8a1\x92\xa5\x99B\xdee\x903\xe1,\
-\xf3\x9ao\x8eQ\xda@\x16\xd5\x90\xa1\x1a\xd9\xe959\
-\xdd \xcd=\x1dL\xe9\x929:$\xe1\x1c\x99\xbb\x80\
-e\xcf[\xabH\x00\xf0\xf3\x09h\x9c\x04ts\x01m\
-\xdb\x08\xa8\xb3\x16\xa66\xc3Y3\xe6'\x02*{\x02\
-\xba\x93P\xd9I(D\xf0\xb1\x8c\xd2#!\xd5\x80Y\
-I!\xb5X\xa5\x14\xcejV%dT%\x86\xf3\x8a\
-\x80YfB\xf2\xaajL\xcbZf\xb8\xaf2\xa0*\
-\xc1p\xabQ\x95@\x10\xc6\x19s\x92e\xa4<\xed\xca\
-\x18\xbb*\xc6#Q\xe0\xc7\xa2\xd0\x87(\xd0\xf3\xcb\xc2\
-\x9e]<\xc9\xc2\xe7\xcb\xc2\x16%\xe6w\xd3\xa2AE\
-\xabe\xe0V\x91Bd\xe1\xd2k\xcc\xde3\xdb\xf0\x5c\
-\xb2\xf1\x91r\xda\xd3\xec\xd5\x93\x0a\x83\x17\xf6\x0c\xfc\xb5\
-\xb5\x09.\x1c\xde\xf3R\x9b\x8d\xb2\xcd\x812I\xcf'\
-5\xa7\xaa\xc4\xe6R\x13[T%~\x15\x17o'\x1f\
-\xba\x93\x0f\xdeK;=\x91\x0fT@\x90\x92@\x16\x9f\
-v\x22q\xb0|\xd0\xd5\xbd\xe6\xe8\xab\xeax6A\xd9\
-\xab\x14\x9e\x04\xe5\xf3\x05e\x8b\x1c\x08\x5c-G\xae\x1c\
-U'$\xd3\xdbDfEZ\x9bUPY[\x8bu\
-\x1d\x99x\xa4\xe0\x95\x90\xc0\xad\x84B\x1cWC\xfeC\
-\xd5Q\xb9q4\x5c\xdc\x97\xe7\x97\x0f\xf5yF\xdb\x9b\
-\xf1\x9a*\xa0\xac\xd7w\xcf.\x8c\xc2\xb5M\xf7U\xfe\
-e-\xf3K\xe9\xa1\x86\xd2M\x13\x9d\x1ce\xb5\x86b\
-\x80L\x99\x15\x10A1\x88\xc3&E\x16<\xdbP\xb8\
- \x97\xd1\x91bFy\xc0P%\x88)3\x0e\xc8\x04\
-\xecR\x0e\xc8\x1d#g\xd2H\xf0+4\x07.u\x1a\
-mHk3\x03\xf2\x87:gF|B\x8e\x11\xff&\
-\x8ditL,\xbb\x96\x89\xd1i\xb1\xecZ-PB\
-\xcbt\x05q\x9f\x90\xc7\xccB&+O\xa3EcY\
-{48\xfbd\x90\xae!\x9b\xb8\xd8z_p\xa7G\
-\xcb\xc7\xb2\xeb\xf9@J(\x90YB}2\xb2\xb4W\
-\x03\xcdc\x84;\x8b\x02\xe9}3\xc9\xb2\xcb\x1b!^\
-l.\x9e\x99m\xce\x02\x08jj-k[\xd1\xe0\xdf\
-\xae\xed+#'\xf5\xc7\xbd\xc7\xff|*\xe1\x94\x1e\xd9\
-Z%p\xdd(=\xd2k\x14\x11\x14u\xa5\xa0 z\
-\xf1\xcb\xa2\x164E\xad.\xea\xf2\xc0G\xdd\xbc\xbaw\
-5z\x08B\xe7a@\x9ft\xa9=\xa9'<iA\
-{>\xa0\x9f\xd2\x0c\xdb\x03}\xa34\x03w\x14\x09e\
-Vg\xf43=\x05\xfa_\xc9TM\x7f\x9c\xd0\xe7[\
-\xd1\xd0\xad\x1d}\xa2\x89\xf3_Vu\xdb\x81X\xfc\x11\
-\x8a\xfd?\x19\x8c\xb9\x9e2\x04\xdb\xc3x\xab\x0cA\xd5\
-\xec\x1c\xa7*Y\x03\xd9\x8bC\xb2\x14\xbe\xac\xb5p`\
-T\xd4\xe7\xa5\xa1|\x9b\x89c)<j9\xe8\xfb@\
-h\xb3\x96\xd3\x97\xfbz:<\x96\xb5r\xddxd\xb0\
-\x19\xc9\x01t\x03%*G\xad~Y\x8b\xf5\x90\x1ft\
-\xb9J:(\x09\xf1\xca}\x86\xb8\xa0N\x86\xbf\x99|\
-6Cjz\xad\xd6\xdf\xd7h\xc69\xa2'@m\xfc\
-7F\xabC\xa5\xec%B=\x9e\xc7\x8fuAiw\
-\xf4<5\xb4\xcfNk6}\xc9t\xfa\xf3I\xc7)\
-\x13\xb0\xb9t\xd0F\x99\x80\xbf\x12\xe0<\xf5\x1a\x9ev\
-l\xed\xb7\x88?\xee\xf8^\x9cP\x15F\xd9X\x19\x9d\
- \xcf\x06::E\xd5\xdb\x83n\x9b\xce\x82\xbf\xda9\
-\xb07*\xf4x\x92h\xf1\x04!\x86\x83:*\xf3\xf1\
-\x916\xda'\xbf\xf1|\xb0;En\x9b\xc3\x8e7\x8a\
-\xdc\xd4z\xc9\xd4C\xe6.\xc7\x0cH\xacm\x1bQ,\
-\xd0\xca\xe5u\x98\xf2\xee\xa5!\xaf\xb8\xec\x86$\x96\xfb\
-)\x094\x7f\xa1\x19C\x8aA\xc3\x91\x95\xc8\xd6\x8eb\
-22\xa7\xc8\xf9,\xbb\xa4\xcf\xdetP\x83\xd9Gk\
-v\xedS\xfa\x14\xacsf(t\xda5\xca\xde\xf7\xc9\
-\xe6XB\x1b3^%0\x19\x91\xb1\xa2fcH\xb5\
-\x11-\x8e\xbeT4Z\x8e\x1e\xe2%\x9b\x88\x9f\x0f\xf1\
-\xa7\x10n{\xc4o\x11\xc2\xfd\xf5\x16\xae\xaf\xf0\x0a\xa1\
-\xc5TZV\x87\x007S\x91Y\x01c\xf4\xf2?\x1d\
-\xdf\xfb\xe3G\xa6\xfc\xbez:\x08\xf8tN\xf0\xc9y\
-<\x1b4\xf9\x14\x96m\x0f\xcd\x8d\xc22A_t\xd8\
-\x18\x82k::Z\x7f\xc9H\xd8N\xb5\xfa\xaaZk\
-\xce\x96>\xc3\xd0\xc7\xe7\xcc\xbd=\x1f\xf4O1\xd7\xe6\
-\xd0\x97\x8db.\xe5Z:2\x12#O\xf0t\xa0\xe0\
-1\xac\x9f\x06\xff\xeb\x9b+\xf6\x9e\x0dOr\x0a\xa7\xb6\
-\xc7\xd36E\xca\xeeQ\xa0\x8cz_g\xb4Qyo\
-(m#\xb2\xc7T\x8c5\xc7,\x88\x9aO+C\xc0\
-=A\xc0nD;\xe3\xf5\x9e\xc3\xcd\x07\xecU~>\
-\xb8\x9e\xc2\xb0\xcd\xe1\xaa[\x85a%j\xc7\xc0\x942\
-\x15\x93\xc8\x02\xf1\xa1\x8a\xda\xbb\xf1\xfd1)\x8a\x94\xd4\
-W\x13zY\xd0F\xbcH\x8bB.(T\x90\xa6\xbd\
-\x07]\x82\xf0\xfe9>\x1fpO\xd1\xd4\xf6\xc0\xdd\xa8\
- &\xc1#\xf9\xd9(\x89@.\xfe\x86L\xfec\xdb\
-~\xc0\xd9\xc1gC\xec\xde\xb4\xd8\x09\xb1\x9f\x8f\xd8\x8d\
-\x82,\x0aAWR2]T\x04?\x1b\xb0\x5c\xdc\x83\
-8V\x14\xd3\xdf\xc4Y\xf0|\xf8<EB\x9b\xe3\xb3\
-m\x14\x095\xe3\x9c\xb8\x17$\x88\xf6[@/&J\
-\xee\x07\x98\xeeJ\xd9\x12\x8a\x1eNx\xa868d\xc0\
-\xc3\xb4\x0c\x22&\xe4\xa5\xd0P\x0d~\x04L\x03\xae\xbd\
-_P\x9c\xe3O\x14d\xc7\x1c\xcfB\xbdt\xe1\x1c\x15\
-2\xca\x91\xb9\xc8F\x07\xb4\xa6a\xbe\x22\xe7\xc8\xc7\x18\
-\xf9\xb3\xe1t\xafHq\xc2\xe9\xe7\xe3t\xb36P\x8c\
-|\xc1\x1d\xf4\x9aS\xddOy\xad>N\x8b\xe5\x9f\xe4\
-\xc5Zv\x07\xf8\xc0)5\xba\x13\xfb\xcfkN|>\
-T\x9e\x02\xa9\xcdQi\xdb\x04R\x9f5p}\x1f\x17\
-=E\xa0>\x01\xe0\x13\xfc\xcd\x8f\x99\xdd\x86\x00<\x1f\
-\x1aO\xd1\xd1\xf6h\xdc\xaa]P\xc7\xac\xdf\xe2h5\
-\xca\xa1\x92_\xc0\xda\xf6\xff\x01!\xd5\xd5\x93\xdcm}\
-\xbeB\x98\x9db\xb4\xed\xe5f\xab\xfeD\xeb\xc5\x91N\
-5.\xe2\xbaRS\x1e\x0b\xff\xd7^\x87\xc2\xf3a\xfa\
-\x14\xd7m\x8e\xe9MX\x0f\xef+\x5c\x96\x15.\xad\xbb\
-\x09\x87\xe4L\xcb\xb6\xd5\xfb?\x82>\xfcA\xf2\xd1\x0c\
-\x19>&\xf0\xb4}\x0cD\xf0Jg\xd2Gi\x0c\xb3\
-\x12\x83\x99+v\x8c^\x88!1Q\x9b\x99\x0b&\x98\
-\x98i%\x87X\x06;\xc4\xb3\x81\xf4\xc4ot\x00\x90\
-nT63\xf4\xc0\x807\x07\xe4Yf\xd3\x8e\xe6\xf7\
-1\xcb\xef\xcf \xe7\x8e\x8fT\x19.\xc68\x9d}\x98\
-\xa7\xc3d\xe9\x83\x89:[G\xea\x9e\x0f\x8a\xa7Hn\
-s(nB\xb9\xf3\xa7)B0\xee\x82\xf4B!\xe8\
-\xc4\xcf\x22\x8a\xdf/\xe9\x02\x8a\x9cH\xe4\xf80\xda\x99\
-c\x9b\xa0\xa9Z\xbf\xf8|H<Eq\xdb#q\xa3\
-(\xce0o\x9bK8@l\xfa\x91\x8c,\x88\x01z\
-\x9a\xeb\xaa\x98.aI>\xc7f<\x08\x1c\xc7\x14\xb0\
-\xcb\xc6\xb4\xa1\xcf\x06\xce\x13\xd9\xcb\x01\xc0\xb9U\xcf`\
-\xd2\xaf\xd0,\x01\xd6\xcb\xec\xf7KBQL>\xf5\xa4\
-\xc1\x86K\x89,A\xf6U-\x03\x90\xd9H\xe0\x0f\x1a\
-\x06\x1f4c\xe3\x1fm\xec\x8d`\x9e0,P\xdb\x18\
-\xdc\xea\xd3\x0a\xbfePp&\xcb\xa9\xdd3\x0a\xa3\xd8\
-\xe0>F\xdc\x93\xba4I=\x97d\xf5|>\xac\x9e\
-B\xa0\xcd\xb1\xba\x15\xc5\x0aW\x03\x8d\xc1,\x86\x8a\xea\
-G\x14i\x12\xca\x22\x1d\x0bB\xd9\xc1\xbe\xbc$\x9fl\
-\x9b\x06\x9f,2G\xc9J\xb9\x0c\x96\xadZ\x82\xd7=\
-0\xa2}\xe6\x22\x84x|e\xd8]\x09v\x872\x8d\
-\xa1L)\xfba\x83\xfb\xdc\x8b\x06J\xb0+w\xefJ\
-\xdd\xfbl@=Q\x9c\x1c\x00\xa8\x1b\xd5\xb6\xacG\xf1\
-\xdcW\x02r\xb6\x0c\xd6\x91\xf2\xc9\xc4\xad\xf4\xe4:F\
-%\x0b\x83\x02\xf7T\xc7+\xd3\xf1G\xa6[6'h\
-\x7f>\x8c\x9e\xe2\xa3\xad1*[qn\x90K\x91\xe8\
-\x18\xf3\x97\x9a\xd1\xf5\xcf\xd7\x9e\xbf\x80r\xfc\x09g\xc6\
-\xf3A\xef\x14\x10m\x0f\xbd\xad\x9a\xfe>\xd3\xe7\xdc\xf1\
-W\xdc\xf3\x98\xfd|&\xf9\xe7\xc2\x9f\x9c\xe8+\x0e\x80\
-\xbf\x8db\x9e\xe6\xd8\xbe5sC\x15\x88\x7fI\x00\x0e\
-#\x9e\xed\xa0\xb0\xe2\xc3\x88/\xc3\x8a\xaf\xeb=\x96{\
-+\xfekh=9\xd1Bl\x8f\xba\xadh!\xac\xd3\
-\xcaZ\xc5\x92\x04o\xa3(Y\x11\x85\xf0(\xa2\xa3\x13\
-\x0fc\xa4\xd326\xe5\x8cE9?\xdfu|\xc4\x7f\
-\x9aC\xd6YUt~\xb6\x5c\x8f\x9c8\x22\x0e\x80\xc0\
-\xcd\xc2\x92'\x08\x5cV\x8c$D\xf6\x08s1_D\
-\x92\xb48\xb9\xacE)\x97ia\xfb\xc3\xd8\xd0\x84\x05\
-M\xcf\x07\xac\x0dc\x89u!\xf3'\x1e\xf8_Y\x0d\
-=\xfd\x5cd\xeea\xe1\xe9\x9a\xe8\x9b\xebo\xdf\xbf\xfa\
-L\xe0\xfe|p\xee\xf6Osy\xea\xc6}|\xd5\xf4\
-\xb4\x11z7\xa2\x9a\xf8\x9c\xd6\xbc\xcf\x07\xe9\xa7a\xb9\
-a\x9cq\x82\xe5\xde\xbb\x07\x84\xe56\xc1LT\xcd\xad\
-\x14\x0bc\xfdEk\xbfl\x8f\xf6\x01\x81\xb9%Q\xc3\
-\x09\x98{\xef\x1e\x0e\x98\x1b\x8d\xc4\x7f\xcen\xf8\x03\xc2\
-r\xcb\xa1\xf7\x13,\xf7\xde= ,\xb7qB\xa9\x12\
-\x08\xaag\x10\x8e\xb5u\xd1\xcaf\xbb\xc7\x0e\x89\xdb\x93\
-\xfby\x9c\xb8\xddd\xc4\xfeOO\xe8\xf2\x9e*\xd7C\
-\x02\xef\xe4`\x1e)\xf06r0?\xa3o\xed\x80\xb0\
-\xdcrD\xfd\x04\xcb\xbdw\x0f\x08\xcbm\x92\xe8\x9f\xc3\
-\x90sHXn\x98\x00?\xc1r\xef\xdd\xc3\xc1r\xa3\
-\xf1w\xaa\xb5\xc3;\x04\xd7x\xd3h\x8fv\xd1\x1e\x10\
-w[N\x9a\x9fp\xb7\xf7\xee\x01q\xb7UXS\xa9\
- \xb5\xae\xbd\xe8\xa8I\xff\xdc\xad\xc7\x87D\xe5)h\
-9NTn4\xce\xbe7\x04\xf13\xbcG{\x0e\xef\
-q\xcb\xa1\xf3\x130\xf7\xde= 0\xb7aQ\xee\xa4\
-\xeb*2w\x90\xd1M\xb9k\x14\xeec\x03?\xec!\
-=\xc4-\xe7\xb6O\xd0\xdb{\xf7\x80\xd0\xdb(py\
-\x0a\xbd\x8b\x89\x0d\x0b9\x93\x03\x89#\xa6\x86\x8d\xe8\xd9\
-T+\xe1\x93\xdb\xf88\xf6#l0\x89\xfdi\x5c\x9e\
-\x22\x97\xe3\xc4\xe5F\x03\xde=(\xf7\x16,\x84)\xda\
-,$\x82\x99\xf31-\xa7\x0eR\xce>\xad|\xb1+\
-%\xe7\x01a\xb9\xe5\xb4\xf5\x09\x96{\xef\x1e\x10\x96\xcf\
-\xb3X\xe6\x90\xd0;E/\xc7\x09\xbd\x8dF\xb8\x9f\xae\
-\xd6\xd8|\xff\xd0\xa7\x91w\x0aO\x8e\x14y\xdb\xf8\x88\
-O\x97\xbc<\xdc&p\xc8\x9e\x9d-\x87OO\xb8\xdb\
-{\xf7p\xb8\xdbd\xc2u\x7f\xb9\xd0W{k\x7f\x9e\
-l\x05\xda[\x1ct@pn9pz\x02\xe7\xde\xbb\
-\x07\x04\xe7F\x9e\xe0go\xba:$8O\xbe\xe2Q\
-\x82S7\x19g\xfd\xd3\xfeR\xb5\xaf\x92sZ\xab\xce\
-jht\x04\xad\x1fYQn\xb3\xb6V0\xb8O\x0d\
-\xab\x04xV!0O\x1c\x12\x9d'\x7f\xf2H\xd1\xb9\
-\xd5\xc4k\x05\x1b$\xcd\xd8\xffS{\x7f\xb4\x1f\xfbp\
-\xb8\xd3-\x87PO\xb8\xdb{\xf7\x80\xb8\xdb\x22\x8ey\
-\xda\xb4\xb8\xb7\xe3\xf7\x90\xc8;E2\xc7\x89\xbc\x03\xed\
-\xa3\xde\xdb&}@\xec\x9d&\x05\x8f\x14{[-\xa5\
-&D(\x0c\xee\x1b/\x15;\xa0~\xe1N\x9eCb\
-\xf3\xe4\x09\x1e)6\xb7\xa2\xf4G\xac,\x92\xcb\xca\xab\
-\xa2#\x07\x1d\xb3-\xeb~\xa5\x9b\xf66\x09\xb6\x9f\xeb\
-\x0c\x1e(\x05\x85N\x8b\x22\x01\x8a|Lb\xf7Cj\
-\xce\xd3\xcc\xe0\xb1\xa2\xf3P\xcb\xcdV\xcd\xd9V\xcdi\
-\x1f\xd5\x9c\xba*\xce\x03\x96dt\xcb\xe5\xcb'h\xee\
-\xbd{8hn\xb5\xe1\xf9\xb3v\xa1\x1c\x10\x98\xa7\x81\
-\xd6#\x05\xe6V\xbbw\xd9\x1d\x84\xb5\xb3\x94\xaeTW\
-\x5c\xb6\xdc\x1fR\x1b\xe9\x84\xc5zs+f\xda\xa6\xb1\
-\xbef\xb7\xbd\x86r'\x1e\x17\xb2\x0a\xc0\xb2\x08\x0e\xd2\
-\x9bNc)\xce\xd8\x89\xc3\x88\xdeA\x85V\xc9\xa6V\
-:\xfb\x9cKJ\xa7\xb1fgl\xd99$\xc0O.\
-\xeb\x91\x02|3\x97\xd5\x8b`\xc9\xa8\x17\xae=\xf1\xdd\
-\x93-\xcd\x80Bp\xf9\xe5\xfe\x5c\xef\xdc\xa7\xb1$j\
-\x19[\xa2\x0e\x08\xca\xd3\xf8\xe1\xb1\x82r+\xde\xf2\xcf\
-\x5c\x1c}Hl\x9e\x5c\xd5\xe3\xc4\xe6V+x\xc7\xaa\
-\xa6\x96\xab\x9a@`\xfa\xb0}\xe8\xa0\xf5\x9e\xd3\x14\xe2\
-\xb1\x22o#\x86\xbf&\xb5T\xd2\x99\x03\x1cT\xfc\x8b\
-\xb6=\x1f\x12\x97\xa7\x8c\xfcq\xe2r\xa39\xc4\xbfy\
-y\xdd!1y\x0ak\x8e\x14\x93\x1b\x855\xee\x0a\xaa\
-\x0ah?\xc2~{2\xc3*\xb9Y\xa5\xb8\x1f\xb2\x06\
-t\x9a@<V\xe4m\xd3\x95\x91\xebi\xb1\x12\xc9\xb0\
-Z\x99:z\xd5Z\xd5BUv\x1bC@r\xd6\xb4\
-t\xac` \xc3[1-V{\x11l\xaf'\xef\x85\
-\x0e\xc9\xd2\xa7\xa7a\xc4#\x85\xe8V\xdbfE\xa5X\
-$\x17@/-W4`\x85L\xcf\x152\x0aRr\
-\x91A\xbe\xab\xa5\xfaXl\x8f$e\x8dCj\xce\xd3\
-0\xe2\xb1\xc2r\xa3\xf8f\x1f\x96J\xc5\x9a\x8032\
-Z\xb4\xc9\xa3\xb8\xb5Y\x03\xebg\x19\xe4\xbb\xec:S\
-\xc5~\xaf\xfdv\xc8M\xb1y\x8aq\x8e\x13\x9b\x9bL\
-+~\xdeB\xa5C\xc2\xf2\x14\xe6\x1c),\xff3,\
-[: 0\xb7\x5c\x0a{\x02\xe6\xde\xbb\x07\x04\xe6F\
-\x15\x9c\xbf}I\xe2!Qy\x0a|\x8e\x13\x95[\xed\
-\x98\xfd\x9bw\x83\x1d\x10\x94\xa7\xc9\xdb\xe3\x04e\xdbj\
-W\xa76)Vy&\x06e\xa4=_A\xf14\xb8\
-x\xac\xc8\xdb\xc8{\xb4\x0e\x92\xb46spi\x95G\
-\xc0\xed\xddg\x867)So\xd9\xd1\x06\x1a\xaa\x88\x89\
-X\x8b\x87`mC\xecuAl\x88\xcbv\x1al<\
-V\x5cn\xb5\xc2\xd3\xd0\xee\xcb\xb3\x801#w)r\
-/\x11\xb9\xfe\xcb;O\xa0\x91\xec1/\x1cX\xa7\xe8\
-\x9c\x9d\x96K\xf3\xd2\xf4\x80]\xea\xed4\xf6x\xa4\xb8\
-\xdcj\xc9\xa76E\xeb\xe3L\xd2\x8b\xd4\xc8B\xb7X\
-\xe6}\x8c`\xb8\x1b\xfe *\xdc\x1df\x1c\x95n\xf2\
-R\x0f\x99\x9a\xdc_@{B\xe5\x91\xa0r\xa3\xb4\xb9\
-\x82\xc4\x14\xbb\xbe\xb4\x83\xcc\x94\xb3\x9c\x03vS4\xa9\
-\x07u\xb0B{\xb7\xb9\x15i\x83\x15\xba\xb7\xd9\x8a\x98\
-\x1d05\xd9Ns\xbaG\x0a\xcb\xad\xe6t\xb5Ki\
-\x0cXr\xe1h>\xe8\xc9\x8d\x05\xb9HWG\x0a\xa8\
-\x06F\x1c\x84\x0c9 \x90h$o\x86\xb2x2\xec\
-g\xe3y\xe3\x98FYr\xceM\xf0X\x0b\x06\x0f4\
-\x97\x1f[?dI\xb2\x9d\x06z\x8f\x15\xc4\x1b5s\
-4,~\x10\xc9Ft\xad\xdd\xb2\x9bC\xacxrH\
-\x13x\xf6}Z\x1a\xe2(\x83\xb1\xc7\x1e'\xa3i1\
-\xc5\xf8\x1a^1/tP\xaf\xf44;y\xa4\x18\xdd\
-jv\xb2K-\x84\xa9\xde\xec\xe1\xe0\x89z2\xc1\xa0\
-L\xee\x07E\xdei8\xf2X\x91\xb7\x0d\x0d\xcc^\x93\
-\xe5\xd2\x14\xeb\x90\xb1r\xc4\x14\xad\x1a\x87\x04\xdf\xc9\xbf\
-<N\xf0m2\xb8\xf8\xa7}\xb5\xb7\xb8#\x8d\x0e*\
-\x0d\xaf\xc5\xe5\x80\x84\x94\xed4\xa0x\xac\xe0\xdb*C\
-\xf9D\xd1\xdd\xef\xdf\xd6\xc7\x0b\xb8\xe3\xc9\x0an?\xf8\
-\x0e\xeev\x1aP<Rln\xb5$1JK\x12\x17\
-4\xa2\xa3\x99\xf7bj\x98\x17\x0b\x14n\xa8v\xb4M\
-\x06\x85\xcf.\xa56\x9d\x884gjgjVH\x0e\
-\x99\xaa<M0\x1e+47\xda\xa3(Zj2\x08\
-\x10\x17\xa1u=<\xe5~x\xcd\xf5\xf0\xed\xc1~\xf8\
-uA\xbc\xe5~\xf8\xda\xc6\x82\xf8\x87\xfb\xe1\xb3\x89\xc8\
-t\xdd\x0f\x7fH\xdc\x9e|\xcd\xe3\xc4\xedF\x13\x8e\x94\
-\xf5p\x9b\x17\xee\xad\x08\x92\x93\xd8;\xcbc\xf1\xec!\
-qwJ?\x1e)\xee\xb6i\xd0\x00\xa7y\x12[r\
-\xa7B\x11\xbb\xc5\xb3:\x16\xcf\x8e\xbd\xb3\x9a{ge\
-\xac\x9d\xed\xb9v\xf6\x90)\xf1\xd3|\xe3\xb1br\xab\
-\xed9Q\xd8\xa0\x0b\xb1#>|\xb7u\xb6\xfd\xc4\xd6\
-\xd9\xb6n\x9d= gP;\x0d5\x1e).7\x19\
-jD22\xd9\x06\x00<`\x0d\xb3\x0f\xads\x89\x8a\
-\x1et\x8b\x22\x07m\xc28\xcd.\x1e+\xfa6j\xc2\
-0Xh\xce5\xb3RH1j\xa3EHg+\xce\
-\x07d\xa8l\xa7\xc9\xc4#E\xdeV\x93\x89{zo\
-\xb7\xf2\xf8\xc9\xce\xe3lF{\xb0\xf5\x98\xa4\x1d|\xef\
-q;\x0d(\x1e+:\xb7\x89`\xac\x18i\x80W\x80\
-\x02\xd4\xd2\xeb\xdec\x8d\xfex\xf5\xb1\xa0%\x0d\xcb\x8f\
-c,?\xb6\xfa\x0c\xeb\x8f\xdbiJ\xf1X\xd1\xb9Q\
-\x19\xe7i\xc9\xf0\x93e\x9cg\xaf\xe2\x9cF\x15\x8f\x14\
-\x9a\x1b\x8d*bM|\x06\xd5H9v\xb3\xfb0\xbb\
-\xffT\x9cm\xcf\x10h\x9f\xe6\x15\x8f\x15\x99[\xf5\x9b\
-\x97\xa8]\xa14\x99\x8aIra0H\xd1\x89g\xac\
-;\xa9\x8e\x91\x1ck\xc6<\x1b\x175\x9b\xba`\xfb\x89\
-`\xc6\xb1\x15\xa5C\xb6f\x9cv\x85\x1e'<m\xab\
-qZ\xaeV\x88l\x16\x83\xc3\x09t\xf6\x02\x0es+\
-\x8d\x02\xdd\x91\xc5j\xe4\x94Nkj\x98,\xeb\xa9T\
-\xc1\xa1J\x87\xf46O\xe3\xb6\xc7\x8a\xcc\x8d:\xd6\x08\
-{\xf3Z\xc7\xda<\x11f\xf4\x92\x83\xbb*;\xc7s\
-\xb0l\xac\xd2+\xcd5\xe6\x16%\x94hb).h\
-\xde0\xc5\x8e\x1e\xec\x8b\xaa\xd2\xfb\xcc\x86<|C\xac\
-\xcfa4\x8bk\xe9\xc4\xd3\xa2Q\xb4\xd2\xac\xb5\x169\
-\xe4\x98\xae\x9d\xc6t\x8f\x15\xcf\x1bEO\x8f\x91\x96c\
-g\xb5\xb0v\x9a\xa5h\xc3\x08\x0fa\xe8\x0cM\x1b\x02\
-\x07A\xe7V\x9e\xf6\x1eo\x0c\xc9S\xd4t\x9c\x90\xdc\
-lB7\xa8(\xcd\x94-A=\x1b\x8cTh^\xac\
-\x95\xa6\xacXw\x92\xb3\x90\x0b\x81\xe1\xb2b\x96\xcc\x02\
-3\xe6\xd8\xd0\x87D*\xc6%ACh\xd9@W\x1a\
-\xf4\xf4\x12\xbd\x98\x8f\xa3\x10\xa3\xd5\x98\xb4\x15\xb8\xbb\x10\
-\x01n\x87\x1cA\xb3\xd3x\xef\xb1Bz\xa3p\xcb\xab\
-\x81H\x18\x1e\xab\x97P\xf9\xa0gS\xcdv\xec\xf5+\
-\xc1X<\xa5!\xb9\x09\x05\x0em\xfa\xb3\x07\x05\xe6)\
-\xd0:N`n5\xe0kT\x8b\x1b<QCH\x85\
-u\x14\x94V~\xa9\x85\x99'l\x87F\xf5\x9dK\xf5\
-\x98V\x0f`\x81\x0bp\xc0z\xa8\x9dFv\x8f\x15\x96\
-\x1b\x91\x1a\x81\xe3\xcd\xb1%\xc50\x82\x9b\xed\xef\x0c\xc6\
-\x030qt\x0edV;\xc5\xbc\xb8a}\xf4\xd4\xbd\
-\x08Z\xec\x08\xe3\x92{:mKd\x9e\xf6\xef\x1e+\
-2\xb7\xdaj\xe6\x86\xe4\xe7\xbc\x84\x97VE\x9e\x12\x5c\
-\xc7c\x82k\x1b\x04\xd7mGp}\xd0\xc8\xe94E\
-~\xa4\xe0\xdcj\x8a\xfc#\xe0\x1cK\x01t,\x05`\
-\x7f\xb4\x15\xc0\xe2\xf1^\x80Cb\xf34g~\xac\xd8\
-\xdc\xaa\xe2\x94\xac\xeb\xc0&0:\xc8\x84\x99\x8a{\x9f\
-\xbd\x08\x0aL\x8b@s\xfa\xcc\x80\xa6\x81!&i[\
-g\xf5\xe2\xda\x0fXo\xb2\xd3\x1c\xfa\x91\x82s\xab\x0d\
-\xd1]\xe0g\xea\x8cF<\xb3\x86\x85\x90a\xe9PZ\
-a\xb2\xa7\xbakS\xec\x9db\x9d#\xc5\xdeV\xf4\xff\
-\x8e\xf6\xe2\x9eyH\xdfQ\xbfQ\xe1\xe6\x08\xbb\xc3\x90\
-\xcdd.\x12\xc9\xab\xe5\x84\x99I\xe1\xd2B\xe7\x8a/\
-\x1e2\xdc9q$\x1c+8\xb7*\x0f\xd5(\xc2#\
-I^15\x09\xabmEY\xe7^\x82\x943\xd3\xae\
-5f\xe9\xa5*Z\x9a\x90yo4\xa3\x94\xd9\xfc\x90\
-V\xfbD\x92p\xa4\xe0\xdcj\x8b\xf3G4'\xb8\xaf\
-\x8d2\x16\xef\xbdM\x8eQ_E\x07\x93i\x13t~\
-F\xf7\x99\xd0B\xef\x87\xecJ\xb6\x13K\xc2\xb1bs\
-\xab\x8a\x0fkaj3u4u\xf2\xa8bb\xb6\xc8\
-dL\xfa2\xd6V\xa0\x22\x04\x0a$\xc7\xa8\x9byq\
-\xca\xe5\x91(tb\xa5\x8a\xf2\xa8\x1ai+bA\x13\
-b'F\x0ce\xb92\xc8Q\xc4d\xc4\xf1\xc9\x1b[\
-\xf9\x90;.\xecD\xa0p\xa4\x90\xdejEt\x88\x94\
-\x00\x19\x92\x80\xba\xb5\x81/iq)\xbd\x0aB\xf6\x1e\
-.(j\xb6\xe2\x223\xb1\x97^1B\xe7\x18f\x97\
-\x999Jo\xb5M\xa2E\x99g\xaa\x9c\x8b\xa5s\xb5\
-P\x1b\xadQ\xad\xfbD\xd12\xf4\x22\x09\x10\xc3\x1e\x12\
-\xcf\xa7\xc0\xebH\xf1\xbcQ\xe0\xd5\xe1\xdb\x8a\xcd\x82\x94\
-h`n\xa4Qi\xf0'\xc8\x8bt\x9e\xba\x16\xc3f\
-!W,\xf3\xc5&\x8d1\x1d\xaa\x0d\xcc!\x07\x84\xe6\
-\x89\x9f\xe1X\xa1\xb9Q\xd8E\x81\x06}\x99\x85m\xe5\
-gx\xe8=\xe8\x9e\xf7\xb0:\x0f\xbcs\x1e\x9e\xba\x0e\
-\x8f<\x87Vs]\x1b<\x07_\x1d\x87\x03NA\xd9\
-\x89\xd4\xe1H\xc1\xbc\xd5\xa6j\xadZ\x0c\xb3\xa2U\x8a\
-p\xdc\xbb\x0d:\xdc\x86\xbez\x0d\xdcW\xaf\xa1\xadN\
-\x83\xaeN\x03\x0d\x9fAW\x9f\xa1\x0d\x9f\x01Q^\xfa\
-\x0c\xb6\xfa\x0c\xf6\x0c>\xc3\x89\x22\xe2X\xb1\xbcQX\
-\xc7h0e\xd4\xa4\xb8\xf4\x5c!\xfc\xc8g\x90\xc7>\
-C\x0c\x9f\xe19\x5c\x86\x13\x85\xc4\x91\x22s#\x0a\x89\
-\xde1\x0b\x05\x1ao\xb4\xa3\xb0N\xcc\xa9t\xa1\x19\x0f\
-\xaa\x11OQ\xd4\x91\xe2n\x9b\x81\xa8\x08)\xe1 \x87\
-\xf0B5h\x0a\xa7\x82\xd5\x97\xd8\xa2q\xc8\xe9z;\
-\x11?\x1c+\xf26\xda\xeb\x82\xbd\xe9\xd4\xfb\xach\x10\
-\xc1\x5cH-^\xa9\xba\xcd*\xd8*t\xc8\xfc\xfe\x89\
-\xda\xe1H\xc1\xb7\xd5\x16j\x0a)\x8c\x08\x9c\xadTU\
-Go\xbcS\xcf\x99\xe4z\xd0.\xcf\x13w\xc3\xb1B\
-o\xa3\x18\xe4\xe9f\xd5\xe7C\xde)\xc68J\xe4\xf9\
-F\xb4\x0c{[\x09\x96\x0c2\x10\xee\x1e:\xcc8\xf1\
-.\x1c+\xf4\xb6)\xd6\xecQ)\x0d\xe4\x1d<\xbe\xf5\
-\x13A\xc2\xb1\x02o\xab\x0e\xb8\xa7}\xeb\x8f\xcd\xed\x01\
-\x1b\xdc\xfc\xc4\x84p\xa4\xd8\xdb\x8a\x09\xe1i\x85\x9a[\
-\x14X[\xac*=\xe4\x92\x1f?\x11\x16\x1c+\xf26\
-\x8a1\xf6z}\x1eC\xef\x80=\xe7\xfb\xf3\xbb'\xec\
-\x1d\x07\xf66\xe1$\xf8\xd3~\x8dm\xe1Z\x9aJ\x9b\
-%7\xf7\x1c\x90x\xc0O\xc4\x03\xc7\x8a\xbd\x8d\xe8\xdd\
-\x9e\xf6*d\xe5\x16\x8d3\xd4\x8a\xc7!9Y\xfd3\
-\xa9\x05\x9e^\xd1G\xbe\xfd_\x1e>\xa3/*\xa8g\
-\xe5I/~j\x7fv*\x95*\xb7Y\xb1\xec\xcd\xba\
-\x82\x90^\xb1\x90:r\x92\x98\x9c\xd9'\xb0\x80\x10%\
-+\xa3\xa8r\x9bzi\xd4@\x14N\x5c\xb4\x8a\xf7\x09\
-\x1c\xf6\xee\x92\xaf4\xa5\xc6S/\x12=\xc0(\xd2\xb0\
-\x04\xa9\xca\xe4\xa5\x928FLjq\xad\x18\x04\xa5\x12\
-\xd4\xc0\xf0\xc4T\xa85\xb4\x88DQ\x11\x87A\x8ab\
-\xeehyb\xacQ\x8a\x86Z\x13\x5c\xf4\x9e4:\xd8\
-\xe0\x10Yr\x97\x22\x06nr\xfcR\xadR9\x0f\xd7\
-\xa4\x8b\xe6\xa8\xa95|\x95\xf11j}\xba\xc2V\xba\
-\x16\x01#W\x8b\x85\xb9N\x18eq\x128\xfb\xb9$\
-\xb9\xdaG_*\xa1U\xfb\x5cQs \x0c\xb6\x8a\x17\
-j\x95\x1d\xeb\xee\xcc\x89'\xf3\xd2\xbb\x85\xcfM\x8b\x9a\
-\xabMFh1\x14\x9e\xa3\x17m\xb0\xb0\x0b\x17\x0e\xe6\
-d\xfdi\xb8%\xe0\x03v\x92\x1a3\x1b\xc8\x81p\xde\
-\x84\x7fQ\x9f\xa5\x15\xf3\x1a8k\xc1\xec\x03\xc9,h\
-\xf8\x82\xbaD\xeb\x17g;\x0d\xb6Wp\xcfF]\x5c\
-g\xcc^\xbas\xb5\xfc\x8c\xb9\x88\xe7g\xaa\xcbh6\
-\xef\x8dB\xc6K\xb5\x19\x0a*\xe4\x1d\x84\xc4\xb5\xd4\xea\
-\x13\x95\xee\xc1XeU\xb8w\xf1IKs\xee\x99\xfe\
-\xa9^\xb9M\xff\xb1'\x9a\x80%\x11\xf3\xa74\xd0\xed\
-\xc5\xf9\xd5\xe5os>\xa3\x8b\xc8\xef\x1e#|KP\
-c\xc4\xb3Vm\xb3\xaa\x82n\xd1\xd1\xf1\xb9\x00\xa1\x02\
-\x22\x5c\xc2)$\xf8Zaa6\xe0\x9a\x1a\xa9\xa7\x01\
-\xf2\x0a61p6E\xf0\x80\x0aZ\x92\xc0\xf9( \
-\x15\x07\xdeZ4\x19\xe8w5\xc5k^L\xd8\x92\x98\
-\x0c3\xcch\x87.DJ\xe3P\xcd\xad\xf7\xfcf\xad\
-\xf8\x22k\xf1\x1e\xa0\xda\xa3V\xd4\x09\xa96\xf1\x22\xd2\
-\x1c\x1f+&\x02\xa1\xe8E\xaaI.X\x8cF8Q\
-\xf4Cy\xce\x10\x00\x83\x9ay\x12,v\xea=&\xc1\
-1S\xe0\xa4\xd40\xe2\x89P\x1ck\xc2)K\xd2\xc9\
-\xb2\xbf*\xbd=\x95\xd2,4\xa6\x96\x10\xc0\x04la\
-\xb5\xda'\x12 \x184l\x15\x9d,\xc8\x05:\xc3(\
-\xd7b\x1c\xa6S\x94pt~#7\x8dj\x1cu\xf4\
-q\xe7\x9c\x18[D\x9b\xd8\x8by\x00_\x8eI\xb1\x1e\
-8\xa6R\xc3\xbe\xb3lJTBV\xa7\xf5Zu\x96\
-\xec\xf0\x0a\x07\x95{\xaf\xbd\xc9\xdc\xb8\xb4\x06\xb2L\x98\
-)W\x9a\xa3Tj\x229\xaaK\xaa3Z\x22{O\
-\xd4\x06\xf7 \x1c\x83\x15\xcbR\x17,I\xed\xc6X2\
-\xa9D\x95r\xf7\x9fv\xec'\xe8\xd9_\x99\xdaB\x94\
-\x08G1S,\xac\xec\xa5\x06\xc6\xcf;\x9e\x93\xb7\x94\
-=\x22\xe1\x5cz \xa4\x82\xb9L/\xd2\x0cL]x\
-\xe69\x91\xd1\x8ahS\x9bk\xe1\x0a-\xe5\xc5{\xa5\
-U\x86\x86\x86j\xd1%ome#\xf9\xb4\xd0\xe8\xaf\
-.4*RLC|\xd6\xf0\xa2]\x9a\xac\xe3\xa9&\
-\x8a\xf6R\xe8\xac\xc4\x22\x88\xa2Z\xef\x94\xf0l,\xb6\
-\xf2E\x12 \x03,t\xed-\xef\xbb`\x1c \x17\xdd\
-1\xd4\xce\xe0J\x85\xd6%)A\xb2\x8a`\xc8\xba\x94\
-\x1e\x0c\xaa\xf99\x0c\x164\xd8\x09\x0c\xbf\x1a#\xfd\x8c\
-\xbbN\x11\xf3\xe0\xff#\x9b\xbcp\x82r\xe9\x1d\xc4\xc1\
-\x14S\xc7\x09\xb6\x86\x1f\xec\x06\xde?j\xa5\x93Bi\
-\x11\x16\x97V\x15 \x93\x85s\xde\xbb\x96\xced\x13R\
-=\x9d\xe7Z*\x19O\x0eEo\x82G*\x1c\x0e\xdc\
-Z\xf3\x98q\xf1*2q-$l>c\xa3ds\
-\x83\xfe\xd7\xd6]\xa0\xb8\x99\xbdMj\x85\xc2\xdcgP\
-\x1a\x08A<\xa40\xa4\x17s\x93\x14-h\xca\x9fn\
-}v\xc7\x09R$\xba\x98=d\xeeV\xb4\xd70\xa0\
-K\xcd\xc1$\x8bFG\x1e\xc0U\xc5\x1a\x18.T+\
-n;E\xa9\xd1\x04\xd3\xc1\xd1\x91\xa5\xff$\xbe\xec\xd7\
-\xc7\x97\xd7B).\x8a9)\x92\x80\xa7\x01\xae\xbc|\
-\xd2V\x5c\x82\xfaDy\x83S\xb3Z6|\x0a\x96v\
-ZK\x8b\xde-Xa\x8a\xa2\xfa0\xcb\xd5Da\x96\
-\xbd\x86\xd8\x8c>\x81\xee\xbdb\xa8\x9f\xa3\xaf\x8c\x8f}\
-\xac\xa1e\x02\xef.\x00\xda\x9b\xc3\xe4\x02z&P\xbc\
-V4\x184\x14\xdcS%P\xf6\xb8\xd4VS\xdb\xd7\
-\xc2\x0d\x0cT\xbd4f\x19A\x8a\x99\xe1\x9c\xf2\xec\x18\
-B!\xb9\x027y\xff\x14DU\xd5`\xb0\xb5\xb8\x0a\
-\xd6QTxI\x9d\xa6\xc1U\x99\xfc\x95x\x8f\xdb\xde\
-+\x1a\x93\x22\xf4q\x9f\xf3KI\x9f\x81\x85\xa6\x1a\x94\
-\x8f\xde\x03\xe6\x184X\x04\x7f\x01N,\x14{\xf3\xd2\
-\x1a& [\xba\x02\xd2q\x18\xc7\x19\xe1V\x82\x17\xb3\
-\x15n\xb0Z\xd4\xc1F\xd8:^\xa8\x89K)\xb5\x83\
-\x12vIJM\xd0\xbe\x17jk\x9f\x05yX@m\
-;\xd5T\x9fxP\x18\xfb\x09\x10r\xe6\x84z!\x89\
-\xd6\xa0r\xcd\x19-\xebx\x88\xf0\x01g\x96bQ\xbb\
-\x0fo\xc6Sw\x07\x9a\x85\xd2\x18b\x91L\x00\xe0J\
-\x9e\x9f\x81\x8c\x0b\xc1\x97\x12\xeb\xd6\xa6E\x15\xdd\xbe5\
-\x89\xea\xd9\xa2Ez7\xca\x9d|\xf6\x12\xd4q\xeb\x15\
-v\x08\x1c\xcb\xf0f\xc2I\xf2\xa5\xa8\xd4|}I\xd2\
-\x5c\x12\xee)\x15\xbf\x5ct\xa2bU\x93e\xacD\xc3\
-\xbc\x9d\x94\x90\x0e\xfd\xa2E4\xaa\x7fZ\x94\xfa\xaf.\
-J\x0d;\xcb\x228f\xedp6B\x86{S)\xa1\
-[\xc1\x02\x84\xd6j\xae\x85;\xc3e\xeb\x04z\xd5\xfb\
-\x17\x1c>\x9e\xc4T\xd3\xc4\xb3T\x81\xf1\xad\xbd\xa2\xab\
-\xb0\xe3nJ\x9b\x04\x1e\xb4zn\x9d\xea\x5c\x99R6\
-\xabc!4\x15\xafp.\xc9\xc0\xd9\x06\xbf\x04k-\
-\xe0\x83\xb0\x94\xd6\x5c\xc72+e#\xb0\x0c\x9aV\xb8\
-\x1cD\xc51(\x8e\xaf\xb9\xe5,#\x06\xcc\xab7\xc9\
-\x97\x18f\x00\x1d>MA\xe3\x0a\x95\x0c\xfd\x0e\xd3b\
-\xf9\xb7\x08N\x87\xb0@\xb5szE\xea\xe9\xbe\xc1\xfb\
-\xaa\xbd\xa5\xd5\xf1P\x5c\x86`\xdb/\xadB\xcd\x1c\x90\
-BP\xcc\xf54X-c\xbf\x8chz\xf1f<\xa8\
-\xbc\x0d\x1c\xb3\xd8\x16#\x1e\xc9\x88\x0cN\x90\x9a\xe6\x02\
-\xde\x0a\xdc.8P\xb56\x9f\x15j\xc1`\x9aJ\xcd\
-e\x09\xb5xK\x1cG\xe9\x98L\x86\x1e\x88.\xa9\xa6\
-['\xe7\xd9\x8bV\x95\xd4\x0c8c\x85;ap\x0d\
-t\x5c^\xa4\xa2C\xd8\xd1,]VB\xaf|\x868\
-0\x93\xd0=Q\x04\xa1Xz}\x16p\xc4\xf1TU\
-{\xe3Td=Hu\x88\x92k\xae\xc5\xe1@\xaf\x1e\
-,\x8c\xd7\xb4\xdaZ\x8cB\xc7\xa5\x88\x82L7K\xbc\
-\xb0\xbcR\xa4i\x87u\xb3\xaa\x0c\xc3^\x8cz\x87g\
-\x145%RJt4\xe4\x8b\x16o\x11y-x0\
-1t\x11\xa5\xa6\x01y\x85a&E\xe1\xa7\xad\xe8d\
-m\xecs\x80j:\xefZ-V)\x07\x03\xa8J\x1b\
-Z\xc3\xa8\x89g\xc4\x13u\x08m\xc5@a\xe9F\xda\
-\xc7\x0fa\x9d.0\x16\xaeyz\xd5\xbb\xcc0(D\
-c\xc9J\x80\xc52/\xbb\x0e\xbd\xe3\xd1\xacA\x13D\
-(n4c\xe9\x05\x9e3\xa1\x99,\x81\x04\x15\xa6\x8c\
-\xb8\xae\x1b&\x17\x17\xc0\xb2U\xa8\x0b\x92\xe0\xe1\xb9S\
-\x07\xbb\x16\x15\xaa0\xfc\xa9\xe4\x14\xce'\xce\xb2\xc1\xd3\
-\xc4\xac\xb90\x5c\x1e|M\xc9S[Y\xf5\x11J\x87\
-\xb8\xcaj\x15jr\x18\x0f\xcf7\xbdc\xab`\x88\xc5\
-\xb3QA\x14\x07\x17\x8c$\xe98[\x93\x90\x894\xef\
-\xdc\x87\xcfd\xec\xc8X\x95\xb0\xbe\x90,\xde\xbd\xcd\x15\
-\x22\xe76\xbe[A\xa3LV\xd4[\xe4w\xc3@3\
-\xb2\xf3\xd8\x97\x94\x03\xebS\xf6\xb4k\xacf\x88<\xf9\
-@\xc3Z\x1fBJ\x86\x87&i\xe3\x1c\x1a\xa1\xb1G\
-\x9ab\x17\x1bFO\xab:\xe3\x15\xf5\x8cA\x02.4\
-\x0d\xa3\x922\xaa\xa5;\xc6D+\x06B\xf0\x89\x0a\x22\
-\x1ex6\x08\x86Z\xa6\xa0\xa1\x8eS\x86\x1c\xb6\x19h\
-\x05\xa1\xbeW\x19\xf72,\xef\x89\xe2y\x99\x8c\xd9\xa7\
-.\x8e+k\xf0J\x1dv\xc5\x8bK\xfe\xc0}\x98L\
-Tz\x97H\xec+\xce/\x85&l]\xc8\x93\xb7\x0d\
-\xa2\xc5\x22#\xec\xa9\x18\xdb&-\xdc\xd3\xf8\x14\x86]\
-\xca/uj\x154\xe9\x9cO\x9c\x8bX\x0dlqV\
-\xe98,\xe1\x9aL\x81|\x09]\x03\xca`L\xc0\xf4\
-R\xc99\xd5\x836\xdc4)\xd4,1\x0ac\xee\x99\
-Cp\xe9\xe9\x01\xc3\xab\xe4\x16\x1f^\x01\x83p\xa8\xcc\
-uB\x86\xd43\x15\xc20\xf0\x81\xb0\x08\xaaI\xf2\x15\
-SR\xbcB\xae\x88)k\xa1\xdeT&\xc7\xb26\x0e\
-\xd8~a#\x05?\x02u\xc2\xd4z@\x98j>9\
-G\xba\x86\x8av\x93\x09\x1a\xa4u\x05\x09\xbc\x01;\x88\
-\xf2\xaa\x98\xdb\x8c\xfb\xd4\xdda\x0e\x94Lt\xf6R\x05\
-A\x1eR8\x02w\x94:\xe8\xbb\xbbN\x8c\xa5\x07\xdd\
-\xfa,\xb8C\xd2}b\xb8Z\xdaf)\xd1\xaa\x02A\
-d\xce\xb8\xa1a\x9d\xe1\x0f\x22{r\xff7g\x0e\x04\
-\x97-\x99 \xe1\xcc\xd8H\x13$\x9c\x84r0\xae!\
-o\x05\x13\x92\xe6\x09\x0d\xc9\xe4\x85\x156\x84\x91qA\
-\xa2\x05\xde\xa3\xb9\xb9\xc0?Wv\x1f\xe6\x88\xc9\xbbM\
-8@e\x9a\x11\x80(\xa7\xa8AYux4\xdd\x18\
-\xe9\x90d<\x81\x8b\xe1\xa5\x91U\x9a0\x0a\xa2\xc6\x08\
-\x0c\x9c23$\x0c\xe7\xd6\xe1o0\xce\x8e\x19\x5c)\
-`6\x0f\xc4\xdd\xc5\xab\xa4\xa6\xf2\xe0\x0ag\xcc\xc8d\
-\x8e\x12B\xd8\xaa\x87|\xcb\xfd_X2a)\xc9\x5c\
-,2\x87Pq\xfa\xe9\x1bF\xb5.\xc9\x17\xa4j\x0c\
-YW\xa9\xb9-\x92\x8a\x93IG\x90\xa3\x0c\xf6\x8b\xb4\
-2\x16\xda\xb0\xf1G\x07\xb8\x11\x5c\xf5N=omM\
-/Sl\x9d\x22\xa8\xd2\xccf\xdc\x0e\xf8\x14\xf8\x8e;\
-\x16\x96\xc3\xc0P\xd3\xe9*\xd3]\xe6\x15 p\xcf\x1c\
-J\xbaz]gM\xc3_3\x03\x85\xd7<\x90~\xc1\
-\xafR\xc2\x17\x1a<\xe6\x96\x1b\x06S.\x1075\x9e\
-\x93\xea=\x17dI\x11\x0a\xa0\xc7\xc0s\xb0f\x02\xdd\
-z\xcc\xb0\xe05g\x1b)\x0a\xf7\xdae\x16/\x11b\
-#\xca6oX\xb2\x0e\xfb\xdd\xbb\xa6\xad\xa3\xca\x94\x87\
-\x82\xeb2\xa8j8\xd3\x1c\xa9G\xa5\xeb'\x1d\xbc'\
-\xfdG\xbf\x8a\x83g\x08\x07q\x99\x0a\xda[j-\x83\
-\x80\xe2\xd0\x89I\x0d\xa5\xd6\x1a$\x80\x15\x83\x9dV\xba\
-VG\xf4\xda\x05\x06\x01a!\xa2\x1e\xc4G<\xa2\xab\
-\xda\xd8m\xea\xc5\x99\xc0\xf1C\x86N\x07@\x0d\xe2d\
-6\x92FZ\x91\xfdHc\x085\x8b\x1b\xca\x08H\xe0\
-r[\xfa}\xf0\xd2\x98|\xca\xf8\x1d\x99\x0d\xeb\xb9\xc4\
-\xf4\x0aS\xab\x90\xf9\x9c2%\x85\xed\x15\xb0\x01\xa4\xb3\
-XS\x07] \xabH\xe6\x00s\x0b\x8b\x98\xcc\x92\xec\
-\x823\xf8G\x0a\x97&\xd2\x0cu\xd2O\xe9\xe0\x04\xb4\
-\x89\xaa\x22&Fc\x06\xea\x02\x0d\xce\x02\x81\xfd\xa5*\
-\x88\xb3\xb0\xa0\xb2\xe1\x0e%\x83\x9b\xf5u\xd2\x15\x11A\
-\xc6\xefMz\xd2k\x09\xb2w\xd8\xbf\xd2U3\xea\xe8\
-\x94\xd7\xe6%<\xc1\xd3+\x88c@\xce\xee\xe9A\x04\
-qO\xb5\xe7H8 \xc0\xaf\xee\xc6\x10\x14n\xa0,\
-\xd6,\x1cp\x06\x13\x18\x8c\xf0\x12\xb5Q\x9b\xd2\xb3\xe9\
-\x99\x83B>\x14+\x0a\x8a:\xfcuh\x96\xc6-\xf3\
-T-*\xc2!\xc4\xa50%\x98{\x84\xe1\x80\xb1\xb1\
-\xe1\xc9*\xad\xe9\x13\xb6\x9e\xe9&\xb6\x86\x98\x05\xa93\
-$)\x87\xe5\x08W8\x8d\xc8\xc8\xe38\x22\xf8\x18T\
-\x86B\xe7\xa4k\xa9p\xa136\x85\xf6\xef\xe9'\xd5\
-j\xa94J\xb36b\xaf&\xe9\x82\xc0\xed'\xcf\xcf\
- \xcb\x09\x05Q\xb1\x0at\xe9I+\x0a'\x89\xbb\xa5\
-\xb1Cv\x06\xf9\x15(\x1e\x87\xfb\xc5\x99-AF,\
-\x98e\xc2\x06\x06\xee\x81$_\x853\x8c\x8f`r\x93\
-z\xa5\x98\x0d\x1bp\x1a\xa77\x9c\xae(t\x8de\xbc\
-\xcf\xe9&H\xc7\x9e\xd1\xe4\x88l\xacC\xb1\x88X\xe4\
-J\x1eb\xaf\x19\xa0\x22\xea\x1d\xe3\xa5\x96\xc7/\xee\xe4\
-\x81_\xec\x9e%\x06\xe4\x04p\xab\x91\x9a\x82\xd2\xca\x13\
-\xafP\xa7\x88|\xe1\xe3\xf4t.\x1a\xf2\x93*xK\
-\x10C\x16\x82[=K\xe1\xaei\x94ki\x1d\xa3\xd9\
-H\xf93tXF\x22\xd6\xf9\xc3+\xb9\xbf\x82:|\
-0\xd0\xb2F:y\xacN\x19\x8e\xd7*I\xc7\x1ap\
-\x05?\xa5\x80\xf8I\x0b\xe7\xaf\xa2\x80\x1aXgz\xc0\
-p\xa3\xe4S-\xf5:vt\xb5\xf440}KC\
-\xadV\xea\xd09\xb0\xa6\x15\xce,R.P\xb0\xa3o\
-\x8a\xc3\xd9F\xed\x22R=\xc0YF\xde\xac@\x8f\xf8\
-\xd8\x8eX\xc7*O\x98c\x04x\xc8lwd\xe6\xaa\
-\xa4/]\xc9\xcc\xe1\x90\xb0\xf2\xf8Fc\x87'\x1d\xa5\
-r\x0d\x19\x07e\x9drI\x88I\xcbp\x85\x14\xe7L\
-\x1d\xe9\x02\xed3\x00\xd2:\xf2\xdf\xb5\x1b\x8f\x8f\xd4\x10\
-\xbc\xe0pE\xc6\x0b\x8c\xd4\x91\xd7\x9e\xd1bQ\xa4\x0a\
-\xb0\x13\xcf\xe7\x91\xf4A\x92\x88\xc4\xf3\x89JN\xdc\x07\
-\xb5\xe6\xf0\xa6P\xa8\x92\xacuqc\xf8\xeb\xc8\xf6I\
-\x86jp9T`\xabQ\xf7\x0a\xaaCk\xd5@F\
-\x12\xa1|K\x9d\xe8\xee\xd6\xb3F\xd68#N\xfc7\
-\xe3gv\xa3\xbcp\xaaXr*\xa8\x91''`\x85\
-!\x83,\xf7\x16sZ\xe2\x90\x09\x05\x05H-\xb7\xa8\
-)GMh\xbc]\x95F\xb0\xa30\x025\xebt\x01\
-\xc5\xe2\x11\x00-\xd2\xfd\x949t\xa7<\xbeF\xcaK\
-s\x88q7\x88\x90\xbagL\x0b2a\x12S\xb0_\
-K\xa3\x1c\xe5\x86d#\x13\x84\x08\x8b8%M!F\
-0\x03\x9a>a\xb4\xf1\x9a\x08\xdch\xbcF\x14\xc3\x8b\
-\x08\xcd\xbb\x90q\x1f\x5c\x00\x22\xcf\x80\x85\xd9\x10\xfb\x09\
-h\x10\xa2f:BX>\x99\xeb\xe4'm\x9c\xbfJ\
-\xae\xb3\xc1z@\xd8\x05\xa9\x1a\xa1\xa1\xbb\x82V\xeb\x07\
-m9\xa2\xed\xce#\xe7\xd4\x9b\x8f\x8aB\xab}\x04X\
-\x99\x95\xc1\x7f\xb5\x22\x9cB\xaa\xb7\x1a\xeaQi\xa7\xe1\
-##Z\x82\xd9\xc7\x91\xfa(c\x8e\x0c\xa8e\xc4\xca\
-\x99\xee\xcb\xdf\x93\x11\x95\xe3^\xbae6\xd2\xbbk\x1a\
-\x1d\x9cA\x0aP(\x0fw\x0e~z.\x85\xc8\x7fL\
-\xbd(r6iA\xd3\xc9@\xe2\xbc\x87\xdb\xb0\xa9\xbd\
-v\x84\x85\x1d\x90E\xa0Wu\xac\x95`\x15\x98\xd8\x9e\
-9\xdc\x96\x19 CF\xc4\xb1\xc4'\xd3\xf1p\xcb\xb3\
-h\x1a\xc8\xaa\xb3\x10\xaa\xa1H\xa1\x1b\x1c\xd8\xda\xcd\x22\
-\x93\x85M\x18%[E\xb5W}F\x00\x93\x08L\x1d\
-\xae\xc8\x0eH\x17\x1f\x5c\x9a\xb8\x0bm\xce\x9c^\x96>\
-\x0b\x1b\xa85J\x97\x06m\x95\xe5>\xe3\x0f/T\x18\
-h\xe7\xb9\xe6\xe3\xd1\xbc5\xf0J3\xcf\xd9[\x97H\
-\x9bYk\x8bO\xe3\xad\xfd\xeax\xc329\xc6\x0e$\
-\xa9TXLWc\xe9\xd68\x1f\xae@\xe7\x8d\xfa\xf1\
-P\x5cI\xbbl\x99/\xf1\x1a\xa3\x92S\x91\xd5\x88b\
-\xd2QD\x81\xab\xc2T\xd7\xce\x7fM:\x1c\xa4\xc3V\
-\x9b\xda`\xe82\xcf\x86\x08\x5cm\x94\xbf\xacs\xa6\xcf\
-\xa2\x1b~\x0f\x85C\xd8\xe2\x05\xb1e\xd8\xd8vGB\
-}\xa4\x19\x82\xa4\x8f\xf07\xf2'\x91x0\xb8\x0d\xe8\
-\xbb\xad\xe3\xb4\x5c\xf3A=x%\xa0\xceF\xeaRk\
-G\xb11\xd3k\xc8\xd0\x87\x96\xce\x0d\xb9\x8b\x8e\x96\x83\
-\xce-{y%\x90\xed\xd6\x02\x1f(\xcb\xbf\x9c\xa9l\
-\x14\xf9FF\x8c\x91:\x05\xdb\xc4\xfd+\xf0\xdc\x92\x1c\
-\x18\xe1\x11\x8aV#]\xcd\x1dz\x14p\x8b\x91\x0aS\
-d\x07\xaa\x99$ \xb9s\xaaQ\x16\xc4\xa3\x99!\x0a\
-\x90\xb7\x22\x0f\x13\xa9\x0eQCh\xa4\xb9g\xcd\x92\x9a\
-\xc5\x8a;\x93A\x8dj3\xe8G\x06\x87aet\xe8\
-t\xa4\xeap(\xbc\xd6[\xab\xf9ZwF\x92\x1bA\
-\xbeU\xfc^\xfewd\xef\x03e\xda\xe6\x86\x22\x13R\
-\x87\xf8\xb3\xf7\x1e<\xc1wZ\xe3=Z\xabc\xe6\x81\
-\xce\x8f\xd2\xd8,M#U\xb4pD\x11S\x92\xdc\xb5\
-\xd91v\xe9\xb8\xc1:\x8a\xc7\xe4\xdc\x90\x02\xe0\xe8}\
-R\x18\x15\xe3\x0csC\xa5\x05bg\x5c\x0e\x9c\xe1\x0a\
-\x17\x90s\xd11b\xe9\x0e\xf8*\x0d\x87\x1b\xa9\x0c\xc1\
-\x12Eo\xd3\xd5\xc4\xa5\xd3\xc8\x982`\x98\x82\xdcQ\
-?\x16t\x87\xd9N}r(\xd2\x13f\x0c7\x83\x0b\
-\xb34\x9b\x11f\xa4^,\x1d\x15\xb9\x19\x15\xbb5;\
-,(\x1e&un\xeb\xf9\x04)\xc3!\xbc`\xc8\x02\
-3\x9e`m\xbb\x82\xed'%\xdc\x7f}\x09\xef\x81b\
-3\xdc\xd1\x86\x1a\x15eV\x15N5z\x15P\x0eg\
-5<\xf2\xd62E\x8eVNd;j\x117\x18\x1d\
-$\xcf\x90\xb1\x078\x1dJ!\x952JR\xf0w\xdc\
-Ge\x8c\x90\xb8\x86\xa4t$m\xd0\xa5\xd0+\x22q\
-\x84\x9e#\xb8\x83\x8c\xd7>\x05\x92C\x94\x86*\xd82\
-\xceR\xcb4\x1f\x9a\x03\x90p\xce\x96\xf9\xe1\xcdUT\
-A\xe1\x5c \x01\x91'\x90\xe8m\x84t\x13d/5\
-O\x12\xc4d*\x08R\x94\x99|\xd3\x96%\xf8N\x1d\
-O\x1c\xa2\x82\xccM.%\xce,!\x9e\x1b\x00\x1c!\
-C \xa2G\x1b]-\x9diX3\xa4\x02\xe1\xbcE\
-x\x8cl\xb5rf\x7f\x11\xdd\x22u\x03U_+\xf5\
-\x94d\x91\xbe\xa2\x0d\xee\xe1\x9c.?~\x09M\x03\xde\
-\x91#R\x0b\x1a\xd1\x18e\x10\x88\x9b&:\x5c\x5c%\
-t\xfeH!\x96\xf8d\x8b\x0c\xd7_?\xc3 \xd2\xf2\
-\xb1\xdb\xcc\x0dA\x8c\xc8h\x1d*\x04\xc9H\x0f\xa1\xc1\
-\xe9\x86rn\x96\xf9\x01\xc5\x83u\x1fe\x83\xe1\x9c\xa5\
-\xa2\xc8\x1c\x8c\xa5\xa2\xe6,\x9f\x05J\xbb\x8bd\xd2\x08\
-\x01,\xfc\xe0\xb6\xbe\x22MF[\x0b\x89;\xf0\x9b\x19\
-<|\x14-!fp{\x90\xc1\x8b\xecGB]\xca\
-\x19\xf9*x\xc8\x01\x1d\x03\xd7\x06\x19K\x8f\xd4\xdb\xd0\
-K\xc8;V\x81\xe8CGw\xf8\x93h\x89\xa9 g\
-\x01\xf1\x95\xd5\x06\x8f#\x94\xe0r\x22\xec7G\x10O\
-\xe8@\xc8\x15\xd8D\xc8L\xf6BfFp:\x22\x10\
-\x82j1K<\xe5\xfa6E\x87\x81W$\x0b\x00@\
-\x94\xad'D\xfc\x9c5M\xf7\xe0\x15\xd50\xa8H\x9e\
-\xc2U\x87\xa5\x15\xd6@E\xa5!\xdf\x82\xa8\xda]\x90\
-(\xe4\xe0LV\x15A\xfa\x16P\x0b\x97L\x0dhS\
-\xcd\x87\x00\xed\x9b\xe9\x83\xc6\xd5\xb3\x92\x07{\x92\xc2\xe2\
-(\xce\x8d\xae\x89\xe1M\xa2\xc2\xda\xb2b&(\xd8A\
-=\xa7\xd9Do\xca \x07sFsQV\x7fa\x19\
-\xb9\xf4\x88\xe4\x07CZ\xa8\x8f\x1e\x0f\xef\x0d\x22\x81\x14\
-\xa2\x06T%G\x1f\xe9:Av\x10\xd6\x84\x90&\xc1\
-\x01\xe1]\x04d+:kK\xe21\x98\x18A\xde\x0f\
-\x0a}Z\x1a\xd2\x96\xe8\x80\xe1\xe1r\xe1Ch\x8bc\
-\xa2L\x0eV\xd4\xa9\xb1\xc2$\xc3\xc4\x19k\x1aa\xc2\
-F\x87\x1e\xf2\x8aH\xb0\x8au\xa1O\x0a\x13\xfd'\x88\
-\x96\x03\xa9\xcb\xcc \xd7@\xea5\xda\xf0F\xe1\x98&\
-\xbc-\x9bK`\xb2H=]\x90V\x81\xc2\xac\xd0\xe0\
-&&\xdd\xbb\x8cZHo\xa9\x8e\xb3\xac\x97\x08\xc9c\
-\xc2m\x93\xb4\xf0I\xbe\x89G\x96\xa9=4viz\
-\xbb\xc8\xc6\xf4Q\xf5\xb1\x90\x04\x89\xd2\xeaX\x99S\xcb\
-W\x88\xea\x888\xc6+8\xc7\xf0\xccW\xc0m\x08d\
-`J\x17\xb8\x03h[\x81H\x83\x97\xab\x13:\x00I\
-\xbb\xa2\xeeiA\x96%\xa4\xc8\x1c+0\x96i\xb0\xb1\
-\xf6H\xb2\xd3\xaaF\xda\x80\x1e=\x18\x0a\x9a4\xd3\xec\
-X\x8fd(\x9e\x08\xdd\xff\x0d\xfd\x80\xd2jEm\x8d\
-\x90B^\xd2\xc8\xab\xe7\xae\x9a\x5c\x92\x8c\xbc\xd5\x1a\xe8\
-\xc3\xac}\x12\x0c\xbf~\xec\x17\xf0\x9ap\x1ff\x0e\xa8\
-\x07l\xd6M00:@\xd2\x19o\x95F\x02|\x07\
-\x8f\xbe:~h\xef\xcc\xa6Z\xa8\xe1Q:\xe3\xd1\x86\
-Y\xd1\xfe\x90Ej\x88\x98d\x95\xd8\x03\x84i\x90L\
-\x81#\xee\xa5+\x0fS\xe5]\x86\x85g\xd4x \xf2\
-\xde2\xd9\x02\x83n*C\xaf\x93\xb6>\x22F\xee=\
-[+\xe0\x91s\x821X<\xbbfF\xc8\x0aw\x15\
--Vi\xa4M\xc7+5\x90`-l\xc3\xcb\xac\x14\
-\x13\xca\xf0Fx\xe0\x22MG(\xc8B({ \x9d\
-\x04\x0d\x0a\x87\x16\xda/\x90\x03\xcc\xaaf\x07O\xf7h\
-\xf1\xcb^\xc2\xea\x11\xd9\x94\x12\x01\x9a\xad\xec\xb5\x0d\xca\
-*p\xe0+H\xb08bG\x18\x01\xcb\xbf\x1b[\x16\
-\xd29\xb3\xaf\xf0\x09\x10mg\xf2\x83\xd0\x12\x92\x09I\
-\xcaN5\x98\xedq\xbe\xed\xd3]\xac\xcc\xbf>\x90d\
-P\xde\x09\xcf\x98K\xec.\xdd2\x85\x8e\x86\x98L\xd3\
-\x1a\x8d\xb0\xa6g\xa2\x0eF\xa2\xa1Jn0A-{\
-Z\xf3\x1f\xe9_\xc3{\xf3Q\x11U\xf3\xe9;\xa4\x9d\
-\xb4\xd5$\xab\x86\x97\xad\xc3x\xa1(\xc9\xd0d\x99\x04\
-\xb2j\x19\xa2\xa3,\x90\xb0\xd2\x80\xbe\x87\xb1\xf6D\x15\
-3\xda5\xd1\xb6\x94\xfd\x04#i\xd1?\xbc\x80\x08-\
-\x90iB\x89\x12=\xb7#\x03\xad\x1cp\xf9%\xfbl\
-\xd7s\xfb\xf4\x93\xf8[\xc2\xeb\xfb~\xf9\x0f\xffx\xf8\
-d\x1e=\x951\xa6\xf0\xf8\xa9\xac\x07\xbd\xff\xe5\x9c\x18\
-@\x8d\xa2R4\x9e\xb93\xd2\xd9M'\xee\xd9\xdcW\
-\x0d\xab\x8b*\xa1\x8d\xec\xfeK\xbbkhV\xefO\xed\
-\xcb\x9b\xcb\x8b\xbb\x8f\x9e\xc6\xeb\xd7\xfb\xa7\x81\xf4\x8c>\
-\xd8\xd5\x85#\xe2\x00F\x1f\xfaE\xd7)\x8c\xec\xaf\x8a\
-\xf6\xe0\xc3_\xef\xc6,\x10\xb5\xa1\x82{\xff\xce\x0f/\
-\xcf8?\xffp\xec\xf4\xc7\x97g\x0b\xa3p*\x0f\xf8\
-\xe5n~|y\xf6aH\xe3\xc1\xbd\x7fw~w\xf3\
-\xf6\x87\xdf\x22vh(\xcf#\x0a\xf5\xda\x15M\xfd\xe9\
-=~\xe4\xe5:\xd7\xdfm\x7f#\x16\xf9\xcc[\x81\x06\
-#KP>\xba\x17\x9aM\x06\xf4\x80\xb3\xed\xaf\xdd\x8c\
-\xe5\xe1\xb5~\xb8\x03\xcb\xa7\xee\xcc\x87\xdb\xb1\xa2\xf4\xcb\
-w\x97w\xe7\xaf\xce\xef\xce\x7fs\x7f\x91\xbbW\xd8\xd8\
-\xcevw\xee\xd5\xeb/\xfe\xc7\x1f\xfe\xf9\x1e\xeb\x17\x17\
-_\xfc\xaf\xeb\x9b\xbf|\x90\x12|\xe0\xfc\xcf\xd7\xdf\xde\
-\xbd<{0\x0a\xf3\xe5\xab\x8b/\xee\xde\xde]]\xfe\
-\xfe\x9fo./\xbf\xfa\xc7?L\xff\xfa\xef\xff2\xfd\
-\xd3\x0f\xdf\x5c\xdf\xdc}\xf9\xe2\xfe\xcd{\x09Z\x0f\xbb\
-\x93\xa3\x07\xbf\xfa\xe5\x8b\xddi\xfd\xfe7_\xbe\xb8\xfd\
-\xee\xcd\xef\x7f\xf3\xff\x00\x95\xc8\x9a\xcb\
-\x00\x00\x0b\xe6\
+\x00\x00\x03\x81\
 <\
 ?xml version=\x221.\
 0\x22 encoding=\x22UTF\
@@ -3084,191 +2426,57 @@ _\xfc\xaf\xeb\x9b\xbf|\x90\x12|\xe0\xfc\xcf\xd7\xdf\xde\
 no\x22?>\x0a<svg\x0a   wi\
 dth=\x2232mm\x22\x0a   he\
 ight=\x2232mm\x22\x0a   v\
-iewBox=\x220 0 320 \
-320\x22\x0a   version=\
-\x221.2\x22\x0a   id=\x22svg\
-753\x22\x0a   sodipodi\
-:docname=\x22Displa\
-y_disabled.svg\x22\x0a\
-   inkscape:vers\
-ion=\x221.3.2 (091e\
-20ef0f, 2023-11-\
-25)\x22\x0a   xmlns:in\
-kscape=\x22http://w\
-ww.inkscape.org/\
-namespaces/inksc\
-ape\x22\x0a   xmlns:so\
-dipodi=\x22http://s\
-odipodi.sourcefo\
-rge.net/DTD/sodi\
-podi-0.dtd\x22\x0a   x\
-mlns=\x22http://www\
-.w3.org/2000/svg\
-\x22\x0a   xmlns:svg=\x22\
-http://www.w3.or\
-g/2000/svg\x22\x0a   x\
-mlns:rdf=\x22http:/\
-/www.w3.org/1999\
-/02/22-rdf-synta\
-x-ns#\x22\x0a   xmlns:\
-cc=\x22http://creat\
-ivecommons.org/n\
-s#\x22\x0a   xmlns:dc=\
-\x22http://purl.org\
-/dc/elements/1.1\
-/\x22>\x0a  <sodipodi:\
-namedview\x0a     i\
-d=\x22namedview755\x22\
-\x0a     pagecolor=\
-\x22#ffffff\x22\x0a     b\
-ordercolor=\x22#000\
-000\x22\x0a     border\
-opacity=\x220.25\x22\x0a \
-    inkscape:sho\
-wpageshadow=\x222\x22\x0a\
-     inkscape:pa\
-geopacity=\x220.0\x22\x0a\
-     inkscape:pa\
-gecheckerboard=\x22\
-0\x22\x0a     inkscape\
-:deskcolor=\x22#d1d\
-1d1\x22\x0a     inksca\
-pe:document-unit\
-s=\x22mm\x22\x0a     show\
-grid=\x22false\x22\x0a   \
-  inkscape:zoom=\
-\x224.3895635\x22\x0a    \
- inkscape:cx=\x2279\
-.73458\x22\x0a     ink\
-scape:cy=\x2233.716\
-336\x22\x0a     inksca\
-pe:window-width=\
-\x221920\x22\x0a     inks\
-cape:window-heig\
-ht=\x221012\x22\x0a     i\
-nkscape:window-x\
-=\x220\x22\x0a     inksca\
-pe:window-y=\x220\x22\x0a\
-     inkscape:wi\
-ndow-maximized=\x22\
-1\x22\x0a     inkscape\
-:current-layer=\x22\
-Page\x22 />\x0a  <titl\
-e\x0a     id=\x22title\
-2\x22>FreeCAD SVG E\
-xport</title>\x0a  \
-<desc\x0a     id=\x22d\
-esc4\x22>Drawing pa\
-ge: Page exporte\
-d from FreeCAD d\
-ocument: glasses\
-</desc>\x0a  <defs\x0a\
-     id=\x22defs6\x22 \
-/>\x0a  <g\x0a     id=\
-\x22Page\x22\x0a     inks\
-cape:label=\x22Tech\
-Draw\x22\x0a     inksc\
-ape:groupmode=\x22l\
-ayer\x22>\x0a    <path\
-\x0a       style=\x22f\
-ill:#000000;stro\
-ke-width:2.64583\
-\x22\x0a       d=\x22M 22\
-.301952,282.0895\
-4 283.29506,47.0\
-14926\x22\x0a       id\
-=\x22path560\x22 />\x0a  \
-  <rect\x0a       s\
-tyle=\x22fill:#c8b7\
-b7;stroke-width:\
-2.64583\x22\x0a       \
-id=\x22rect1003\x22\x0a  \
-     width=\x22259.\
-7876\x22\x0a       hei\
-ght=\x22200.71756\x22\x0a\
-       x=\x2229.535\
-019\x22\x0a       y=\x226\
-5.700348\x22 />\x0a   \
+iewBox=\x220 0 32 3\
+2\x22\x0a   version=\x221\
+.1\x22\x0a   id=\x22svg1\x22\
+\x0a   xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22\x0a   xmlns:\
+svg=\x22http://www.\
+w3.org/2000/svg\x22\
+>\x0a  <g\x0a     id=\x22\
+layer1\x22>\x0a    <re\
+ct\x0a       style=\
+\x22fill:#ffffff;st\
+roke:#000000;str\
+oke-width:1.2\x22\x0a \
+      id=\x22frame\x22\
+\x0a       width=\x222\
+9\x22\x0a       height\
+=\x2229\x22\x0a       x=\x22\
+1.5\x22\x0a       y=\x221\
+.5\x22\x0a       ry=\x222\
+\x22 />\x0a    <rect\x0a \
+      style=\x22fil\
+l:#d17070;stroke\
+:#000000;stroke-\
+width:0.8\x22\x0a     \
+  id=\x22bar1\x22\x0a    \
+   width=\x225\x22\x0a   \
+    height=\x2220\x22\x0a\
+       x=\x225\x22\x0a   \
+    y=\x227\x22 />\x0a   \
  <rect\x0a       st\
-yle=\x22fill:#241f1\
-c;stroke-width:2\
-.66074\x22\x0a       i\
-d=\x22rect1007\x22\x0a   \
-    width=\x22215.7\
-8644\x22\x0a       hei\
-ght=\x22162.74397\x22\x0a\
-       x=\x2251.836\
-971\x22\x0a       y=\x228\
-4.385757\x22\x0a      \
- ry=\x220\x22 />\x0a    <\
-rect\x0a       styl\
-e=\x22fill:#c8b7b7;\
-stroke-width:2.6\
-4583\x22\x0a       id=\
-\x22rect1009\x22\x0a     \
-  width=\x22180.826\
-63\x22\x0a       heigh\
-t=\x2216.877153\x22\x0a  \
-     x=\x2268.11136\
-6\x22\x0a       y=\x22283\
-.8978\x22 />\x0a    <r\
-ect\x0a       style\
-=\x22fill:#c8b7b7;s\
-troke-width:2.64\
-583\x22\x0a       id=\x22\
-rect1011\x22\x0a      \
- width=\x2239.78186\
-4\x22\x0a       height\
-=\x2219.288176\x22\x0a   \
-    x=\x22136.22273\
-\x22\x0a       y=\x22265.\
-2124\x22 />\x0a    <re\
+yle=\x22fill:#e0a06\
+0;stroke:#000000\
+;stroke-width:0.\
+8\x22\x0a       id=\x22ba\
+r2\x22\x0a       width\
+=\x225\x22\x0a       heig\
+ht=\x2213\x22\x0a       x\
+=\x2213.5\x22\x0a       y\
+=\x2214\x22 />\x0a    <re\
 ct\x0a       style=\
-\x22fill:#ff0000;st\
-roke-width:4.384\
-27\x22\x0a       id=\x22r\
-ect614-3\x22\x0a      \
- width=\x2216.97952\
-7\x22\x0a       height\
-=\x22434.47598\x22\x0a   \
-    x=\x22-8.063242\
-9\x22\x0a       y=\x22-44\
-3.13181\x22\x0a       \
-ry=\x220\x22\x0a       tr\
-ansform=\x22matrix(\
--0.70844066,0.70\
-577038,-0.708440\
-66,-0.70577038,0\
-,0)\x22 />\x0a    <rec\
-t\x0a       style=\x22\
-fill:#ff0000;str\
-oke-width:4.3842\
-7\x22\x0a       id=\x22re\
-ct614\x22\x0a       wi\
-dth=\x2216.979527\x22\x0a\
-       height=\x224\
-34.47598\x22\x0a      \
- x=\x22216.97707\x22\x0a \
-      y=\x22-217.23\
-75\x22\x0a       ry=\x220\
-\x22\x0a       transfo\
-rm=\x22matrix(0.705\
-77038,0.70844066\
-,-0.70577038,0.7\
-0844066,0,0)\x22 />\
-\x0a  </g>\x0a  <metad\
-ata\x0a     id=\x22met\
-adata2626\x22>\x0a    \
-<rdf:RDF>\x0a      \
-<cc:Work\x0a       \
-  rdf:about=\x22\x22>\x0a\
-        <dc:titl\
-e>FreeCAD SVG Ex\
-port</dc:title>\x0a\
-      </cc:Work>\
-\x0a    </rdf:RDF>\x0a\
-  </metadata>\x0a</\
-svg>\x0a\
+\x22fill:#70b070;st\
+roke:#000000;str\
+oke-width:0.8\x22\x0a \
+      id=\x22bar3\x22\x0a\
+       width=\x225\x22\
+\x0a       height=\x22\
+6\x22\x0a       x=\x2222\x22\
+\x0a       y=\x2221\x22 /\
+>\x0a  </g>\x0a</svg>\x0a\
+\
 \x00\x00-\x06\
 <\
 ?xml version=\x221.\
@@ -4151,6 +3359,906 @@ title>\x0a      </c\
 c:Work>\x0a    </rd\
 f:RDF>\x0a  </metad\
 ata>\x0a</svg>\x0a\
+\x00\x008\x1d\
+\x00\
+\x01\x82ex\x9c\xed\x9d[\x93\x1c\xc7\x91\xa5\xdf\xf5+\
+\xd20\x0f#\x99U\x15\xe2~\xe1\x92\x1a\x9b\xa5F\xf3\
+\x22\xad\xad\xadfg\x1f\xd7Z@\x83\xc4\xaa\x81\xe66\
+\x9a\x17\xcd\xaf\xdf\xf3yd5\xba\xaa\x01v\x92`5\
+kl\x134\x09\xa8[fF\xc4q\xf7\xe3\x1e\xee\x1e\
+\x9f\xff\xd3\x0fo\xae\xa6\xef.o\xde\xbd\xbe~\xfb\xc5\
+3\xbfs\xcf\xa6\xcb\xb7/\xae_\xbe~\xfb\xd5\x17\xcf\
+\xfe\xe7\xbf\xfdq\xdb\x9eM\xefn/\xde\xbe\xbc\xb8\xba\
+~{\xf9\xc5\xb3\xb7\xd7\xcf\xfe\xe9\xf7\xbf\xf9\xfc\xddw\
+_\xfdf\x9a\xa6\xef_\xbf\xbc\xfd\xfa\x8bg1\xbcy\
+\xf3\x8c\xd7__\xbe\xfe\xea\xeb\xdb{o|\xf7\xfa\xf2\
+\xfb\xffz\xfd\xc3\x17\xcf\xdc\xe4\xa6\x18\xec\x7f\xe3\x83\xf7\
+\xb7\x0c\xf6\xc6\xeb\x97_<\xd3Uk\x8e\xf6\xf2\x9d\x1e\
+\xe1\x1b\xfd\xef\xb3\x97\xd7/\xde^\xbc\xd1\x9d\xffr{\
+\xf9\xcd\xeb\xcb\xb7\xff\xfb_\xaf.\xde\xbd\xbb|\xb7\xd3\
+\x97\xc7\x0f\xdf\xfe\xed\xdd\x8b\x8bo.?\xbbw\xc9\xb8\
+\x0b\xd3o]\xf7\x97\xc1]\xber\xaf6Sp!n\
+\xbd\xdf\x86\xfc;\xfb\x91F\xfd\xf6\xddg\xfb\x9f~\xf1\
+\xec\xeb\xdb\xdbo>{\xfe\xfc\xfb\xef\xbf\xdf\xed\xdf\xdc\
+]\xdf|\xf5\x9c[\xbf\xfb\xe6\xe2\xc5\xe5\xbb\xe7\xfb\xf7\
+\xef\xfd~\xff\x90w\xbf\xdf\xbf\xb1{w\xfd\xed\xcd\x8b\
+\xcbW\xba\xc4\xe5\xee\xed\xe5\xed\xf3?\xfc\xdb\x1f\xee>\
+\xdc\xba\xdd\xcb\xdb\x97\xef/sp\xf7\xef\xa3\xdd78\
+\xe7\x9e\xefG8\xdf\xec\xbb\xaf\x16~\xf3\xe6\xe5\xab\x0f\
+}\xd3\xf7\xde\x9f\xbb\xf0<\x84\xad\xbe\xb1}\xf7\xf7\xb7\
+\xb7\x17?l\xdf\xbe\xfb\x87{?}\xf1\xe2\xee\x97/\
+n./n_\x7fw\xf9\xe2\xfa\xcd\x9b\xeb\xb7\xef\xc6\
+t\x1c|\xf9\xe5\xfb/\x7f\xf3\xed\xcd\x95}\xe3\xe5\x8b\
+\xe7\x97W\x97o.\xdf\xde\xbe{\xeew\xfe\xf9\xb3\xdf\
+\xeb\xfb\x9f\xdf\xad&\xf3\xf9\x12Pp\x95\xb1\xe8wo\
+\xd5\x9c\x9f\x8d\xb7\xbf\xb9\xf8J\xb7\xbd\xba\xbe\xf9\xe2\xd9\
+?\xbc\xb2?\xf3\x07\x7f\xbd\xbeyyy\xb3\xff\xc8\xd9\
+\x9f\x83\x8f\xae\xb5V\xafo\xff.\xbc\xed\xc2\xfejw\
+\x00y\xf7\xf5\xf5\xf7\x5c\xfa\xdd\xd7\x17/\xaf\xbf\xff\xe2\
+Y8\xfe\x02\x1f\xde\xbb\x82\xfb\xd0\xe7/\xbe\xbe|\xf1\
+\xb7\xcb\x9b\xbf^_\xdc\xe8\xe1\x1f|\xe5\xe5\xe5\xbb\xbf\
+\xed\x9f\xef\xa5\xe7\xbf\x07\xdf\xb8~\xf1-\xf3\xb3\xfd\xf6\
+\xed\xeb[-\xfe,)\x82\xbc\x1e\xef\xab\x1b\xa6\xe4\xd5\
+\xc5\xd5\xbb\xcb\xe3\xdf\xfd\xc7\xf5\xf5\x9b/\x9e\x95]p\
+\xb56\xf7\xe0\xd9_H\xc8z\xd9\x95\x1c\xba\xab\x0f>\
+\xd4x\xaa\xdbU_\xeb\x83\xe7\xf9\xfe\xf5[\xcd\xc6v\
+\x16e\xdf\xc3\x831\xcd\xdf\xd8\x0b\xb7w\xfe\xc1\xdd\xe7\
+\xaf\xfc\xf0\x81\x19\x99?\xfa\xfb\xc7?zs\xf1\xc3\xeb\
+7\xaf\xff\xe3R#\x7f\xf0t/\xbe\xbd\xb9a\xb2\xae\
+.\xfe~\xa99\xfd*\x94\x90\x9eM\xcf\x0dU\xb7\xaf\
+o\xaf.\xdf\x03\xc9^\x86g\xbf\xff\xe3\xcd\xe5\xe5\x97\
+\xff\xfc\x87\xe9/\xff\xfe\xaf\xd3\xbf\xfc\xf0\xcd\xf5\xcd\xed\
+\xe7\xcf\xed3\xfb\x91\x16\xe8\xc5\xfb\xdf\xf0*=\xfb\xfd\
+\x1fn.\xf4,_\x19\xf0>\x9b\xfe\xbb\xfe\x7f\xba\xb4\
+_^\xbe\x9c^\xdd\x5c\xbf\x99\xf6\xd7\xdc/\xdeg\xd3\
+WC\x0d}\xfe\x9cK\xccW~\xf5\xee\xfe\x95_\xbd\
++\xfb'\xfd\xea\xfd\xfb\x5c\xfcx\x90W\x17\x7f\xbd\xbc\
+\xfa\xe2\xd9\xbf\x09\x5c<\xc9\xf1\xc7_\xdd\x5c\x7f\xfb\xcd\
+\x9b\xeb\x97\xd2S6\x0d&S\xef\xaf*\xe4\xdc\xde\x5c\
+\xff\xedr{\xf5\xfa\xed\xe5\xff\xb9~-\x0d\xf8\xd7\xcb\
+\xef.\xaf\x9e\xed?\xe6\xb6\xf3\x08\xbf\xbc~{\xab\xc7\
+\xbf\xfb\xe8\xd5\xeb\xab+\x94\xfa\xdb\xcbg\x1f\xb8\x98\xee\
+.\xa5\xfc\x7f\xbf\xbd\xb8y\xf0\xf1\x1e.\x07W\xda\xde\
+|{\xa5\x87\xd4\xcd\xdf^\xbf|y\xf4\x93c\x81\x9d\
+\xa6\xdb\x9b\x8b\xb7\xef\xa4#\x05\xeb7\x17\xb77\xaf\x7f\
+\xf8\xad\xdb\xf9\x5c\x04\xee\x907\x8e\xffxYk\x0du\
+\xb3\xada\xa7\xf7Ki\x9b \x94\xbb\xe8\xe2\xef\xe6y\
+\xb8?\x13c\xb0\x03%\xbf\xbf{\xf3\xfe\xe7zR\xcd\
+\xc1\xf6\xdd\xed\xdf\xaf\xcc\x9c\xdd\xbc\xb9x?S\xef\xa7\
+\xe4P\xef<x^\xfb\xe7\xd5\xc5\xed\xe5o}j~\
+\x97\xc2\xa6\xa5\xa0\xa7\xfd\xdd\x83Km\xef\x14\x8a\x7f\xf6\
+\xe0)^]\xbcy}\xa5\x8f\xfe\xf1\xbf]\xdf^O\
+\x7f\xd15\xff\xf1\xe0K\xfb\x99;X\xa0\xbb_\x7f?\
+\x0bd\xba7\xa7\xef\x07(\x81\x92!\xce\xbb u\xf1\
+\xcd\x0f\x07_\xb09\xf2\xa5\xdf\x9b\x22M\xd27\x17\xb7\
+_\xdf\xff\xd64\xe9k\x7f\x9eZ\xddE_6i\xd7\
+J\xf7Ssu\xe7\x9d\xd6#\xc4\xba\xeb\xa9L/\xa6\
+\x90w\xb9\x95\xcd\xb6\xedJ\xf4Sv\xbbV\xf5y\xdf\
+\xb5\xe6\xa7\x9av)\xfb\xcd6\xeeJm\xd3\xd5\x14\xc2\
+\xae\xb4\xbc\xc9\xbb^\xba~\x9a\xeb.\xf9\xbe\xf1Y\xd7\
+lS\xef\xbb\xee\xeb\xa6\xc6\x9d\xcbi\xf2>\xed\xb2^\
+\x0a\x02;\x1f\xe3\xa4\xebf\x9e\x22\xc5\xac\x7f\xf3+\xb7\
+\xcb\xd3\xd6\xef\x9a\xe7\x02\xc5\xeb7[\x81\xc4\xeb\xea\xde\
+g}\xa4\xbf\xdb\xa6\xefB\xe8\xfa\xa4\xed\xf4T^\xd4\
+ W\xaf\x07\xd9\x96]\xaf\xba\x9c\x8f-\xebA\xf4\xc3\
+\xa4E\xf4<m\x98\xb6i\xd73\xaf\xba\x0bu\xda\xd6\
+]\x88Y\xaf\xa2\xf3}\xfa\xd3\xd4\xab8K\xdfl\xb3\
+\x9eS\x83\xd2\x8f\xa3\x9eA\x13 \xf6\xe4\x12W.)\
+m\xb6<j\xe1\xc7Eh\xde\xeaacn]\xcf\xab\
+\x1f\xbb\xb6\xd9\x96\xa0\xe9\xd3\x0cm\x93F\xc0\x1b\x9a\x81\
+]uz\xb8m\xd3\xf5\x0a\xbf\xd1\xcc&\x9f\xf5Np\
+z \xcd\xb9\xa6V\x97LQ\x03\xf4\x92\x8e\xae\xdbo\
+Kf\x106\xb4\xd0\x19Yu\x9a\x0d\x9771z-\
+\x8c\x1e\xc8\xe9\x11\xfa\xa6\xebb-N_NZ\xbe]\
+\x0ba\x13\x13\x9f\x97I\x17\x88\xc5o\x92\xe6;\xb9\xc0\
+\xd7\xab\xd3w\xb4\xe4QCiUC\xde\xc6\xa8'i\
+m\x93R\xdd\xd5\x90l\xd0m\xd7\x1b\xb3\xa4\xa7\xc9\xc1\
+\x9e\xda\xb9\x126u\x97\x83\x1e\xd2\x87\xb4\xab=\x06\x0d\
+C\xab\x9d*O\xe6\x03\xab\xc5\xadv\xae\x07.\x22\xa1\
+)ZI\xee\xaca\xf6\xa01h\xead\xbc\x8b\x9e[\
+\xab\xbe\x93\xfc\x0b=}\x97J\xb6\xa9\x0aL\xad^\x07\
+\xbe_:\xc8\x10\xd6\x9a\x16Y\x03\xcf\x02\x8e\xdd\xb01\
+@\xee\xb7\xcb\x86\x13M\x90&\xb1\xecR\xd7Di\xf4\
+>\xda\xc5b\x0d\x1b!R\xb3\xa2\x87\x8bA\xf6\xd1\xe6\
+\xd1\xc5\xfa~\x80G\xe3;\x1a\xde\x8f\x8fNHnZ\
+\x08}\xb5u=\x80/\x9ap\xa1l+\xd1)I\x8f\
+\xe0;\x82\xa0\x01y\x8d\xa8\x80\x8e\xa8\x99\xe0\xa2N@\
+N\xb9\x80K\xd6\xdd\x01\xc8\x18\xa6\x0a\x08\xf5\xb9 -\
+ipY\xb7\xe5\xab=\xe8=\xfd\xb4\xea\x8b\x92\x8dq\
+\xc9$\xaa\xa0;N5\xeb\x1a\x02\xaa~%\xc4j\xc5\
+\xeeD6\x1d\xcal?\x14\xdaz$\xb5\xa9\xfd\x98\xd8\
+\xf6#\xb9-\x87\x82\xebMr\x93\x09n\xbe'\xb9\xb3\
+\xe8\xda@\x9d\xcbCt\xefK\xae\x09\xae\x9etH\xee\
+^p\xc3\x90\xdc\xbd\xe0\xa6!\xb8Cn\x93\xc9m\x1c\
+b\xdbLl\x03\xbf\x1b\x83\xd0l\xeeGab\x9b\xdb\
+\x8f\xc9m\x99\x05\xf7Nn\xfd^pg\xb9\xad\xe1N\
+pg\xb9M\x06y\x93\xdc4\x0b\xae\xe3&\xc8n\xdd\
+\xcb\xaeV\x03\xe9\xad\xb3\xf4\xd6>\xcb/\x93\xbd\x95\x06\
+\xd2\x8c\xf5\x22\xdc\xf0d\x8c2i\xb8\xa8/\xa6\xa4M\
+-i]\xc2F\xab\xe0b\xb1\xf9FA{Wv5\
+J{\xf1\xa4\x89a\x15dv\x12\xec=\xea*4-\
+\x8f\x9f\xf4\x00\x01m-\xd9j\xb1q\xc3\x19\xf8\xdb\x81\
+|d[kb0\xd3\xb3\x95\xc0\xe7,\x8d^e\xa9\
+\xde$\xd9\xea6g\xc2\xb8\x1e\xb0\xe4\xc8z\xf6\xdc\xf3\
+T\xbb\xd6JJZ0*\xfa\xa1\x80\x11\xaa\x96\xc3i\
+h)iI\xf4#$N\x13\x1c\xf4$\xbamd\xc5\
+krM\x97\xd2e\xe3\xa6\xe9YSq\x1aUD\xd3\
+3\x93\x9avW4NA\x9e\xe5\x91\x90\x85&a(\
+\x13\x00o\xcc,\x88\x88Q\xef\x1c\x8feF\xba\x1b@\
+\xe7\x0dI@\xe4\xb2Ld\xd6Lzt\xa2\x0d\xa7\x05\
+M\xddw\xf2R\xffth\xf1\x9e\x1d\x9a\xc4\x1f\xa19\
+\xe3\x8f\x1c\xa6\xdb\xeb\x9b\xed\xe5\xabW\xfa\x87Y\xee\xad\
+X\x9c\xd8\xd4W\xdba\xcd\x8f\xbe\x8f-\xc6\xf2Jb\
+f\xb68\x9b\xe3\xe7_\xad\x04\xe6\xc7\x09L\x8d\x8b\x08\
+\x8c\xccB\x95p\x887J\xed\xa0\xde\xa4\x18Z\xf4\x1b\
+\xd4uEkH w5\xc3i*\x86\xb7\x19\x0cP\
+-Bc\x92\xc4K\xdb9\xa9\xf8m\x96\xe6@KJ\
+\xceZ\x90\x962\xf4\xa0n\x84\x1d.SvCI\x96\
+\x86\xb9\x89h\xa6\x8cm\x83\xc0J\xf2\x07\x5c\xdf\xa3U\
+\x9a&ce\x85TI\xbeQ\x94\x9e\xbaD J?\
+E\xb3\x7f\xd2\xaf\x09\x03\xe4jNf\x11\xe5\xd5\xa2\xd2\
+\x92\xdd\x10\x95\xa2a\xe8*\x01{\xa61\xf8\x8d\xa4\xdb\
+\xc5nj\xb1\xa1dZ\x96\x06\x96\xe8\xa6T\xf4\xaa\xc6\
+f\x1a5\xfa\x8c\x95M\x85\x07\x93\xd1\xed\x9d\x97\xbd5\
+{\xaa*\xb5\xbcE\x90\x18\x86\xb4\x22\x1aM\xc2P\x8d\
+_yo\xca,\x96\x5c#*\x94\x9b\xea\xfa\x12'\xd7\
+\xf9\xb1q\x19\xa9\x1ai]\xb3p;\xfb\x5c\x8f,\x1e\
+\xcf\x1c\xa2Wu\xbd.\xb5*\x83\xa0wLK\x18C\
+25!!\xb5\x99l\xa6\x8aE\xca\xaa\xb1\x8f\xdc*\
+\xaf]\xe9L\xa5\xe9 SA|[\x8cT\xab\xa7U\
+nu\xcc\xbb\x8bf\xe6\x93\x14\xb6i\x5c\x14\xde^\xdf\
+i\x9c\xb2\xac\x9a\x0bW\xb0\xaf\xfa\xbb\xe3g\xa08\xb7\
+\xfc\xcdG\xbe\xdb\xb4t\x0d5\xe9\xe1za\x06\xb3T\
+\x99\xee[ \x1eu\xf0C\x8d\xde\x1b\x19\xd0\x0cV\xf4\
+\x9a~as\xa2\xfbI\x85\xe6aU\xc4!\x8a\xe6\x0b\
+\x02#\x83*S\xedQ\x8b\xd8\x0b\xdd\x9b\xdbE\xb4,\
+*\xab\x8a>\xb1r!\xda\xfd\xb1\xe2\x9a\xdf`\xf3\x9a\
+P[2\x03\x192\x0b\xe7H\x00Q\xa4A?\x95\x90\
+d\xaf\xd7Y\xb3\xdd\x0dI\x05c2\xe6\xb4\xe4`X\
+\xea\x8c\x1f\xcd\xa8\x89\x12\xcb2\x90\xc3ZZ\xd7|i\
+\xfd\xa5\xb5k\xf2L\x02\xfc\xe1\x8e>\x88\xa2\x14\xac\xa6\
+\xa65\x14I\xcb\x8bI0\x8d\xdc;\x8b\x0d{\xe9U\
+o\xea6\xcb\xf4K`\x9a\x19T\x111\xcd\xa7P\x07\
+{\xf3f\xf9\xd1\xc8\x0d\x9a\x22\xab\xacW\x05\xdbk\x03\
+*q\xc2\xde\xc5\x01\xc88\xd9\xe3\xf1B\xa2\x0a=\xc9\
+fl\x12\xdf\xf2\xcdp\xea\xab\xcc\x90\xa6\xdc\x1bS\x14\
+\x7f\xc7!4\xda(\xac\xcbT\x1aV\xf4{\xad[\xf7\
+,\xad10\xc7m\xf1\x1d\xebF\xbc\xb1'= \xf3\
+\x966\xc9L\xb0\x04C|%\xc82K\xe6\xf4[!\
+K\xaf\x93\xe4_\xab\xc3\xb25\x91\x17\xe7\x02R\x94\xc7\
+\xbf\xf5\x11L\xc7@\xa4\xfbk\x82\xaa\x81(\xe2\xe14\
+)\x0dH\xa77\x18\xc1\x11\x5c\x84\xd94\x13E\x0f[\
+s&\xb5ZQI-\x96\x5c\x80\x905\x02\xc8y\x90\
+\xd7.\x02\xd2\x06y\xcd\x18\xc6\x0d&\x93\xc5\xd4L\xc5\
+\xa4/:\xb0\x01\x03\xd5s\x95!\xa1\xfa\x0c\xeb/\xbe\
+\x9e\x01\x11\xdeP\x84\x89 \x16\x99\xdfd3\x94\xdbZ\
+L\xe7\xc9>\xca\xeeB1<\xf2\xb3\x09\xfa\xa1\x04\xbb\
+e\x13d\xd9\x5c\xd7\xb5\xca3\xd9\x9d\xb9\xae\x96\xb9\x8b\
+\xb1\xc8\x88J\x0fNYR\xc9\xba\xe8\xbb\x9a\x97\x0a\x1b\
+E\xe2\xc5\x93\x07\x9a4M[-\x0a$\xcf\xdbDJ\
+=h\x8d$\x0e\x11?\xc5 \x09O\xef\x9a\xd3X\x8c\
+u\xf0]\xe9j^@f\xe4\x82\xc8\x85\xe1:\x12j\
+\xe7`\xeb\xc3\xa5\xd9\x9aO\x13x|F\x0d\xb3\x06W\
+u\xd2\xf7\x02A\x83\xc2\x03\x8b7K\x07\x14\xf4\x90\x98\
+m\x93\x1cO\xc8K4df\x89:\xd4\x0b\xffM\xb3\
+\xdbE\xaf\xbc\xd9\x07{\xa9A\xeb\xbb.\xb1\xea\x0ef\
+\x8a/QyU\xbat%<\xc9\xa3\x81]\xd6Z3\
+\x83\x12\x06o\x8a4cv\xa2\x16\x09\xf0\xa4\x1c!\xd5\
+\xbd\xe1\x81\xeamM4K\xa0k\xc2\x86\xba\xe8\xfb\xa1\
+\x98\xa5~(f\xc1\xe4\xcc\xf5\xbd\xa0\x95CI\xd3\x80\
+\xef\x8b\xda,ka\x96\xb5~(l\x8d\x01\x0dii\
+^*\xdb\xa3\x01\x99Z\xdd\xb73\xa20\xf8\x90|\xa3\
+<\x84\xa9\x1c\x08\xd3\xec\xcf8\xcd\xea\x90&\xad\xcb\x90\
+'o\xf2\x14\xa5\xd2L\xa2\xda,Oa\x16\xa88\xe4\
+\xc9\xd5Y\xa0\xcc\x19(2`\xd2Z1\x19V\xd1|\
+|\x9d\xcb\xc5!+Y<\xd4Glf\x1e\xc2\x22\xd9\
+\xba'-\x02\xc1}q9\x92\x97p(0\xf1@b\
+\xe4\xc0 2q/2\xfeHf\xf2\x81\xcc\xd4\x9f)\
+3a/4\xa5\xc8\xe2 \x19\xf2C\xd0Yh\x84\x8c\
+0t\xbc(?1j\xf1tt\xbe\xf8\xa7O\xf1\xc9\
+\x88g\xf5+\xf1<\x18\xe0\xe3\xc4\xb3.\x22\x9e,q\
+\x92\x19\x0e2\xadYb\xf9\x18\x11\x15\x9a\x05\x19 \x12\
+\xbdy\x87\xb3\xa3^\x0f\xfc\xf4v\xe0\xa6\x87\xbd\x97\xfe\
+\x9f0\x94\xf6h\xdcl\xef~[\xdcLb\x13q\xbf\
+5\x15\x1dF\xa4\xf1\x1am\x94v\xcb(\x87\x8ep[\
+\xd4L\x02\xd8\xea\xe0aFs{\x9f\xafg\x8a\xad\xce\
+d+\x13i\xd2E\x8d\xeb\xfdb\xf1\xb5\xa7\x93\xda\xbc\
+J\xed\xc1\x00\x1f\x95\xda\xe6\x17H\xed\x1b|\x96D\x00\
+i\x13e\xdeZ\xafF.\x12\x9a\xbbD\xbd\x8fd\xe4\
+\xe1\x17\xca\x18\x8a\x0d\x10\x87\xac8\x02\xd0\x13\x08\xa5E\
+5%\x1a\x822\x91Ua\xb5\xb3k\x97\xec\x02\xd9\x11\
+b\xf5\xfa\x06At92.\xb4\xe1]\xe0\xd0\xb4\x16\
+\xcc\x1c\xc9\x1f\x93\xe3\x81\x18x~\xea7\xe2=xO\
+\x12\x82$\x05P`&z\x0e!\x5c\xa4@_\xf1-\
+\x9b\x97\x14%\xe4rb-\xfc%;C\xf8\x92\xb0\x0f\
+&\x10\xb2%\x19\xd6\xa3\xf6\x16\xc7K\x07\xaa\xf7\xd4\x0b\
+j[\x8d<I\xe2\x06\xd7#\xd0+\x93_:\x16\xae\
+\x18m\xeaXM\xc8\x98\xc8s4s\xe7\xe5\xe2\xc9\xae\
+Ms\xf0u\x1f{\xb5P\xad\xe6pDj\xfb\xd8\x14\
+ \xfeX\x88\xed\x8c\xb8\xee\x1c\xd6\xcd\xc8b3r\x17\
+\xf5hD\xb7\x08_Ub^\x1d\xabjS\x9bp\xbe\
+\xc3\xd3\x89W_\xc5\xeb`\x80\x8f\x8bW^&^B\
+\x95<K\x19\x81f\xa1\x80#\xf1\x8a\x0f\xc4k/_\
+q/_\x08\xd0\xa1\x84\xf9\x03\x11K\x1d\x95n\x22V\
+\xfa,c\xd0<\x8b\xc6\xc7\x11\x8d\x1f\xb4\x0fWSH\
+'\xec\xe3\xc4\x93\xb7sx\xfd.\xbaN4>@H\
+\x89\xc6\xe3\xbe\x04\xf3\xd6|1\x1fs\xda\x87\xef\xf7\xd1\
+\xfb\x03 \x87C \xb7\x01d\xff\xf4H\x96MZ\x91\
+|\x7f\x80\x8f#y\xc9\xc6\xa8\x90\x9c\xe4\x10%W\xcc\
+aq\x84\xce\xe4\xbd\x08I}S\x9by\xd9O\x85\xec\
+\x0fl\x02\x1dGm\x8e\xe2\xe2\xa2a\xd5\x1c\xde$r\
+\x07\xf9\xe13\xd9\x98\x5c\xc6f\xc3\x89\x22(O\x87\xf9\
+5\x96~8\xc0G1\xdf\x97\xc4\xd2\x7f\x15r\xb4G\
+w\xda\xa3;<\x08\x96\x1c\xa1\x9b\xb8=\x8e4\xb1g\
+\xbf\x07\xf4\xc9\xa2\x18Wwr\xdff\xc1\x7f2\x98\xf7\
+\xd5s?\x1c\xe0\xe30_\xe2\xb9CR*\xf1Yv\
+:\x08\xe0\xe6\xc9\x97\x22?T\x98\x88\xec\xe6\xcc\x1bD\
+\x8d\xe8/a\xdf\xe4\x09\x1a:\xcf\xe6Op\x05\xaf=\
+\xa5\xcanAe\x8b\xfenCw\xfb~G7\x90\xce\
+T\xc2\xec\xe0z\xdb\xe1m\xd5\xf6\xedu\x89<\xdd\xed\
+\x0bo\xe7\x8da\x91\x97.\xb6,\xaf4K\x0dW\xb6\
+r2\x01\xe88\x99/\x1b#\x1b\x10A\xf8ND^\
+-qA\x82&\x15\xdd\x08k\x12\x92.D\xa6\xfbd\
+~2\xfe\xeb\xdeQ&^\x89\xa7\x9f}\xe4.^~\
+\xbe\x86:\x8d\xc4\x95y\xfb\x9b\x98U\xdaX\x14v\x22\
+\xae\xc5\xbf\xbd$o\xec\xb1o\xf7\x9b\xecco~\xbb\
+\xdf\x9cg\xdb\xc6\x9cl\xaf\x01\x10;\xb3\xcd\xb3\x90\xf4\
+P\xb6\xa9\xbf\x9dw\xf5\x83eV\x10d\xf0\x9a\xbc]\
+\x99\xe7\x85\x99\x1eI\x02\xdb}\x96\x00\x81\x8cN<\x84\
+=\xb1n\xdbI\xae\x93n\xe4\x99Y6\xe5\xee\xd2\x0f\
+\xb6\xfbh\x07~R\xae\xb1Z45X\xd0\x9d}\x9c\
+l\xfb)=\xc3\x0c\xe7\x84\x87\x11I\xf9\xd3\x83\xe5\x7f\
+:\x81^\x9d\xfa\xc3\x01>&\xd0r.\x97\x09\xb4\xd4\
+\xf3.F\xb6\x01\x05\x86N\x92\xc3Ob\xeb$\xc1\xcc\
+\xe4n{\x8f\xdd\xfd\xe2\xfbAWc\xd7Y\xf25\x8c\
+\xd7QV\xd2Q\x04\xfa(\xe5\xe8\xe9`\xba:\xc7\x87\
+\x03|\x1c\xa6\x0b\x9d\xe3\xd0\xd8\x14\x8a\x9bT\x03\xd9'\
+\xc70}$:\x22\xd5EV\xa6#IV:.\x16\
+o(\xfdi\xbb,{\x08\xca\xa0\xdc\xc7`=3\x10\
+J\x91\xaf <\x18\xe0\xe3 \x5c\xea\xd7\x8a\xe9\x92\xa5\
+\xeb]\xb4\x98\xf7\x03\xfem\x1b\x97\xdby\xe7\x12\x84\x09\
+Y2\xdfl\xb6Y\xa81\xee\xc2\x88\xdd\xb3K\x0f\xa5\
+\x9f7?\xb7w\xbb\x9f\xd8\xfay\x9f1\x87\x11\xf3\x0c\
+\xb8\xb4\xe4n\x18\xa6\xc6\xce\xeav\xdeZ\x05\xfdd\x14\
+F3\xed\x06P\xb9\x06\x1b\xc0\xce\xbe\x08\xaf\x83\xec\xb7\
+HZ\xc6E\xbe:\x88\xc9\x8fgd\x077\x95\xf1w\
+\x1f\x1b\xd3\xce[\xe6\x07\xbb\xa7a\xdc\xacE6\xe2F\
+\x86J&Uq\x9a\xe3\xaf[\x0b\xc0>\x1d\xb6W\xff\
+\xf5p\x80\x8fb\xdb/\xf4_\x1f!\xf6\xc7\xf6\xf68\
+;\xe6a2\xedan\xec\xb6z\xf6\xf0\xd8\xe4\xd3\x14\
+6\xffd\xd4Q\x00^!s0\xc0\xc7!\xb3l\x17\
+\xf7\xd1]\xda\x07%\x11\x87\x15\x13\xdbj\x10\xa2\x08\xa2\
+\xb1\x0b\xda?\x90pxt\x8f\xa7\x03\xcd\xeao\x1c\x0e\
+\xf0Q\xd0\x84\x85\xfeF*mg\xee\xaeE\xbbF\xa6\
+z\x9f7\xb8\xf5w'e\xa5\xbaa\x04\x85\x97L$\
+j\xbbO\xe5\xde\xde\xe5r\x93\xe4\xc2\xb6\xb5<S\xb4\
+\x8b\xacQ\xb7M\xf0]\x89#\xd6F\x9ca\xbb\x0f4\
+<\xa8a\xc8\x18LRPeC\xcd\x1a\xcb\x8a\x9bW\
+\x9c\xa6}B\xe0]>\xa0%O\xe7Q\x89\x22]V\
+\xc6\xce\x0c\xb9\x92[K\x964\x1fg\xe4\xdf\x91P6\
+r%\xb7\x96,\xf9tx]\x1d\x8f\xc3\x01>\x8e\xd7\
+%\x8e\xc7\xe3\xa9*_\xf2\x8e'\x11N|\x8dX>\
+`))\xcaS\x01\x84d\x1c\x1f\x97\x08\xfd\xe9\x03\x95\
+D_\x1e\x17\x1b\x1d\xd7\x22\x1d=\xc7\x93\x01+\xac\xce\
+\xc4\xe1\x00\x1f\x07\xd6Bg\x22\x92{\xd9\xcb(\x93\xc9\
+id\xcd\xfd\x94\xa2\x91\xbdZ\xab\xb3ZsV}\xf6\
+\x04\x89\xe5\x9fR\x19\xf3t\xc0]=\x85\xc3\x01>\x0a\
+\xdc\xb8\xd0SH\xc1\x09,\xf2\x82\x87oz\x9cr|\
+\x08\xcac\x87s\xfepF\xce\x93\xa1!\xaeN\xc0\xe1\
+\x00\x1fG\xc3\xb2\x0d\xa1&-\x85\x22hm\xae\xa0d\
+\x8f2\xb3\x09\x887I\xd6{\xd1+\x91\xbdT\xe4\x10\
+\x8c\xfa\xdd\xbb\xf2\xdd}\x01\xa5\xf9\x88\xcdJ\x0fO\x98\
+\xcd\xf8t`[\x9d\x87\xc3\x01>\x0a\xb6\xb4\xd4y\x90\
+\x9f\xd8(gHr\x08K\xec\xb6\x95v\xaa\xed\xbf}\
+i\xec\xa8\xe3\x22\x88!\x96\xa6\x1b\x90h\xb8\x8d\xb9\xef\
+|\x8d\x84\x955\xedXJJ\x91cx\xf8\x8cO\x07\
+\xbb\xd5\x078\x1c\xe0\xe3\xb0[\xb8\xf9\x10{\x18\xc1\xae\
+\xec\xadD\xfe\xc5\xcf\x88\xbb\x1eZ\xc5\x13\xd6\xe5<\x19\
+\xde\xd2\xea\x1a\x1c\x0e\xf0q\xbc-t\x0d|\x8f\xe4N\
+X\x05\xb7\x83\xb2\xff\x02\xd5\xdbw\x10\xec3\x06\xfd\xcf\
+\xaa\xe6}:t\xad\xfc\xfdp\x80\x8f\xa2+/\xe4\xef\
+\xb9\x04\xab$\x8d\x84\x14\x1e&\x89\xc9\x97\xb3\x9af\x8c\
+\x9e\xf3\x964F\x96\x17\xcc\xac\x8c\xce\x06t\x07\xd9\x8e\
+\xf6 D2H\x98\xa4\xee\x97:\x999\xbf\x04\xa55\
+^\xb2u5r\xe4\xc5\x11\xf5\x8b`i\xf8\xc5[1\
+I\xb7\x0d]\xd2_\xc8~\xb6\xfa\xc8Q\x1e\xf9d(\
+\xcb\xab_p8\xc0\xc7Q\xb68Q\x8cb\x08h\x10\
+\xfd\xd5D\xcd\x8e{\xa5|\xb8\xd5J\xfdh\xaf\x95\xed\
+\xfe\x02\xef\xfb\x94\x8c\xfc\xa5\xb6,}\xe9\xe90\xb5\xd2\
+\xff\xc3\x01>\x8a\xa9\xb2\x8c\xfe\x7fR\x19\xe0\x1d\x9b?\
+\xc6O:\x82\xcf\x11z6\x87\xbd~\x06|\x9f\x0eK\
++\xa7?\x1c\xe0\xe3XZ\x9aP\x94F\x0d\x8bL\x97\
+\xef\xd9\x12\xb6\x7fB\x17\x9e\xff\x0fZ\x94\x5c\x1d\xc5\xea\
+\xdc\xd3m:\x94\xd5\xb38\x1c\xe0\xe3\xa8_\x9a\xc1T\
+\xc4\xe6\x08\x9f\x89\x03\xc6\x9a\xe6Fa\xffY\xfa\xb9<\
+\xd8\x89}:D\xae\xde\xc8\xe1\x00\x1fE\xe4\xa2\x1eT\
+w\xbb\x09\xc5v\x13\x92\xdbg\x0f[\x07\x1bKK\xbb\
+{\xd1\xfd\xfb\x17>~0\xa6\xc2\xd7\x22\x0c\xb3\x8ed\
+\xe30\x97\xa7\xb7\xb1\x0dA\x1e\xf2\xe8\x93\xd2\xf7\xfdU\
+\xf0|\xa8\xf32o9x\xd4\xfb4\x97\x0boG\xbd\
+\xf0\x93Al\xed6q4\xc0\xc7!\xb6p\x8b\xa2\xb0\
+SO\x17\x03\x1a\x91\x942\xed\x1b\x1e\x1e\xf6;\x5c\xd0\
+\xa6\xb4\x7f &\xfcb\x94\x89\x94\xf7u\x22\xd4;\xdd\
+\xab\x14)s\xa9\xc8\xd3\x01i\xf5?\x0e\x07\xf8(\x90\
+\x165@\xf8\xf3\xd4{$\x11\x1c\x97V\xe4N\xfa\xe8\
+\x93\x1a\xde>\xdc\xfc\x02H\xc1p$KxWpd\
+\xc5D\xb4\xfc\x98\x7f\xf8t8Z}\x8f\xc3\x01>\x8e\
+\xa3\x85\xbeG\xa1\x86\xcb\x1av\xd3\xa0\xed\x03\x118J\
+E\x9b\x19:\xc1\x88m\xf6h}\xa9\xb2\xe8\x935\xa2\
+\x1a\x95e5\xfe\xc2\xed\xcf\x9e\x0cZk\xe9\xfd\xd1\x00\
+\x1f\x87\xd6\xd2\xac\x22+\x86\x97/\xd9\xe9\xbde\x19A\
+\xd6\xd6\x8c\x8c\xfef\xcd8\xa1Rx\xa6\x96\xbb\xb1\x1d\
+p\xb2\x0d\xd3z/\xa5\xe8^\xaa$\xff\xc8\xa3\xf7t\
+\x08\x13\x89\xb8.\x8f\x82\x846\xcd\xe0\xd9\x8eF`\xd6\
+k\xad\xdc\xf55$4\x5c\xeb(z\xb4\x06j\xd6Z\
+lk\xbd\xc5\x9e\x0ei+q?\x1c\xe0\xa3H[Z\
+\xf0\x1e\x5c\xa1,u\x13\x0b{O\x1fPb\xd6\x94\x8e\
+\xf0\x1bM\xe9F\x07\xc7\xad\xf5\xa4\xcb\xd3\xe8IG\xac\
+\xc1zcmG\xbf\x11\xd9\xbf0w\x82\x8fRU\xf2\
+P=>\xe0\xdc\xa5on\xd27\x14Y\x1f\x8a\xcc[\
+\xbe\x9b~%\x875u6\xab\xe6\xfe\x7fs\xfb\xbf'\
+\x83\xd9Zp~4\xc0\xc7a\xb6p\x1fA\xd4H\x98\
+A\xab\xd0d\xc6\x1cD\x82\x04\x16\xa8\x8b\xcd\xba\x1d\xb2\
+k@\x12\xee]\xb3\xc3\xb9\xd7\xe1\x07\xf2\xbe\x7f\xf1\x16\
+\xadO\x87\xb0\x95\xd5\x1f\x0e\xf01\x84\xc5\xa5\x15\xd0\xbe\
+\xca\xe1\x97\xcf\x16Ha5\x8fn\xb9\xe6\xfa\x09-C\
+\x8f*\x98\x9f\x0e8+\x8d?\x1c\xe0\xe3\xc0Y\x9a\x16\
+\xf4\x89\x5ck_M|\xd7\x8fey\x1f\xd7\xa7BO\
+\x5c\x8b\x89\x8f\x06\xf88z\x162\xf5\x5c9wBZ\
+\x87\x88{\xf8)N\x1f\xe6\xcf\xd2\xbd\xb0\x7f\xc3\xfcm\
+\x87\xfd\x9b[co\xef\xec\xdf\xaf\xa1q\xe2Z\xa4{\
+4\xc0G1\xb3\xb4H\xb74?w\xdf\x08\xd1\xda\xcc\
+\x8c\xed\x1b\x07w\x0ec\xb3\x90\x5c\x1dJ\x93\xa6\xed\xe8\
+\x11?Z\xc4/\xa7L\x07\x1d\xd0\xac\xec\xce\xf6_j\
+x\xb2\xe8@\x5c+v\x8f\x06\xf88~\x16\x93\xe9#\
+\xfcl\xe7\x15\xb6\x05~\xd0\xf0\x8e\xbcy\x1f\xadA\x80\
+5\x19O\xde\x0e\x81\xa0\xef\xf18Y\x80\x83\x05\x9e\x0e\
+\x16\x8b\x19\xf0|\x14\xdfG\x96\xeb\x91C\x01\xdfO\xfb\
+#\xb8z\xb0\x92\xc7\x07\x04\xde\x5c\x7f\xfb\xf6\xe5'\xc2\
+n9\xb4\xf6'\x0f\x86]\xfe \xf0\x8e\x0f\x19\xbc\xbb\
+\xfc'boa\xe1\xef\xa7$\xef|:\xc4>\x0e\xaa\
+\xc5\xecx\x05\xd5\x83OO\x08\xaae\x14\x5c\xe4\xda\xba\
+)\x0bTyWr\xfei''\x9e\x10V\xcb\xcbf\
+WX=\xf8\xf4t\xb0ZX\xe2\xf8)gy\x9e\x10\
+T\xcb\x8b\x18WP=\xf8\xf4\x84\xa0ZF\xbe\xbc\xf3\
+4w\xdc\xd0\xf6$\xcf\xed\xbd\x7f\xb1\xd3&N\x89\xba\
+\x95v\x9d#\xea\x16\x95L>vH\xf1)a\xb3\x12\
+\xab\xb3\x84\xcdBb\xf5\x09\x99-'\x04\xd5\xf2\x92\xc3\
+\x15T\x0f>=!\xa8\x96\x85<?\xa5W\xc0)A\
+\xb58\x5c\xb9\x82\xea\xc1\xa7\xa7\x03\xd5\xc2rF\xef\x5c\
+\x83\x15\xd1e3\xa7\x9e\x0fN\xdd:!j\x96W\x0e\
+\xae\xa8y\xf0\xe9\x09Q\xb3\x94\x8c;\x198og)\
+\xa4\xb1\xf7\xb6\xf4t\xb6Sbj\xa5\xda\xe7\x88\xa9\x85\
+\xe5\x89\x0f\xd2\x83\x17\xb0\xa6\xf2\x14\xaciy\x11\xe1\x0a\
+\xab\x07\x9f\x9e\x10V\xcb:\x106\x9f\xe6\x83\x1fj\xa5\
+\xa1\x8d\x1d\x88j\xb4\x89\x03\x86\xcb)\x99\xd1\xf2:\xbc\
+\x158\x0f>=!p\x16\xd2\xedc\xe0\xbc\x98B\xe1\
+\xe8!\xeb\xe5\x10z\x9f2\xa7&Z\xca[\xecu\xaa\
+e|\x9d\xae\xbc\xbf@e\xdd\xc7Q\xb5\xf2\xedsD\
+\xd5\xc2\x82\xbd\xd6\xbdu\xcb\x95\x1bWv\xd9\xb6\x5c\xe8\
+\xacu\xd8V+\x8d\xa6Zm\x9a\xbb\xb5\xcd-\xb5N\
+\x08\xaa\xe5\xd5s+\xa8\x1e|zBP\xfd2\xad\xc4\
+O\x09\x9c\x95s\x9f#p\x16\x96\xe4=rr\xf8)\
+q\xb3\x92\xea\xb3\xc4\xcd2nt\xdc\xd6\xfb~\x0f\xdb\
+S\xe6\x05,/GZQ\xf3\xe0\xd3\xd3\xa1fQ\xcd\
+\xd3\xc3f\xf0_>h\xd3~\xd4\xc5\xfdA\xa3\xf7\x13\
+Bky\x09\xd2\x0a\xad\x07\x9f\x9e\x10Z\x0b\x19\xd0'\
+\x9f+pJh\xad\x1c\xe9\x0c\xa1\x95\x16\x158\xfd\xf9\
+\xe1\x01\x14_Z\xb7\xc5\xe4\xd2&\x15\x12\x99h\xec\xe3\
+\x8b&\x82\xa3}u?rP2\x0dl\x83\xd4\x96\xa7\
+\x8a\xf7\x94\xd8Zy\xd4Ybki\x0d\x94\xa3\x9b\x93\
+\xdf\xd0\xaf\xdd\xb5vp\x02\xde\xe9P\x93\x96\x97%\xad\
+\xa8y\xf0\xe9\x09Q\xb3\x84}\x1f'%=8\x07\xec\
+\x94\xb8Y\xf9\xf79\xe2\xe6g\x9e8\xf7\xe0\xbc\xb8\x13\
+\x22g\xad>9K\xe4,=v\xce\xc3\xab\x035\xfc\
+u\xe7\xe8\xb8\xff\x13{\xa8\x9f\x12Y+\x03:Kd\
+-m$\x8b\x7f&\xbf\x8c\xc3\x04]b\xd7\x9f|\xb6\
+l;$RJ\xa9\xe5\x89\x03\xa4)\xe6\x8d\xec\xb7\x89\
+^s\xe4t\xa71+\x95u\xed\x94Zk\xadC9\
+Ol\xfd\xdc\x83 f\xad\x95g\xadU>\xa8\xb5\xd2\
+\xac\xb4N\x18\xfeN\xcb\x8fW[\x81\xf5\xe0\xd3\xd3\x01\
+k\xe9\x19n\x9f\xd4\xfd\xfa\x84\xb0ZK\x9c\xce\x12V\
+K\xcf\xe7\xd2\x05\xec\xe4\xde(\x14y7\xa3*[\xc7\
+h\x97}\x9a8BD\xa0*%\xe5i\xb4\x1b\xdfw\
+\x1b\xf7v\xfa\x87&\xa78\xe0\x16dP#\xa7\x0c\xa6\
+i41\x1f=\xcc\x03\x1e#\xedT\x9c\x97\xea\x93\x8e\
+\xab\x1b;\x0ai\x1am\xd1GW\xf4S\xc2s\xa5j\
+g\x09\xcf\xc5T\xadr\x06*]\xa0\x83k\x86\xcef\
+\x1dW\x0a\x18\xa2\x9b\x8f\x9d\xb1U[h\xd3h\xc9\xbf\
+\x1d=\xf9O\x08\xa9\xb5\xa4\xe5<!\xb5\xb4\xdf\xe6'\
+\x1e\x0dwJd\xad\x14\xed\x1c\x91\xb5\xf4\x98\xae\x1f?\
+f\xf7\x84\xb8Y+[\xce\x137\x0b{\xfc\xe4\xe8v\
+\xce\xa7M\xe8t\xc2\x08?\xe9<\xb7S\xa2j\x8d\x9f\
+\x9e#\xaa\x16\xd6\xb6\xfc\xecc:N\x89\xa8\x95\x8c\x9f\
+%\xa2\x16\x92\xf1Z\x13e\xbfh\x1e\xcf\xe9\x91^\x8c\
+(\xe6\xbcIqW\xeb)\xe3\xedkU\xcby\xe2f\
+\xd9\xde\xb1\x1daE\x03\xfa\xc2\xe1i\xbe\x91\xcd\x92]\
+\xday\x17\xf7=\xa2i\x94\x92e\xf3h\xdb\xeb\x0b\x1f\
+\xf5i[\x5c\x13\xbcx\xa7\xb6\x9d?e\x9f\x9e\xb4\x16\
+\xb8\x9c%\xc0\x96\x9eH\x159|\xbb[e\xa6\x90f\
+m}i\xf9\xdd\xac\xe5w\xa2\x99f\x8c\xa3q]\xda\
+\xb9:\x8e\x8d$(\xe5\xfa)\xb5\xd6Z\xe0r\x9e\xa0\
+Z\xc8\xca\x1f\x82J\xc4\x9b\xb3j9\xc9.\xcb\xfc\xd5\
+\xbe\xabE\xd6\xafsDU\xa0q]\x10g\xf7\x8e\xb3\
+\x10\xd2/q\x0c\xd9\xc7\x91\xb52\xf3sD\xd6\xa2\x0a\
+\x98Ok_\x7fJP\xad\xe4\xfc,A\xf5\x14\xad\xed\
+O\x08\xab\xe5\x07G\xad\xb0z\xf0\xe9\x09a\xb50Z\
+\xfe\xf3\x0fs9%\xa6V\xba~\x8e\x98Zz\x0e\xd5\
+\xcf>G\xe1\x84\x90Zk\xb1\xce\x11Ry\xe9\x89@\
+)\x8b\xac\xbb\xb0\xf1\x81\x96O\xe5\xe9\xb6^\xd6b\x98\
+\xf3\xc4\xcd\xd2s=\x1b\x8dV\xa4\x8b:\xc7\x94\x87\xe1\
+\xe4\xd5V7\x01\x16\x15'\xce\x1fvb\xea]\xdc\xa9\
+\x8b\x8b'Y\xbbH\xab\xdf\x9eN\x18(\xcfk\xb1\xcc\
+y\xa2j\xe9AA\x85d\xbc\xb0\x89T\x1f\xdb\x99/\
+\xa1\xedz\xb7\xa3\x12j\x0b\x13m\xa0\x1a'rv\x8e\
+}\xa9\xc12\xa9d\x16w9\x9d0\x034\xaf\xa54\
+g\x89\xaa\xa5G\x09%\xc1&8i\x9f\xd8d\xe3\xc6\
+\xf1\xd3\xb1X\xa4\xa0xL^\xe6\x85\x97\x7f\xd7*\x06\
+\x90\x1d=_\xe5\x03\x9e\xd0\xfe\xe5\xe5'\xff\xac\x98z\
+\xf0\xe9\x091\xb50\xc8\x99h!fG\xfe6Z\x89\
+\x05\x0b\x9d\xd3[\x8c\x04\xd0\xee\x1b\xfd\x10k+\x1c=\
+\x9dG?\xc4\x967E\xb0+'\x0cE\xe5\xb5r\xeb\
+,A\xb5\xb4r+\xb5(R\x05\xa8hZ\x97\xebh\
+\xabYB$\xf6TS%h\xe0:\xc9\xbf\xd1\x97`\
+\xa7\x07\xd7b5\xc8)\xc4j}]-\xa93s&\
+\xbam\xe0\xd8\xd1\xad\x99#\x14`^v\xbcYi\xa7\
+\xdc\xbc\xc9k\x89\xd7yBp\xe1\x96s\xa6Yp\x8c\
+\x96\xe4\x99\x5c+\xb6\xe7\x1c\xcb\xaeZ\xf7DN\x07f\
+\x1f0\xc3\xfe\xedDa\xba\xe6\x17/\xfd\x96(\xaa\xe0\
+\x9dRw\xfe\xa4ll\xad\xc79K\x84-\xad\xc7i\
+\xd1\xed<u^\xb6\xd3\x1c&\xdf\xac&\x9e\xed\xc0z\
+R\xdc\xac\x057\xe7\x89\x9be\x05\xf1\x0f\x92\xa8\xb6b\
+\xf5\xdd\x93\xec\x99JbC\xf9\x94\xd0Yy\xd59B\
+gQ1\xcc\x9f\x1f\xaa\x1ca\x89\xa0'e\xc9\xd5\xed\
+j<aC\xa9\xbc\x16\xbd\x9c't\x96F\xa4\x8e\x94\
+\xcc\xdd\xf9x\xe9\xf0\x80\xbc~tD^=\xf9\x19y\
+y-z9Kd-=\xcc\xa5\xef\xb2\x95\xb3\x93\xe4\
+I\xaa\xdd\x07\xcf\xf3\xecG\x07z\x96'8\xd13\xaf\
+U1\xe7\x09\xac\x85\xe7\xbd\xc4$\xc0P\xcf\xe9\xc3.\
+\xfa\xf9\xf0Eo\xa7/&;|1\xdf;}q>\
+~\xb1\xd8\xe9\x8b.\x8f\xe3\x17\xef\x9f\xbeh\x89\x0a\xd2\
+v\xe3\xf4\xc5S\xa2n\xe5X\xe7\x88\xba\x85U3\xde\
+\xf6\xfd\x8a8V\xcb\xbbH0\x8a\xb3\xa9\xc28\x9c\xea\
+\x94\xa8Y\xc3Mg\x89\x9ae\xdb\xc8\xf4\xe2\xb4\xc6T\
+A\xa3\xf5\xbd\xef\x0f\xa7J\xe3p\xaaq6U\xb2\xb3\
+\xa9\xe28\x9a\xaa\xd9\xd1T\xa7\x0c`\xae53\xe7\x89\
+\xa8\xa5\xdd\xcee\xb5\x0az\x88\x13\x18{\xdd\x9fL\x95\
+\x17\x9c\xe7y\xc2\xde\x07y-\x949KT-*\x94\
+!\xf8d\xb5\x9f\xc0\x06\xa4\x90\x15\x9c[\x90V\x22\xbf\
+\xb3ti\xa4S\xf2\xf1\xb5\x1e\xe6<\xb1\xb3p\xab\xb8\
+`\xdb\x82\x1dE\x15w>\x91B\x9e\x84\xa1\xb4)\xbb\
+\x1aN\xd8a*\xaf\xd5.g\x89\x9b\xa5\xd5.\x0ft\
+\xce\xfeP\xb3\xa3S\xcd,]\xe5\xde\xb9f>\xe6\x93\
+\x9fl\x96\xd7\xa2\x97\xf3\xc4\xd62\xde-\x98H\x11Q\
+\xe5\xe9;M\x15\xe7\x93\xcdRo\x87\x87\x9bE\x92V\
+8\xde\xac\x8f\xe3\xcd\x8a{\x82\x03\xce\xf2Z\xf9r\x9e\
+\xd8Z\x182?\xde\x5c\xf9h\xc8\xfc\xc9#\xe6k\xf9\
+\xcbY\x02ka\xf9\x0b\x870\x9a#G\x88\xa9\x95r\
+\xe7\xda\xb5\x1f\xf3\xed\xca\x138wk\x0d\xccy\xe2j\
+i.\xa7\x1c9\x0d\x91\xb4;/\xfddu\xc5\x81f\
+\x9e>lhp\xed*\xa9\xe6%\x17)\xb5\x22\xc6%\
+\xe8\xb5H\xbf\xebH\xddL\xde%\x7f\xca\x0d\xe4\xf5D\
+\xa2s\x04WYZ`\x15\x9c8\xbb/\x9bX Z\
+`\xab\xed\xe8\xbd)e\xe6;\xd9O2\x96\xdd\xb2\xcf\
+s\x96\xd2\x0am\xd7L\xa1\xd1\xc1\xcc\x9f\x92e\xad\x05\
+X\xe7\x89\xab\x859-\x9ct\x1d\x84\x14\xea\xf6b\x08\
+\xe4i\xd2A\xc3\xb22\xad\xdca\x1c\x1a\xb2\xcb5\xf5\
+M\xee\xbb\x9e\xe4A\x86(B\xc6\x16sI\xf4T\xa7\
+;\xbf\x8bM\x17)DM3\xfee\xe8\xbaB\x14%\
+kr\x02\xb6\xa9\xef\x92\xfcK\x8dE\xe8=!\x1a\xcb\
+Z\xb8u\x9eh\x5c\xc8\xf9\x0fqb\xc5\x10n\x174\
+\xf6M\x14\xb7'5\xddS\x0a\xc1\xd6r\xc4\xb4&\xbd\
+\xca\xa7l\x99W\xd6\x9a\xad\xb3\x04\xd4\xe2\x9a\xad\xaeQ\
+\xfa\x8d\xb7\xb4\x83fI\x0c)J\xb5\x15\xe1&\x85D\
+\x83k\xab\xaf\xd9z:T9*\x1c\xa4\xc3R\xc2\x94\
+6\x02g\x94\xe0\xd0\x88\xa8X\x8a\x8d\xc0&\x1d\xb9\xed\
+\xb2\xb6u\x5c\xc5\x07\x12\x01}\xe20J\xa8\x9f\x14`\
+>eaDY\x0b\xbe\xce\x13\x90\x0b\x9d\x84*\x1e\x97\
+\xad\xc0\xc1W\x19\xd3\xf8^\xc7\x99\x8ak\x9c`\xb2\xeb\
+\x816\xff\xa9G\xeb}\x0d\x913\x1ewRX\xad\xee\
+\xc19\xc2ji\xc9W\x11\x86j\x81\x81\x15\x1c\x01Z\
+\x18{\xb3\x8f[aK*\x8b\xf3\xdf\xd8e\x94\xd1\xac\
+}\x9am\xe7\x16\xe3y\xc2\x9d\xa3\xb2\x16q\x9d'\xa8\
+\x166g\xa0OL\xa5/v\xa1(\xcbRK\x03\xf5\
+\xa7T5\xb7\xd0\x89\xa45y\x01\xdbZ8 \xce\xce\
+\xa8$\x09\xc7S\x82\xe3OXGQ\xd63\xba\xce\x13\
+WKO\x80\x10`\x92p\xb5\xedU\x9c+\xc6\xe3\xd6\
+\x8e\xfd\xb0\xb5c\x19\xad\x1d\xf3\xbe\xb5\xe3I\xf9\xfeZ\
+\x15x\x96\xd0ZZ\x15\xf8\x01h\x8dV\xb4i\xb4\xa2\
+\x0d\xf5\xa0\x17m\xe9\x87\xddhO\x89\xac\xb5n\xf0<\
+\x91\xb54\xbao\xddBA\x16\x08\x1b\x8d\xf8\x02G\xbd\
+\xb7\x8d\xec\x1e\xc1\xfcmDk\xd5M\x00X\x85Zy\
+k\x9a\xb6\xe1\x0c\xf9\xd4N\x18\xdb/k]\xe1YB\
+k\xe9\x19p-\xc2\xaf\x04\xad\xeav\xa5d\x0e\xae\xe9\
+\xc5\x88T\xd9\x05_NX\xcc\x5c\xd6\xe3\xd9\xce\x139\
+K\x9b\xceV\x92\xff\x9a\xc5\x9d\xea\xbe}\x8c\xdf\x05;\
+\xe0[ \x22z\x15\xc28:7\x10\xa1\xea\x168\xcd\
+=m\x1c?<%I_+V\xcf\x13ZKC\xf1\
+\xae\xefb\x18!MG%\x0e\xf6N\xa6/\xa4M\xdb\
+u\x9f\x82\xc5E\xf5\xadMl;\x97H\x9b N\x9a\
+\xfd\x86M\x9f\x5cOi\xef\xd6\x92\xd5\xb3\x84\xd6\xd2s\
+\xda>\xa0\xb5\xe8\xfaX\xbc\xf9\x7f\xad\xe5\xa9R\xfc\x95\
+\xc8\x92\x90*\x8cdvu1vOzj=e\xce\
+`YkV\xcf\x13YK\xa3\xeb\xe2\xde\xc1\xe7\x8do\
+$m\x85\xb1\xdfC\xce|\x89\xa3\xf6+\xd0\xea\x98\xe8\
+;\xad\x1c*\x05\x18E\xec\xdc\xdb!7l\x09\xd1D\
+;\x85\x11\xa1OB[\xe9\xfa\x8a\x18\x7f\x80\xf9\x17k\
+\xf1^\xd9\xee\x09\xf8\x8e\xd6\xb5\xcd\x85S\xf6E.k\
+9\xebY\x02r\xe9!p=\x0ax4u\x884N\
+\xcb\xf4}\xd8\xd6\xb8k.\xe2&\xb6^#\xdb?y\
+Wc\xdc\xf8P\xf5\x01\x85\x1d\x95\xe2D}#tY\
+R\x97\xa78\x8e\x1e\xf7.\xd8\xd1q\xd6\x0a>\x8f\xf4\
+\x8b\xdc\xea\xe4{6\x87\xc1\xcb\x01-\xed\x84\x19\x8ae\
+-\x93=O4.t\x17\x1a\x9c.\x96M$\x04\xd6\
+\xc9\xa8\xce~\x97\xb1\xc4\x9ec\x9e\xc3\xd4\x92\x0c\xae^\
+\xca\xe0\xfa\xda\xe8\xbe<*\x8e\xa4\x0a\xfb)O\x98+\
+k\xb5\xecy\x02k\xa1\xb3\xe0;\xc9\xafq\x13\xe5!\
+\x8cj\xd9\xfbv7=\xb0\xbb\xb3\xd9\x0d{\xb3{l\
+t\x0flnvv\xb4\x056\xb7\xce&\xf7\x84\xd9\xfd\
+e-\xb1=K(.=\x8bN\x9e\xa8\x8c \x9bE\
+Q\xfek\xbf3\xb8i\x18\xdc6\xdb[)\xbdao\
+\xf3ln\xd3ln\xfd\xb0\xb6i\xb6\xb6yX[|\
+\x13\xb3\xb6e\xb6\xb6\xe5\x09\xac\xedZ\xb0{\x9eH\x5c\
+\xe8\x8c\x04\x12\xc8\x02\xf1\xff\xb0kv\xcc\xd8\x81\xb5\x8d\
+\x87\xd6\xb6\x0fk\xfb\x14\xc6v-\xe8=K\x5c-,\
+\xe8m\x8d\x1c\x7f\x1aX\xb2i\x1e\xd2$\xfd\x84\xc2C\
++\x9dT\x1b\xad\xdc\xff,Q\xb3,\xd1\xbfw1\xb1\
+J\xa9n\xe5t_?uY=\x8e\xe8\xa1\xf3\xf2)\
+\xab%\xcbZ\x86{\x9e\xb8Y\xd8\xc9\x9bs\x0d}k\
+\x9b\xc466\x19\xd3nW\x9dw\xb5lR\xa4\x0b\xfc\
+)\xa3\xb1k\xa1\xedYBg\xe99s^:'\xe0\
+\xf5\xc9+t\xc2\x0fy\xa7\xd57\xabRs'\xcd\xe2\
+Z+i\xcf\x138\x0b\x99\xf3\xf1\xf9MO\x87\x9b\x95\
+\x19\x9f!n\xea\xc2\x22\xd9\x07\xbdp\xb7F\x8dq\xb1\
+NM\x8e\xd7*\xd8\xf3\x04\xce\xb2\xc0\xf8\x83\x96\x10\x03\
+7'\xf7\xa9\xeaZ\xaez\x9e\xb0Y\x9a#s\x9c\x13\
+zh\xa8N\x98\x02S\xd7\xba\xd4\xb3D\xce\xd2\xba\xd4\
+\xe3\x9d\xb8\x90\xfb\x0e;\xc5\x81H\xa7l\xca^\xd7\xf2\
+\xd1\xf3\xc4\xcdBf\xfc \x9f\xe0\x108'\xcc\xe7\xac\
+k\x85\xe8Y\x22gQ\x85\xe8\x9f\x1f\xeeFl\x83\xdb\
+\xe5\x14\xf3&Z\xa7\xf5\x13\x96\x81\xd6\xb5\x0c\xf4<\x91\
+\xb3\xb0E\xcc\xf1\x8e\xaa\xedP\xb19\xef\xf3\xae\xf6S\
+vD\xab?Z\xe8y\xfc\xbc\xf3\xb2s\xff\xcf\xfe\xe1\
+\xf2\x05\xff\xfd\x97\xfb3\xfc\x99\xa3\xad[\xcc\x87\xe6\xd5\
+\xf4j\xa8\x22l\xde\x85\xbcI\x1c{!\xeeO\x9b\xd4\
+\xc4\x81r\xdd*\xc7|\x0d\xa1N\xd4K{o]\x97\
+b\x12\xf9\x9b\xda.\xfbL\x03L\x1fvI\x8c\xafM\
+tV\xad5\xda;9\xf9\x1c\xf4\x9d\xd8[\xa7\xf6:\
+\xd3\x92\xde\xc5\xa9\xea^\xb1\x92Z\xedv59J\x87\
+\xfc\xae\xfbL\x1f\x8a\xe0\x05\xa5\xcc6\xb5\xf4z\x8c\x1c\
+\x0d\xcb>\xb3\xae\xe9\xcd\x9dMI3.\x7f\x16\xe2\xd9\
+\xac]\x00]\x81\xbbm\x1cjy\x0a=7\xb9\x93s\
+\xd1\x05\xbb\x5c\x8e-&+N*\x99\x9f\x06\xbe\xa6\x9b\
+MW\x9c\xcf\x915\xc0F\x95x\xe9\xa5\xa6\x89\x14n\
+\x91\x18(\xac\x1d\x93&N\xfb\xa1\xb7d{\x9c~\xe6\
+\x88\xffzJ\xa1b\xd5c\xbbP9\xf8C\xdf\x0eS\
+\xa9\xbb&5\xa37\xd2.\xe9\xcae*\x9e\x14\xa3\x18\
+6]\xcey\xc6vm\xe9>\x1b\x82u7\xc8L\x09\
+\xbd\xf6t+\xd77\xa1\xd0\x04\x81\xe7\xf6\xfcK\x9cZ\
+H.\x22\xe6<u$kX\xcb\x10I\x19A\x95\x91\
+<\x12lK\x9f\x8e\xc8r\xe2,Y]\xe3\xec\x1b=\
+F\x0dzd\xbeS\xaa&\xd4\xbe\xe3j\x1c\x89\x9e-\
+{\xce\x93\xe7-\x97\x0b\xc1m_\x1b\xcd\xfe\x9c\x9dP\
+\xe9\xf5\xeb\x1e8X`\x17Z\xd3\x03&\xddR\xff\x22\
+\xa0\xe0\xaa\xf02\xfd\xc7\x03\xc1\x02\x96\xde\x87\xf01\xfd\
+\xf1\xee\xc5\xc5\xd5\xe5o-\xb3\xb9\x89\xfe\xfd\xee\x10\xe1\
+?\x0a\xeaW\xf6g1\xa8)+rNn\xac`G\
+C\xa6J\xc6\xd7\x16\x84F\xda\xd4y\x1e\xc1\xc0'q\
+\x8e!\x14p\xed\xb3\xe7\x80\xd8@\x94\xdf\x8e\xb3vt\
+\x08\x0e\x03*\xa4E\xd0\x15*\xd2n\x13\xbc\x09\xfbq\
+\xa0_+\x9cx\xaf\xeeJ\x0c\xc5\xda\xa7P\xf5F2\
+\xe3\xce\xfb\xe4\xc7\xa5r-\xad\xd9/\x85O\xfcm!\
+\xaau\xda\xf9\xe8\x19R\xf5\x04o\x04%\x11\x99\xca\xd7\
+t\xad\x88Pp\xdev\x89v\xd4L\x17\xc0\x11\x93\x80\
+\x9c\x91\xbf\x0b\x06\x93\xf9\xee4\xeao\xba#'&w\
+\x138\xdd\xa6\x17\x81\xd1\xb3Q\x91\x05=\xa4 6!\
+\x96\x1c\x0f\xe3QBw.=\xf5)\x1b\x04\xec\xe0\xdb\
+\x90\x8ak\x93\x1eR\x08\xa6Y\x8cc?\x9e\xe8R\x0d\
+\x18L\xddQ\x93\x99\xa6\xae\xb7\xc9\xdb$V\xc9\xce\x88\
+F\xac\xb7\xad>B3\xd0\xc5\xcd4\x19\xb5\x83\xafJ\
+\x85\x84\x1e\xcd\xb3\x99\x929}\xc2\xd2\x9a4c\x1aH\
+n\xfa\xd7&Z\x96I\xaf49m\x12\xed\xb8\xc9\xfa\
+(\xd3N\x0b#S\x93\xdft\xe9\x0d\x91<+\x0f\xf3\
+)mH\xaa\xd2#2\x07\x12\x96\xee\xb9FH\x1c\xfa\
+\xb4\xe5\xb0\xa7V\x02\xc7\xed$\xef\x9d\xb7sTR\xa3\
+\xefn\xb3\x0c-\xd3\x16Q\x9fq\x95\xa2\xb5+\xe3T\
+`\x0a\x16\x1b\xebT\xb3\xc9\x9e\xd4]\xb0f\xbeQ\x8b\
+C5\x91V'\x17:\x92\xb0\xe6\x96\x0d\xad\x99\x93<\
+\x17\xcdKph)\xc9ps~\x96\xa1\xa1\xa1\xa4\xd0\
+\xa2M\xad\x0b\xc5\xc7\x8f\x0bM\xfa\xd5\x85F:W\x9f\
+i\x1a6\xa9W1k}i.\xaa*1\x91\xa0\x86\
+\xce2,\xd2R#K\x10\x0c\x9e9\xc42\xf7\xa4\xf2\
+@\x06,\xb4$E\xc4\xbcG\x92y\xed\xd8\x91\x10\xc3\
+\xbe\x9b\x1aZWk\xd0}\x9cEP\xf7\x1c\xc7R\xd2\
+c\xcd\xbeGZp\xc6NP\xb2U\x02\x01Mf\xdd\
+w\x89\x97u)\xd2\xa2\xe9\xaa\x06\xcamk4\x06\xf4\
+]\xf6F\x0f\x9837\x14\x028\x19U\x80\x12Ui\
+&\x81-;]'\xd8\xc3X\x8d\xa1\xde\x0a\xba\x0e\x01\
+\x8c\x16\xb4\x86Z\xb9\xa0\xab\xeaY$\xfe\x8e\xafi\x8d\
+=\x95=UjY\xd7\xd6\x0cMR\x0fz\xc4R7\
+\x9c\xce#\xb0\xa0\xff\xb52\xc2\x0e\xad\xdf\x82\xb0\x93\x04\
+\x9d\xce\xc9\xe6\x14\xc1J''\xae\x11\x90^\xea\x85\xbc\
+\x8c\x98\x9f\xec\xd6\x82R\xad<\xa0\xef\x86.\xfdZ\x12\
+\xd3\xf4<\xf2\x91\x0b\xe8\x92\xf9\xa0\xd7\x9c\x9d8=\x80\
+\xab\x91k\xc8\x12\x18i\x91b\x1ds\x9c\x14\x115m\
+\x9a\xf4\xf4#\xf8*'\xc0\xd7e\xe1\xbf\xc5\xf8\xaa\x9a\
+:\x13\x97D\x8d\x82\x8f\x1d\xa6AO [\xe9\xa2%\
+\xe7\xd8wo\x13l\x9a\xb5X\xd2Y\xe4\x00\xa4\x92\xcd\
+\xa2\xcb\xaej>e\x8a\xba\xab\xc3,K;&\xcc\xb2\
+\x0cd\x94\xe0\x09\xc3M2H!i\xe8m\xeeK\xd5\
+\xc6\x81\x5c\xc1\xf72\x00\xdar\xc5\xe4\x02\xbd\xc2Q\xcd\
+Qs\xde\x03\x85\xcb\xa1\x99J\xf0\x96-\xe0\xb23m\
+\xafke\xba}H;\x84\x10\x87\x03Q\xf4'\x1b\x8e\
+\xf5\xb4\x08E\xb4\xc3\xc0\xac\xbfQ\xa2)\x88,\xef\x15\
+\x9dQk\x8a4jv\xb0$]mt\xd4\xb2.[\
+|&;z\xfc\x8e4r\xc2-\x11\x82\xecGVp\
+\xcd\xe1PI\xe6\x82\xa5\x17J*\xdd\xc6\xa3x['\
+\xb7O\x96E8\xce\xf2\x833\xb5C\xd9\xa8\x80T\x96\
+\xfe\xae<\x11SI\xf7.MA\xc6ji\x06B\x82\
+BAf\x0d\x97R\x9a\x8d\xb6s[k\xfcESV\
+\x99\xc3y\xcf[\xf7\x93U\xd3@\xabn\xc7\xac\xb1P\
+$\xedw\xda\x86Y]\xa5\xe6\xa0K\xeeP\x15\xa2\x1c\
+\xc9\xa6\xcc\xc3\x017z\xee\xd2]\xab\x83\xcdT\xd3\xdd\
+\x9d\xb4\x0b3\x864H\xef\x00<\x89{\xd4Y\xc6\xa3\
+\x87K\xc5\xa25\xd7\xfc%2\x0e\x9d\xb5\x91\x95i\xc9\
+\xdd\xd8M\x0aM_\xaaR!\x8d\xa9O\xd8!\xba0\
+\xc2ft\x93hou\x99\x8c:\xbf\x15\xcd\x5cz\xe6\
+T7\xbd\xdcJ&wE<\xce\x0e\xb5\xe9\x99Z\x17\
+)\xa4\xd8\xd0/\xfaA\x12\xbc>.J\xed\x04\xa2$\
+s\xa1\xff\x96\x8aR\xe6\x1c\x0cq\x93.Q\x82l\xf4\
+8\xe8\x8d\xf3\x06]G\xd7\x07\xd2;\x85S\xa9A(\
+[\xf34\x81\xbb{\xa3\xc2\xf1\x84dg&>HK\
+c|\xf5\x04dW5fS\xf3\x1aa\xd0\xa9\xdaY\
+\x08-\xb8\xe0M6]\xe5h<\xcd\xa2\x83\x5cjY\
+`\x94e\xb4\x8c\x86\x83\xe8\xd1r\xaei\x1c\xb1\x90d\
+\xf4\xe8\xc7T\x92\xebv\xfc\xb9\x0c\xa4>\xe4g\xb5X\
+\x1d\x11\x85\x95\xbad\xb4\xb7\x02f\x80l\x8b\x9ch6\
+\x87JF\xbfcZ\x8a\xbd\x16\x8b\xcdv\x19a*\x18\
++\x92S\xcf\xdda_\xa2\x0efujO\x0c#r\
+r\x9a\x9f\x85:H\x97c;d\x87\x9b\x19\xacl\x9e\
+\x9dy4\x1a\xafl\xcch\xf6Y\xe8\x84G\x1fu\x09\
+\xadu]\xa4\x0e\xdd\x99\xb9\x80\xad@\xbb P\xe2K\
+2\x93\xa8\x85\x82i\x92\x16\xa2\x95\xb1\x98c6\x1ck\
+\xbe\xa8\xe9C\x0f\xc8\xfc\x9b\x9a\xceBl\x10d\xe5=\
+D\xd3\x0c<q\x82N\x14\xa8A\x1a\xc3\xeb\xa6\xe8p\
+;r1\xca\xea\xc9\xd75\x17\x073\x89\xee\x11\x8d\xc3\
+\x153\xd6'\xd1\x0ac\x99eTs0E&6\x94\
+\xd2\x10\xa5\x9a\xaca|\xe8d=aad\xda\x9au\
+7\x15\xddJc(\xf2\xe6\xa4zl\xd3\x10\xcb\xab\x81\
+g\xa9\xe7\x0d\xbd\xb4\xb4x\xbcQ\xc4\xb4`F\x9ar\
+$Rr\xd2H\x0a\xd6o\xab\x5c(\x1b\x0b\x0b\xd3\x87\
+.\xf2\xa6i(\xb9.d\xb5'x\xda\x8c\xce\x90\xe4\
+\xaa\x88\xca%\x99M+\xfe\xd1=\xbc%'\xcb\xbf\xce\
+Ck\xc8=\x13\x01\xc1\xe3\xe9n\x08\xad\xa3\x1cH\x8a\
+_v|\xdc\x88\xc3\xcd\xc0X\xaf\xc9\x1eO\xca$n\
+0(\x22\xdb\xd6\xc0\xbc\xd3\xef\xcb\x86\xed\x86\xde\xd1R\
+jZ\xa5\x09\xe4\xf11\xd1\x81\x96\xd4\xac\xb3'\xb1\xc7\
+\x80\x84\x0a\x93V\xd1\x12j\x90\xce`$\x09r\xa8\x0b\
+\xe9\xb60\x98\xbb\x86\xd28K\xcd;\x0c\xbf)\xb9\x04\
+\xf9\xe4)3L\x93*\xcd\x18\xa0<\xfcLJ\xcd\xb4\
+\x95\x9ep\xb8\xd2\xd2\xdb2\xd1\xc3*8\xeb\xb48\x98\
+\xaf\xb1c)9\x88\x11\x89\xb1\x11/\x0e\x0a\xe6\xa35\
+.\x93\xd2\x96\x84\xfbd3\xf7\xfe;\xe6;\x06Z!\
+\xcfoX\xa7P\xe94\x87\xc8\xd52~\xebh\xf6\xa8\
+I\x90 w\xfb\xad\xf4\xa9\xcc\xec\x9e\xb1oM\x0e\x8a\
+\xec.\x99\xb9\xa9\xcffH`\xa5s\x9a\xe8T\x1bB\
+*\xdd\xa9E\x8bf\xe3\xec\xa4^\xade7S\x5cc\
+\x19FO\xd0\xd6\xaf\xf4N\xaa\xe6\x83t(\xb4\x1fF\
+\xc5dT*\xa2R\xe4\xe5HJ\xe7\x1b\x8e\xe6\x0f0\
+\x1b\x9c\xa1l\xc1]\xd4\xb1\xc9P\xc56\x83VZ\xee\
+V\x17\xc7\x5c\xca\x823'\x89\xf5*qTO\xc8;\
+ed\x19VZ\xb1+Z\xd5h7\xb8s\x935\x1f\
+\x82a7\xec'\x9e\xcf\x84F31\x9a\xdd\xdb\xb4!\
+ZA\x8ao\xac'%\x93z\xe0\xd0\xcc\xf8\xec\x02v\
+\xc9~$2\xe1h\xc5\x1al\xc5\xe5\x1d\x14\xd79S\
+O>\x02\x97\xf5\x8cI\x0cb\x83\xddI\xb3C)\x00\
+9\x9c#\xa7i5\xf5\x902\x93\xa6A\xe4b\x18\xc5\
+\x98W\x8b!\xd4\xd8\x8c\x01\xc3*C\xee\xef\xdf\xa1S\
+\xa2\x18\xa8\x16\x97\xe8e\xb5PH\xc0\xc0w\xdc\x22T\
+S\xb4wt\xef\xc4;^\xd2\x1f\x19\x8aoYoT\
+\x0e!\x91\xc1\x90\xed\x97\xba\x96\xa4\x90z\xad\xc5\xccf\
+\xc7\xc5\xa7l\xe5*\xe1\x1a\x8dE\x0cxB\x83d\x91\
+\xca\x0d\xe1\x07\xe22\xfa\xa9Hg-\x1ck\xaa\xc1V\
+\xcc\x81\x88\xb8\x18\x87\xccI\xc4\xc9#\x84\x13\xa1\xa3\xfa\
+\xaaTxKS\xa0-r\x13h#3\xa4_M\x01\
+\xaa%\xcf\x5ck)l\x82 A+0\xa1\xbd\x88\xb2\
+\xb3\x1f-\x96w\xf7:X\x0c\x84aG\x0b\x90\x04\x8b\
+\xd8\xe8&\x04\x9c\xa2\xb7\xd2\x9aL\xdc\x0a\x13b\xe6\x89\
+\xd4NM_H\xd8\x90@\xc4\x85@\x0b\xecQ\xcf^\
+#\xfc\x5c\x98\xab\xc3\x1c\x05\x11\x0fQ']@\xf6m\
+\x83\x03\x92\x82\x89\x1a\xca\xaa\xc1h\xe4I\x10\x0e\xb1J\
+\x7f(F\xe5\x10a-=\x09\xedI~f\x00\x1b\x16\
+\x19\x92\xbb(\xd0U\xf8F\xe0\xe9\xe4\x9eH'\xd2\x7f\
+\xb5\xe3wK\xe6\xa3i\xaa\xdaeL';46j\
+.\xbbFA\xacL\xf0\xb9{E\x1b\xeab\x92\xac\x05\
+\xed\x16Cp<\xbeq\xc3\xae\xd1F\xebr\x91\xf4\x00\
+\xc8z\x92\x03\xef\x87y\xd55\x1bNN\x0a\xd4\x8d\x9b\
+\x95\xd1\x052\xfd\xf8\xd3\x007\xce\x95\xcc@\xb3\xa9u\
+\xc62\xe5\x88\x8dlj\xe9a\xa9\x0d\xa6\x03N\xc1o\
+j\xe5\xf8H\x0c\x8c\x08\x9dt\x17\xe1\xaeR\x1d \xd0\
+Ge\x04\x8ed2\xd2&\x99\xe1w\x16\x81\xe2=i\
+\xdd\x8d\xe8[\xc2\x07\xb2`\x05\xcar\x93\xed\xe4\x1c\x93\
+\x0b\xfc&\x19-kHk\x87O\xc8\xf8\x08\xcd\x09\xae\
+'n0G\x02\xa5\xf1dX\x1a\x0d\xb9M\x92\x05(\
+Q\xa5\xb8\xd1\x83tQ\xfe\xe1e\x0b\xa0\xc9N\xd8\x95\
+\xbej\xc9l\x9d\xd7\x82\xda\xa5\xa0.\xa3EC\xb00\
+\x87\xe9Q\xa9\xba\x8f\x12\xbc\xde\x7f}\x82Wp\x07\x19\
+f\xa2\xc5\xa0\xcf\xd9\x9c\x00A\xa7\x10\x8e\xb4\xa0\x93\xc8\
+\x8e$@\x18\xab8O\x22|\x15\xefUZ.\xda\xe1\
+U\x1d\xaf\x07\xff(\x0c\xef\xcaIa\x17\xc1\xac\x06O\
+o\x0bML\x84\xea#4E\xeb?\x82F\xc9\x11\xfd\
+0c\x88\x9aeB\x03\x0e\x09\x94\xbb\x18\xef\x83\xa5I\
+h&\xf3\xdf\x89l\x88>q\xb4\xd6\x15uo\xc8\xbc\
+\xd5\xa9\xf9\x84\xed\x8d\xd4\xf2\x1aYt\xa6\x83^\x10U\
+\xe4\x04n\xa1!\xcb\xa9\xe8S)Vh\x1e\xcc\xf9'\
+\x84+\xb9J\xe6\xea\x18Oit\x91\x12\xc9t\x09\x9f\
+\x98t\x03\xa2\xfa\x19\xb2\xe0\xe9\x9b\xe0\x12\xed^8x\
+)3C\xd65\xa8\xb4\xb9V\x0e\x8f\xc0\xfcw-\xb6\
+5\x85\x89D\xef\xe8\xd0.\xa5f^\x87\x88\x15c\x13\
+\x90\xaa\x81GJZZ\x84&\xb4\xd5\x18\x84\x1e\xac\x99\
+\xda\xab\x04\x1cp\xf0%.\x928=k\xc8\xb4\x87L\
+\xb6-\x10\xcc\x99 \xc5\x5cW\x12U\xcd\x931\x9bf\
+1(\xe2\xa14R\x16\x90\xe1\xebh\x16\xe9u\x8bS\
+I\xe9\xe2\x0e\xe1\x97:;\xa9UsL\xc7f)\x94\
+2\x98l\xf2s\xf8D\xa3\xb2p\x93\x16\x01\x9f\x85\xd0\
+\x19A\xcaa9\xf4\xf4\x90F\x22\xf2\x5cG\xce\x1ck\
+\x15\xcdJ\xea[\xd6\xaf\x04\x0am\xbe)\xda\xbf\x19O\
+r\xd2y\xf6\x8e\xc8\xd1\xf0\xbdr4\x0a\x02\xed\xf7\xd5\
+\xbeC\x94\x13\x05\xe18\xe2j\xdb\xac\x8d\x1c$If\
+\xd1\x8c\x1d\xd1\x19\xe2+(\x9e\x0a\xfd\x0a\x16-!\x22\
+\xd6\xe5*O\xf4\x89\x0e\xad\x13\xe4s\x90a\xbeB\xf5\
+\x98\x97\xbd\xea\x9bB\x8f\xfc\x1c\x8c\x0d\x1b\x15E\xd7\x14\
+\xf3\xf7\x83\xd1\x04\xe9K\x0d\xd7\xba\x8aI\xd9\x0e\xc5\x22\
+\xcf\xb8[\xd3~\xafU2\x07\x15\xafw\x94\xb8\x15\xbb\
+\xbe\x14\x93|V\xee\xd8\xaam1\x10\x13`\xaa\x09M\
+\xa1\xb4\xec\xc1\x1d\xea\x14\xcf\x17\x8e\xd3\x8c\x5cd\xe2\x93\
+\x9a4G\xb8\x9cI\xf3\xd0jY*Y23\xca\xba\
+W\xa3\xb8\x93\x90\x7f@\x87\x99'\x223\xf5\xfe\x1d\xeb\
+\xb2\xed\x1b\x1c\x8c6|\xddH\x9e>\xf1\xe6\x8e\x8bV\
+X\xfb\xbd\x0e\x15\xfc\x98\x02\x0a\xce\x9f@\x01E\xfb\xb3\
+X\x01e:>\xc8{\x91\xe1f\xcbG\x0b`\xa7\x05\
+\xe9\xdf\xd9\x98\x06\x15\x80~\xa8UA\x1d\x9d\x835u\
+\x90YB.(\xd8\x91\x0d$\xc7+\x94\xb1w\xd1M\
+=@\x96\x89\x9b\xed\xd0#u\x9c<\xe4\xc6!W\x98\
+c\x1c<\x22\xdb\x8d\xc8\x9c\x8b\xc6\xa5\x9d/\xa5BH\
+\x82\xf0goH\x99\xc1\xa4\xa5\xe7\x82\xebq\x5cT\x08\
+\xb1V\xe6b\x07\xe6\xae\xf8\xc43k\xd1a\x22\x8d\xe3\
+\xdb\xbb\x04\x8f]\xae\xc6\x91\xb5|E\xbf\xe5\x8d\x0a\x15\
+\x19o\x04BG\xf2\x93\xcc[\xdc%B\x05\x9cXS\
+7#\xe8C\x90\xc8\xc7j+\x1a\xadf\xb7K9W\
+\xd8\x14\x1bU\xd1\xf6\xba$\xe1\xf0u\xa2}\xd1\x5c5\
+(\x87\x14\xaa\x14\x05\xfb^\xdd\xbb\xa1\xb5\x5c'\x22\x89\
++\x9fM'\xea\x0a\xb2g\xec\x91\xe5`\x1e'\x7f\x9b\
+\xff,\x8d\xe0m\xe0b\x1a\x91X\x85\xd4\xa9u\xb2r\
+\x182dY\xf4yc\x96XwfC\x01\xa9\x15\x7f\
+t&G\x92\xe7\xf1\xb14\xfepv\x12F\xc0\xd9>\
+]G\xb1\xd4\xde\x01-\xe1~o1t\xf1J\xae\x9f\
+\xba\xc9K\xae\x88q+\x88\x90\xaem>-\xcd#E\
+\xc2\x13\xbdJ\x05\x0a+'E\xb2\x89\x04\xe1a\xf9`\
+\x92\x96\x10#\xcc@2N\xd8\xf3x/Fh4\xef\
+\xc9\xe0\x0e\x16\xd1\x93\xcd\x82\xf9}P\x00y\x1a\xe6\xb0\
+H\xfb\xe1\xfbE\x0a\xa9\xa5_\xc1\x9eT\xf9Gc\x9d\
+\xe1\xe8(\xd9_C|t}\x01\x03a\x8f\x84j\xa2\
+\x1f\xba\xab\xfb\xd9\xfa\xa1-\x87\xb7-Mg1'\xb9\
+.cG!\x0b{\xe6`YT\x86\xbf\xc5\x22\xb1\xc5\
+\x1d\x8d\xcd~\x94\xd9i82\xde\x12f\x9f+\xb5\xb1\
+\x8d9\x22\xa0\xc5<\xd6`\xe1>\xbb_\x1c^9s\
+Y\x8bE#\xe5c%3:<\x81\x09\x90\xa4s\xd0\
+9x\xba\xb5\xcf\xb6\x7f\x882$b6fA\x8dd\
+\x108o\xdd\x8e\xaa\xd7B\x88\xd6\xe0\x166 \x8b\xa3\
+'\x9dl\x0d\xb8\x83\xbc\x0f\xbc.\x8b\xe1f\x8b\x00\x15\
+\x22\x22\x95\xa3\x06,\x1c\x0f-\xb7M\xd3NT=\x08\
+\x22l\xc7\x05\x00'\xfe\xa6\x11\xeaI\x09\x16\xca,\xb1\
+e\x9b\xd8\xed\x15Dp`\x0c\x81\xa6\xc3\x13\xd1\x01\xd9\
+\x89::\xc01\x0byc1=\xdb\xfa\x94)\xa48\
+_\xb4(\xa3\xadl\xbbO\xa4\xfd\xee\x0d\x87\x81\x16A\
+r\xb6<\xc9\xa6\x06VjqN={\xecf3E\
+\x1c\xfb\xc7\xf1\x96\x7fu\xbcq\xdcL\xe0\xa4\x86\xe8\xa4\
+,$\x94\xb3\xb1\x14\x91\x08\xb6\xb8\x11\x9d7\xf6\x8f\x87\
+\xe2\xb2F\x9d\xc5\xe2%\xd5\xf5\xb1\x93\xe3\x88jH\xb1\
+\xcb\xe8fs\xd7\xa5\xa1\xdd\x9cK\x9e\xac\x1d\x06\xe1\xb0\
+\xd9\xa6f\x0c\x9d\xc5\xd9\xf0\xc0S\x19\xdb_\xb2\x85\x16\
+>\x93\xae\xe0~l\x1cb\x8b\xb7\xf8\x96\xbd\x8c\xf3p\
+$\x0em\x84\x19D!\xdbp\x7f\xbb\xdd\x92\xc0C\x81\
+6\x90M\xea\xc6c\x89\xdc\xb0P\xf7\xde\xe9\xa8\xb3\x11\
+\xba\x94\x1c\xb0\xd9h\xe15\x22\xf4]\x82$j\x86\xdf\
+G\xcaA\xe3d\xf2^\x88\xabe\xec/\x1c\xc8\xb6\x7f\
+\x83\x85\xb2\xd9\xe4\x1b\x11\xb1@\xe8\x94\x8a\xf7\xbbw`\
+n\xd6\x90\x12\xf7\x88M\xab\x11\xae\x96\x16$F$\xb8\
+\xf5\x11\x0aKD\x074#\xd1\x00\x19Z05*\xa6\
+\x99G\x88\x8b\xfd\x1eH^v\xdd\xd4!{\x08\x1a\x90\
+\x9d\xe5R\xac\xb9\x83T\xa5&\xa9\xa0FS.\xe8\xc7\
+@\xf7/9-a\xd3\x1a\xa1:.\xc5{\x9a#g\
+\xef5\xfd \x8e\xd8|q\xdc\xcf\xfe\x1e\xd1\xfb\xce6\
+\xad\x0c,\x9bL\x84\x0ey\xd9$\xafa\x82;\xcd\xfe\
+\x9e\x9fw\xc7${d~\xe8\x99\xe4nb\x09e\x9a\
+*N\xa9 \xa4;p\x04C\xa3\x04\xae2\xc1il\
+\x1e\xfb\xaa\x9ft\x22\xaa\xa2M\x09\xa3R\x82\xb9\xb9]\
+\xd8\xec\xf8\xce\x0c\x072\xec\xa0\x80\xc1\x0e\x11\xc4\x97n\
+\xc0WJ\xc7\x087\xa1\x8c\xc81K\xf27\xaed\xf9\
+\x9b\x1f\x11\xd3\x00\x0cM\x90\x1b\xfb\xc7\x91\xcc\xad\xb2W\
+\x9f\x92\x7f\xc2\x13\x82\x164C\xd3\xado\x97\x0dn\x86\
+\xe9E\xcd\x8b\x06\xbea\xc7n\x8e\x0eG6\x0f\xad\xe1\
+cn\xb6\x82\xde\xdc!\xde(D\x81\x03+\xe8\xf2~\
+\xc3\xf6\xa3\x12^\x7f}\x09o\x9c3\x0b\xfb\x8f\x99=\
+*oQUH5\xb9\x0al\x87\x07\xad\x0f6?[\
+\x88\x9c$I\xa2\x1dZ\xecZ0:\x04\xcf\x88\xd8\x03\
+\xce\x8aR0\xa5\xcc\x96\x14|\xa7\xd6\xb13\xe6\x09\x5c\
+#)\x8d\xa0\x0dY\x0a\xcd\xe1\x89\xe3z\x0e\xe7\x0e\x19\
+\xd7Tu\x82C\xde\x0cU\x0f\xc5\xfc\xacT,\xccG\
+r\x00\x01gK\x04\x1fl\xce\xb1\x0b\x0a\xb9 \x00a\
+\x0f`\xe8\xcd\x9ep\x13\xb2g\x9a\xc7\x9aTX(\x08\
+)\xb2H\xbe\xa6\xd5\xb6\xe0\x05BV\x1cQ!rc\
+G\x06Z\x94\x90u\x03\xc0\xc2\xca\x10\x08q\xd6<\xb2\
+ZZ\xf0\xc3\x9a\x11\x0a\x84\xbcu\xa1nD\xabS\xb0\
+\xe8/\xde-\xa1\x1bT\xbd\x13\x8b5I\x96\xcd\x9b\xd1\
+\x06=\xdc\x18\xe5\xe7N$\x0d\xd4F\x8c(\xc9c\x1d\
+\xde\x987'\x90I\x8biP\x5c\xf9\x89\xbd\x12\xd8\x0b\
+\xb1\x7f4EFw\xff\xd5#\x0c\xe2_\xb6\xec\x9a\x9a\
+\x8c\x13\x13\xe3H\x1d\xd2\x93\x97h\x19\x0cDw\x86r\
+\xce\xc5\xe2\x03\x89\x85\xadul\x1b\x0crf\x8a\xc2b\
+0\xc5\x14u\xb0\xed\xb3\xce\xd6\xee6Z\xd0\x08\x07\x16\
+\x1e\x9c\xe7w\xf40#\xadE,\xba\x82_\x8b\xe0\xf1\
+URBJ\x81\xf6\x10\xc1\xeb\x96\x8f\xc4\xbeT\x0d\xc4\
+\xab`\xc8\x1d\x1d\x03\xb5!bY\xbb\xe9m\xf4\x12q\
+G\x17\x11}tt\x83O\x92\x12\xe3h1A\xeb\x9c\
+\x22nJ\x7fE=\x0d*FJQ\x03#\x8f\x86\x0c\
+\x04;\xa0R\x1e[E\xdb\xc9\xcf\x90\x16\xd2\x8f\x85\xf9\
+@\xacMj\x11<\xd915\x89\x0c\x03A\xbbZ\xfe\
+Ib\xdbz\xc2\xe3\x0f\xb6\xa7Y\xa5JgTcP\
+\x09\x9eB\xd5\xb1\xb4r\xab;;*\x99x\x0b^\xb5\
+t,\x81\xc2\xd0\x83\x05\xab\xc4_Dv\x81\x9a$\xc4\
+B\x03)\xa7d\x8b\x80\xf6\xb5\xf0A\x96\x12\xb2\x9d<\
+\xec\x89\x09KesndM\x0c6\xc9\x0ek\xb6\x1d\
+\xb3\xc8\x86\x1d\xea\xd9\xcc&\xb9)\xa3\xbdP\x0d$\x17\
+\xd9\xee/\x96Qr\xd5\xbbu\x18\x22,\xd4F\x8eG\
+m\x19\x91 \x84\xa8\xb9\xde\xd8>\xfa\x08\xd7E\xa2\x83\
+X\x13O\x98\x84\x0b\xc2.:\xb2\xa5\xd9J\xd9Z\x17\
+ab\x22q?\x14\xba\x84\x84\xb0%\x190aP.\
+\xbeDZ\x5c\xd0x\x09\x0e:\xf6\xa9iYon\xe2\
+\x86\xc3\xa40a#C\x8f\xb8\x22\x01\xd6X\x9af\xf2\
+c\xc2\xe4\xcf\xc0[\xee\x84.-\x82\xec:\xa1\xd7\x9e\
+\x07\x1b\x85\x98\x1a\xbc\x8b%\x97`\xb2|\xaaFAd\
+\xca\x8bM\xab\xfe\x11\xfbhR\x1c\xc7^\x88\xc0nk\
+\x81T\x18B\xec\x9a\xd0\xb6h\x16\xdeZ\xe7\xb1d\x16\
+\xda#\xb1+\x19\xdb%\x1a\xd3\xc6\xaeO\xe9\xd1@\x92\
+\xfcL\xacD\xfb\xb2\xbd\xe3E}\xfa\xfbwx\xc6^\
+-^\x01m\xe8D`\xb4R\xd0\x01\xd2V\x10iz\
+\x03i5!\xe0\x12\x02\xf6=\xa5\x00\x8bm!u\x8b\
+\xb1\x821\x0b\x83\x8dC*\xa2eZ\xe9.\xd8\x00\xa9\
+t\xa1\x08\xaa\x97,\xcc\xcea\x16\x85\xcd\x13N\xb1\x9e\
+_\xa3\x1f\xd8Zu\xec\xadyB\xc8[3\xf2\xa9\xda\
+\xd9\x04v\x8c\x22q\xab\xd9\xd1\xc7\xac}\x14\x0c\xbf\xbe\
+\xef\xd7aM\xcc\x83\xb4\x02\xea\x81\xd3\xfb\x0c\x0c\x81\x0c\
+\x10#\xe3\x92\xd2\x11\x00\xdf\xc3\xa3\xcd\xc4\x8f\xf4NK\
+\xaaE\x0d\x8f\xad\xb30\xd20\x1d\xe9\x0f\xb6I\x8d\x88\
+E\xdb%\xae\x9d\xa6MHf\x84\x88\xd7\x9d\xd8\xe80\
+U\x12\xb9a\xe1\x03{<\x88|\xcd\x16l\xc1\xa0\xcb\
+\xea\x0f\xbd.9n\xc3c\x0cR\xb0\xc6\xa8\x84\xb2`\
+`\x942\xab\x9653\x5cV\xe8*)Vf\xa4K\
+\x1a\xef\xb8N\x80U\x0f6X\xa6\xd3\xe7l\xc3\xeb\xe5\
+\xc6\x1c\xfc4\x5cAyvl{\x10NB\x83Bh\
+\xd1~\x9d\x18\xa0\xedj6:\xdc\x8e\x14?\xcb%t\
+U\xc0\xb2\xd0\x5c\xa7Y\x90\xe5\xdavo\xbb\xc0\x9d\x9f\
+\x10`\xa9\xf8\x8e\x18\x81b\xafE`m#=X\xf4\
+\x15N\x80\xb7m\xc1\x0fOJ\x88\x05$\xbde\xaaa\
+\xb6\xc7\xf3\xe6\x8fg\xb1\x8aY\xfe\xea@\x8a\xa3\xedV\
+\xd4l\x92\x19)\xd3P,\x84NB\x8c\x85iE\x02\
+\xcd\xadi\x16\xa8\xc3Hdv\xc99\x18\xb7\xe62N\
+\xc8\xc5\x9b\x86_\xc3\xde\xea\xd8\x11\x15/\x9c\xbe#\xec\
+\x94\xa4z \x91\xb0\xec4\x8c\x17\x9b\x92\x01MfA\
+ \xad\xa5\xb9\xe8l\x0b\x18\xacRG\xdfc\xac\xab\xa1\
+J.|\x96\xb6\xe7\x03\xa2\x09#h\xd1\xde\xbf\x81\x87\
+\xd6\x894\xb1EI\xce\xed\x88@K\x9bA\xf9\xa3\xe5\
+\xd9\xce\xcf\xf6\xf1\x95\xf89\xee\xf5]\xbe\xfc\xfc\x8f\xfd\
+_o.o/^^\xdc^\xfc\xe6\xee&\xfbw\xe4\
+`\x95\xb9*\xe0\xf3\x9b\x97\xaf>\xfb\x1f\x7f\xf8\xe3\xdd\
+\xc5^\xbc\xf8\xec\x7f]\xdf\xfc\xed\xfdc\xf0\x85\x8b\xbf\
+^\x7f{\xfb\xc5\xb3{\x95\x04\x9f\xbf|\xf1\xd9\xed\xeb\
+\xdb\xab\xcb\xdf\xff\xf1\xe6\xf2\xf2\xcb\x7f\xfe\xc3\xf4\x97\x7f\
+\xff\xd7\xe9_~\xf8\xe6\xfa\xe6\xf6\xf3\xe7w\x1f\xde=\
+\xe2|\xd9\xfd\x83\xde\xbb\xeb\xe7\xcf\xf7\x8f\xf5\xfb\xdf|\
+\xfe\xfc\xddwz\xf8\xff\x07\xe2#\x90*\
 "
 
 qt_resource_name = b"\
@@ -4166,21 +4274,6 @@ qt_resource_name = b"\
 \x05\xf2\xa9Y\
 \x00X\
 \x00R\x00P\x00r\x00e\x00f\x00e\x00r\x00e\x00n\x00c\x00e\x00s\x00.\x00u\x00i\
-\x00\x1f\
-\x02\xc1 \x87\
-\x00p\
-\x00r\x00e\x00f\x00e\x00r\x00e\x00n\x00c\x00e\x00s\x00-\x00v\x00i\x00r\x00t\x00u\
-\x00a\x00l\x00_\x00r\x00e\x00a\x00l\x00i\x00t\x00y\x00.\x00s\x00v\x00g\
-\x00\x13\
-\x0b\x0b\xb7g\
-\x00S\
-\x00t\x00e\x00p\x00i\x00e\x00n\x00_\x00G\x00l\x00a\x00s\x00s\x00e\x00s\x00.\x00s\
-\x00v\x00g\
-\x00\x15\
-\x06?{\xa7\
-\x00R\
-\x00e\x00l\x00o\x00a\x00d\x00_\x00s\x00c\x00e\x00n\x00e\x00g\x00r\x00a\x00p\x00h\
-\x00.\x00s\x00v\x00g\
 \x00\x14\
 \x03\xfc \xa7\
 \x00G\
@@ -4191,6 +4284,21 @@ qt_resource_name = b"\
 \x00D\
 \x00i\x00s\x00p\x00l\x00a\x00y\x00_\x00d\x00i\x00s\x00a\x00b\x00l\x00e\x00d\x00.\
 \x00s\x00v\x00g\
+\x00\x1f\
+\x02\xc1 \x87\
+\x00p\
+\x00r\x00e\x00f\x00e\x00r\x00e\x00n\x00c\x00e\x00s\x00-\x00v\x00i\x00r\x00t\x00u\
+\x00a\x00l\x00_\x00r\x00e\x00a\x00l\x00i\x00t\x00y\x00.\x00s\x00v\x00g\
+\x00\x15\
+\x06?{\xa7\
+\x00R\
+\x00e\x00l\x00o\x00a\x00d\x00_\x00s\x00c\x00e\x00n\x00e\x00g\x00r\x00a\x00p\x00h\
+\x00.\x00s\x00v\x00g\
+\x00\x15\
+\x00\xb3-'\
+\x00C\
+\x00o\x00m\x00p\x00l\x00e\x00x\x00i\x00t\x00y\x00_\x00r\x00e\x00p\x00o\x00r\x00t\
+\x00.\x00s\x00v\x00g\
 \x00\x11\
 \x0f0c\x07\
 \x00T\
@@ -4201,31 +4309,38 @@ qt_resource_name = b"\
 \x00D\
 \x00i\x00s\x00p\x00l\x00a\x00y\x00_\x00e\x00n\x00a\x00b\x00l\x00e\x00d\x00.\x00s\
 \x00v\x00g\
+\x00\x13\
+\x0b\x0b\xb7g\
+\x00S\
+\x00t\x00e\x00p\x00i\x00e\x00n\x00_\x00G\x00l\x00a\x00s\x00s\x00e\x00s\x00.\x00s\
+\x00v\x00g\
 "
 
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00,\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9d\xb6\x08\xe7}\
-\x00\x00\x01v\x00\x00\x00\x00\x00\x01\x00\x00\xf8\x22\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x05\xe6\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x00\xf2\x00\x01\x00\x00\x00\x01\x00\x00\x87\xce\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00Z)\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x00\x96\x00\x01\x00\x00\x00\x01\x00\x00#\x85\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x01 \x00\x00\x00\x00\x00\x01\x00\x00\xbf.\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
-\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x00\xcb\x18\
-\x00\x00\x01\x9a\xd0\x90\x8e\xb0\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x01z\x00\x00\x00\x00\x00\x01\x00\x00\xc6\x8b\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x95\xfc\
+\x00\x00\x01\xa1T\xbb\xd1E\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00J\xb8\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x00R\x00\x01\x00\x00\x00\x01\x00\x00\x05\xe7\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x00\xf2\x00\x00\x00\x00\x00\x01\x00\x00hW\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x01\xa6\x00\x01\x00\x00\x00\x01\x00\x00\xd0\x5c\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00>\xce\
+\x00\x00\x01\x9d\xbb\xedG\x98\
+\x00\x00\x01R\x00\x00\x00\x00\x00\x01\x00\x00\x99\x81\
+\x00\x00\x01\x9d\xbb\xedG\x98\
 "
 
 def qInitResources():
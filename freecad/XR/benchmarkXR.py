@@ -0,0 +1,516 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD as App
+import FreeCADGui as Gui
+import Part
+
+from math import pi
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+from pivy.coin import SoSeparator
+from pivy.coin import SoPerspectiveCamera, SoDirectionalLight, SoOrthographicCamera
+from pivy.coin import SoRayPickAction, SbVec3f, SbRotation
+from pivy.coin import SoTransform
+from pivy.coin import SbViewportRegion
+from pivy.coin import SoOffscreenRenderer
+
+from PySide.QtCore import QTimer, QObject, SIGNAL
+
+import freecad.XR.cachePolicyXR as cachePol
+import freecad.XR.dragOverlayXR as dragOver
+import freecad.XR.viewSuspendXR as viewSusp
+import freecad.XR.profilerXR as prof
+import freecad.XR.commonXR as comXR
+import freecad.XR.documentInteraction as docInter
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.floorCacheXR as floorXR
+import freecad.XR.schedulerXR as sched
+import freecad.XR.movementXR as movXR
+import freecad.XR.collisionXR as collXR
+
+# Benchmarks of XR optimizations, to be run from the FreeCAD Python console:
+# import freecad.XR.benchmarkXR as bench
+# bench.make_static_scene()
+# bench.cache_policy_benchmark()
+# most of them do not need a running XR session, an offscreen renderer
+# stands in for a single eye pass
+
+
+def make_static_scene(count=1000, doc_name="XRBenchmark"):
+    # grid of boxes and cylinders, a large scene that does not change
+    doc = App.newDocument(doc_name)
+    side = int(count ** 0.5) + 1
+    for i in range(count):
+        if i % 2:
+            obj = doc.addObject("Part::Box", f"Box{i}")
+        else:
+            obj = doc.addObject("Part::Cylinder", f"Cylinder{i}")
+        obj.Placement.Base = App.Vector(
+            (i % side) * 20.0, (i // side) * 20.0, 0.0)
+    doc.recompute()
+    Gui.SendMsgToActiveView("ViewFit")
+    return doc
+
+
+def eye_scene(sg, vp_reg):
+    scene = SoSeparator()
+    scene.ref()
+    camera = SoPerspectiveCamera()
+    scene.addChild(camera)
+    scene.addChild(SoDirectionalLight())
+    scene.addChild(sg)
+    camera.viewAll(sg, vp_reg)
+    return scene
+
+
+def render_time(scene, vp_reg, samples):
+    # median time of a single eye pass in ms, the first render builds caches
+    renderer = SoOffscreenRenderer(vp_reg)
+    renderer.render(scene)
+    times = []
+    for i in range(samples):
+        start = perf_counter()
+        renderer.render(scene)
+        times.append(perf_counter() - start)
+    return median(times) * 1000
+
+
+def cache_policy_benchmark(samples=20, size=1024):
+    # per eye render time with caching set by FreeCAD and with the XR policy
+    gui_doc = Gui.ActiveDocument
+    if gui_doc is None:
+        print("No active document")
+        return None
+    vp_reg = SbViewportRegion(size, size)
+    scene = eye_scene(gui_doc.ActiveView.getSceneGraph(), vp_reg)
+    default_ms = render_time(scene, vp_reg, samples)
+    policy = cachePol.xrCachePolicy()
+    policy.apply_document(gui_doc.Document)
+    policy_ms = render_time(scene, vp_reg, samples)
+    policy.restore()
+    scene.unref()
+    print(f"Objects: {len(gui_doc.Document.Objects)}")
+    print(f"Eye render, FreeCAD caching: {default_ms:.3f} ms")
+    print(f"Eye render, XR cache policy: {policy_ms:.3f} ms")
+    return default_ms, policy_ms
+
+
+def drag_benchmark(counts=(1, 10, 100), frames=60, size=512):
+    # drag frames of N objects: placement writes every frame (the property
+    # path, with the tree view and view provider updates) against the Coin
+    # overlay with a single commit, every frame includes one eye render
+    doc = make_static_scene(max(counts), "XRDragBenchmark")
+    vp_reg = SbViewportRegion(size, size)
+    scene = eye_scene(Gui.ActiveDocument.ActiveView.getSceneGraph(), vp_reg)
+    renderer = SoOffscreenRenderer(vp_reg)
+    renderer.render(scene)
+    results = []
+    for count in counts:
+        dragged = doc.Objects[:count]
+        start_placs = [o.Placement for o in dragged]
+        plts = [App.Placement(App.Vector(i * 0.5, 0, 0), App.Rotation(0, 0, i))
+                for i in range(frames)]
+
+        start = perf_counter()
+        for plt in plts:
+            for obj, plac in zip(dragged, start_placs):
+                obj.Placement = plt.multiply(plac)
+            Gui.updateGui()
+            renderer.render(scene)
+        property_ms = (perf_counter() - start) / frames * 1000
+        for obj, plac in zip(dragged, start_placs):
+            obj.Placement = plac
+
+        overlay = dragOver.xrDragOverlay()
+        overlay.start(dragged)
+        start = perf_counter()
+        for plt in plts:
+            overlay.update(plt)
+            Gui.updateGui()
+            renderer.render(scene)
+        overlay_ms = (perf_counter() - start) / frames * 1000
+        start = perf_counter()
+        overlay.commit(doc, plts[-1])
+        commit_ms = (perf_counter() - start) * 1000
+        for obj, plac in zip(dragged, start_placs):
+            obj.Placement = plac
+        results.append((count, property_ms, overlay_ms, commit_ms))
+    scene.unref()
+    App.closeDocument(doc.Name)
+    print(f"{'Objects':>8}{'Property ms':>14}{'Overlay ms':>13}{'Commit ms':>12}")
+    for count, property_ms, overlay_ms, commit_ms in results:
+        print(f"{count:>8}{property_ms:>14.3f}{overlay_ms:>13.3f}{commit_ms:>12.3f}")
+    return results
+
+
+def gesture_memory_benchmark(gestures=2000, frames=30, report_every=200):
+    # long session: drag gestures of frames placement changes each,
+    # every gesture is one transaction, RSS should stay flat once
+    # the undo stack reaches its size limit
+    doc = App.newDocument("XRGestureBenchmark")
+    box = doc.addObject("Part::Box", "Box")
+    doc.recompute()
+    samples = []
+    for g in range(gestures):
+        docInter.begin_gesture("XR drag")
+        for i in range(frames):
+            box.Placement = App.Placement(
+                App.Vector(i, g % 100, 0), App.Rotation(0, 0, i))
+        docInter.end_gesture()
+        Gui.updateGui()
+        if g % report_every == 0 or g == gestures - 1:
+            samples.append((g + 1, prof.get_rss_kb(), doc.UndoCount))
+    App.closeDocument(doc.Name)
+    print(f"{'Gestures':>9}{'RSS kB':>12}{'Undo steps':>12}")
+    for g, rss, undo in samples:
+        print(f"{g:>9}{rss:>12}{undo:>12}")
+    half = samples[len(samples) // 2][1]
+    print(f"RSS change in the second half: {samples[-1][1] - half} kB")
+    return samples
+
+
+def pick_index_benchmark(rays=200, count=1000):
+    # controller-like rays from above against the desktop view pick path
+    # and the XR pick index, picked sub-elements should be the same
+    doc = make_static_scene(count, "XRPickBenchmark")
+    view = Gui.ActiveDocument.ActiveView
+    index = pickIdx.xrPickIndex()
+    index.set_scene(view.getSceneGraph(), doc)
+    start = perf_counter()
+    index.update()
+    build_ms = (perf_counter() - start) * 1000
+    side = int(count ** 0.5) + 1
+    starts = [App.Vector((i * 7.3) % (side * 20.0), (i * 3.1) % (side * 20.0), 500.0)
+              for i in range(rays)]
+    direction = App.Vector(0.05, 0.02, -1.0)
+    start = perf_counter()
+    view_infos = [view.getObjectInfoRay(s, direction) for s in starts]
+    view_ms = (perf_counter() - start) / rays * 1000
+    start = perf_counter()
+    index_infos = [index.pick(s, direction) for s in starts]
+    index_ms = (perf_counter() - start) / rays * 1000
+    same = sum(1 for a, b in zip(view_infos, index_infos)
+               if (a is None and b is None)
+               or (a and b and a['Object'] == b['Object']
+                   and a['Component'] == b['Component']))
+    App.closeDocument(doc.Name)
+    print(f"Index build: {build_ms:.1f} ms, triangles: {len(index.tris)}, "
+          f"segments: {len(index.segs)}, points: {len(index.pnts)}")
+    print(f"getObjectInfoRay: {view_ms:.3f} ms/ray")
+    print(f"XR pick index: {index_ms:.3f} ms/ray")
+    print(f"Same result: {same}/{rays}")
+    return build_ms, view_ms, index_ms, same
+
+
+def make_edge_scene(edges=100000, doc_name="XREdgeBenchmark"):
+    # a single object with a grid of short separate edges
+    doc = App.newDocument(doc_name)
+    side = int(edges ** 0.5)
+    segs = [Part.LineSegment(App.Vector(i * 10.0, j * 10.0, 0),
+                             App.Vector(i * 10.0 + 5.0, j * 10.0, 0)).toShape()
+            for i in range(side) for j in range(side)]
+    obj = doc.addObject("Part::Feature", "Edges")
+    obj.Shape = Part.Compound(segs)
+    doc.recompute()
+    Gui.SendMsgToActiveView("ViewFit")
+    return doc, side
+
+
+def cone_pick_benchmark(edges=100000, rays=100, radius=10.0, distance=1000.0):
+    # edge picking with a radius: the orthographic pick camera traversal
+    # used before against the XR pick index cone, radius in mm at distance
+    doc, side = make_edge_scene(edges)
+    sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
+    root = SoSeparator()
+    root.ref()
+    camera = SoOrthographicCamera()
+    camera.height = 2 * radius
+    root.addChild(camera)
+    root.addChild(sg)
+    vp_reg = SbViewportRegion(5, 5)
+    index = pickIdx.xrPickIndex()
+    index.set_scene(sg, doc)
+    start = perf_counter()
+    index.update()
+    build_ms = (perf_counter() - start) * 1000
+    starts = [App.Vector((i * 37.3) % (side * 10.0), (i * 13.1) % (side * 10.0), distance)
+              for i in range(rays)]
+    direction = App.Vector(0, 0, -1)
+
+    start = perf_counter()
+    camera_hits = 0
+    for s in starts:
+        camera.position.setValue(SbVec3f(s.x, s.y, s.z))
+        camera.pointAt(SbVec3f(s.x, s.y, 0))
+        pick_action = SoRayPickAction(vp_reg)
+        pick_action.setPoint(vp_reg.getWindowSize() / 2)
+        pick_action.apply(root)
+        if pick_action.getPickedPoint():
+            camera_hits += 1
+    camera_ms = (perf_counter() - start) / rays * 1000
+
+    start = perf_counter()
+    index_hits = sum(1 for s in starts
+                     if index.pick_cone(s, direction, radius / distance))
+    index_ms = (perf_counter() - start) / rays * 1000
+    root.unref()
+    App.closeDocument(doc.Name)
+    print(f"Edges: {len(index.segs)}, index build: {build_ms:.1f} ms")
+    print(f"Pick camera: {camera_ms:.3f} ms/ray, hits: {camera_hits}/{rays}")
+    print(f"XR pick index cone: {index_ms:.3f} ms/ray, hits: {index_hits}/{rays}")
+    return build_ms, camera_ms, index_ms
+
+
+def make_building_scene(floors=20, rooms=10, room_size=5000.0, height=3000.0,
+                        doc_name="XRFloorBenchmark"):
+    # a slab and two walls for every room, a compound object per storey
+    doc = App.newDocument(doc_name)
+    for f in range(floors):
+        solids = []
+        for i in range(rooms):
+            for j in range(rooms):
+                base = App.Vector(i * room_size, j * room_size, f * height)
+                wall_base = base + App.Vector(0, 0, 200)
+                solids.append(Part.makeBox(room_size, room_size, 200, base))
+                solids.append(Part.makeBox(room_size, 200, height - 200, wall_base))
+                solids.append(Part.makeBox(200, room_size, height - 200, wall_base))
+        obj = doc.addObject("Part::Feature", f"Storey{f}")
+        obj.Shape = Part.Compound(solids)
+    doc.recompute()
+    Gui.SendMsgToActiveView("ViewFit")
+    return doc
+
+
+def floor_cache_benchmark(floors=20, rooms=10, frames=500, storey=10):
+    # lock to floor lookups of a walk across a storey of a building:
+    # a vertical ray pick through the whole scene every frame
+    # against reads of the floor cache, cold (tiles filled on the way) and warm
+    doc = make_building_scene(floors, rooms)
+    sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
+    root = SoSeparator()
+    root.ref()
+    doc_xr_transform = SoTransform()
+    doc_xr_transform.scaleFactor.setValue(0.001, 0.001, 0.001)
+    doc_xr_transform.rotation.setValue(SbRotation(SbVec3f(1, 0, 0), -pi / 2))
+    root.addChild(doc_xr_transform)
+    root.addChild(sg)
+    vp_reg = SbViewportRegion(1, 1)
+    index = pickIdx.xrPickIndex()
+    index.set_scene(sg, doc)
+    floor = floorXR.xrFloorCache(index)
+    floor.set_transform(doc_xr_transform)
+    start = perf_counter()
+    index.update()
+    build_ms = (perf_counter() - start) * 1000
+    # XR space, Y is up, Z is the negated document Y, 1 m above the storey
+    size = rooms * 5.0
+    y = storey * 3.0 + 0.2 + 1.0
+    starts = [SbVec3f(0.1 + size * i / frames, y, -0.1 - size * (i % 50) / 50)
+              for i in range(frames)]
+
+    start = perf_counter()
+    ray_heights = []
+    for s in starts:
+        pick_action = SoRayPickAction(vp_reg)
+        pick_action.setRay(s, SbVec3f(0.0, -1.0, 0.0), 0.01, 2.0)
+        pick_action.apply(root)
+        picked_point = pick_action.getPickedPoint()
+        ray_heights.append(picked_point.getPoint()[1] if picked_point else None)
+    ray_ms = (perf_counter() - start) / frames * 1000
+
+    def cache_height(s):
+        ready, h = floor.find_floor(s, 2.0)
+        if not ready:
+            # tile jobs run at once, in a session they use the frame slack
+            sched.jobs.flush()
+            ready, h = floor.find_floor(s, 2.0)
+        return h
+
+    start = perf_counter()
+    cache_heights = [cache_height(s) for s in starts]
+    cold_ms = (perf_counter() - start) / frames * 1000
+    start = perf_counter()
+    for s in starts:
+        cache_height(s)
+    warm_ms = (perf_counter() - start) / frames * 1000
+    same = sum(1 for a, b in zip(ray_heights, cache_heights)
+               if (a is None and b is None)
+               or (a is not None and b is not None and abs(a - b) < 0.001))
+    root.unref()
+    App.closeDocument(doc.Name)
+    print(f"Triangles: {len(index.tris)}, index build: {build_ms:.1f} ms, "
+          f"tiles: {len(floor.tiles)}")
+    print(f"Ray pick: {ray_ms:.3f} ms/frame")
+    print(f"Floor cache: {cold_ms:.3f} ms/frame cold, {warm_ms:.3f} ms/frame warm")
+    print(f"Same height: {same}/{frames}")
+    return build_ms, ray_ms, cold_ms, warm_ms, same
+
+
+def teleport_arc_benchmark(floors=20, rooms=10, arcs=100, segments=32):
+    # parabolic teleport arcs thrown across a storey: a ray pick action
+    # per segment until the first hit against one query of all segments
+    # of the arc in the XR pick index
+    doc = make_building_scene(floors, rooms)
+    sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
+    vp_reg = SbViewportRegion(1, 1)
+    index = pickIdx.xrPickIndex()
+    index.set_scene(sg, doc)
+    index.update()
+    # document space (Z is up), meters converted to mm
+    size = rooms * 5000.0
+    arcs_pnts = []
+    for i in range(arcs):
+        start = np.array([size * i / arcs, size * (i % 10) / 10, 10 * 3000.0 + 1700.0])
+        direction = np.array([0.8, 0.3, 0.5])
+        direction /= np.linalg.norm(direction)
+        arc = movXR.teleport_arc(start[[0, 2, 1]] / 1000, direction[[0, 2, 1]], segments)
+        arcs_pnts.append(arc[:, [0, 2, 1]] * 1000)
+
+    start = perf_counter()
+    ray_hits = []
+    for pnts in arcs_pnts:
+        hit = None
+        for k in range(segments):
+            a = SbVec3f(*pnts[k])
+            d = SbVec3f(*(pnts[k + 1] - pnts[k]))
+            length = d.normalize()
+            pick_action = SoRayPickAction(vp_reg)
+            pick_action.setRay(a, d, 0.0, length)
+            pick_action.apply(sg)
+            if pick_action.getPickedPoint():
+                hit = k
+                break
+        ray_hits.append(hit)
+    ray_ms = (perf_counter() - start) / arcs * 1000
+
+    start = perf_counter()
+    index_hits = []
+    for pnts in arcs_pnts:
+        hit = index.cast_polyline(pnts)
+        index_hits.append(hit[0] if hit is not None else None)
+    index_ms = (perf_counter() - start) / arcs * 1000
+    same = sum(1 for a, b in zip(ray_hits, index_hits) if a == b)
+    App.closeDocument(doc.Name)
+    print(f"Triangles: {len(index.tris)}, segments per arc: {segments}")
+    print(f"Ray pick per segment: {ray_ms:.3f} ms/arc")
+    print(f"Batched arc query: {index_ms:.3f} ms/arc")
+    print(f"Same hit segment: {same}/{arcs}")
+    return ray_ms, index_ms, same
+
+
+def collision_benchmark(floors=30, rooms=30, frames=900, speed=3.0, budget=1.0):
+    # head collisions of a walk across a storey of a ~1M triangle building,
+    # speed in m/s at 90 frames per second, budget in ms per frame
+    doc = make_building_scene(floors, rooms)
+    sg = Gui.ActiveDocument.ActiveView.getSceneGraph()
+    index = pickIdx.xrPickIndex()
+    index.set_scene(sg, doc)
+    start = perf_counter()
+    index.update()
+    build_ms = (perf_counter() - start) * 1000
+    collider = collXR.xrCollider(index, budget=budget / 1000)
+    collider.enabled = True
+    storey = floors // 2
+    head = np.array([2500.0, 2500.0, storey * 3000.0 + 200.0 + 1700.0])
+    step = np.array([0.8, 0.6, 0.0]) * speed * 1000 / 90
+    times = []
+    blocked = 0
+    overruns = prof.stats.get_count("collision_budget_overruns")
+    for i in range(frames):
+        start = perf_counter()
+        allowed = collider.move(head, head + step, 0.001)
+        times.append(perf_counter() - start)
+        if not np.allclose(allowed, head + step):
+            blocked += 1
+        head = allowed
+    overruns = prof.stats.get_count("collision_budget_overruns") - overruns
+    App.closeDocument(doc.Name)
+    print(f"Triangles: {len(index.tris)}, index build: {build_ms:.1f} ms")
+    print(f"Collision: mean {sum(times) / frames * 1000:.3f} ms/frame, "
+          f"max {max(times) * 1000:.3f} ms/frame")
+    print(f"Frames with contacts: {blocked}/{frames}, budget overruns: {overruns}")
+    print(f"Final head position: {head.round(1)}")
+    return build_ms, times, blocked, overruns
+
+
+class mainViewBenchmark:
+    # compares XR frames in every MainViewMode, needs a running session
+    # selection changes every load_interval ms repaint the desktop views
+    # desktop repaints happen between XR frames, so they show up as
+    # dropped frames rather than as longer CPU frame times
+    # bench.mainViewBenchmark() returns immediately, results are printed
+    # after all phases, since the render loop runs on the same thread
+    def __init__(self, phase_time=5000, load_interval=100):
+        self.xr_widget = comXR.get_xr_widget()
+        if self.xr_widget is None:
+            print("XR session is not running")
+            return
+        self.objects = [o for o in Gui.ActiveDocument.Document.Objects
+                        if o.ViewObject and o.ViewObject.Visibility]
+        self.load_index = 0
+        self.modes = list(viewSusp.MainViewMode)
+        self.results = {}
+        self.load_timer = QTimer()
+        QObject.connect(self.load_timer, SIGNAL("timeout()"), self.load)
+        self.phase_timer = QTimer()
+        QObject.connect(self.phase_timer, SIGNAL("timeout()"), self.next_phase)
+        self.mode = None
+        self.load_timer.start(load_interval)
+        self.phase_timer.start(phase_time)
+        self.next_phase()
+
+    def load(self):
+        if not self.objects:
+            return
+        obj = self.objects[self.load_index % len(self.objects)]
+        self.load_index += 1
+        Gui.Selection.clearSelection()
+        Gui.Selection.addSelection(obj)
+
+    def next_phase(self):
+        if self.mode is not None:
+            frames = prof.stats.frame_count - self.start_frames
+            total = prof.stats.total_frame_time - self.start_time
+            dropped = prof.stats.dropped_frames - self.start_dropped
+            self.results[self.mode] = (
+                frames, dropped, total / frames * 1000 if frames else 0.0)
+        if not self.modes:
+            self.finish()
+            return
+        self.mode = self.modes.pop(0)
+        self.xr_widget.view_suspender.suspend(self.mode)
+        self.start_frames = prof.stats.frame_count
+        self.start_time = prof.stats.total_frame_time
+        self.start_dropped = prof.stats.dropped_frames
+
+    def finish(self):
+        self.load_timer.stop()
+        self.phase_timer.stop()
+        Gui.Selection.clearSelection()
+        self.xr_widget.suspend_main_views()  # back to preferences
+        for mode, (frames, dropped, mean_ms) in self.results.items():
+            print(f"Main view {mode.name}: {frames} frames, {dropped} dropped, "
+                  f"mean CPU frame time {mean_ms:.3f} ms")
@@ -0,0 +1,143 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import numpy as np
+
+from pivy.coin import SoSeparator, SoSwitch, SoPickStyle, SO_SWITCH_NONE, SO_SWITCH_ALL
+from pivy.coin import SoBaseColor, SoDrawStyle, SoLightModel
+from pivy.coin import SoVertexProperty, SoIndexedLineSet
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.objectBoxesXR as boxXR
+import freecad.XR.selectionXR as selXR
+
+# Volume selection between both controllers
+# the box is axis aligned in the document coordinates, objects inside it
+# are found in the object box index and shown as their bounding boxes
+# while the box is resized, the XR selection set (and later Gui.Selection)
+# is changed once, when the gesture ends
+
+# corners of a box, lo-hi bits per axis, and its edges
+box_corners = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)])
+box_edges = np.array([[0, 1], [2, 3], [4, 5], [6, 7], [0, 2], [1, 3],
+                      [4, 6], [5, 7], [0, 4], [1, 5], [2, 6], [3, 7]])
+
+
+def box_lines(lo, hi):
+    # vertices and line set indices of the boxes, lo, hi - (n, 3) arrays
+    verts = np.where(box_corners[None, :, :], hi[:, None, :], lo[:, None, :])
+    edges = box_edges[None, :, :] + 8 * np.arange(len(lo))[:, None, None]
+    idx = np.concatenate((edges, np.full((len(lo), 12, 1), -1)), axis=2)
+    return verts.reshape(-1, 3), idx.reshape(-1)
+
+
+class xrBoxSelect:
+    def __init__(self, boxes):
+        self.boxes = boxes  # xrObjectBoxes
+        self.lo = None
+        self.hi = None
+        self.names = []  # objects inside the box
+        self.sg = None
+
+    def get_scenegraph(self):
+        if self.sg is None:
+            self.setup_scenegraph()
+        return self.sg
+
+    def setup_scenegraph(self):
+        # rendered in the document coordinates
+        self.sg = SoSwitch()
+        self.sg.whichChild = SO_SWITCH_NONE
+        sep = SoSeparator()
+        self.sg.addChild(sep)
+        unpickable = SoPickStyle()
+        unpickable.style = SoPickStyle.UNPICKABLE
+        sep.addChild(unpickable)
+        light_model = SoLightModel()
+        light_model.model = SoLightModel.BASE_COLOR
+        sep.addChild(light_model)
+        draw_style = SoDrawStyle()
+        draw_style.lineWidth = 2
+        sep.addChild(draw_style)
+        box_color = SoBaseColor()
+        box_color.rgb.setValue(0.9, 0.9, 0.1)
+        sep.addChild(box_color)
+        self.box_vtxs = SoVertexProperty()
+        self.box_set = SoIndexedLineSet()
+        self.box_set.vertexProperty = self.box_vtxs
+        sep.addChild(self.box_set)
+        obj_color = SoBaseColor()
+        obj_color.rgb.setValue(0.1, 0.8, 0.1)
+        sep.addChild(obj_color)
+        self.obj_vtxs = SoVertexProperty()
+        self.obj_set = SoIndexedLineSet()
+        self.obj_set.vertexProperty = self.obj_vtxs
+        sep.addChild(self.obj_set)
+
+    def update(self, a, b):
+        # a, b - opposite corners in the document coordinates,
+        # called every frame while the box is resized
+        self.lo = np.minimum(a, b)
+        self.hi = np.maximum(a, b)
+        with prof.timed("box_select_update"):
+            names = self.boxes.inside(self.lo, self.hi)
+            self.get_scenegraph()
+            self.sg.whichChild = SO_SWITCH_ALL
+            verts, idx = box_lines(self.lo[None, :], self.hi[None, :])
+            selXR.set_values(self.box_vtxs.vertex, verts.tolist())
+            selXR.set_values(self.box_set.coordIndex, idx.tolist())
+            if names != self.names:
+                # the object boxes are rebuilt only when the result changes
+                self.names = names
+                bounds = self.boxes.bounds
+                lo = np.array([bounds[n][1] for n in names]).reshape(-1, 3)
+                hi = np.array([bounds[n][2] for n in names]).reshape(-1, 3)
+                verts, idx = box_lines(lo, hi)
+                selXR.set_values(self.obj_vtxs.vertex, verts.tolist())
+                selXR.set_values(self.obj_set.coordIndex, idx.tolist())
+
+    def commit(self):
+        # replaces the XR selection with the objects inside the box,
+        # returns the number of selected objects
+        self.hide()
+        doc = self.boxes.index.doc
+        items = []
+        for name in self.names:
+            chain = self.boxes.index.blocks[name].chain
+            # the same as a desktop pick, the outermost container
+            # and the path to the object
+            sub = ".".join(chain[1:]) + "." if len(chain) > 1 else ""
+            items.append(selXR.selItem(doc.Name, chain[0], sub))
+        selXR.selection.set_items(items)
+        selXR.selection.flush()
+        count = len(self.names)
+        prof.stats.count("box_selections")
+        self.names = []
+        return count
+
+    def hide(self):
+        if self.sg:
+            self.sg.whichChild = SO_SWITCH_NONE
+
+
+# box selection of the pick index scene
+box_select = xrBoxSelect(boxXR.boxes)
@@ -0,0 +1,174 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD as App
+
+from pivy.coin import SoSeparator, SoNodeSensor
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.docObserverXR as docObs
+
+# Render cache policy for the XR session
+# both eyes traverse the same scenegraph every frame, so subgraphs which do not
+# change between frames should keep Coin render and bounding box caches
+# (CACHE ON), while subgraphs modified every frame (edited or dragged objects)
+# would only rebuild caches which are thrown away in the next frame (CACHE OFF)
+# original values set by FreeCAD for the desktop view are restored at the end
+
+
+class xrCachePolicy:
+    def __init__(self):
+        # key -> (node, renderCaching, boundingBoxCaching) set by FreeCAD,
+        # document objects use (document name, object name) keys
+        self.saved = {}
+        # key -> sensor counting notifications, every notification of
+        # a cached separator invalidates its caches
+        self.sensors = {}
+        # keys of objects under edit or drag
+        self.volatile = set()
+        # keys of objects created during the session, waiting for recompute
+        self.pending = set()
+        self.doc = None  # the document shown in the headset
+        self.invalidations = 0
+        self.last_invalidations = 0
+        self.enabled = True
+
+    def set_caching(self, key, node, on):
+        if not node or not node.isOfType(SoSeparator.getClassTypeId()):
+            return
+        if key not in self.saved:
+            node.ref()
+            self.saved[key] = (node,
+                               node.renderCaching.getValue(),
+                               node.boundingBoxCaching.getValue())
+            sensor = SoNodeSensor(self.node_changed, None)
+            sensor.attach(node)
+            self.sensors[key] = sensor
+        value = SoSeparator.ON if on else SoSeparator.OFF
+        if node.renderCaching.getValue() != value:
+            node.renderCaching = value
+            node.boundingBoxCaching = value
+
+    def node_changed(self, data, sensor):
+        self.invalidations += 1
+
+    def add_static(self, node):
+        # controller models, menus, never changed by the document
+        if self.enabled:
+            self.set_caching(("static", len(self.saved)), node, True)
+
+    def get_key(self, obj):
+        return (obj.Document.Name, obj.Name)
+
+    def get_object(self, key):
+        doc = App.listDocuments().get(key[0])
+        return doc.getObject(key[1]) if doc else None
+
+    def get_root_node(self, obj):
+        vobj = getattr(obj, "ViewObject", None)
+        if vobj is None:
+            return None
+        return vobj.RootNode
+
+    def apply_document(self, doc=None):
+        if not self.enabled:
+            return
+        if doc is None:
+            doc = App.ActiveDocument
+        if doc is None:
+            return
+        self.doc = doc
+        for obj in doc.Objects:
+            key = self.get_key(obj)
+            self.set_caching(key, self.get_root_node(obj), key not in self.volatile)
+
+    def get_parents(self, obj):
+        # containers (Body, Part...) render their children too
+        parents = []
+        parent = obj.getParentGeoFeatureGroup()
+        while parent:
+            parents.append(parent)
+            parent = parent.getParentGeoFeatureGroup()
+        return parents
+
+    def set_volatile(self, obj):
+        # object (and its containers) will change every frame
+        if not obj or not self.enabled:
+            return
+        for o in [obj] + self.get_parents(obj):
+            key = self.get_key(o)
+            self.volatile.add(key)
+            self.set_caching(key, self.get_root_node(o), False)
+
+    def set_stable(self, obj=None):
+        # obj=None - end of all edits
+        if not self.enabled:
+            return
+        if obj:
+            keys = [self.get_key(o) for o in [obj] + self.get_parents(obj)]
+        else:
+            keys = list(self.volatile)
+        for key in keys:
+            self.volatile.discard(key)
+            o = self.get_object(key)
+            if o:
+                self.set_caching(key, self.get_root_node(o), True)
+
+    def on_doc_event(self, event, obj, prop):
+        # new objects are cached when their shape is computed,
+        # other documents are not shown in the headset
+        if obj is not None and obj.Document != self.doc:
+            return
+        if event == docObs.DocEvent.CREATED:
+            self.pending.add(self.get_key(obj))
+        elif event == docObs.DocEvent.RECOMPUTED and self.pending:
+            for key in self.pending:
+                o = self.get_object(key)
+                if o:
+                    self.set_caching(key, self.get_root_node(o), key not in self.volatile)
+            self.pending = set()
+        elif event == docObs.DocEvent.DELETED:
+            key = self.get_key(obj)
+            self.volatile.discard(key)
+            self.pending.discard(key)
+            # the name can be reused by a new object
+            if key in self.saved:
+                self.sensors.pop(key).detach()
+                node = self.saved.pop(key)[0]
+                node.unref()
+
+    def end_frame(self):
+        self.last_invalidations = self.invalidations
+        prof.stats.count("cache_invalidations", self.invalidations)
+        self.invalidations = 0
+
+    def restore(self):
+        for sensor in self.sensors.values():
+            sensor.detach()
+        for node, render_caching, bbox_caching in self.saved.values():
+            node.renderCaching = render_caching
+            node.boundingBoxCaching = bbox_caching
+            node.unref()
+        self.sensors = {}
+        self.saved = {}
+        self.volatile = set()
+        self.pending = set()
@@ -0,0 +1,118 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+from math import ceil
+from time import perf_counter
+
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.spatialXR as spatial
+
+# Head collisions for the artificial movement
+# the head is a vertical capsule hanging from the HMD position, approximated
+# by a chain of spheres, it is swept from the previous position in steps not
+# longer than half of the radius (thin walls are not skipped), penetrating
+# spheres are pushed out along the contact normal, which leaves the movement
+# along the surface, so the viewer slides along walls
+# nothing is resolved without artificial movement, overlaps from walking
+# in the room or from standing next to geometry do not nudge the viewer
+# only triangles of the XR pick index around the whole sweep are tested,
+# when the frame budget is spent the rest of the movement is dropped
+
+
+class xrCollider:
+    def __init__(self, index, radius=0.2, height=0.5, spheres=3, budget=0.001):
+        self.enabled = False
+        self.index = index  # xrPickIndex, source of the triangles
+        self.radius = radius  # m
+        self.height = height  # m, capsule axis length below the head
+        self.spheres = spheres
+        self.budget = budget  # s per frame
+        self.max_iterations = 4  # push outs per step, corners need more than one
+
+    def move(self, start, end, scale):
+        # start, end - head positions (numpy arrays) in the document
+        # coordinates, scale - document to XR (meters) scale factor
+        # returns the allowed end position
+        if not self.enabled or not self.index.enabled:
+            return end
+        r = self.radius / scale
+        if np.linalg.norm(end - start) <= r * 1e-3:
+            return end
+        begin = perf_counter()
+        self.index.update()
+        if self.index.sg is None or not len(self.index.tris):
+            return end
+        offsets = np.outer(np.linspace(0.0, 1.0, self.spheres), (0.0, 0.0, -self.height / scale))
+        reach = np.array((r, r, r))
+        lo = np.minimum(start, end) + offsets.min(axis=0) - reach
+        hi = np.maximum(start, end) + reach
+        cand = self.index.tri_index.box_candidates(lo, hi)
+        if not len(cand):
+            return end
+        tris = self.index.tris[cand]
+        steps = max(1, ceil(np.linalg.norm(end - start) / (r / 2)))
+        delta = (end - start) / steps
+        pos = start
+        changed = False
+        for step in range(steps):
+            target = pos + delta
+            for i in range(self.max_iterations):
+                push = self.push_out(target + offsets, tris, r)
+                if push is None:
+                    break
+                target = target + push
+                changed = True
+            pos = target
+            if step < steps - 1 and perf_counter() - begin > self.budget:
+                prof.stats.count("collision_budget_overruns")
+                changed = True
+                break
+        prof.stats.add_time("collision", perf_counter() - begin)
+        return pos if changed else end
+
+    def push_out(self, centers, tris, r):
+        # the deepest contact of the spheres, None if nothing penetrates
+        best = None
+        depth = r * 1e-3  # ignore touching contacts
+        for center in centers:
+            dist, closest = spatial.closest_on_triangles(
+                center, tris[:, 0], tris[:, 1], tris[:, 2])
+            k = int(np.argmin(dist))
+            if r - dist[k] > depth:
+                depth = r - dist[k]
+                normal = center - closest[k]
+                if dist[k] > 1e-9:
+                    normal /= dist[k]
+                else:
+                    # the center on the surface, use the triangle normal
+                    normal = np.cross(tris[k, 1] - tris[k, 0], tris[k, 2] - tris[k, 0])
+                    normal /= np.linalg.norm(normal)
+                best = normal * depth
+        return best
+
+
+# head collisions with the pick index scene
+collider = xrCollider(pickIdx.index)
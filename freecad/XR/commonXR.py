@@ -30,7 +30,27 @@ import freecad.XR.menuCoin as menuCoin
 import freecad.XR.previewCoin as prCoin
 import freecad.XR.documentInteraction as docInter
 import freecad.XR.qtWidgetRender as qWRen
+import freecad.XR.hudCoin as hudCoin
+import freecad.XR.profilerXR as prof
+import freecad.XR.sceneComplexity as sceneCompl
+import freecad.XR.docObserverXR as docObs
+import freecad.XR.cachePolicyXR as cachePol
+import freecad.XR.viewSuspendXR as viewSusp
+import freecad.XR.schedulerXR as sched
+import freecad.XR.selectionXR as selXR
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.snapXR as snapXR
+import freecad.XR.floorCacheXR as floorXR
+import freecad.XR.navSurfaceXR as navXR
+import freecad.XR.collisionXR as collXR
+import freecad.XR.objectBoxesXR as boxXR
+import freecad.XR.boxSelectXR as boxSelXR
+import freecad.XR.sectionBoxXR as sectXR
+import freecad.XR.hoverCacheXR as hovXR
+import freecad.XR.hoverPickXR as hovPick
 from math import tan, pi
+from time import perf_counter
+import FreeCAD as App
 import FreeCADGui as Gui
 from pivy.coin import SoTransform
 from pivy.coin import SoGroup
@@ -48,6 +68,7 @@ from pivy.coin import SoSceneManager
 from pivy.coin import SbColor
 from pivy.coin import SoSeparator
 import ctypes
+import numpy as np
 import logging
 from enum import Enum
 
@@ -126,6 +147,9 @@ ALL_TYPES = (
     | xr.DEBUG_UTILS_MESSAGE_TYPE_CONFORMANCE_BIT_EXT
 )
 
+# frames a created object waits for a recompute before its cache warm-up
+WARM_UP_WAIT_FRAMES = 30
+
 
 def py_log_level(severity_flags: int):
     if severity_flags & 0x0001:  # VERBOSE
@@ -208,6 +232,9 @@ stringForFormat = {
     GL.GL_BGRA: "BGRA (Out of spec)",
 }
 
+# ms between hover queries preparing the selection context
+hover_prefetch_interval = 200
+
 
 class InteractMode(Enum):
     TELEPORT = 1
@@ -216,6 +243,8 @@ class InteractMode(Enum):
     SELECT_MODE = 4
     DRAG_MODE = 5
     WORKING_PLANE = 6
+    BOX_SELECT = 7
+    SECTION_BOX = 8
 
 
 class DockWidget(QDockWidget):
@@ -359,9 +388,20 @@ class XRwidget(QOpenGLWidget):
         self.primary_con = 0
         # 0 is the left one - defined in hand_paths
         self.secondary_con = 1
+        # hand dragging with the grip button and the objects within its reach
+        self.grip_hand = None
+        self.grip_targets = [None, None]
+        # (cube name, gesture number) of the cube being resized
+        self.cube_gesture = None
         self.interact_mode = InteractMode.TELEPORT
         self.frame_duration = 0
         self.render_duration = 0
+        prof.stats.reset()
+        sched.jobs.clear()
+        self.last_frame_time = 0.0  # s, CPU time of the last rendered frame
+        self.cache_policy = cachePol.xrCachePolicy()
+        self.cache_policy.enabled = pref.preferences().GetBool(
+            "CachePolicyEnable", True)
 
         self.prepare_xr_instance()
         self.prepare_xr_system()
@@ -378,6 +418,9 @@ class XRwidget(QOpenGLWidget):
         self.read_preferences()  # done after scene and menu init
         self.initialize_offsGL()
         self.reload_scenegraph()
+        self.setup_doc_observer()
+        self.warm_up_caches()  # before the first headset frame
+        self.setup_view_suspender()
 
         self.timer = QTimer()
         QObject.connect(self.timer, SIGNAL("timeout()"), self.update_render)
@@ -386,6 +429,11 @@ class XRwidget(QOpenGLWidget):
         self.timer_gui = QTimer()  # timer used to update non-vr things like widget title bar
         QObject.connect(self.timer_gui, SIGNAL("timeout()"), self.update_gui)
         self.timer_gui.start(100)
+
+        # performance HUD has own low rate timer, independent from the render loop
+        self.timer_hud = QTimer()
+        QObject.connect(self.timer_hud, SIGNAL("timeout()"), self.update_hud)
+        self.timer_hud.start(hudCoin.hud_update_interval)
         print("XR session has started")
 
         self.double_click_timer = QElapsedTimer()
@@ -423,6 +471,8 @@ class XRwidget(QOpenGLWidget):
         # As as workaround, additional camera is used, with its placement
         # resembling placement of the ray. And then viewport space setPoint() is used.
         # setPoint() can use value set by setRadius()
+        # The camera is used only with the XR pick index disabled, otherwise
+        # its height sets the angular picking radius of find_picked_doc_point()
         self.pick_camera = SoOrthographicCamera()
         self.pick_camera.near_plane = self.near_plane
         self.pick_camera.far_plane = self.far_plane
@@ -467,11 +517,19 @@ class XRwidget(QOpenGLWidget):
             SbRotation(SbVec3f(1, 0, 0), -pi / 2))
         self.sg = SoSeparator()  # placeholder for scenegraph
         self.geo_prev = prCoin.coinPreview()  # geometry preview
+        self.feature_prev = prCoin.coinFeaturePreview()
         # store complete transformation of world, including artificial movement
         self.world_transform = SoTransform()
         self.world_separator = SoSeparator()
         self.world_separator.addChild(self.doc_xr_transform)
+        # section box clip planes, cut everything after them
+        self.world_separator.addChild(sectXR.section.get_scenegraph())
         self.world_separator.addChild(self.sg)  # add FreeCAD active scenegraph
+        # pad/pocket preview in the document coordinates
+        self.world_separator.addChild(self.feature_prev.get_scenegraph())
+        # XR selection highlight, in the document coordinates too
+        self.world_separator.addChild(selXR.selection.get_scenegraph())
+        self.world_separator.addChild(boxSelXR.box_select.get_scenegraph())
         self.cgrp = [SoGroup(), SoGroup()]  # group for camera
         self.sgrp = [SoGroup(), SoGroup()]  # group for scenegraph
         self.root_scene = [SoSeparator(), SoSeparator()]
@@ -493,6 +551,9 @@ class XRwidget(QOpenGLWidget):
         self.status_label.set_location(
             SbVec3f(-0.1, 0.0, 0.0), SbRotation(0, 0, 0, 0))
         self.labels_separator.addChild(self.status_label.get_scenegraph())
+        # performance HUD, hidden by default
+        self.hud = hudCoin.coinHud()
+        self.labels_separator.addChild(self.hud.get_scenegraph())
         for eye_index in range(2):
             self.root_scene[eye_index].ref()
             self.root_scene[eye_index].addChild(self.cgrp[eye_index])
@@ -530,6 +591,48 @@ class XRwidget(QOpenGLWidget):
         # populate only when a tracker with a camera role is detected
         self.tpp_cam_root = None
 
+    def setup_doc_observer(self):
+        # document changes are forwarded to XR caches
+        self.doc_observer = docObs.xrDocObserver()
+        self.doc_observer.add_listener(self.on_doc_event)
+        self.doc_observer.add_listener(self.cache_policy.on_doc_event)
+        self.doc_observer.add_listener(docInter.on_doc_event)
+        self.doc_observer.add_listener(selXR.selection.on_doc_event)
+        self.doc_observer.add_listener(pickIdx.index.on_doc_event)
+        self.doc_observer.add_listener(sectXR.section.on_doc_event)
+        selXR.selection.start(pref.preferences().GetInt("SelectionSyncDelay", 300))
+        self.hover_prefetch_timer = QElapsedTimer()
+        self.hover_prefetch_timer.start()
+        self.doc_observer.register()
+        hovPick.picker.start()
+        # objects created during the session, waiting for the cache warm-up,
+        # (document name, object name) -> frames left to wait for a recompute
+        self.warm_up_pending = {}
+        self.warm_up_generation = 0  # queued warm-ups of older sessions are skipped
+        self.first_menu_pending = False
+        self.first_menu_done = False
+
+    def setup_view_suspender(self):
+        # desktop 3D views render the same scenegraph on the same thread
+        self.view_suspender = viewSusp.xrViewSuspender()
+        self.suspend_main_views()
+
+    def suspend_main_views(self):
+        self.view_suspender.suspend(
+            pref.preferences().GetInt("MainViewMode", viewSusp.MainViewMode.NORMAL),
+            pref.preferences().GetInt("MainViewInterval", 1000),
+            pref.preferences().GetBool("SuspendPanels", False),
+            [w.widget for w in self.qt_widget_renders])
+
+    def on_doc_event(self, event, obj, prop):
+        if event == docObs.DocEvent.CREATED:
+            self.warm_up_pending[(obj.Document.Name, obj.Name)] = WARM_UP_WAIT_FRAMES
+        elif event == docObs.DocEvent.RECOMPUTED and self.warm_up_pending:
+            # shapes are computed now, objects still touched failed to recompute
+            for doc_name, obj_name in self.warm_up_pending:
+                self.queue_warm_up(doc_name, obj_name)
+            self.warm_up_pending = {}
+
     def setup_tpp_camera_scene(self):
         # TPP camera world
         self.tpp_cam_root = SoSeparator()
@@ -635,7 +738,30 @@ class XRwidget(QOpenGLWidget):
         elif (movement_type == "ARCH"):
             self.con_menu.select_widget_by_name("arch_mov_button")
         self.lock_to_floor = pref.preferences().GetBool("LockToFloor", False)
+        self.snap_to_geometry = pref.preferences().GetBool("SnapToGeometry", True)
+        self.teleport_arc = pref.preferences().GetBool("TeleportArc", False)
+        collXR.collider.enabled = pref.preferences().GetBool("Collisions", False)
+        collXR.collider.budget = pref.preferences().GetFloat("CollisionBudget", 1.0) / 1000
+        # how far from the hand objects can be grabbed with the grip button, m
+        self.grab_reach = pref.preferences().GetFloat("GrabReach", 0.1)
+        # working plane grid step, mm, 0 - no grid
+        self.plane_grid_size = pref.preferences().GetFloat("PlaneGridSize", 10.0)
+        docInter.assembly_solve_interval = pref.preferences().GetInt(
+            "AssemblySolveInterval", 100) / 1000
+        docInter.use_drag_overlay = pref.preferences().GetBool(
+            "DragOverlayEnable", True)
+        pickIdx.index.enabled = pref.preferences().GetBool("PickIndexEnable", True)
+        hovXR.cache.enabled = pref.preferences().GetBool("HoverCoherence", True)
+        hovPick.picker.enabled = pref.preferences().GetBool("HoverPickThread", True)
+        snapXR.snapper.enabled = pref.preferences().GetBool("SnapEnable", True)
+        floorXR.floor.enabled = pref.preferences().GetBool("FloorCacheEnable", True)
+        navXR.nav.enabled = pref.preferences().GetBool("NavSurfaceEnable", True)
+        floorXR.floor.set_cell_size(
+            pref.preferences().GetFloat("FloorCacheCellSize", 100.0))
         self.con_menu.lock_floor_button.select(self.lock_to_floor)
+        self.con_menu.snap_geometry_button.select(self.snap_to_geometry)
+        self.con_menu.teleport_arc_button.select(self.teleport_arc)
+        self.con_menu.collisions_button.select(collXR.collider.enabled)
         self.con_menu.select_widget_by_name(
             "lin_speed_slider", self.user_mov_speed)
         self.con_menu.select_widget_by_name(
@@ -646,6 +772,11 @@ class XRwidget(QOpenGLWidget):
         self.con_menu.select_widget_by_name(
             "scale_slider", sf * 100)
         self.con_menu.select_widget_by_name("teleport_mode_button")
+        if pref.preferences().GetBool("HUDEnable", False):
+            self.hud.show_hud()
+        else:
+            self.hud.hide_hud()
+        self.con_menu.toggle_hud_button.select(not self.hud.is_hidden())
         if self.tpp_camera:
             self.tpp_camera.heightAngle.setValue(
                 pref.preferences().GetFloat("TPPCamVFov", 42.88) * pi / 180)
@@ -668,6 +799,26 @@ class XRwidget(QOpenGLWidget):
         sg = self.view.getSceneGraph()  # get active scenegraph
         self.world_separator.replaceChild(self.sg, sg)
         self.sg = sg
+        self.apply_cache_policy()
+        # objects switched off by the section box belong to the previous scene
+        sectXR.section.clear()
+        hovXR.cache.clear()
+        hovPick.picker.clear()
+        # built on the first pick
+        pickIdx.index.set_scene(sg, Gui.ActiveDocument.Document)
+        floorXR.floor.clear()
+        navXR.nav.clear()
+        boxXR.boxes.clear()
+        floorXR.floor.set_transform(self.doc_xr_transform)
+
+    def apply_cache_policy(self):
+        # values from the previous document are restored first
+        self.cache_policy.restore()
+        for con in self.xr_con:
+            self.cache_policy.add_static(con.get_model_scenegraph())
+        self.cache_policy.add_static(self.con_menu.get_menu_scenegraph())
+        self.cache_policy.add_static(self.edit_menu.get_menu_scenegraph())
+        self.cache_policy.apply_document(Gui.ActiveDocument.Document)
 
     def prepare_xr_instance(self):
         discovered_extensions = xr.enumerate_instance_extension_properties()
@@ -829,6 +980,122 @@ class XRwidget(QOpenGLWidget):
         self.gl_ofc.glEnable(GL.GL_BLEND)
         self.ctx.doneCurrent()
 
+    def render_offscreen(self, scene, w, h):
+        # renders into the currently bound framebuffer, used for the cache warm-up,
+        # the result is cleared by the next regular render
+        self.vp_reg.setViewportPixels(0, 0, w, h)
+        self.m_sceneManager.setViewportRegion(self.vp_reg)
+        self.m_sceneManager.setSceneGraph(scene)
+        self.gl_ofc.glEnable(GL.GL_DEPTH_TEST)
+        self.m_sceneManager.render()
+        self.gl_ofc.glDisable(GL.GL_DEPTH_TEST)
+
+    def warm_up_caches(self):
+        # Coin builds display lists, vertex buffers, textures and render caches
+        # lazily, during the first render of a node, what makes first frames
+        # and first menu openings stutter
+        # render everything once offscreen, before the first headset frame
+        warm_timer = QElapsedTimer()
+        warm_timer.start()
+        self.ctx.makeCurrent(self.offs_surface)
+        con_menu_hidden = self.con_menu.is_hidden()
+        edit_menu_hidden = self.edit_menu.is_hidden()
+        self.con_menu.show_menu()
+        self.edit_menu.show_menu()
+        widgets_hidden = [w.warm_up() for w in self.qt_widget_renders]
+        self.fbo_msaa.bind()
+        w, h = self.render_target_size
+        near = self.near_plane
+        for eye_index in range(2):
+            # 90 deg field of view, menus and controllers are still at the origin
+            cam = self.camera[eye_index]
+            cam.position.setValue(SbVec3f(0, 0, 0))
+            cam.aspectRatio.setValue(1.0)
+            cam.nearDistance.setValue(near)
+            cam.farDistance.setValue(self.far_plane)
+            cam.left.setValue(-near)
+            cam.right.setValue(near)
+            cam.top.setValue(near)
+            cam.bottom.setValue(-near)
+        # look around, then at the whole world
+        for i in range(4):
+            self.camera[0].orientation.setValue(
+                SbRotation(SbVec3f(0, 1, 0), i * pi / 2))
+            self.render_offscreen(self.root_scene[0], w // 2, h)
+        self.camera[1].orientation.setValue(SbRotation())
+        self.render_offscreen(self.root_scene[1], w // 2, h)
+        for eye_index in range(2):
+            self.camera[eye_index].viewAll(self.world_separator, self.vp_reg)
+            self.render_offscreen(self.root_scene[eye_index], w // 2, h)
+        self.fbo_msaa.release()
+        if con_menu_hidden:
+            self.con_menu.hide_menu()
+        if edit_menu_hidden:
+            self.edit_menu.hide_menu()
+        for wid, hidden in zip(self.qt_widget_renders, widgets_hidden):
+            if hidden:
+                wid.hide_widget()
+        self.ctx.doneCurrent()
+        warm_time = warm_timer.nsecsElapsed() / 1e9
+        prof.stats.add_time("cache_warm_up", warm_time)
+        print(f"XR render caches prepared in {warm_time * 1000:.1f} ms")
+
+    def warm_up_tpp_scene(self):
+        # TPP scene is created when a tracker appears, render it once
+        # before its first real frame
+        self.ctx.makeCurrent(self.offs_surface)
+        self.fbo_tpp.bind()
+        self.tpp_camera.viewAll(self.world_separator, self.vp_reg)
+        self.render_offscreen(self.tpp_cam_root,
+                              self.fbo_tpp.size().width(),
+                              self.fbo_tpp.size().height())
+        self.fbo_tpp.release()
+
+    def warm_up_new_objects(self):
+        # objects created during the session wait for the next recompute,
+        # but only for a few frames, objects which do not need it are
+        # warmed up then and objects still touched are dropped
+        for key in list(self.warm_up_pending):
+            self.warm_up_pending[key] -= 1
+            if self.warm_up_pending[key] <= 0:
+                del self.warm_up_pending[key]
+                self.queue_warm_up(*key)
+
+    def queue_warm_up(self, doc_name, obj_name):
+        doc = App.listDocuments().get(doc_name)
+        obj = doc.getObject(obj_name) if doc else None
+        if obj is None or obj.ViewObject is None or obj.isTouched():
+            return
+        sched.jobs.submit("warm_up", self.warm_up_object,
+                          doc_name, obj_name, self.warm_up_generation)
+
+    def warm_up_object(self, doc_name, obj_name, generation):
+        # the object is rendered in isolation, in the slack after the frame
+        # is submitted, with its own camera into the MSAA framebuffer,
+        # the result is cleared by the next regular render
+        if generation != self.warm_up_generation:
+            return
+        doc = App.listDocuments().get(doc_name)
+        obj = doc.getObject(obj_name) if doc else None
+        if obj is None or obj.ViewObject is None:
+            return
+        root = obj.ViewObject.RootNode
+        self.ctx.makeCurrent(self.offs_surface)
+        self.fbo_msaa.bind()
+        scene = SoSeparator()
+        scene.ref()
+        cam = SoPerspectiveCamera()
+        scene.addChild(cam)
+        scene.addChild(self.environ)
+        scene.addChild(self.light)
+        scene.addChild(root)
+        cam.viewAll(root, self.vp_reg)
+        w, h = self.render_target_size
+        self.render_offscreen(scene, w // 2, h)
+        scene.unref()
+        self.fbo_msaa.release()
+        self.ctx.doneCurrent()
+
     def prepare_window(self):
         self.resize(
             self.render_target_size[0] // 4,
@@ -991,6 +1258,18 @@ class XRwidget(QOpenGLWidget):
             ),
         )
 
+        # grip button, direct grabbing of objects close to the hand
+        self.grip_action = xr.create_action(
+            action_set=self.action_set,
+            create_info=xr.ActionCreateInfo(
+                action_type=xr.ActionType.FLOAT_INPUT,
+                action_name="gripgrab",
+                localized_action_name="Grab Object with Grip Button",
+                count_subaction_paths=len(self.hand_paths),
+                subaction_paths=self.hand_paths,
+            ),
+        )
+
         pose_path = (
             xr.Path *
             hand_count)(
@@ -1013,6 +1292,29 @@ class XRwidget(QOpenGLWidget):
                 "/user/hand/right/input/trigger/value"),
         )
 
+        squeeze_value_path = (
+            xr.Path *
+            hand_count)(
+            xr.string_to_path(
+                self.instance,
+                "/user/hand/left/input/squeeze/value"),
+            xr.string_to_path(
+                self.instance,
+                "/user/hand/right/input/squeeze/value"),
+        )
+
+        # controllers with a grip button instead of an analog one
+        squeeze_click_path = (
+            xr.Path *
+            hand_count)(
+            xr.string_to_path(
+                self.instance,
+                "/user/hand/left/input/squeeze/click"),
+            xr.string_to_path(
+                self.instance,
+                "/user/hand/right/input/squeeze/click"),
+        )
+
         thumbstick_x_path = (
             xr.Path *
             hand_count)(
@@ -1071,6 +1373,8 @@ class XRwidget(QOpenGLWidget):
                 self.y_lever_action, thumbstick_y_path[1]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[0]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[1]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_value_path[0]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_value_path[1]),
 
         ]
         xr.suggest_interaction_profile_bindings(
@@ -1099,6 +1403,8 @@ class XRwidget(QOpenGLWidget):
             xr.ActionSuggestedBinding(self.y_lever_action, trackpad_y_path[1]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[0]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[1]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_click_path[0]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_click_path[1]),
 
         ]
         xr.suggest_interaction_profile_bindings(
@@ -1131,6 +1437,8 @@ class XRwidget(QOpenGLWidget):
                 self.y_lever_action, thumbstick_y_path[1]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[0]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[1]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_value_path[0]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_value_path[1]),
 
         ]
         xr.suggest_interaction_profile_bindings(
@@ -1163,6 +1471,8 @@ class XRwidget(QOpenGLWidget):
                 self.y_lever_action, thumbstick_y_path[1]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[0]),
             xr.ActionSuggestedBinding(self.grab_action, trigger_value_path[1]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_click_path[0]),
+            xr.ActionSuggestedBinding(self.grip_action, squeeze_click_path[1]),
 
         ]
         xr.suggest_interaction_profile_bindings(
@@ -1199,6 +1509,10 @@ class XRwidget(QOpenGLWidget):
                     self.grab_action, trigger_value_path[0]),
                 xr.ActionSuggestedBinding(
                     self.grab_action, trigger_value_path[1]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[0]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[1]),
 
             ]
             xr.suggest_interaction_profile_bindings(
@@ -1233,6 +1547,10 @@ class XRwidget(QOpenGLWidget):
                     self.grab_action, trigger_value_path[0]),
                 xr.ActionSuggestedBinding(
                     self.grab_action, trigger_value_path[1]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[0]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[1]),
 
             ]
             xr.suggest_interaction_profile_bindings(
@@ -1267,6 +1585,10 @@ class XRwidget(QOpenGLWidget):
                     self.grab_action, trigger_value_path[0]),
                 xr.ActionSuggestedBinding(
                     self.grab_action, trigger_value_path[1]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[0]),
+                xr.ActionSuggestedBinding(
+                    self.grip_action, squeeze_value_path[1]),
 
             ]
             xr.suggest_interaction_profile_bindings(
@@ -1420,8 +1742,16 @@ class XRwidget(QOpenGLWidget):
                         subaction_path=self.hand_paths[hand],
                     ),
                 )
+                grip_value = xr.get_action_state_float(
+                    self.session,
+                    xr.ActionStateGetInfo(
+                        action=self.grip_action,
+                        subaction_path=self.hand_paths[hand],
+                    ),
+                )
                 self.xr_con[hand].update_lever(x_lever_value, y_lever_value)
                 self.xr_con[hand].update_grab(grab_value)
+                self.xr_con[hand].update_grip(grip_value)
             else:
                 self.xr_con[hand].hide_controller()
 
@@ -1454,6 +1784,7 @@ class XRwidget(QOpenGLWidget):
                 print("A tracker with CAMERA role has been found")
                 self.setup_tpp_camera()
                 self.setup_tpp_camera_scene()
+                self.warm_up_tpp_scene()
             tracker_rot = SbRotation(
                 space_location.pose.orientation.x,
                 space_location.pose.orientation.y,
@@ -1536,11 +1867,128 @@ class XRwidget(QOpenGLWidget):
         xr.end_frame(self.session, frame_end_info)
         self.ctx.doneCurrent()
 
+    def find_teleport_target(self, controller, hover=None):
+        # the first object hit by the controller ray, snapped to the closest
+        # walkable point of the navigation surface, when committed valid only
+        # if there is room for the viewer above it, the same as find_picked_coin_object:
+        # (target or None, target coordinates in the XR space)
+        # hover - key of a pick only drawing the ray, see find_picked_doc_point
+        if not navXR.nav.is_ready():
+            # the surface is not built yet
+            return controller.find_picked_coin_object(
+                self.world_separator, self.vp_reg, self.near_plane, self.far_plane)
+        start_time = perf_counter()
+        if hover:
+            token = self.get_teleport_token()
+            entry, motion = hovXR.cache.check(hover, controller, token)
+            if motion == hovXR.REUSE:
+                target, p_coords = entry.result
+                controller.show_picked_point(p_coords if target is not None else None)
+                hovXR.cache.saved(entry, perf_counter() - start_time, motion)
+                return target, p_coords.getValue()
+        transform = self.get_doc_transf(controller.get_local_transf())
+        start, direction = docInter.get_doc_ray(transform)
+        sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+        answered = True
+        if hover and hovPick.picker.is_running():
+            answered, hit = hovPick.picker.request(
+                hover, hovPick.CONE, np.array(start), np.array(direction),
+                0.0, self.far_plane / sf)
+            info = pickIdx.index.hit_info(hit)
+        else:
+            info = pickIdx.index.pick_cone(start, direction, 0.0, self.far_plane / sf)
+            prof.stats.count("pick_casts")
+        target = None
+        if info:
+            target = self.validate_teleport_target(info['PickedPoint'], not hover)
+        p_coords = SbVec3f(0.0, 0.0, 0.0)
+        if target is not None:
+            p_coords = self.get_xr_sbvec(docInter.doc_to_coin_pnt(target))
+        controller.show_picked_point(p_coords if target is not None else None)
+        if hover and answered:
+            hovXR.cache.store(hover, controller, token, (target, p_coords),
+                              cast_time=perf_counter() - start_time)
+        return target, p_coords.getValue()
+
+    def get_teleport_token(self):
+        # hover teleport targets change with the scene and the navigation surface
+        return (pickIdx.index.version, pickIdx.index.clip_version, id(navXR.nav.surface),
+                self.get_world_token())
+
+    def validate_teleport_target(self, point, headroom=True):
+        # point - App.Vector in the document coordinates
+        # returns the closest walkable point or None
+        # headroom - check room for the viewer above the point, only when
+        # the teleport is committed, hovering reads the precomputed surface only
+        if not navXR.nav.is_ready():
+            return point
+        snapped = navXR.nav.snap(point)
+        if snapped is None:
+            return None
+        target = App.Vector(*snapped[0])
+        if not headroom:
+            return target
+        # from slightly above the floor up to the viewer height
+        sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+        above = target + App.Vector(0, 0, 10.0)
+        if pickIdx.index.pick_cone(above, App.Vector(0, 0, 1), 0.0, self.hmdpos[1] / sf):
+            return None
+        return target
+
+    def find_teleport_arc_target(self, controller, hover=None):
+        # the parabolic arc is built in the XR space, all its segments are
+        # cast at once against the pick index in the document space,
+        # it is drawn up to the first hit
+        start_time = perf_counter()
+        if hover:
+            token = self.get_teleport_token()
+            entry, motion = hovXR.cache.check(hover, controller, token)
+            if motion == hovXR.REUSE:
+                target, p_coords, pnts, count = entry.result
+                controller.show_arc(pnts, count, p_coords if target is not None else None)
+                hovXR.cache.saved(entry, perf_counter() - start_time, motion)
+                return target, p_coords.getValue()
+        start = np.array(controller.get_global_transf().translation.getValue().getValue())
+        direction = -np.array(controller.find_ray_axis().getValue())
+        pnts = movXR.teleport_arc(start, direction, conXR.arc_vertices - 1)
+        mat = SbMatrix()
+        inv = SbMatrix()
+        self.doc_xr_transform.getTranslationSpaceMatrix(mat, inv)
+        homog = np.hstack((pnts, np.ones((len(pnts), 1))))
+        doc_pnts = (homog @ np.array(inv.getValue()))[:, :3]
+        answered = True
+        if hover and hovPick.picker.is_running():
+            answered, hit = hovPick.picker.request(hover, hovPick.POLYLINE, doc_pnts)
+        else:
+            hit = pickIdx.index.cast_polyline(doc_pnts)
+            prof.stats.count("pick_casts")
+        count = len(pnts)
+        target = None
+        p_coords = SbVec3f(0.0, 0.0, 0.0)
+        if hit is not None:
+            k, point = hit
+            count = k + 2
+            pnts[k + 1] = (np.append(point, 1.0) @ np.array(mat.getValue()))[:3]
+            target = self.validate_teleport_target(App.Vector(*point), not hover)
+            if target is not None:
+                p_coords = self.get_xr_sbvec(docInter.doc_to_coin_pnt(target))
+        controller.show_arc(pnts, count, p_coords if target is not None else None)
+        if hover and answered:
+            hovXR.cache.store(hover, controller, token, (target, p_coords, pnts, count),
+                              cast_time=perf_counter() - start_time)
+        return target, p_coords.getValue()
+
     def check_teleport_jump(self):
         # teleport implementation
         hand = self.secondary_con
         con = self.xr_con[hand]
         con.make_ray_red()
+        navXR.nav.update()
+        # the arc is cast only against the pick index
+        if self.teleport_arc and pickIdx.index.enabled:
+            find_target = self.find_teleport_arc_target
+        else:
+            find_target = self.find_teleport_target
         if con.get_ray_scenegraph():
             if (con.get_buttons_states().grab_ev ==
                     conXR.AnInpEv.JUST_PRESSED):
@@ -1548,26 +1996,20 @@ class XRwidget(QOpenGLWidget):
                 con.show_ray()
             elif (con.get_buttons_states().grab_ev ==
                   conXR.AnInpEv.PRESSED):
-                # traverse just to update the ray view
-                con.find_picked_coin_object(
-                    self.world_separator,
-                    self.vp_reg,
-                    self.near_plane,
-                    self.far_plane)
+                # just to update the ray view
+                find_target(con, hover=find_target.__name__)
                 con.show_ray()
             elif (con.get_buttons_states().grab_ev ==
                   conXR.AnInpEv.JUST_RELEASED):
                 # just released
-                # do traversal only if trigger is pressed or just released,
-                # because it is expensive
-                # traverse only the world, avoid picking controller
+                # do picking only if trigger is pressed or just released,
+                # only the world, avoid picking controller
                 # gizmos or other non-world objects
-                coin_picked_point, coin_picked_p_coords = con.find_picked_coin_object(
-                    self.world_separator, self.vp_reg, self.near_plane, self.far_plane)
-                if (coin_picked_point):
+                target, target_coords = find_target(con)
+                if target is not None:
                     teleport_transform = SoTransform()
                     teleport_transform.translation.setValue(
-                        SbVec3f(coin_picked_p_coords) -
+                        SbVec3f(target_coords) -
                         self.camera[0].position.getValue() +
                         SbVec3f(
                             0.0,
@@ -1575,9 +2017,11 @@ class XRwidget(QOpenGLWidget):
                             0.0))
                     self.world_transform.combineRight(teleport_transform)
                 con.hide_ray()
+                con.hide_arc()
             elif (con.get_buttons_states().grab_ev ==
                   conXR.AnInpEv.RELEASED):
                 con.hide_ray()
+                con.hide_arc()
 
     def get_doc_transf(self, con_transf):
         # XR to FreeCAD coordinate system transformation
@@ -1612,17 +2056,151 @@ class XRwidget(QOpenGLWidget):
             vec_doc = mat_t.multMatrixVec(vec)
         return vec_doc
 
+    def get_pick_tan_angle(self):
+        # pick_camera.height is the picking diameter, at 1 m from the controller
+        return self.pick_camera.height.getValue() / 2
+
+    def find_picked_doc_point(self, controller, far_plane=None, hover=None):
+        # picks document objects and the polyline preview points around
+        # the controller ray, returns the same as find_picked_coin_object:
+        # (picked or None, point coordinates in the XR space)
+        # hover - key of a per-frame pick drawing only the ray and the sphere,
+        # it may reuse the previous result (see hoverCacheXR)
+        if far_plane is None:
+            far_plane = self.far_plane
+        if not pickIdx.index.enabled:
+            return controller.find_picked_coin_object(
+                self.cam_picking_root, self.pick_vp_reg, self.near_plane, far_plane,
+                self.pick_camera)
+        start_time = perf_counter()
+        sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+        if hover:
+            token = (pickIdx.index.version, pickIdx.index.clip_version,
+                     len(docInter.polyline_points), far_plane / sf, self.get_world_token())
+            entry, motion = hovXR.cache.check(hover, controller, token)
+            if motion == hovXR.REUSE:
+                info, p_coords = entry.result
+                controller.show_picked_point(p_coords if info else None)
+                hovXR.cache.saved(entry, perf_counter() - start_time, motion)
+                return info, p_coords.getValue()
+        transform = self.get_doc_transf(controller.get_local_transf())
+        start, direction = docInter.get_doc_ray(transform)
+        if hover and motion == hovXR.REVALIDATE:
+            # the same face still under the ray, edges and vertices
+            # do not change within the tolerance
+            info, p_coords = entry.result
+            kind, i = entry.prim
+            pnt = pickIdx.index.ray_face(i, start, direction, far_plane / sf)
+            if pnt is not None:
+                info = dict(info, PickedPoint=App.Vector(*pnt))
+                p_coords = self.get_xr_sbvec(docInter.doc_to_coin_pnt(info['PickedPoint']))
+                controller.show_picked_point(p_coords)
+                hovXR.cache.revalidated(entry, controller, (info, p_coords))
+                hovXR.cache.saved(entry, perf_counter() - start_time, motion)
+                return info, p_coords.getValue()
+        answered = True
+        if hover and hovPick.picker.is_running():
+            # the worker answers the previous frame ray
+            answered, hit = hovPick.picker.request(
+                hover, hovPick.CONE, np.array(start), np.array(direction),
+                self.get_pick_tan_angle(), far_plane / sf,
+                pickIdx.points_array(docInter.polyline_points))
+            info = pickIdx.index.hit_info(hit)
+            last_hit = None if hit is None else hit[1:3]
+        else:
+            info = pickIdx.index.pick_cone(
+                start, direction, self.get_pick_tan_angle(), far_plane / sf,
+                docInter.polyline_points)
+            prof.stats.count("pick_casts")
+            last_hit = pickIdx.index.last_hit
+        p_coords = SbVec3f(0.0, 0.0, 0.0)
+        if info:
+            p_coords = self.get_xr_sbvec(docInter.doc_to_coin_pnt(info['PickedPoint']))
+        controller.show_picked_point(p_coords if info else None)
+        if hover and answered:
+            prim = last_hit if info and last_hit and last_hit[0] == "Face" else None
+            hovXR.cache.store(hover, controller, token, (info, p_coords), prim,
+                              perf_counter() - start_time)
+        return info, p_coords.getValue()
+
+    def get_world_token(self):
+        # changes with the artificial movement and the model scale
+        return (self.world_transform.translation.getValue().getValue(),
+                self.world_transform.rotation.getValue().getValue(),
+                self.doc_xr_transform.scaleFactor.getValue().getValue())
+
     def get_picked_doc_sbvec(self, controller):
-        # finds picked point with camera pick_camera
+        # finds picked point around the controller ray
         # that can be used for feeding getObjectInfoRay - useful for lines and points
-        coin_picked_point, p_coords = controller.find_picked_coin_object(
-            self.cam_picking_root, self.pick_vp_reg, self.near_plane, self.far_plane,
-            self.pick_camera)
+        coin_picked_point, p_coords = self.find_picked_doc_point(controller)
         point_coords = None
         if coin_picked_point:
             point_coords = self.get_doc_sbvec(SbVec3f(p_coords))
         return point_coords
 
+    def get_working_plane_doc(self):
+        # working plane origin and axes in the document coordinates
+        # with the grid step, None if the plane is hidden
+        if self.geo_prev.is_working_plane_hidden():
+            return None
+        transf = self.geo_prev.plane_transform
+        pos = transf.translation.getValue()
+        rot = transf.rotation.getValue()
+        origin = self.get_doc_sbvec(pos)
+        x_dir = self.get_doc_sbvec(pos + rot.multVec(SbVec3f(1, 0, 0))) - origin
+        y_dir = self.get_doc_sbvec(pos + rot.multVec(SbVec3f(0, 1, 0))) - origin
+        x_dir.normalize()
+        y_dir.normalize()
+        return (origin.getValue(), x_dir.getValue(), y_dir.getValue(),
+                self.plane_grid_size)
+
+    def intersect_working_plane(self, controller):
+        # analytic controller ray and working plane intersection in the XR
+        # space, quantized to the plane grid, None if the plane is hidden
+        # or not in front of the controller
+        if self.geo_prev.is_working_plane_hidden():
+            return None
+        transf = self.geo_prev.plane_transform
+        pos = transf.translation.getValue()
+        normal = transf.rotation.getValue().multVec(SbVec3f(0, 0, 1))
+        start = controller.get_global_transf().translation.getValue()
+        direction = -controller.find_ray_axis()
+        denom = normal.dot(direction)
+        if abs(denom) < 1e-9:
+            return None
+        t = normal.dot(pos - start) / denom
+        if t < 0:
+            return None
+        point_coords = start + direction * t
+        if self.plane_grid_size > 0:
+            origin, x_dir, y_dir, step = self.get_working_plane_doc()
+            node = snapXR.grid_node(
+                self.get_doc_sbvec(point_coords).getValue(), origin, x_dir, y_dir, step)
+            point_coords = self.get_xr_sbvec(SbVec3f(*node))
+        return point_coords
+
+    def ray_distance(self, controller, point_coords):
+        # distance of a point in the XR space along the controller ray
+        start = controller.get_global_transf().translation.getValue()
+        return (point_coords - start).dot(-controller.find_ray_axis())
+
+    def snap_point(self, controller, point_coords):
+        # snaps a point in the XR space to document vertices, edge midpoints,
+        # the polyline points and the working plane grid
+        pnt = docInter.coin_to_doc_pnt(self.get_doc_sbvec(point_coords))
+        start, _ = docInter.get_doc_ray(
+            self.get_doc_transf(controller.get_local_transf()))
+        tan_angle = self.get_pick_tan_angle()
+        sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+        # cells of the snap hash are close to the snap radius at 1 m
+        snapXR.snapper.fit_cell_size(tan_angle * 1.0 / sf)
+        snapped, kind = snapXR.snapper.snap(
+            pnt, tan_angle * pnt.distanceToPoint(start),
+            self.get_working_plane_doc(), docInter.polyline_points)
+        if kind == snapXR.SnapKind.NONE:
+            return point_coords
+        return self.get_xr_sbvec(docInter.doc_to_coin_pnt(snapped))
+
     # the function creates a polyline with controller trigger
     # press trigger to set point
     # press another controller (the menu one) trigger to finish editing
@@ -1639,14 +2217,22 @@ class XRwidget(QOpenGLWidget):
             self.geo_prev.update_coord_label(end_doc_vtx)
             self.geo_prev.update_length_label(diff_doc_vec.length())
         far_plane = 1.0  # how far picking should happen - prevent background objects picking
-        coin_picked_point, p_coords = con.find_picked_coin_object(
-            self.cam_picking_root, self.pick_vp_reg, self.near_plane, far_plane,
-            self.pick_camera)
-        if coin_picked_point:
-            point_coords = SbVec3f(p_coords)
-            con.show_ray_ext(point_coords)
-        else:
+        point_coords = self.intersect_working_plane(con)
+        # the scene is picked only for snapping, drawing on the working plane
+        # costs the same whatever the model size
+        if self.snap_to_geometry:
+            coin_picked_point, p_coords = self.find_picked_doc_point(con, far_plane)
+            # the nearer of the object and the plane along the ray
+            if coin_picked_point and (
+                    point_coords is None
+                    or self.ray_distance(con, SbVec3f(p_coords))
+                    < self.ray_distance(con, point_coords)):
+                point_coords = SbVec3f(p_coords)
+        if point_coords is None:
             point_coords = con.show_ray_ext()
+        if self.snap_to_geometry:
+            point_coords = self.snap_point(con, point_coords)
+        con.show_ray_ext(point_coords)
         if (con.get_buttons_states().grab_ev ==
                 conXR.AnInpEv.JUST_PRESSED):
             self.geo_prev.add_polyline_node(point_coords)
@@ -1665,14 +2251,22 @@ class XRwidget(QOpenGLWidget):
         if (con.get_buttons_states().grab_ev ==
                 conXR.AnInpEv.JUST_PRESSED):
             transform = self.get_doc_transf(con.get_local_transf())
-            docInter.add_cube(transform)
+            gesture = docInter.begin_gesture("XR cube")
+            cube = docInter.add_cube(transform)
+            # resized every frame
+            self.cache_policy.set_volatile(cube)
+            self.cube_gesture = (cube.Name, gesture)
         elif (con.get_buttons_states().grab_ev ==
                 conXR.AnInpEv.PRESSED):
             transform = self.get_doc_transf(con.get_local_transf())
             docInter.resize_cube(transform)
         elif (con.get_buttons_states().grab_ev ==
-                conXR.AnInpEv.JUST_RELEASED):
-            docInter.recompute()
+                conXR.AnInpEv.JUST_RELEASED and self.cube_gesture):
+            name, gesture = self.cube_gesture
+            self.cube_gesture = None
+            sched.jobs.submit("recompute", docInter.recompute,
+                              on_done=lambda: self.on_cube_finished(name, gesture),
+                              on_error=lambda: self.on_cube_finished(name, gesture, True))
 
     # this function selects a FreeCAD model (document object)
     # also opens a menu with available actions
@@ -1711,7 +2305,10 @@ class XRwidget(QOpenGLWidget):
                     conXR.AnInpEv.JUST_PRESSED):
                 if not menu_picked_point:
                     # start editing only if the menu wasn't accidentally hit
-                    docInter.set_start_edit(transform, self.view)
+                    sched.jobs.submit("start_edit", docInter.set_start_edit,
+                                      transform, self.view,
+                                      on_done=self.on_edit_started,
+                                      on_error=self.on_edit_failed)
             elif (con.get_buttons_states().grab_ev ==
                   conXR.AnInpEv.PRESSED):
                 if not menu_picked_point:
@@ -1727,9 +2324,11 @@ class XRwidget(QOpenGLWidget):
                         if edit_mode is not docInter.EditMode.NONE:
                             self.geo_prev.set_feature_label(
                                 edit_mode, length, i_sec_xr)
+                            self.feature_prev.set_length(length)
         if (con.get_buttons_states().grab_ev ==
                 conXR.AnInpEv.JUST_RELEASED):
             self.geo_prev.clean_feature_preview()  # hide the label
+            self.feature_prev.hide_preview()
             if menu_picked_point:
                 tail = con.get_picked_tail()
                 coords = con.get_picked_tex_coords()
@@ -1738,7 +2337,9 @@ class XRwidget(QOpenGLWidget):
             else:
                 # after finishing the editing, the user has to select an object again
                 # and select the edit mode again - this should reduce confusion about active mode
-                docInter.set_finish_edit()
+                sched.jobs.submit("finish_edit", docInter.set_finish_edit,
+                                  on_done=self.cache_policy.set_stable,
+                                  on_error=self.on_edit_failed)
                 self.edit_menu.deselect_all_buttons()
                 self.edit_menu.hide_menu()
         elif (con.get_buttons_states().grab_ev ==
@@ -1746,23 +2347,114 @@ class XRwidget(QOpenGLWidget):
             con.make_ray_red()
             # if there is no intersection with menu, check the scene scenegraph
             if not menu_picked_point:
-                con.find_picked_coin_object(
-                    self.cam_picking_root, self.pick_vp_reg, self.near_plane, self.far_plane,
-                    self.pick_camera)
+                picked_point, p_coords = self.find_picked_doc_point(con, hover="select")
+                # prepare the face data of the object under the ray
+                # before the trigger is pressed
+                if (picked_point and self.edit_menu.is_hidden()
+                        and self.hover_prefetch_timer.elapsed() > hover_prefetch_interval):
+                    self.hover_prefetch_timer.restart()
+                    docInter.prefetch_hover(
+                        transform, self.view, self.get_doc_sbvec(SbVec3f(p_coords)))
+
+    def on_cube_finished(self, name, gesture, failed=False):
+        # the gesture could be already ended by the next one,
+        # only the cube is made stable, not objects of a newer gesture
+        doc = App.ActiveDocument
+        cube = doc.getObject(name) if doc else None
+        if cube:
+            self.cache_policy.set_stable(cube)
+        if failed:
+            docInter.abort_gesture(gesture)
+        else:
+            docInter.end_gesture(gesture)
+
+    def on_edit_failed(self):
+        self.feature_prev.hide_preview()
+        self.cache_policy.set_stable()
+        docInter.abort_edit()
+
+    def on_edit_started(self):
+        self.cache_policy.set_volatile(docInter.curr_feature_obj)
+        profile = docInter.get_edit_profile()
+        # the trigger could be already released
+        grab_ev = self.xr_con[self.secondary_con].get_buttons_states().grab_ev
+        if profile and grab_ev in (conXR.AnInpEv.JUST_PRESSED, conXR.AnInpEv.PRESSED):
+            self.feature_prev.set_profile(profile, docInter.edit_mode)
 
     # this function selects, then drags a FreeCAD model
     # press trigger to select object
     # move controller with trigger pressed to move the object
 
+    def interact_grip_grab(self):
+        # direct grabbing, the grip pressed close to an object selects
+        # and drags it with the hand, no ray is needed,
+        # returns True while the grip drag is in progress
+        if self.grip_hand is not None:
+            con = self.xr_con[self.grip_hand]
+            transform = self.get_doc_transf(con.get_local_transf())
+            if con.get_buttons_states().grip_ev == conXR.AnInpEv.PRESSED:
+                docInter.drag_object(transform)
+                return True
+            self.finish_grip_grab()
+            return False
+        if (self.xr_con[self.secondary_con].get_buttons_states().grab_ev !=
+                conXR.AnInpEv.RELEASED):
+            # the ray drag is in progress
+            return False
+        sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+        reach = self.grab_reach / sf
+        # nearest objects of both hands, ready for the grip press
+        for hand, con in enumerate(self.xr_con):
+            self.grip_targets[hand] = boxXR.boxes.nearest(self.get_con_doc_pos(con), reach)
+        for hand, con in enumerate(self.xr_con):
+            info = self.grip_targets[hand]
+            if (info is None or con.get_buttons_states().grip_ev !=
+                    conXR.AnInpEv.JUST_PRESSED):
+                continue
+            transform = self.get_doc_transf(con.get_local_transf())
+            selected = docInter.get_selected_draggables()
+            docInter.clear_selection()
+            docInter.select_info(info, transform)
+            if not docInter.curr_draggable_obj:
+                return False
+            self.cache_policy.set_volatile(docInter.curr_draggable_obj)
+            docInter.begin_gesture("XR grab")
+            selXR.selection.hide_highlight()
+            docInter.start_drag(selected)
+            for item in docInter.drag_overlay.items:
+                self.cache_policy.set_volatile(item.obj)
+            self.grip_hand = hand
+            return True
+        return False
+
+    def finish_grip_grab(self):
+        # the grabbed objects stay where they are, the gesture is committed
+        docInter.finish_drag()
+        docInter.end_gesture()
+        selXR.selection.show_highlight()
+        self.cache_policy.set_stable()
+        self.grip_hand = None
+
     def interact_drag_mode(self):
+        if self.interact_grip_grab():
+            return
         hand = self.secondary_con
         con = self.xr_con[hand]
         if (con.get_buttons_states().grab_ev ==
                 conXR.AnInpEv.JUST_PRESSED):
             transform = self.get_doc_transf(con.get_local_transf())
+            selected = docInter.get_selected_draggables()
             docInter.clear_selection()
             docInter.select_object(transform, self.view,
                                    self.get_picked_doc_sbvec(con))
+            self.cache_policy.set_volatile(docInter.curr_draggable_obj)
+            if docInter.curr_draggable_obj:
+                docInter.begin_gesture("XR drag")
+                # the highlight does not follow the dragged objects
+                selXR.selection.hide_highlight()
+            docInter.start_drag(selected)
+            for item in docInter.drag_overlay.items:
+                self.cache_policy.set_volatile(item.obj)
             i_sec_xr = self.get_xr_sbvec(docInter.get_sel_sbvec())
             if (i_sec_xr):
                 con.make_ray_green()
@@ -1776,13 +2468,50 @@ class XRwidget(QOpenGLWidget):
             # transform to XR coordinates
             i_sec_xr = self.get_xr_sbvec(i_sec)
             con.show_ray_ext(i_sec_xr)
+        elif (con.get_buttons_states().grab_ev ==
+              conXR.AnInpEv.JUST_RELEASED):
+            docInter.finish_drag()
+            docInter.end_gesture()
+            selXR.selection.show_highlight()
+            self.cache_policy.set_stable()
         elif (con.get_buttons_states().grab_ev ==
               conXR.AnInpEv.RELEASED):
             con.make_ray_red()
             con.show_ray()
-            con.find_picked_coin_object(
-                self.cam_picking_root, self.pick_vp_reg, self.near_plane, self.far_plane,
-                self.pick_camera)
+            self.find_picked_doc_point(con, hover="drag")
+
+    def interact_box_select(self):
+        # volume selection, the box spans between both controllers
+        # while the secondary trigger is pressed
+        con = self.xr_con[self.secondary_con]
+        grab_ev = con.get_buttons_states().grab_ev
+        if grab_ev in (conXR.AnInpEv.JUST_PRESSED, conXR.AnInpEv.PRESSED):
+            corners = [self.get_con_doc_pos(c) for c in self.xr_con]
+            boxSelXR.box_select.update(*corners)
+            text = f"Objects in the box: {len(boxSelXR.box_select.names)}"
+            if self.status_label.text != text:
+                self.status_label.set_text(text)
+        elif grab_ev == conXR.AnInpEv.JUST_RELEASED:
+            count = boxSelXR.box_select.commit()
+            self.status_label.set_text(f"Selected objects: {count}")
+        else:
+            con.make_ray_red()
+            con.show_ray()
+
+    def interact_section_box(self):
+        # the section box spans between both controllers
+        # while the secondary trigger is pressed
+        con = self.xr_con[self.secondary_con]
+        grab_ev = con.get_buttons_states().grab_ev
+        if grab_ev in (conXR.AnInpEv.JUST_PRESSED, conXR.AnInpEv.PRESSED):
+            corners = [self.get_con_doc_pos(c) for c in self.xr_con]
+            sectXR.section.set_box(*corners)
+            sectXR.section.show_outline()
+        elif grab_ev == conXR.AnInpEv.JUST_RELEASED:
+            sectXR.section.show_outline(False)
+        else:
+            con.make_ray_red()
+            con.show_ray()
 
     def interact_working_plane(self):
         # working plane implementation
@@ -1828,6 +2557,8 @@ class XRwidget(QOpenGLWidget):
                     self.con_menu.update_location(pos, rot)
                 self.hide_menu_timer.stop()
                 self.con_menu.show_menu()
+                if not self.first_menu_done:
+                    self.first_menu_pending = True
                 con.show_ray()
                 # when the menu is invoked, current document interaction
                 # like drawing something is accepted and finished
@@ -1876,6 +2607,21 @@ class XRwidget(QOpenGLWidget):
             pref.preferences().SetBool(
                 "LockToFloor", self.lock_to_floor)
             self.con_menu.lock_floor_button.select(self.lock_to_floor)
+        elif (name == "snap_geometry_button"):
+            self.snap_to_geometry = not self.snap_to_geometry
+            pref.preferences().SetBool(
+                "SnapToGeometry", self.snap_to_geometry)
+            self.con_menu.snap_geometry_button.select(self.snap_to_geometry)
+        elif (name == "teleport_arc_button"):
+            self.teleport_arc = not self.teleport_arc
+            pref.preferences().SetBool(
+                "TeleportArc", self.teleport_arc)
+            self.con_menu.teleport_arc_button.select(self.teleport_arc)
+        elif (name == "collisions_button"):
+            collXR.collider.enabled = not collXR.collider.enabled
+            pref.preferences().SetBool(
+                "Collisions", collXR.collider.enabled)
+            self.con_menu.collisions_button.select(collXR.collider.enabled)
         elif (name == "lin_speed_slider"):
             self.user_mov_speed = widget.value
             pref.preferences().SetInt("LinearSpeed",
@@ -1915,10 +2661,23 @@ class XRwidget(QOpenGLWidget):
         elif (name == "pick_drag_button"):
             self.interact_mode = InteractMode.DRAG_MODE
             self.status_label.set_text("Pick element for dragging")
+        elif (name == "section_box_button"):
+            self.interact_mode = InteractMode.SECTION_BOX
+            self.status_label.set_text("Press and span the section box with both controllers")
+        elif (name == "clear_section_button"):
+            sectXR.section.clear()
+            self.con_menu.clear_section_button.select(False)
+        elif (name == "box_select_button"):
+            self.interact_mode = InteractMode.BOX_SELECT
+            self.status_label.set_text("Press and span a box with both controllers")
         elif (name == "toggle_overlay_button"):
             for w in self.qt_widget_renders:
                 w.toggle_widget()
             self.con_menu.toggle_overlay_button.select(False)
+        elif (name == "toggle_hud_button"):
+            self.hud.toggle_hud()
+            pref.preferences().SetBool("HUDEnable", not self.hud.is_hidden())
+            self.con_menu.toggle_hud_button.select(not self.hud.is_hidden())
         elif (name == "scale_reset_button"):
             sf = 0.001
             self.doc_xr_transform.scaleFactor.setValue(sf, sf, sf)
@@ -1939,7 +2698,9 @@ class XRwidget(QOpenGLWidget):
             self.edit_menu.del_obj_button.select(
                 False)  # button not toggleable
         elif (name == "new_body_button"):
-            docInter.create_body(add_obj=True)
+            sched.jobs.submit(
+                "create_body", docInter.create_body, True,
+                on_done=lambda: self.status_label.set_text(docInter.get_selection_label()))
             self.edit_menu.new_body_button.select(False)
         elif (name == "pad_button"):
             docInter.create_pad()
@@ -1963,8 +2724,7 @@ class XRwidget(QOpenGLWidget):
             if not self.double_click_timer.hasExpired(800):  # 0.8s
                 double_click = True
             self.double_click_timer.restart()
-        widget_picked_point, widget_picked_p_coords = con.find_picked_coin_object(
-            self.qt_widgets_separator, self.vp_reg, self.near_plane, self.far_plane)
+        widget_picked_point = self.pick_qt_widgets(con, trigger_state)
         for w in self.qt_widget_renders:
             w.swap_texture()  # update 2D widgets render
             if widget_picked_point:
@@ -1982,6 +2742,31 @@ class XRwidget(QOpenGLWidget):
                 con.hide_ray()
         return widget_picked_point
 
+    def pick_qt_widgets(self, con, trigger_state):
+        # True if the ray hits a widget, the hit is kept by the controller
+        start_time = perf_counter()
+        hover = trigger_state == conXR.AnInpEv.RELEASED
+        if hover:
+            # the widgets are glued to the primary controller
+            primary = self.xr_con[self.primary_con].get_global_transf()
+            token = (primary.translation.getValue().getValue(),
+                     primary.rotation.getValue().getValue(),
+                     tuple(w.z_offset for w in self.qt_widget_renders))
+            entry, motion = hovXR.cache.check("qt_widgets", con, token)
+            if motion == hovXR.REUSE:
+                p_coords, tail, tex_coords = entry.result
+                con.show_cached_pick(p_coords, tail, tex_coords)
+                hovXR.cache.saved(entry, perf_counter() - start_time, motion)
+                return tail is not None
+        picked_point, p_coords = con.find_picked_coin_object(
+            self.qt_widgets_separator, self.vp_reg, self.near_plane, self.far_plane)
+        if hover:
+            tail = con.get_picked_tail() if picked_point else None
+            tex_coords = con.get_picked_tex_coords() if picked_point else None
+            hovXR.cache.store("qt_widgets", con, token, (SbVec3f(p_coords), tail, tex_coords),
+                              cast_time=perf_counter() - start_time)
+        return picked_point is not None
+
     def update_xr_movement(self):
         curr_time = self.frame_state.predicted_display_time / \
             1e9  # XrTime is measured in nanoseconds (int64)
@@ -1995,6 +2780,7 @@ class XRwidget(QOpenGLWidget):
             self.user_mov_speed * aux_mul
         final_rot_speed = self.frame_duration * \
             self.user_rot_speed * aux_mul
+        head_start = self.get_head_doc_pos()
         # transformation with movement at this particular moment
         # combine it with existing world transformation
         self.world_transform.combineLeft(self.mov_xr.calculate_transformation(
@@ -2010,12 +2796,39 @@ class XRwidget(QOpenGLWidget):
                                                 self.world_separator, self.vp_reg)
                 self.world_transform.translation.setValue(SbVec3f(pos.getValue()[0],
                                                                 h_diff, pos.getValue()[2]))
+        if collXR.collider.enabled:
+            # walls stop the artificial movement, the head is moved back
+            # to the allowed position
+            head_end = self.get_head_doc_pos()
+            sf = self.doc_xr_transform.scaleFactor.getValue()[0]
+            head_allowed = collXR.collider.move(head_start, head_end, sf)
+            if not np.array_equal(head_allowed, head_end):
+                shift = (self.get_xr_sbvec(SbVec3f(*head_allowed))
+                         - self.get_xr_sbvec(SbVec3f(*head_end)))
+                self.world_transform.translation.setValue(
+                    self.world_transform.translation.getValue() + shift)
+
+    def get_head_doc_pos(self):
+        # HMD position in the document coordinates
+        head = SoTransform()
+        head.translation.setValue(self.hmdpos)
+        return np.array(self.get_doc_transf(head).translation.getValue().getValue())
+
+    def get_con_doc_pos(self, con):
+        # controller position in the document coordinates
+        transform = self.get_doc_transf(con.get_local_transf())
+        return np.array(transform.translation.getValue().getValue())
 
     def update_xr_interaction(self):
         if pref.pref_updated:
             self.read_preferences()
             pref.reset_upd_flag()
         self.check_menu_selection()  # quick setting menu, primary (left) controller
+        # before any pick, objects changed while switched off are restored
+        sectXR.section.update()
+        if self.grip_hand is not None and self.interact_mode != InteractMode.DRAG_MODE:
+            # the mode was changed while grabbing
+            self.finish_grip_grab()
 
         if self.update_qt_widgets():  # Qt widgets renders, secondary controller
             return
@@ -2032,6 +2845,10 @@ class XRwidget(QOpenGLWidget):
             self.interact_drag_mode()
         elif self.interact_mode == InteractMode.WORKING_PLANE:
             self.interact_working_plane()
+        elif self.interact_mode == InteractMode.BOX_SELECT:
+            self.interact_box_select()
+        elif self.interact_mode == InteractMode.SECTION_BOX:
+            self.interact_section_box()
 
     def update_xr_views(self):
         near_plane = self.near_plane
@@ -2089,6 +2906,12 @@ class XRwidget(QOpenGLWidget):
                     1000) +
                 " ms")
 
+    def update_hud(self):
+        # documents, the active scenegraph and the section box
+        scene_token = (self.doc_observer.version, id(self.sg), pickIdx.index.clip_version)
+        self.hud.update(prof.stats, self.frame_duration, self.render_duration,
+                        self.root_scene[0], self.vp_reg, scene_token)
+
     def update_render(self):
         self.ctx.makeCurrent(self.offs_surface)
         self.poll_xr_events()
@@ -2096,11 +2919,14 @@ class XRwidget(QOpenGLWidget):
             return
         if self.start_xr_frame():
             if self.frame_state.should_render:
+                frame_timer = QElapsedTimer()
+                frame_timer.start()
                 self.update_xr_movement()
                 self.update_xr_views()
                 # execute after new velocity calculation in update_xr_movement()
                 self.update_xr_controls()
                 self.update_xr_interaction()
+                selXR.selection.update_highlight()
                 ren_timer = QElapsedTimer()
                 ren_timer.start()
                 ai = xr.SwapchainImageAcquireInfo(None)
@@ -2186,8 +3012,34 @@ class XRwidget(QOpenGLWidget):
                         self.fbo.release()
                     # update the QOpenGLWidget
                     self.update()
+                frame_time = frame_timer.nsecsElapsed() / 1e9
+                self.last_frame_time = frame_time
+                if prof.stats.frame_count == 0:
+                    prof.stats.add_time("first_frame", frame_time)
+                    print(f"First XR frame: {frame_time * 1000:.1f} ms")
+                if self.first_menu_pending:
+                    self.first_menu_pending = False
+                    self.first_menu_done = True
+                    prof.stats.add_time("first_menu_frame", frame_time)
+                    print(f"First XR menu frame: {frame_time * 1000:.1f} ms")
+                self.cache_policy.end_frame()
+                prof.stats.end_frame(frame_time,
+                                     self.frame_duration,
+                                     self.frame_state.predicted_display_period / 1e9)
                 self.ctx.doneCurrent()
             self.end_xr_frame()
+            if self.warm_up_pending:
+                self.warm_up_new_objects()
+            self.run_jobs()
+
+    def run_jobs(self):
+        # document operations in the time left before the next frame
+        if sched.jobs.pending_count():
+            budget = (self.frame_state.predicted_display_period / 1e9
+                      - self.last_frame_time)
+            sched.jobs.run(budget)
+        pending = sched.jobs.pending_count()
+        self.status_label.set_suffix(f" [{pending} pending]" if pending else "")
 
     def paintGL(self):
         if (self.tpp_cam_enabled
@@ -2223,6 +3075,20 @@ class XRwidget(QOpenGLWidget):
 
     def terminate(self):
         self.timer.stop()
+        self.timer_hud.stop()
+        floorXR.floor.clear()  # queued tile fills stop at their first step
+        self.warm_up_generation += 1  # and queued warm-ups do not render
+        self.warm_up_pending = {}
+        sched.jobs.flush()  # leave the document in the expected state
+        if self.grip_hand is not None:
+            self.finish_grip_grab()
+        docInter.end_gesture()
+        selXR.selection.stop()
+        sectXR.section.clear()
+        hovPick.picker.stop()
+        self.doc_observer.unregister()
+        self.cache_policy.restore()
+        self.view_suspender.resume()  # repaints the desktop views
         self.quit = True
         self.ctx.makeCurrent(self.offs_surface)
         if hasattr(self, 'offs_gl_logger'):
@@ -2341,3 +3207,22 @@ def reload_scenegraph():
     global xr_dock_w
     if shiboken.isValid(xr_dock_w) and xr_dock_w is not None:
         xr_dock_w.reload_scenegraph()
+
+
+def get_xr_widget():
+    global xr_dock_w
+    if shiboken.isValid(xr_dock_w) and xr_dock_w is not None:
+        return xr_dock_w.xr_widget
+    return None
+
+
+def complexity_report():
+    # measure the scenegraph shown in the headset if the session is running
+    global xr_dock_w
+    if Gui.ActiveDocument is None:
+        print("No active view!")
+        return
+    if shiboken.isValid(xr_dock_w) and xr_dock_w is not None:
+        sceneCompl.complexity_report(xr_dock_w.xr_widget.sg)
+    else:
+        sceneCompl.complexity_report()
@@ -38,10 +38,14 @@ from pivy.coin import SoBaseColor, SbColor
 from pivy.coin import SoRayPickAction, SoPickStyle
 from pivy.coin import SoSwitch, SO_SWITCH_NONE, SO_SWITCH_ALL
 
+import freecad.XR.profilerXR as prof
+
 
 LOW_STATE = 0.3
 HIGH_STATE = 0.7
 
+arc_vertices = 33  # teleport arc, 32 segments
+
 
 class AnInpEv(Enum):
     JUST_RELEASED = 1
@@ -54,10 +58,27 @@ class AnInpEv(Enum):
 class ButtonsState:
     grab: float = 0.0
     grab_ev: int = AnInpEv.RELEASED
+    grip: float = 0.0
+    grip_ev: int = AnInpEv.RELEASED
     lever_x: float = 0.0
     lever_y: float = 0.0
 
 
+def analog_event(value, event):
+    # the next event of an analog button, with hysteresis
+    if (value > HIGH_STATE):
+        if (event == AnInpEv.RELEASED
+                or event == AnInpEv.JUST_RELEASED):
+            return AnInpEv.JUST_PRESSED
+        return AnInpEv.PRESSED
+    elif (value < LOW_STATE):
+        if (event == AnInpEv.PRESSED
+                or event == AnInpEv.JUST_PRESSED):
+            return AnInpEv.JUST_RELEASED
+        return AnInpEv.RELEASED
+    return event
+
+
 class xrController:
     def __init__(self, iden=0, ray=False, log_level=logging.WARNING):
         logging.basicConfig()
@@ -107,6 +128,7 @@ class xrController:
         con_sep.addChild(unpickable)
         con_sep.addChild(con_node)
         self.controller_node.addChild(con_sep)
+        self.con_model = con_node
 
     def add_picking_ray(self):
         self.ray_vtxs = SoVertexProperty()
@@ -123,7 +145,12 @@ class xrController:
         # required since SoSwitch behaves like a node not like a separator
         ray_sep = SoSeparator()
         ray_sep.addChild(self.ray_color)
-        ray_sep.addChild(ray_line)
+        # the straight ray or the teleport arc
+        self.line_node = SoSwitch()
+        self.line_node.addChild(ray_line)
+        self.line_node.addChild(self.add_arc())
+        self.line_node.whichChild = 0
+        ray_sep.addChild(self.line_node)
         self.sph_trans = SoTranslation()
         self.sph_trans.translation.setValue(0, 0, 0)
         self.sph_node = SoSwitch()
@@ -134,6 +161,16 @@ class xrController:
         ray_sep.addChild(self.sph_node)
         self.ray_node.addChild(ray_sep)
 
+    def add_arc(self, vertices=arc_vertices):
+        # parabolic teleport arc, vertices are allocated once,
+        # only the used part is drawn
+        self.arc_vtxs = SoVertexProperty()
+        self.arc_vtxs.vertex.setNum(vertices)
+        self.arc_line = SoLineSet()
+        self.arc_line.vertexProperty = self.arc_vtxs
+        self.arc_line.numVertices.setValue(vertices)
+        return self.arc_line
+
     def make_ray_red(self):
         self.ray_color.rgb = SbColor(1, 0, 0)
 
@@ -143,6 +180,10 @@ class xrController:
     def get_controller_scenegraph(self):
         return self.controller_node
 
+    def get_model_scenegraph(self):
+        # static controller model, without transformations
+        return self.con_model
+
     def get_ray_scenegraph(self):
         return self.ray_node
 
@@ -230,6 +271,7 @@ class xrController:
         self.ray_vtxs.vertex.set1Value(1, ray_end_vec)
 
         con_pick_action.apply(separator)
+        prof.stats.count("pick_casts")
         picked_p_coords = SbVec3f(0.0, 0.0, 0.0)
         picked_point = con_pick_action.getPickedPoint()
 
@@ -248,6 +290,44 @@ class xrController:
         # returning value seems to be safer
         return picked_point, picked_p_coords.getValue()
 
+    def show_cached_pick(self, picked_p_coords, picked_tail=None, tex_coords=None):
+        # the ray and the sphere of a reused find_picked_coin_object result,
+        # picked_tail None - nothing was picked
+        if picked_tail is not None:
+            self.picked_tail = picked_tail
+            self.picked_tex_coords = SbVec4f(tex_coords)
+        self.show_picked_point(picked_p_coords if picked_tail is not None else None)
+
+    def show_picked_point(self, picked_p_coords=None):
+        # the same ray and sphere as find_picked_coin_object shows,
+        # for points picked without Coin (XR pick index)
+        ray_axis = self.find_ray_axis()
+        ray_start_vec = self.con_transform.translation.getValue()
+        self.ray_vtxs.vertex.set1Value(0, ray_start_vec)
+        self.ray_vtxs.vertex.set1Value(1, ray_start_vec - ray_axis)
+        if picked_p_coords:
+            self.sph_node.whichChild = SO_SWITCH_ALL
+            self.sph_trans.translation.setValue(picked_p_coords)
+            self.ray_vtxs.vertex.set1Value(1, picked_p_coords)
+        else:
+            self.sph_node.whichChild = SO_SWITCH_NONE
+
+    def show_arc(self, pnts, count, picked_p_coords=None):
+        # the first count points of the arc, pnts - (n, 3) array in the same
+        # space as the ray, the sphere at the target if there is one
+        self.line_node.whichChild = 1
+        self.arc_vtxs.vertex.setValues(0, count, pnts[:count].tolist())
+        self.arc_line.numVertices.setValue(count)
+        if picked_p_coords:
+            self.sph_node.whichChild = SO_SWITCH_ALL
+            self.sph_trans.translation.setValue(picked_p_coords)
+        else:
+            self.sph_node.whichChild = SO_SWITCH_NONE
+
+    def hide_arc(self):
+        # back to the straight ray
+        self.line_node.whichChild = 0
+
     def get_picked_tail(self):
         return self.picked_tail
 
@@ -275,24 +355,24 @@ class xrController:
 
     def update_grab(self, grab_value):
         self.buttons_state.grab = grab_value.current_state
-        if (self.buttons_state.grab > HIGH_STATE):
-            if (self.buttons_state.grab_ev == AnInpEv.RELEASED
-                    or self.buttons_state.grab_ev == AnInpEv.JUST_RELEASED):
-                self.buttons_state.grab_ev = AnInpEv.JUST_PRESSED
-            else:
-                self.buttons_state.grab_ev = AnInpEv.PRESSED
-        elif (self.buttons_state.grab < LOW_STATE):
-            if (self.buttons_state.grab_ev == AnInpEv.PRESSED
-                    or self.buttons_state.grab_ev == AnInpEv.JUST_PRESSED):
-                self.buttons_state.grab_ev = AnInpEv.JUST_RELEASED
-            else:
-                self.buttons_state.grab_ev = AnInpEv.RELEASED
+        self.buttons_state.grab_ev = analog_event(
+            self.buttons_state.grab, self.buttons_state.grab_ev)
 
         self.logger.debug(
             "Controller %d Grab %.2f",
             self.iden,
             self.buttons_state.grab)
 
+    def update_grip(self, grip_value):
+        self.buttons_state.grip = grip_value.current_state
+        self.buttons_state.grip_ev = analog_event(
+            self.buttons_state.grip, self.buttons_state.grip_ev)
+
+        self.logger.debug(
+            "Controller %d Grip %.2f",
+            self.iden,
+            self.buttons_state.grip)
+
     def get_local_transf(self):
         return self.con_localtransform
 
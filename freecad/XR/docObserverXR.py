@@ -0,0 +1,103 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD as App
+import FreeCADGui as Gui
+
+from enum import Enum
+
+# Document and selection change events for XR caches
+# registered as a document and a selection observer for the XR session lifetime,
+# it only forwards events to listeners, listeners should just mark
+# their data dirty and do the real work later, outside of the slot
+
+
+class DocEvent(Enum):
+    CREATED = 1
+    DELETED = 2
+    CHANGED = 3
+    RECOMPUTED = 4
+    SELECTION = 5
+
+
+class xrDocObserver:
+    def __init__(self):
+        self.listeners = []
+        # incremented on every change, cheap way to check
+        # if anything in the documents has changed since the last check
+        self.version = 0
+
+    def add_listener(self, listener):
+        # listener(event, obj, prop), obj is None for RECOMPUTED and SELECTION
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify(self, event, obj=None, prop=""):
+        self.version += 1
+        for listener in self.listeners:
+            listener(event, obj, prop)
+
+    def register(self):
+        App.addDocumentObserver(self)
+        Gui.Selection.addObserver(self)
+
+    def unregister(self):
+        App.removeDocumentObserver(self)
+        Gui.Selection.removeObserver(self)
+        self.listeners = []
+
+    # FreeCAD document observer slots
+
+    def slotCreatedObject(self, obj):
+        self.notify(DocEvent.CREATED, obj)
+
+    def slotDeletedObject(self, obj):
+        self.notify(DocEvent.DELETED, obj)
+
+    def slotChangedObject(self, obj, prop):
+        self.notify(DocEvent.CHANGED, obj, prop)
+
+    def slotRecomputedDocument(self, doc):
+        self.notify(DocEvent.RECOMPUTED)
+
+    # FreeCAD selection observer slots, selection changes do not change
+    # the documents, so the version is not incremented
+
+    def notify_selection(self):
+        for listener in self.listeners:
+            listener(DocEvent.SELECTION, None, "")
+
+    def addSelection(self, doc, obj, sub, pnt):
+        self.notify_selection()
+
+    def removeSelection(self, doc, obj, sub):
+        self.notify_selection()
+
+    def setSelection(self, doc):
+        self.notify_selection()
+
+    def clearSelection(self, doc):
+        self.notify_selection()
@@ -34,9 +34,18 @@ except ImportError:
     has_utils_assembly = False
 
 from enum import Enum
+from dataclasses import dataclass
 import math
+from time import perf_counter
 from pivy.coin import SbVec3f, SbRotation
 
+import freecad.XR.profilerXR as prof
+import freecad.XR.docObserverXR as docObs
+import freecad.XR.dragOverlayXR as dragOver
+import freecad.XR.schedulerXR as sched
+import freecad.XR.selectionXR as selXR
+import freecad.XR.pickIndexXR as pickIdx
+
 
 class BuilderMode(Enum):
     NONE = 0
@@ -60,6 +69,45 @@ con_plac_at_sel = App.Placement()
 
 polyline_cnt = 0
 cube_cnt = 0
+
+
+# topology of the selected face, obj.Shape access copies the whole shape,
+# so it is done once, not every frame
+@dataclass
+class selectionContext:
+    key: tuple = ()  # (document, object, sub-element)
+    face: object = None
+    surface: object = None
+    uv: tuple = None
+    normal: App.Vector = None
+
+
+sel_context = None
+# the same for the object under the ray, built while hovering,
+# so the trigger press does not need to access the shape
+hover_context = None
+
+# assembly solving during drag, solve() is called at most once per interval
+# or when the controller settles, with the latest dragged placement only
+# (older ones are dropped), between solves the dragged object moves
+# towards the target placement
+assembly_solve_interval = 0.1  # s, set from preferences
+settle_distance = 0.5  # mm, smaller controller moves are treated as rest
+settle_time = 0.15  # s
+target_plac = None
+solved_plac = None
+settle_plac = None
+solve_pending = False
+last_solve_time = 0.0
+last_move_time = 0.0
+drag_solves = 0
+drag_solve_time = 0.0
+
+# objects outside assemblies are moved by the Coin overlay during drag,
+# placements are committed on release
+use_drag_overlay = True  # set from preferences
+drag_overlay = dragOver.xrDragOverlay()
+drag_plt = App.Placement()  # the last controller transformation
 # distance in mm where a point will be snapped to the first point of the
 # polyline
 eps = 1.0
@@ -73,14 +121,15 @@ def set_mode(mode):
 
 def finish_building():
     if (builder_mode == BuilderMode.LINE_BUILDER):
-        add_polyline()
         global polyline_points
+        if (len(polyline_points) >= 2):
+            sched.jobs.submit("add_polyline", add_polyline, polyline_points)
         polyline_points = []
 
 
-def add_polyline():
+def add_polyline(polyline_points):
+    # scheduler job, the wire is created in the first step, recomputed in the second
     global polyline_cnt
-    global polyline_points
     if (len(polyline_points) < 2):
         return
     doc = App.ActiveDocument
@@ -103,6 +152,7 @@ def add_polyline():
         closed=is_closed,
         face=is_closed)
     polyline.Label = polyline_name
+    yield
     recompute()
 
 
@@ -120,8 +170,10 @@ def add_cube(transf):
     cube_name = 'Cube' + str(cube_cnt)
     cube_cnt = cube_cnt + 1
     doc.addObject("Part::Box", cube_name)
-    doc.getObject(cube_name).Placement = coin_to_doc_placement(transf)
-    recompute()
+    cube = doc.getObject(cube_name)
+    cube.Placement = coin_to_doc_placement(transf)
+    sched.jobs.submit("recompute", recompute)
+    return cube
 
 
 def resize_cube(transf):
@@ -147,33 +199,108 @@ def resize_cube(transf):
         cube.Height = lz if lz > 0 else 1
 
 
-def select_object(transform, view, point_coords=None):
-    doc = App.ActiveDocument
+def get_doc_ray(transform):
+    # controller ray start and direction in the document coordinates
     rot = transform.rotation.getValue()
     ray_axis = rot.multVec(SbVec3f(0, 0, 1))
-    vec_start = coin_to_doc_pnt(transform.translation.getValue())
+    return coin_to_doc_pnt(transform.translation.getValue()), coin_to_doc_pnt(-ray_axis)
+
+
+def get_object_info_ray(transform, view, point_coords=None):
+    vec_start, vec_dir = get_doc_ray(transform)
     if point_coords:
         # overwrite direction, for picking lines and points
         # selecting them with a controller ray is almost impossible
         vec_dir = coin_to_doc_pnt(point_coords) - vec_start
-    else:
-        vec_dir = coin_to_doc_pnt(-ray_axis)
+    # the XR pick index first, the desktop view pick path only if it misses
+    # or the ray crosses an object the index does not read (e.g. a mesh)
+    # in front of its hit
+    info = pickIdx.index.pick(vec_start, vec_dir)
+    if info and not pickIdx.index.unindexed_hit(
+            vec_start, vec_dir, (info['PickedPoint'] - vec_start).Length):
+        prof.stats.count("pick_index_hits")
+        return info
+    prof.stats.count("pick_index_misses")
     # Document objects picking, Base::Vector is needed, not SbVec3f
-    info = view.getObjectInfoRay(vec_start, vec_dir)
+    coin_info = view.getObjectInfoRay(vec_start, vec_dir)
+    if info and coin_info:
+        # the nearer of the two hits
+        if ((coin_info['PickedPoint'] - vec_start).Length
+                >= (info['PickedPoint'] - vec_start).Length):
+            return info
+    return coin_info or info
+
+
+def build_sel_context(key, pnt, context=None):
+    # context - already built one for the same key, only the point is updated
+    if context is None:
+        context = selectionContext(key=key)
+        doc_name, obj_name, sub = key
+        doc = App.getDocument(doc_name)
+        obj = doc.getObject(obj_name) if doc else None
+        if obj and sub.startswith('Face') and hasattr(obj, 'Shape'):
+            # FreeCAD face index starts at 1
+            context.face = obj.Shape.Faces[int(sub.split('Face')[1]) - 1]
+            context.surface = context.face.Surface
+    if context.face:
+        context.uv = context.surface.parameter(pnt)
+        context.normal = context.face.normalAt(*context.uv)
+    return context
+
+
+def on_doc_event(event, obj, prop):
+    # contexts are dropped on recompute, selection change
+    # or when the object of the context moves
+    global sel_context, hover_context
+    if event == docObs.DocEvent.RECOMPUTED:
+        sel_context = None
+        hover_context = None
+    elif event == docObs.DocEvent.SELECTION:
+        # the XR selection pushed to Gui.Selection, the context is still valid
+        if not selXR.selection.syncing:
+            sel_context = None
+    elif event == docObs.DocEvent.CHANGED and prop in ('Placement', 'Shape'):
+        if sel_context and sel_context.key[1] == obj.Name:
+            sel_context = None
+        if hover_context and hover_context.key[1] == obj.Name:
+            hover_context = None
+
+
+def prefetch_hover(transform, view, point_coords=None):
+    global hover_context
+    info = get_object_info_ray(transform, view, point_coords)
+    if not info:
+        return
+    key = (info['Document'], info['Object'], info['Component'])
+    if hover_context and hover_context.key == key:
+        return
+    hover_context = build_sel_context(key, info['PickedPoint'])
+
+
+def select_object(transform, view, point_coords=None):
+    info = get_object_info_ray(transform, view, point_coords)
+    if (info):
+        select_info(info, transform)
+
+
+def select_info(info, transform):
+    # info - dict like View3DInventor.getObjectInfoRay, from a ray or a proximity query
+    doc = App.ActiveDocument
     if (info):
         sect_pt = info['PickedPoint']
-        Gui.Selection.addSelection(
-            info['Document'],
-            info['Object'],
-            info['Component'],
-            sect_pt.x,
-            sect_pt.y,
-            sect_pt.z)
         global curr_sel, curr_obj, sel_pnt, curr_draggable_obj
         global con_plac_at_sel, obj_plac_at_sel, draggable_obj_plac_at_sel
+        global sel_context
         curr_sel = info
         curr_obj = doc.getObject(info['Object'])
         sel_pnt = sect_pt
+        key = (info['Document'], info['Object'], info['Component'])
+        if hover_context and hover_context.key == key:
+            sel_context = build_sel_context(key, sect_pt, hover_context)
+        else:
+            sel_context = build_sel_context(key, sect_pt)
+        # Gui.Selection is updated later, the face is reused for the highlight
+        selXR.selection.add(*key, sect_pt, sel_context.face)
         con_plac_at_sel = coin_to_doc_placement(transform)
         if hasattr(curr_obj, 'Placement'):
             obj_plac_at_sel = curr_obj.Placement
@@ -229,7 +356,7 @@ def select_object(transform, view, point_coords=None):
 
 
 def clear_selection():
-    Gui.Selection.clearSelection()
+    selXR.selection.clear()
     global curr_sel, curr_obj, curr_draggable_obj
     curr_obj = None
     curr_sel = None
@@ -243,23 +370,161 @@ def deselect_body():
 
 def get_selection_label():
     s = ""
-    sub = ""
     body_label = ""
-    selection = Gui.Selection.getSelectionEx()
-    if len(selection):
-        obj = selection[0].Object
-        if obj:
-            subs = selection[0].SubElementNames
-            if len(subs):
-                sub = subs[0]
-            doc = App.ActiveDocument
-            body = get_active_body()
-            if body:
-                body_label = body.Label
-            s = "Sel: " + obj.Name + ", " + sub + " [Body: " + body_label + "]"
+    obj, sub = selXR.selection.get_first()
+    if obj:
+        body = get_active_body()
+        if body:
+            body_label = body.Label
+        s = "Sel: " + obj.Name + ", " + sub + " [Body: " + body_label + "]"
     return s
 
 
+# gestures (a drag, a cube resize, a pad/pocket edit) change properties
+# every frame, all the changes of one gesture go to a single undo transaction
+# jobs finishing a gesture later pass its number, so they end only that one
+gesture_name = None
+gesture_number = 0
+gesture_rss = 0
+gesture_undo_count = 0
+last_gesture_rss_delta = 0  # kB
+
+
+def begin_gesture(name):
+    # returns the gesture number or None
+    global gesture_name, gesture_rss, gesture_undo_count, gesture_number
+    doc = App.ActiveDocument
+    if doc is None:
+        return None
+    if gesture_name:
+        end_gesture()
+    gesture_name = name
+    gesture_number += 1
+    gesture_rss = prof.get_rss_kb()
+    gesture_undo_count = doc.UndoCount
+    doc.openTransaction(name)
+    return gesture_number
+
+
+def is_gesture_open(number=None):
+    # number=None - any gesture
+    return bool(gesture_name) and (number is None or number == gesture_number)
+
+
+def end_gesture(number=None):
+    # number=None - the open gesture, whichever it is
+    global gesture_name, last_gesture_rss_delta
+    if not is_gesture_open(number):
+        return
+    doc = App.ActiveDocument
+    if doc:
+        doc.commitTransaction()
+        prof.stats.count("gesture_undo_steps", doc.UndoCount - gesture_undo_count)
+    last_gesture_rss_delta = prof.get_rss_kb() - gesture_rss
+    prof.stats.count("gestures")
+    prof.stats.count("gesture_rss_kb", last_gesture_rss_delta)
+    gesture_name = None
+    # the desktop views see the selection the gesture ended with
+    selXR.selection.flush()
+
+
+def abort_gesture(number=None):
+    # a failed gesture is rolled back, nothing half-applied stays in the document
+    global gesture_name
+    if not is_gesture_open(number):
+        return
+    doc = App.ActiveDocument
+    if doc:
+        doc.abortTransaction()
+    prof.stats.count("gestures_aborted")
+    gesture_name = None
+    selXR.selection.flush()
+
+
+def get_active_assembly():
+    if has_utils_assembly:
+        return UtilsAssembly.activeAssembly()
+    return None
+
+
+def get_selected_draggables():
+    return [o for o in selXR.selection.get_objects() if hasattr(o, 'Placement')]
+
+
+def start_drag(selected=()):
+    # selected - objects selected before the drag, dragged together
+    # if the picked object is one of them
+    global target_plac, solved_plac, settle_plac, solve_pending
+    global last_solve_time, last_move_time, drag_solves, drag_solve_time
+    global drag_plt
+    drag_plt = App.Placement()
+    if use_drag_overlay and curr_draggable_obj and not get_active_assembly():
+        objs = [curr_draggable_obj]
+        if curr_draggable_obj.Name in [o.Name for o in selected]:
+            objs = selected
+        drag_overlay.start(objs)
+    target_plac = None
+    settle_plac = None
+    solved_plac = draggable_obj_plac_at_sel
+    solve_pending = False
+    last_solve_time = last_move_time = perf_counter()
+    drag_solves = 0
+    drag_solve_time = 0.0
+
+
+def solve_assembly(assembly):
+    global solved_plac, solve_pending, last_solve_time, drag_solves, drag_solve_time
+    curr_draggable_obj.Placement = target_plac
+    start = perf_counter()
+    assembly.solve()
+    last_solve_time = perf_counter()
+    prof.stats.add_time("assembly_solve", last_solve_time - start)
+    drag_solve_time += last_solve_time - start
+    drag_solves += 1
+    # joints can correct the dragged placement
+    solved_plac = curr_draggable_obj.Placement
+    solve_pending = False
+
+
+def drag_assembly(assembly, plac):
+    global target_plac, settle_plac, solve_pending, last_move_time
+    now = perf_counter()
+    if target_plac is None or not plac.isSame(target_plac, 1e-6):
+        target_plac = plac  # latest wins
+        solve_pending = True
+    if settle_plac is None or not plac.isSame(settle_plac, settle_distance):
+        settle_plac = plac
+        last_move_time = now
+    if not solve_pending:
+        return
+    if (now - last_solve_time >= assembly_solve_interval
+            or now - last_move_time >= settle_time):
+        solve_assembly(assembly)
+    else:
+        # transient placement, not solved
+        t = (now - last_solve_time) / assembly_solve_interval
+        curr_draggable_obj.Placement = solved_plac.slerp(target_plac, t)
+
+
+def finish_drag():
+    if drag_overlay.is_active():
+        if drag_plt.isIdentity():
+            drag_overlay.cancel()  # nothing to commit
+        else:
+            drag_overlay.commit(App.ActiveDocument, drag_plt)
+        return
+    # the last placement is always solved
+    if not curr_draggable_obj:
+        return
+    assembly = get_active_assembly()
+    if assembly and solve_pending:
+        solve_assembly(assembly)
+    if drag_solves:
+        prof.stats.count("assembly_drags")
+        prof.stats.count("assembly_drag_solves", drag_solves)
+        prof.stats.add_time("assembly_drag_solve_time", drag_solve_time)
+
+
 def drag_object(transform):
     con_plac = coin_to_doc_placement(transform)
     old_obj_plac = draggable_obj_plac_at_sel
@@ -268,11 +533,16 @@ def drag_object(transform):
     plt_con = con_plac * old_con_plac.inverse()
     # calculate the selected obj new placement
     draggable_obj_plac = plt_con * old_obj_plac
-    if (curr_draggable_obj):
-        curr_draggable_obj.Placement = draggable_obj_plac
-        if has_utils_assembly:
-            if UtilsAssembly.activeAssembly():
-                UtilsAssembly.activeAssembly().solve()
+    if drag_overlay.is_active():
+        global drag_plt
+        drag_plt = plt_con
+        drag_overlay.update(plt_con)
+    elif (curr_draggable_obj):
+        assembly = get_active_assembly()
+        if assembly:
+            drag_assembly(assembly, draggable_obj_plac)
+        else:
+            curr_draggable_obj.Placement = draggable_obj_plac
     # calculate the selection point new location
     s_pnt = plt_con * sel_pnt
     return s_pnt
@@ -281,21 +551,15 @@ def drag_object(transform):
 
 
 def find_normal_sel():
-    selection = Gui.Selection.getSelectionEx()
-    obj = selection[0].Object
-    subs = selection[0].SubElementNames
-    if not len(subs):
-        return None
-    sub = subs[0]
-    if sub.startswith('Face'):
-        face_index = int(sub.split('Face')[1])
-        # FreeCAD face index starts at 1
-        face = obj.Shape.Faces[face_index - 1]
-        u, v = face.Surface.parameter(sel_pnt)
-        normal = face.normalAt(u, v)
-        return normal
-    else:
-        return None
+    global sel_context
+    if sel_context is None:
+        # selection not made by select_object, eg. in the desktop window
+        obj, sub = selXR.selection.get_first()
+        if not obj or not sub:
+            return None
+        sel_context = build_sel_context(
+            (obj.Document.Name, obj.Name, sub), sel_pnt)
+    return sel_context.normal
 
 
 def get_sel_sbvec():
@@ -389,6 +653,16 @@ curr_feature_obj = None
 edit_sel_pnt = None
 edit_started = False
 length = 0
+# found once at the edit start, not in every frame
+edit_normal = None  # in the object coordinates, for the feature direction
+edit_plane_normal = None  # in the global coordinates
+# (points, triangles, base point, normal) of the unit length prism
+# extruded from the selected face, used for the feature preview
+edit_profile = None
+# if the preview cannot be built, the feature is recomputed at most
+# once per interval (s), the final recompute happens in set_finish_edit
+edit_recompute_interval = 0.25
+last_edit_recompute = 0.0
 
 
 def get_active_body():
@@ -412,10 +686,10 @@ def update_edit_transf(transform):
     s_pnt = plt_con * edit_sel_pnt
 
     global length
-    normal = find_normal_sel()
+    normal = edit_normal
     if normal:
         # we assume the feature is extended in normal direction to selection
-        length = s_pnt.distanceToPlane(edit_sel_pnt, normal)
+        length = s_pnt.distanceToPlane(edit_sel_pnt, edit_plane_normal)
     else:
         return
     if edit_mode == EditMode.PAD:
@@ -443,19 +717,21 @@ def update_edit_transf(transform):
             curr_feature_obj.Reversed = False
         else:
             curr_feature_obj.Reversed = True
-        recompute()
+        if not edit_profile:
+            global last_edit_recompute
+            now = perf_counter()
+            if now - last_edit_recompute > edit_recompute_interval:
+                last_edit_recompute = now
+                with prof.timed("edit_recompute"):
+                    recompute()
 
     return s_pnt
 
 
 def set_start_edit(transform, view):
+    # scheduler job, split into picking, body and feature creation steps
     doc = App.ActiveDocument
-    rot = transform.rotation.getValue()
-    ray_axis = rot.multVec(SbVec3f(0, 0, 1))
-    vec_start = coin_to_doc_pnt(transform.translation.getValue())
-    vec_dir = coin_to_doc_pnt(-ray_axis)
-    # Document objects picking, Base::Vector is needed, not SbVec3f
-    info = view.getObjectInfoRay(vec_start, vec_dir)
+    info = get_object_info_ray(transform, view)
     global edit_sel_pnt
     edit_sel_pnt = None
     if (info):
@@ -465,23 +741,27 @@ def set_start_edit(transform, view):
     global initial_edit_plac
     initial_edit_plac = coin_to_doc_placement(transform)
     global curr_feature_obj, curr_obj
-    selection = Gui.Selection.getSelectionEx()
-    curr_obj = selection[0].Object
+    curr_obj, sel_sub = selXR.selection.get_first()
     if not curr_obj:
         print("Pad failed, no object selected")
         return
+    # curr_obj can be replaced with a sketch while adding to the body
+    sel_obj = curr_obj
+    if edit_mode == EditMode.PAD or edit_mode == EditMode.POCKET:
+        begin_gesture("XR " + edit_mode.name.lower())
+    yield
     curr_feature_obj = None
     sub_objs = ['',]
     if (curr_obj.TypeId == 'PartDesign::Pad'
             or curr_obj.TypeId == 'PartDesign::Pocket'):
-        subs = selection[0].SubElementNames
-        if len(subs):
-            sub_objs = [subs[0],]
+        if sel_sub:
+            sub_objs = [sel_sub,]
     if edit_mode == EditMode.PAD:
         body = find_add_body()
         if not curr_obj:  # asking again, since adding obj to the Body might fail
             print(f"Pad failed, no object added to {body.Label}")
             return
+        yield
         curr_feature_obj = body.newObject('PartDesign::Pad', 'Pad')
         curr_feature_obj.Profile = (curr_obj, sub_objs)
         curr_obj.ViewObject.Visibility = False
@@ -496,27 +776,53 @@ def set_start_edit(transform, view):
             print("Pocket failed, no object selected")
             return
         add_obj_to_body
+        yield
         curr_feature_obj = body.newObject('PartDesign::Pocket', 'Pocket')
         curr_feature_obj.Profile = (curr_obj, sub_objs)
         curr_obj.ViewObject.Visibility = False
         curr_feature_obj.ViewObject.Visibility = True
+    global edit_normal, edit_plane_normal, edit_profile, last_edit_recompute
+    # shapes are copied here once, the drag uses cached results
+    edit_normal = find_normal_sel()
+    edit_profile = None
+    edit_plane_normal = edit_normal
+    if edit_normal:
+        edit_profile, edit_plane_normal = build_edit_profile(
+            sel_obj, sel_sub, edit_normal)
+    last_edit_recompute = 0.0
     global edit_started
     edit_started = True
 
 
 def set_finish_edit():
-    global edit_started
-    global edit_mode
     if edit_started:
         if (edit_mode == EditMode.PAD
                 or edit_mode == EditMode.POCKET):
             edit_sel_pnt = None
-            recompute()
-        edit_started = False
-        edit_mode = EditMode.NONE
-        global curr_feature_obj, curr_obj
-        curr_obj = None
-        curr_feature_obj = None
+            # the only full recompute if the preview was shown
+            with prof.timed("edit_recompute"):
+                recompute()
+        clear_edit()
+    end_gesture()
+
+
+def abort_edit():
+    # error handler of the edit jobs, the feature is removed with the gesture
+    clear_edit()
+    abort_gesture()
+
+
+def clear_edit():
+    global edit_started, edit_mode
+    global edit_normal, edit_plane_normal, edit_profile
+    global curr_feature_obj, curr_obj
+    edit_normal = None
+    edit_plane_normal = None
+    edit_profile = None
+    edit_started = False
+    edit_mode = EditMode.NONE
+    curr_obj = None
+    curr_feature_obj = None
 
 
 def create_pad():
@@ -533,6 +839,34 @@ def get_edit_info():
     return edit_mode, length
 
 
+def get_edit_profile():
+    return edit_profile
+
+
+def build_edit_profile(obj, sub, normal):
+    # the face in the global coordinates extruded to the unit length prism,
+    # tessellated once, the preview scales it along the normal during drag
+    plane_normal = App.Vector(normal)
+    if not sub.startswith('Face'):
+        return None, plane_normal
+    face_index = int(sub.split('Face')[1])
+    if face_index > len(obj.Shape.Faces):
+        return None, plane_normal
+    face = obj.Shape.Faces[face_index - 1].copy()
+    parent = obj.getParentGeoFeatureGroup()
+    if parent:
+        parent_plac = parent.getGlobalPlacement()
+        face.Placement = parent_plac.multiply(face.Placement)
+        plane_normal = parent_plac.Rotation.multVec(plane_normal)
+    try:
+        prism = face.extrude(plane_normal)
+    except Part.OCCError:
+        return None, plane_normal
+    tolerance = max(prism.BoundBox.DiagonalLength * 0.002, 0.01)
+    points, triangles = prism.tessellate(tolerance)
+    return (points, triangles, face.Vertexes[0].Point, plane_normal), plane_normal
+
+
 def create_body(add_obj=False):
     doc = App.ActiveDocument
     body = doc.addObject("PartDesign::Body", "Body")
@@ -543,9 +877,8 @@ def create_body(add_obj=False):
 
 
 def delete_sel_obj():
-    selection = Gui.Selection.getSelectionEx()
-    if len(selection):
-        obj = selection[0].Object
+    obj, sub = selXR.selection.get_first()
+    if obj:
         doc = App.ActiveDocument
         print("Deleting object:", obj.Name)
         doc.removeObject(obj.Name)
@@ -0,0 +1,93 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from pivy.coin import SoTransform, SbVec3f, SbRotation
+
+# Transient drag overlay
+# while dragging, the controller movement is applied to SoTransform nodes
+# inserted at the beginning of the dragged objects' view provider roots,
+# so neither the document, the tree view nor the undo stack see any change,
+# placements are written once, in a single transaction, on release
+
+
+class dragItem:
+    def __init__(self, obj):
+        self.obj = obj
+        self.start_plac = obj.Placement
+        # placement of the coordinate system the object's placement is in
+        self.parent_plac = obj.getGlobalPlacement().multiply(obj.Placement.inverse())
+        self.parent_plac_inv = self.parent_plac.inverse()
+        self.root = obj.ViewObject.RootNode
+        self.transform = SoTransform()
+        # the first child of the root is the outermost transformation
+        self.root.insertChild(self.transform, 0)
+
+    def get_delta(self, plt):
+        # plt - transformation in the global coordinates
+        return self.parent_plac_inv.multiply(plt).multiply(self.parent_plac)
+
+    def update(self, plt):
+        delta = self.get_delta(plt)
+        q = delta.Rotation.Q
+        self.transform.rotation.setValue(SbRotation(q[0], q[1], q[2], q[3]))
+        self.transform.translation.setValue(
+            SbVec3f(delta.Base.x, delta.Base.y, delta.Base.z))
+
+    def remove(self):
+        index = self.root.findChild(self.transform)
+        if index >= 0:
+            self.root.removeChild(index)
+
+
+class xrDragOverlay:
+    def __init__(self):
+        self.items = []
+
+    def is_active(self):
+        return len(self.items) > 0
+
+    def start(self, objs):
+        self.cancel()
+        for obj in objs:
+            if obj and hasattr(obj, 'Placement') and obj.ViewObject:
+                self.items.append(dragItem(obj))
+
+    def update(self, plt):
+        for item in self.items:
+            item.update(plt)
+
+    def commit(self, doc, plt):
+        # all placements in one undo step, the gesture transaction if opened
+        own_transaction = not doc.HasPendingTransaction
+        if own_transaction:
+            doc.openTransaction("XR drag")
+        for item in self.items:
+            item.obj.Placement = item.get_delta(plt).multiply(item.start_plac)
+            item.remove()
+        if own_transaction:
+            doc.commitTransaction()
+        self.items = []
+
+    def cancel(self):
+        for item in self.items:
+            item.remove()
+        self.items = []
@@ -0,0 +1,238 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+from pivy.coin import SbVec3f, SbMatrix
+
+import math
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.schedulerXR as sched
+
+# Floor height cache for the lock-to-floor movement
+# a heightfield over the document XY plane (Z is up in the document), every
+# grid node keeps heights of all surfaces crossed by a vertical line, so
+# multi-storey buildings work, nodes are filled in tiles with vectorized
+# queries of many vertical rays against the triangles of the XR pick index
+# tiles around the user are filled ahead by scheduler jobs, in steps
+# fitting the frame slack, until a tile is ready the caller picks the
+# scene as before, tiles under objects re-read by the index are dropped
+# surfaces outside of the section box are skipped at lookup
+
+
+class xrFloorCache:
+    def __init__(self, index, cell_size=100.0, tile_cells=32):
+        self.enabled = True
+        self.index = index  # xrPickIndex, source of the triangles
+        self.cell_size = cell_size  # mm
+        self.tile_cells = tile_cells
+        self.tiles = {}  # (i, j) -> list of sorted heights of tile nodes
+        self.pending = set()  # keys of tiles being filled by jobs
+        # incremented when filled tiles become invalid, running jobs stop
+        self.generation = 0
+        self.bounds = {}  # object name -> (stamp, xy min, xy max)
+        self.index_version = -1
+        self.doc_xr_transform = None
+
+    def set_transform(self, doc_xr_transform):
+        # the document to XR transformation node (scale, Z up to Y up)
+        self.doc_xr_transform = doc_xr_transform
+
+    def set_cell_size(self, cell_size):
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.clear()
+
+    def clear(self):
+        self.tiles = {}
+        self.pending = set()
+        self.generation += 1
+        self.bounds = {}
+        self.index_version = -1
+
+    def is_ready(self):
+        return (self.enabled and self.doc_xr_transform is not None
+                and self.index.sg is not None)
+
+    # invalidation
+
+    def update(self):
+        index = self.index
+        index.update()
+        if index.version == self.index_version:
+            return
+        self.index_version = index.version
+        # jobs would mix triangles of the old and the new index
+        self.pending = set()
+        self.generation += 1
+        changed = []
+        for name in list(self.bounds):
+            block = index.blocks.get(name)
+            if block is None or block.stamp != self.bounds[name][0]:
+                changed.append(self.bounds.pop(name))
+        for name, block in index.blocks.items():
+            if name not in self.bounds and len(block.tris):
+                xy = block.tris[:, :, :2].reshape(-1, 2)
+                self.bounds[name] = (block.stamp, xy.min(axis=0), xy.max(axis=0))
+                changed.append(self.bounds[name])
+        tile_size = self.cell_size * self.tile_cells
+        for _, lo, hi in changed:
+            i0, j0 = np.floor(lo / tile_size).astype(int)
+            i1, j1 = np.floor(hi / tile_size).astype(int)
+            for key in [k for k in self.tiles
+                        if i0 <= k[0] <= i1 and j0 <= k[1] <= j1]:
+                del self.tiles[key]
+                prof.stats.count("floor_tiles_dropped")
+
+    # filling
+
+    def request_tile(self, key):
+        if key not in self.tiles and key not in self.pending:
+            self.pending.add(key)
+            sched.jobs.submit("floor_tile", self.fill_tile, key, self.generation)
+
+    def fill_tile(self, key, generation):
+        # scheduler job, heights at (tile_cells + 1)^2 nodes of the tile,
+        # all vertical rays of the tile are cast at once against a part
+        # of the triangles over the tile in every step
+        if generation != self.generation:
+            return
+        tile_size = self.cell_size * self.tile_cells
+        n = self.tile_cells + 1
+        gx, gy = np.meshgrid(key[0] * tile_size + np.arange(n) * self.cell_size,
+                             key[1] * tile_size + np.arange(n) * self.cell_size,
+                             indexing='ij')
+        nodes = np.stack((gx.ravel(), gy.ravel()), axis=1)
+        heights = [[] for _ in range(len(nodes))]
+        tris = self.tile_triangles(nodes.min(axis=0), nodes.max(axis=0))
+        e1 = tris[:, 1] - tris[:, 0]
+        e2 = tris[:, 2] - tris[:, 0]
+        det = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+        # vertical triangles (walls) cannot be stood on
+        ok = np.abs(det) > 1e-9
+        a, e1, e2, det = tris[ok, 0], e1[ok], e2[ok], det[ok]
+        # limit the memory of the nodes x triangles arrays,
+        # so a step fits the frame slack
+        step = max(1, 50000 // len(nodes))
+        for s in range(0, len(a), step):
+            yield
+            if generation != self.generation:
+                return
+            with prof.timed("floor_cache_fill"):
+                part = slice(s, s + step)
+                self.vertical_hits(nodes, a[part], e1[part], e2[part], det[part], heights)
+        self.pending.discard(key)
+        self.tiles[key] = [np.sort(np.array(h)) for h in heights]
+        prof.stats.count("floor_cache_tiles")
+
+    def tile_triangles(self, lo, hi):
+        # triangles of the pick index over the XY rectangle lo-hi
+        index = self.index
+        if not hasattr(index, 'tri_index'):
+            return np.zeros((0, 3, 3))
+        ids = index.tri_index.box_candidates(np.array([lo[0], lo[1], -np.inf]),
+                                             np.array([hi[0], hi[1], np.inf]))
+        return index.tris[ids]
+
+    def vertical_hits(self, nodes, a, e1, e2, det, heights):
+        # 2D point in triangle test of all nodes against all triangles,
+        # barycentric interpolation of the hit height
+        px = nodes[:, 0:1] - a[:, 0]
+        py = nodes[:, 1:2] - a[:, 1]
+        u = (px * e2[:, 1] - py * e2[:, 0]) / det
+        v = (py * e1[:, 0] - px * e1[:, 1]) / det
+        inside = (u >= 0) & (v >= 0) & (u + v <= 1)
+        node_idx, tri_idx = np.nonzero(inside)
+        z = (a[tri_idx, 2] + u[node_idx, tri_idx] * e1[tri_idx, 2]
+             + v[node_idx, tri_idx] * e2[tri_idx, 2])
+        for i, h in zip(node_idx.tolist(), z.tolist()):
+            heights[i].append(h)
+
+    # lookup
+
+    def node_height(self, tile, i, j, top, bottom):
+        # the highest surface of the node between bottom and top
+        tc = self.tile_cells
+        heights = tile[(i % tc) * (tc + 1) + (j % tc)]
+        if self.index.clip_lo is not None and len(heights):
+            pnts = np.column_stack((np.full(len(heights), i * self.cell_size),
+                                    np.full(len(heights), j * self.cell_size), heights))
+            heights = heights[self.index.clip_mask(pnts)]
+        k = np.searchsorted(heights, top, side='right') - 1
+        if k < 0 or heights[k] < bottom:
+            return None
+        return heights[k]
+
+    def prefetch(self, ti, tj):
+        # the tile of the user first, then the tiles around
+        self.request_tile((ti, tj))
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                self.request_tile((ti + di, tj + dj))
+
+    def floor_height(self, x, y, top, bottom):
+        # document coordinates, bilinear interpolation of the four nodes
+        # around the point, missing nodes (edges of floors) are skipped
+        # returns (ready, height or None), not ready until the tiles are filled
+        self.update()
+        fx = x / self.cell_size
+        fy = y / self.cell_size
+        i = math.floor(fx)
+        j = math.floor(fy)
+        tx = fx - i
+        ty = fy - j
+        tc = self.tile_cells
+        self.prefetch(i // tc, j // tc)
+        total = 0.0
+        weight = 0.0
+        for di, dj, w in ((0, 0, (1 - tx) * (1 - ty)), (1, 0, tx * (1 - ty)),
+                          (0, 1, (1 - tx) * ty), (1, 1, tx * ty)):
+            if w > 0:
+                tile = self.tiles.get(((i + di) // tc, (j + dj) // tc))
+                if tile is None:
+                    return False, None
+                h = self.node_height(tile, i + di, j + dj, top, bottom)
+                if h is not None:
+                    total += h * w
+                    weight += w
+        if weight == 0:
+            return True, None
+        return True, total / weight
+
+    def find_floor(self, start, length):
+        # start - point in the XR space, the floor is searched downwards
+        # up to length (m), returns (ready, the XR height of the floor or None)
+        mat = SbMatrix()
+        inv = SbMatrix()
+        self.doc_xr_transform.getTranslationSpaceMatrix(mat, inv)
+        x, y, z = inv.transpose().multMatrixVec(start).getValue()
+        scale = self.doc_xr_transform.scaleFactor.getValue()[0]
+        ready, h = self.floor_height(x, y, z, z - length / scale)
+        if h is None:
+            return ready, None
+        return True, mat.transpose().multMatrixVec(SbVec3f(x, y, h)).getValue()[1]
+
+
+# the floor of the pick index scene
+floor = xrFloorCache(pickIdx.index)
@@ -0,0 +1,134 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+
+# Temporal coherence of hover picks
+# while the trigger is up, the controller ray is picked every frame only
+# to draw the ray and the sphere, a steady hand moves the ray by less than
+# the tracking noise, so the previous result is reused if the scene did
+# not change (the caller's token, e.g. the pick index version and the world
+# transformation), a slightly larger motion re-validates the previously
+# hit face only, anything else casts again, the re-validation range is
+# measured from the ray of the last cast, so a slow sweep still casts
+# and finds nearer faces, edges and vertices
+# picks started by the trigger never use the cache
+
+REUSE = 0
+REVALIDATE = 1
+CAST = 2
+
+
+@dataclass
+class hoverEntry:
+    # ray of the result, reused within the tolerances
+    origin: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    axis: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    # ray of the last cast, re-validated within the larger tolerances
+    cast_origin: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    cast_axis: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    token: tuple = ()
+    result: tuple = ()
+    prim: tuple = None  # (kind, index) of the hit primitive, if known
+    cast_time: float = 0.0  # seconds, running mean of the key casts
+
+
+class xrHoverCache:
+    def __init__(self):
+        self.enabled = True
+        # ray motion in the XR space
+        self.pos_tol = 0.0005  # m
+        self.angle_tol = 0.001  # rad
+        # up to this multiple of the tolerances the hit face is re-validated
+        self.revalidate_factor = 10.0
+        self.entries = {}  # key (e.g. handler name) -> hoverEntry
+
+    def clear(self):
+        self.entries = {}
+
+    def get_ray(self, controller):
+        transf = controller.get_global_transf()
+        origin = np.array(transf.translation.getValue().getValue())
+        axis = np.array(controller.find_ray_axis().getValue())
+        return origin, axis
+
+    def check(self, key, controller, token):
+        # returns (entry or None, REUSE / REVALIDATE / CAST)
+        prof.stats.count("hover_picks")
+        entry = self.entries.get(key)
+        if not self.enabled or entry is None or entry.token != token:
+            return entry, CAST
+        origin, axis = self.get_ray(controller)
+        dist = np.linalg.norm(origin - entry.origin)
+        angle = np.arccos(np.clip(axis @ entry.axis, -1.0, 1.0))
+        if dist <= self.pos_tol and angle <= self.angle_tol:
+            return entry, REUSE
+        dist = np.linalg.norm(origin - entry.cast_origin)
+        angle = np.arccos(np.clip(axis @ entry.cast_axis, -1.0, 1.0))
+        if (entry.prim is not None and dist <= self.pos_tol * self.revalidate_factor
+                and angle <= self.angle_tol * self.revalidate_factor):
+            return entry, REVALIDATE
+        return entry, CAST
+
+    def store(self, key, controller, token, result, prim=None, cast_time=0.0):
+        # result of a new cast
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = hoverEntry(cast_time=cast_time)
+            self.entries[key] = entry
+        elif cast_time > 0.0:
+            entry.cast_time += (cast_time - entry.cast_time) * 0.1
+        entry.origin, entry.axis = self.get_ray(controller)
+        entry.cast_origin, entry.cast_axis = entry.origin, entry.axis
+        entry.token = token
+        entry.result = result
+        entry.prim = prim
+        return entry
+
+    def revalidated(self, entry, controller, result):
+        # result of a successful re-validation, the ray of the last cast is kept
+        entry.origin, entry.axis = self.get_ray(controller)
+        entry.result = result
+
+    def saved(self, entry, elapsed, motion):
+        # statistics of a pick answered without a cast
+        if motion == REUSE:
+            prof.stats.count("hover_reuses")
+        else:
+            prof.stats.count("hover_revalidations")
+        prof.stats.add_time("hover_time_saved", max(entry.cast_time - elapsed, 0.0))
+
+
+def reuse_rate(stats):
+    # share of hover picks answered without a cast, 0 - 1
+    picks = stats.get_count("hover_picks")
+    if picks == 0:
+        return 0.0
+    return (stats.get_count("hover_reuses") + stats.get_count("hover_revalidations")) / picks
+
+
+# hover picks of the XR session
+cache = xrHoverCache()
@@ -0,0 +1,123 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from time import perf_counter
+import threading
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+
+# Hover picking on a worker thread
+# hover picks only draw the ray and the sphere, so they do not need the
+# answer within the frame: the render loop posts the newest ray of every
+# hover (one pending request per key) and takes the answer of the previous
+# one, the worker answers them from a snapshot of the pick index arrays
+# and touches neither Coin nor FreeCAD objects, hits are turned into
+# object info by the render loop
+# the snapshot is replaced once the index has re-read objects changed by
+# document events, answers from an older snapshot are dropped
+# picks started by the trigger stay synchronous
+
+CONE = 0  # pick_cone query
+POLYLINE = 1  # cast_polyline query
+
+
+class xrHoverPicker:
+    def __init__(self, index):
+        self.enabled = True
+        self.index = index  # xrPickIndex
+        self.snap = None
+        self.pending = {}  # key -> (snapshot, kind, args), guarded by the lock
+        self.results = {}  # key -> (snapshot, hit), guarded by the lock
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.worker = None
+
+    def start(self):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.run, name="XR hover picking",
+                                           daemon=True)
+            self.worker.start()
+
+    def stop(self):
+        # the worker leaves its loop after the current request
+        self.worker = None
+        self.wake.set()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.pending = {}
+            self.results = {}
+        self.snap = None
+
+    def is_running(self):
+        return self.enabled and self.index.enabled and self.worker is not None
+
+    def refresh(self):
+        # render loop, re-reads changed objects and takes a new snapshot
+        self.index.update()
+        if (self.snap is None or self.snap.version != self.index.version
+                or self.snap.clip_version != self.index.clip_version):
+            self.snap = self.index.snapshot()
+
+    def request(self, key, kind, *args):
+        # render loop, posts the query and returns the answer to the previous
+        # request of the key: (answered, query_hit or polyline_hit result)
+        self.refresh()
+        if not hasattr(self.snap, 'tris'):
+            return False, None
+        with self.lock:
+            self.pending[key] = (self.snap, kind, args)
+            result = self.results.get(key)
+        self.wake.set()
+        prof.stats.count("hover_requests")
+        if result is None or result[0] is not self.snap:
+            return False, None
+        return True, result[1]
+
+    def run(self):
+        # worker thread
+        this = threading.current_thread()
+        while self.worker is this:
+            self.wake.wait()
+            self.wake.clear()
+            with self.lock:
+                pending = self.pending
+                self.pending = {}
+            for key, (snap, kind, args) in pending.items():
+                start = perf_counter()
+                try:
+                    if kind == CONE:
+                        hit = snap.query_hit(*args)
+                    else:
+                        hit = snap.polyline_hit(*args)
+                except Exception as e:
+                    print(f"XR hover picking failed: {e}")
+                    hit = None
+                prof.stats.add_time("hover_worker_pick", perf_counter() - start)
+                with self.lock:
+                    self.results[key] = (snap, hit)
+
+
+# hover picks of the pick index scene
+picker = xrHoverPicker(pickIdx.index)
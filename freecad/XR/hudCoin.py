@@ -0,0 +1,187 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from freecad.XR.menuCoin import labelWidget
+import freecad.XR.hoverCacheXR as hovXR
+
+from time import perf_counter
+
+from pivy.coin import SoSeparator
+from pivy.coin import SoTransform
+from pivy.coin import SbVec3f, SbRotation
+from pivy.coin import SoSwitch, SoPickStyle, SO_SWITCH_NONE, SO_SWITCH_ALL
+from pivy.coin import SoVertexProperty, SoLineSet
+from pivy.coin import SoBaseColor, SbColor
+from pivy.coin import SoGetPrimitiveCountAction
+
+# performance HUD glued to the secondary controller
+# the HUD is refreshed by its own low rate timer, never from the render loop,
+# and text nodes are touched only if the shown value has changed, so Coin
+# keeps glyph and render caches of the labels between refreshes
+# counting primitives needs a full scenegraph traversal, it is done only
+# after the scene has changed and then stayed the same for a refresh,
+# so continuous edits (e.g. dragging) do not trigger it
+
+hud_update_interval = 250  # ms
+
+line_spacing = 0.016
+graph_width = 0.2
+graph_height = 0.05
+
+
+class coinHud:
+    def __init__(self, history=90):
+        self.history = history
+        self.hud_switch = SoSwitch()
+        self.hud_switch.whichChild = SO_SWITCH_NONE
+        self.hud_sep = SoSeparator()
+        self.hud_switch.addChild(self.hud_sep)
+        unpickable = SoPickStyle()
+        unpickable.style = SoPickStyle.UNPICKABLE
+        self.hud_sep.addChild(unpickable)
+        # location relative to the controller
+        self.location = SoTransform()
+        self.location.translation.setValue(SbVec3f(-0.1, 0.04, 0.0))
+        self.hud_sep.addChild(self.location)
+
+        self.line_names = ("frame", "dropped", "triangles", "picks", "panels", "caches")
+        self.labels = {}
+        self.shown_text = {}
+        for i, name in enumerate(self.line_names):
+            label = labelWidget(name, "", 0.2, 0.0012)
+            label.set_location(SbVec3f(0.0, line_spacing * i, 0.0),
+                               SbRotation(0, 0, 0, 0))
+            self.hud_sep.addChild(label.get_scenegraph())
+            self.labels[name] = label
+            self.shown_text[name] = ""
+
+        # rolling frame time graph, vertices are allocated once
+        graph_sep = SoSeparator()
+        graph_transf = SoTransform()
+        graph_transf.translation.setValue(
+            SbVec3f(-0.08, line_spacing * len(self.line_names), 0.0))
+        graph_sep.addChild(graph_transf)
+        graph_color = SoBaseColor()
+        graph_color.rgb = SbColor(0, 0.4, 0)
+        graph_sep.addChild(graph_color)
+        self.graph_vtxs = SoVertexProperty()
+        self.graph_vtxs.vertex.setValues(
+            0, history, [[graph_width * i / (history - 1), 0.0, 0.0] for i in range(history)])
+        graph_line = SoLineSet()
+        graph_line.vertexProperty = self.graph_vtxs
+        graph_sep.addChild(graph_line)
+        # frame budget (display period) reference line
+        budget_color = SoBaseColor()
+        budget_color.rgb = SbColor(1, 0, 0)
+        graph_sep.addChild(budget_color)
+        self.budget_vtxs = SoVertexProperty()
+        self.budget_vtxs.vertex.set1Value(0, 0, 0, 0)
+        self.budget_vtxs.vertex.set1Value(1, graph_width, 0, 0)
+        budget_line = SoLineSet()
+        budget_line.vertexProperty = self.budget_vtxs
+        graph_sep.addChild(budget_line)
+        self.hud_sep.addChild(graph_sep)
+
+        self.triangles = 0
+        self.scene_token = None  # of the last refresh
+        self.counted_token = None  # of the last primitive count
+        self.last_time = perf_counter()
+        self.last_frames = 0
+        self.last_picks = 0
+        self.last_panels = 0
+        self.last_invalidations = 0
+
+    def get_scenegraph(self):
+        return self.hud_switch
+
+    def show_hud(self):
+        self.hud_switch.whichChild = SO_SWITCH_ALL
+
+    def hide_hud(self):
+        self.hud_switch.whichChild = SO_SWITCH_NONE
+
+    def toggle_hud(self):
+        if self.is_hidden():
+            self.show_hud()
+        else:
+            self.hide_hud()
+
+    def is_hidden(self):
+        return self.hud_switch.whichChild.getValue() == SO_SWITCH_NONE
+
+    def set_line(self, name, text):
+        if self.shown_text[name] != text:
+            self.shown_text[name] = text
+            self.labels[name].set_text(text)
+
+    def count_triangles(self, scene, vp_reg):
+        # triangles rendered for a single eye
+        count_action = SoGetPrimitiveCountAction(vp_reg)
+        count_action.apply(scene)
+        return count_action.getTriangleCount()
+
+    def update(self, stats, frame_duration, render_duration, eye_scene, vp_reg, scene_token):
+        # frame_duration in seconds, render_duration in nanoseconds
+        # scene_token - changes with the rendered scene
+        if self.is_hidden():
+            return
+        now = perf_counter()
+        elapsed = now - self.last_time
+        frames = stats.frame_count - self.last_frames
+        picks = stats.get_count("pick_casts") - self.last_picks
+        panels = stats.get_count("qt_panel_updates") - self.last_panels
+        invalidations = stats.get_count("cache_invalidations") - self.last_invalidations
+        self.last_time = now
+        self.last_frames = stats.frame_count
+        self.last_picks = stats.get_count("pick_casts")
+        self.last_panels = stats.get_count("qt_panel_updates")
+        self.last_invalidations = stats.get_count("cache_invalidations")
+
+        if scene_token != self.counted_token and scene_token == self.scene_token:
+            self.triangles = self.count_triangles(eye_scene, vp_reg)
+            self.counted_token = scene_token
+        self.scene_token = scene_token
+
+        self.set_line("frame", "Frame {:.1f} ms  CPU {:.1f} ms  Render {:.1f} ms".format(
+            frame_duration * 1000, stats.last_frame_time, render_duration / 1e6))
+        self.set_line("dropped", f"Dropped frames: {stats.dropped_frames}")
+        self.set_line("triangles", f"Triangles/eye: {self.triangles}")
+        if frames > 0:
+            self.set_line("picks", "Pick casts/frame: {:.1f}  hover reuse {:.0%}".format(
+                picks / frames, hovXR.reuse_rate(stats)))
+            self.set_line("caches", "Cache invalidations/frame: {:.1f}".format(
+                invalidations / frames))
+        if elapsed > 0:
+            self.set_line("panels", "Qt panel updates: {:.1f}/s".format(panels / elapsed))
+        self.update_graph(stats)
+
+    def update_graph(self, stats):
+        times = list(stats.frame_times)
+        budget = stats.display_period * 1000
+        # keep the budget line at half height if frames fit the budget
+        scale_max = max(max(times), 2 * budget, 1.0)
+        sy = graph_height / scale_max
+        sx = graph_width / (len(times) - 1)
+        self.graph_vtxs.vertex.setValues(
+            0, len(times), [[sx * i, t * sy, 0.0] for i, t in enumerate(times)])
+        self.budget_vtxs.vertex.set1Value(0, 0, budget * sy, 0)
+        self.budget_vtxs.vertex.set1Value(1, graph_width, budget * sy, 0)
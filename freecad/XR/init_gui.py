@@ -60,9 +60,9 @@ static char * ico_xpm[] = {
         """This function is executed when the workbench is first activated.
         It is executed once in a FreeCAD session followed by the Activated function.
         """
-        from freecad.XR import startXR, stopXR, enableMirror, disableMirror, reloadScenegraph, toggleTPPCamera  # import here all the needed files that create your FreeCAD commands
+        from freecad.XR import startXR, stopXR, enableMirror, disableMirror, reloadScenegraph, toggleTPPCamera, complexityReport  # import here all the needed files that create your FreeCAD commands
         self.list = ["startXR", "stopXR", "enableMirror", "disableMirror", "reloadScenegraph",
-                     "toggleTPPCamera",]  # a list of command names created in the line above
+                     "toggleTPPCamera", "complexityReport",]  # a list of command names created in the line above
 
         from PySide.QtCore import QT_TRANSLATE_NOOP
         # creates a new toolbar with your commands
@@ -180,13 +180,22 @@ class labelWidget:
         self.label.string = text
         self.label_sep.addChild(text_scale)
         self.label_sep.addChild(self.label)
+        self.text = text
+        self.suffix = ""
 
     def set_location(self, pos, rot):
         self.relativ_loc.translation = pos
         self.relativ_loc.rotation = rot
 
     def set_text(self, text):
-        self.label.string = text
+        self.text = text
+        self.label.string = text + self.suffix
+
+    def set_suffix(self, suffix):
+        # additional info kept after the text, eg. a pending jobs indicator
+        if suffix != self.suffix:
+            self.suffix = suffix
+            self.label.string = self.text + suffix
 
     def get_scenegraph(self):
         return self.label_sep
@@ -304,6 +313,33 @@ class mainCoinMenu(coinMenu):
                 0, 0, 0, 0))
         self.widget_list.append(self.lock_floor_button)
 
+        # line builder points picked from the scene, not only from the working plane
+        self.snap_geometry_button = buttonWidget(
+            "snap_geometry_button", "Snap To Geometry", 0, 0.18)
+        self.snap_geometry_button.set_location(
+            SbVec3f(
+                0.0, 0.0, -0.3), SbRotation(
+                0, 0, 0, 0))
+        self.widget_list.append(self.snap_geometry_button)
+
+        # teleport along a parabolic arc instead of the straight ray
+        self.teleport_arc_button = buttonWidget(
+            "teleport_arc_button", "Arc Teleport", 0, 0.18)
+        self.teleport_arc_button.set_location(
+            SbVec3f(
+                0.0, -0.05, -0.3), SbRotation(
+                0, 0, 0, 0))
+        self.widget_list.append(self.teleport_arc_button)
+
+        # artificial movement stopped by the scene geometry
+        self.collisions_button = buttonWidget(
+            "collisions_button", "Collisions", 0, 0.18)
+        self.collisions_button.set_location(
+            SbVec3f(
+                0.0, -0.1, -0.3), SbRotation(
+                0, 0, 0, 0))
+        self.widget_list.append(self.collisions_button)
+
         self.lin_speed_slider = sliderWidget(
             "lin_speed_slider", "Linear Speed")
         self.lin_speed_slider.set_location(
@@ -361,6 +397,18 @@ class mainCoinMenu(coinMenu):
             SbVec3f(0.5, 0.05, -0.3), SbRotation(0, 0, 0, 0))
         self.widget_list.append(self.working_plane_button)
 
+        self.box_select_button = buttonWidget(
+            "box_select_button", "Box Select", 2, 0.2)
+        self.box_select_button.set_location(
+            SbVec3f(0.5, 0.1, -0.3), SbRotation(0, 0, 0, 0))
+        self.widget_list.append(self.box_select_button)
+
+        self.section_box_button = buttonWidget(
+            "section_box_button", "Section Box", 2, 0.2)
+        self.section_box_button.set_location(
+            SbVec3f(0.5, 0.15, -0.3), SbRotation(0, 0, 0, 0))
+        self.widget_list.append(self.section_box_button)
+
         # no radio group
         self.toggle_plane_button = buttonWidget(
             "toggle_plane_button", "Toggle Plane", 0, 0.2)
@@ -374,6 +422,18 @@ class mainCoinMenu(coinMenu):
             SbVec3f(0.5, -0.05, -0.3), SbRotation(0, 0, 0, 0))
         self.widget_list.append(self.toggle_overlay_button)
 
+        self.toggle_hud_button = buttonWidget(
+            "toggle_hud_button", "Toggle HUD", 0, 0.2)
+        self.toggle_hud_button.set_location(
+            SbVec3f(0.5, -0.1, -0.3), SbRotation(0, 0, 0, 0))
+        self.widget_list.append(self.toggle_hud_button)
+
+        self.clear_section_button = buttonWidget(
+            "clear_section_button", "Clear Section", 0, 0.2)
+        self.clear_section_button.set_location(
+            SbVec3f(0.5, 0.2, -0.3), SbRotation(0, 0, 0, 0))
+        self.widget_list.append(self.clear_section_button)
+
         self.scale_reset_button = buttonWidget(
             "scale_reset_button", "Reset Scale", 0, 0.2)
         self.scale_reset_button.set_location(
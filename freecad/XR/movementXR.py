@@ -25,6 +25,11 @@ from pivy.coin import SoTransform
 from pivy.coin import SoRayPickAction
 from dataclasses import dataclass
 
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.floorCacheXR as floorXR
+
 # only for key enums
 from PySide.QtCore import Qt
 
@@ -42,6 +47,13 @@ class KeyboardMovement:
     zrot: float = 0.0  # roll
 
 
+def teleport_arc(start, direction, segments, speed=10.0, time_step=0.08, gravity=9.81):
+    # points of a parabolic throw from the controller, XR space (Y is up)
+    # start, direction - (3,) arrays, direction normalized, speed in m/s
+    t = np.arange(segments + 1)[:, None] * time_step
+    return start + direction * speed * t - np.array([0.0, 0.5 * gravity, 0.0]) * t * t
+
+
 class xrMovement:
     def __init__(self, mov_type='ARCH'):
         self.movement_type = mov_type
@@ -227,11 +239,19 @@ class xrMovement:
 
     def find_floor(self, pos, hmdpos, separator, vp_reg):
         # shoots a ray vertically from the player location to find a floor (experimental)
+        start = pos + SbVec3f(hmdpos.getValue()[0], 1.0, hmdpos.getValue()[2])
+        if floorXR.floor.is_ready():
+            # heightfield read instead of a scenegraph traversal every frame,
+            # the scene is picked until the tiles around are filled
+            ready, h_diff = floorXR.floor.find_floor(start, 2.0)
+            if ready:
+                if h_diff is None:
+                    h_diff = pos.getValue()[1]
+                return h_diff
         con_pick_action = SoRayPickAction(vp_reg)
-        con_pick_action.setRay(
-                pos + SbVec3f(hmdpos.getValue()[0], 1.0, hmdpos.getValue()[2]),
-                SbVec3f(0.0, -1.0, 0.0), 0.01, 2.0)
+        con_pick_action.setRay(start, SbVec3f(0.0, -1.0, 0.0), 0.01, 2.0)
         con_pick_action.apply(separator)
+        prof.stats.count("pick_casts")
         picked_p_coords = SbVec3f(0.0, 0.0, 0.0)
         picked_point = con_pick_action.getPickedPoint()
         if (picked_point):
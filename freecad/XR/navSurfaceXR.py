@@ -0,0 +1,182 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+from dataclasses import dataclass
+from math import cos, radians, floor
+from time import perf_counter
+import threading
+
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.spatialXR as spatial
+
+# Navigation surface for teleporting
+# walkable triangles (facing up, not steeper than max_slope) of the XR pick
+# index, grouped into connected regions, too small regions (tops of
+# furniture, window sills) are dropped, the rest is binned on an XY grid
+# for point queries, points outside of the section box are not walkable
+# the surface is built by a worker thread from a snapshot of the index
+# arrays (the index replaces its arrays on changes, it never modifies them),
+# the worker touches neither Coin nor FreeCAD objects
+# the render loop keeps using the previous surface until the new one is ready
+
+
+@dataclass
+class navSurface:
+    tris: np.ndarray  # (n, 3, 3) walkable triangles, document coordinates
+    regions: np.ndarray  # region number of every triangle
+    areas: np.ndarray  # area of every region, mm^2
+    cells: dict  # XY grid cell -> triangle numbers, point queries
+    cell_size: float
+
+
+def connected_regions(tri_verts, count):
+    # label propagation over shared vertices with pointer jumping,
+    # every vertex ends with the lowest vertex number of its region
+    labels = np.arange(count)
+    while True:
+        old = labels
+        low = labels[tri_verts].min(axis=1)
+        labels = labels.copy()
+        np.minimum.at(labels, tri_verts.ravel(), np.repeat(low, 3))
+        labels = labels[labels]
+        if np.array_equal(labels, old):
+            return labels
+
+
+def build_surface(tris, min_nz, min_area, cell_size):
+    e1 = tris[:, 1] - tris[:, 0]
+    e2 = tris[:, 2] - tris[:, 0]
+    normals = np.cross(e1, e2)
+    double_areas = np.linalg.norm(normals, axis=1)
+    valid = double_areas > 1e-9
+    nz = normals[:, 2] / np.where(valid, double_areas, 1.0)
+    walkable = np.nonzero(valid & (nz >= min_nz))[0]
+    tris = tris[walkable]
+    double_areas = double_areas[walkable]
+    # vertices shared by triangles, welded at 0.01 mm
+    keys = np.round(tris.reshape(-1, 3) * 100).astype(np.int64)
+    _, verts = spatial.unique_rows(keys)
+    tri_verts = verts.reshape(-1, 3)
+    labels = connected_regions(tri_verts, int(tri_verts.max()) + 1 if len(tri_verts) else 0)
+    _, regions = np.unique(labels[tri_verts[:, 0]], return_inverse=True)
+    regions = regions.ravel()
+    areas = np.bincount(regions, weights=double_areas / 2)
+    keep = areas[regions] >= min_area
+    tris = tris[keep]
+    _, regions = np.unique(regions[keep], return_inverse=True)
+    regions = regions.ravel()
+    areas = np.bincount(regions, weights=np.linalg.norm(
+        np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0]), axis=1) / 2)
+    lo = tris.min(axis=1)
+    hi = tris.max(axis=1)
+    return navSurface(tris, regions, areas,
+                      spatial.bin_xy(lo[:, :2], hi[:, :2], cell_size), cell_size)
+
+
+class xrNavSurface:
+    def __init__(self, index, max_slope=30.0, min_area=0.25e6, snap_radius=500.0):
+        self.enabled = True
+        self.index = index  # xrPickIndex, source of the triangles
+        self.min_nz = cos(radians(max_slope))
+        self.min_area = min_area  # mm^2
+        self.snap_radius = snap_radius  # mm
+        self.surface = None
+        self.version = -1  # index version of the surface, built or being built
+        self.worker = None
+        self.result = None  # set by the worker
+
+    def clear(self):
+        # a running worker is left to finish, its result is dropped
+        self.surface = None
+        self.version = -1
+        self.worker = None
+        self.result = None
+
+    def is_ready(self):
+        return self.enabled and self.index.enabled and self.surface is not None
+
+    def update(self):
+        # called from the render loop, only reads the index here
+        if self.worker is not None:
+            if self.worker.is_alive():
+                return
+            self.worker = None
+            if self.result is not None:
+                self.surface = self.result
+                self.result = None
+        if not self.enabled:
+            return
+        self.index.update()
+        if self.index.version == self.version or not hasattr(self.index, 'tris'):
+            return
+        self.version = self.index.version
+        self.worker = threading.Thread(
+            target=self.build, args=(self.index.tris,),
+            name="XR navigation surface", daemon=True)
+        self.worker.start()
+
+    def build(self, tris):
+        # worker thread
+        start = perf_counter()
+        try:
+            surface = build_surface(tris, self.min_nz, self.min_area, self.snap_radius)
+        except Exception as e:
+            print(f"XR navigation surface failed: {e}")
+            return
+        if threading.current_thread() is self.worker:
+            self.result = surface
+        prof.stats.add_time("nav_surface_build", perf_counter() - start)
+
+    def snap(self, pnt, radius=None):
+        # the closest walkable point within the radius
+        # pnt - document coordinates, returns (point, region) or None
+        surface = self.surface
+        if surface is None:
+            return None
+        if radius is None:
+            radius = self.snap_radius
+        pnt = np.array(tuple(pnt), dtype=float)
+        size = surface.cell_size
+        i0, j0 = floor((pnt[0] - radius) / size), floor((pnt[1] - radius) / size)
+        i1, j1 = floor((pnt[0] + radius) / size), floor((pnt[1] + radius) / size)
+        groups = [surface.cells[(i, j)] for i in range(i0, i1 + 1)
+                  for j in range(j0, j1 + 1) if (i, j) in surface.cells]
+        if None in surface.cells:
+            groups.append(surface.cells[None])
+        if not groups:
+            return None
+        ids = np.unique(np.concatenate(groups))
+        tris = surface.tris[ids]
+        dist, closest = spatial.closest_on_triangles(pnt, tris[:, 0], tris[:, 1], tris[:, 2])
+        dist[~self.index.clip_mask(closest)] = np.inf
+        k = int(np.argmin(dist))
+        if dist[k] > radius:
+            return None
+        return closest[k], int(surface.regions[ids[k]])
+
+
+# the navigation surface of the pick index scene
+nav = xrNavSurface(pickIdx.index)
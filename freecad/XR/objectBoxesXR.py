@@ -0,0 +1,181 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+import freecad.XR.spatialXR as spatial
+
+# Bounding boxes of document objects for direct grabbing
+# boxes of objects shown in the headset, in the document coordinates,
+# taken from the XR pick index, so they follow recomputes and placement
+# changes the same way, only boxes of re-read objects are recalculated
+# the boxes are kept in a chunk hierarchy for box queries around the hands,
+# the nearest point is then searched only in objects whose boxes are close
+
+
+class xrObjectBoxes:
+    def __init__(self, index):
+        self.index = index  # xrPickIndex, source of the primitives
+        self.version = -1
+        self.bounds = {}  # object name -> (stamp, lo, hi)
+        self.names = []
+        self.owners = np.zeros(0, dtype=np.int64)  # positions in the pick index names
+        self.lo = np.zeros((0, 3))
+        self.hi = np.zeros((0, 3))
+        self.tree = spatial.chunkIndex(self.lo, self.hi)
+
+    def clear(self):
+        self.version = -1
+        self.bounds = {}
+
+    def update(self):
+        self.index.update()
+        if self.index.version == self.version:
+            return
+        self.version = self.index.version
+        with prof.timed("object_boxes_update"):
+            bounds = {}
+            for name, block in self.index.blocks.items():
+                old = self.bounds.get(name)
+                if old is not None and old[0] == block.stamp:
+                    bounds[name] = old
+                    continue
+                pnts = np.concatenate((block.tris.reshape(-1, 3),
+                                       block.segs.reshape(-1, 3), block.pnts))
+                if len(pnts):
+                    bounds[name] = (block.stamp, pnts.min(axis=0), pnts.max(axis=0))
+            self.bounds = bounds
+            self.names = list(bounds)
+            position = {name: i for i, name in enumerate(self.index.names)}
+            self.owners = np.array([position[n] for n in self.names], dtype=np.int64)
+            self.lo = np.array([b[1] for b in bounds.values()]).reshape(-1, 3)
+            self.hi = np.array([b[2] for b in bounds.values()]).reshape(-1, 3)
+            self.tree = spatial.chunkIndex(self.lo, self.hi)
+
+    def nearest(self, pnt, reach):
+        # the object closest to the point within reach (mm), returns
+        # a dict like View3DInventor.getObjectInfoRay or None,
+        # the sub-element is the closest face, edge or vertex
+        if not self.index.enabled:
+            return None
+        self.update()
+        if not self.names:
+            return None
+        lo = pnt - reach
+        hi = pnt + reach
+        cand = self.tree.box_candidates(lo, hi)
+        box_dist = np.linalg.norm(pnt - np.clip(pnt, self.lo[cand], self.hi[cand]), axis=1)
+        near = cand[box_dist <= reach]
+        if not len(near):
+            return None
+        prof.stats.count("grab_queries")
+        # primitives of the close objects around the point, large objects
+        # (e.g. a building the viewer is in) are not tested whole
+        index = self.index
+        owners = self.owner_mask(near)
+        best = (reach, None, None)  # distance, primitive kind and number, point
+        ids = index.tri_index.box_candidates(lo, hi)
+        ids = ids[owners[index.tri_owners[ids]]]
+        if len(ids):
+            tris = index.tris[ids]
+            dist, closest = spatial.closest_on_triangles(pnt, tris[:, 0], tris[:, 1], tris[:, 2])
+            dist[~index.clip_mask(closest)] = np.inf
+            k = int(np.argmin(dist))
+            if dist[k] <= best[0]:
+                best = (dist[k], ("Face", ids[k]), closest[k])
+        ids = index.seg_index.box_candidates(lo, hi)
+        ids = ids[owners[index.seg_owners[ids]]]
+        if len(ids):
+            segs = index.segs[ids]
+            dist, closest = spatial.closest_on_segments(pnt, segs[:, 0], segs[:, 1])
+            dist[~index.clip_mask(closest)] = np.inf
+            k = int(np.argmin(dist))
+            if dist[k] <= best[0]:
+                best = (dist[k], ("Edge", ids[k]), closest[k])
+        ids = index.pnt_index.box_candidates(lo, hi)
+        ids = ids[owners[index.pnt_owners[ids]]]
+        if len(ids):
+            dist = np.linalg.norm(index.pnts[ids] - pnt, axis=1)
+            dist[~index.clip_mask(index.pnts[ids])] = np.inf
+            k = int(np.argmin(dist))
+            if dist[k] <= best[0]:
+                best = (dist[k], ("Vertex", ids[k]), index.pnts[ids[k]])
+        if best[1] is None:
+            return None
+        kind, i = best[1]
+        if kind == "Face":
+            owner, number = index.tri_owners[i], index.tri_ids[i]
+        elif kind == "Edge":
+            owner, number = index.seg_owners[i], index.seg_ids[i]
+        else:
+            owner, number = index.pnt_owners[i], index.pnt_ids[i]
+        return index.make_info(index.names[owner], f"{kind}{number}", best[2])
+
+    def owner_mask(self, boxes):
+        # pick index owners of the given boxes, for filtering primitives
+        mask = np.zeros(len(self.index.names), dtype=bool)
+        mask[self.owners[boxes]] = True
+        return mask
+
+    def inside(self, lo, hi):
+        # names of objects in the box lo-hi: objects whose bounds are
+        # within the box and objects crossing its sides with at least
+        # one vertex of their tessellation inside
+        if not self.index.enabled:
+            return []
+        self.update()
+        if not self.names:
+            return []
+        cand = self.tree.box_candidates(lo, hi)
+        within = np.all((self.lo[cand] >= lo) & (self.hi[cand] <= hi), axis=1)
+        crossing = cand[~within]
+        crossing = crossing[np.all((self.lo[crossing] <= hi) & (self.hi[crossing] >= lo), axis=1)]
+        found = [self.owners[cand[within]]]
+        if len(crossing):
+            index = self.index
+            owners = self.owner_mask(crossing)
+            # only the part of the box touched by the crossing objects
+            q_lo = np.maximum(lo, self.lo[crossing].min(axis=0))
+            q_hi = np.minimum(hi, self.hi[crossing].max(axis=0))
+            for prims, prim_owners, prim_index in (
+                    (index.tris, index.tri_owners, index.tri_index),
+                    (index.segs, index.seg_owners, index.seg_index),
+                    (index.pnts[:, None, :], index.pnt_owners, index.pnt_index)):
+                ids = prim_index.box_candidates(q_lo, q_hi)
+                ids = ids[owners[prim_owners[ids]]]
+                if not len(ids):
+                    continue
+                verts = prims[ids]
+                hit = np.any(np.all((verts >= lo) & (verts <= hi), axis=2), axis=1)
+                hit_owners = np.unique(prim_owners[ids[hit]])
+                found.append(hit_owners)
+                # objects already found need no more tests
+                owners[hit_owners] = False
+        prof.stats.count("box_select_queries")
+        return [self.index.names[i] for i in np.unique(np.concatenate(found))]
+
+
+# object boxes of the pick index scene
+boxes = xrObjectBoxes(pickIdx.index)
@@ -0,0 +1,559 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD as App
+
+from dataclasses import dataclass, field
+import copy
+import numpy as np
+
+from pivy.coin import SoSearchAction, SoGetMatrixAction, SoGetBoundingBoxAction, SbViewportRegion
+from pivy.coin import SoType, SoCoordinate3, SoShape
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.docObserverXR as docObs
+import freecad.XR.spatialXR as spatial
+
+# XR pick index
+# triangles, edge segments and points of visible document objects are
+# copied once from their Coin nodes (SoBrepFaceSet, SoBrepEdgeSet,
+# SoBrepPointSet) to NumPy arrays in the document coordinates, every
+# primitive keeps its object and Face/Edge/Vertex number
+# (SoBrepFaceSet partIndex holds triangle counts of faces, SoBrepEdgeSet
+# polylines are edges), so a controller ray can be answered without
+# the desktop view pick path, objects are re-read only after they change
+# bounding boxes of objects with other shapes (meshes, point clouds, sketch
+# markers...) are kept, rays crossing them before the index hit are
+# checked by Coin too
+
+
+@dataclass
+class objBlock:
+    # primitives of one document object
+    chain: tuple = ()  # names of the object and its containers, outermost first
+    stamp: int = 0  # changes every time the object is re-read
+    tris: np.ndarray = field(default_factory=lambda: np.zeros((0, 3, 3)))
+    tri_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    segs: np.ndarray = field(default_factory=lambda: np.zeros((0, 2, 3)))
+    seg_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    pnts: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    pnt_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    unindexed: tuple = None  # (lo, hi) box of shapes the index does not read
+
+
+def node_key(node):
+    # pivy creates a new wrapper for every returned node, compare pointers
+    return int(node.this)
+
+
+def field_values(node, name):
+    fld = node.getField(name)
+    if fld is None:
+        return []
+    return fld.getValues(0)
+
+
+def find_coordinates(path):
+    # the last SoCoordinate3 traversed before the tail of the path,
+    # children of separators and groups preceding the path are skipped
+    for i in range(path.getLength() - 2, -1, -1):
+        children = path.getNode(i).getChildren()
+        if children is None:
+            continue
+        for j in range(path.getIndex(i + 1) - 1, -1, -1):
+            child = children[j]
+            if child.isOfType(SoCoordinate3.getClassTypeId()):
+                return child
+    return None
+
+
+def to_array(vecs):
+    if not len(vecs):
+        return np.zeros((0, 3))
+    return np.array([v.getValue() for v in vecs], dtype=float)
+
+
+def split_polylines(idx):
+    # coordIndex with -1 separators to (segment start, segment end, polyline number)
+    idx = np.asarray(idx, dtype=np.int64)
+    if len(idx) < 2:
+        return idx[:0], idx[:0], idx[:0]
+    numbers = np.cumsum(idx == -1)
+    valid = (idx[:-1] >= 0) & (idx[1:] >= 0)
+    return idx[:-1][valid], idx[1:][valid], numbers[:-1][valid]
+
+
+class xrPickIndex:
+    def __init__(self):
+        self.enabled = True
+        self.sg = None
+        self.doc = None
+        self.blocks = {}  # object name -> objBlock
+        self.unindexed = set()  # names of objects with shapes not in the arrays
+        self.unindexed_lo = np.zeros((0, 3))  # their boxes
+        self.unindexed_hi = np.zeros((0, 3))
+        self.dirty = set()  # names of objects to re-read
+        self.rebuild_all = True
+        # incremented on every re-read object and every merge,
+        # users of the arrays check them for changes
+        self.stamp = 0
+        self.version = 0
+        # angular tolerance of edge and vertex hits, radians
+        self.tan_angle = 0.002
+        self.min_dist = 0.5  # mm, tolerance close to the ray origin
+        # section box, hits outside of it are not visible, None - no section
+        self.clip_lo = None
+        self.clip_hi = None
+        self.clip_version = 0
+        # primitive of the last query hit, (kind, index in the merged arrays)
+        self.last_hit = None
+        self.vp_reg = SbViewportRegion(1, 1)
+
+    def set_scene(self, sg, doc):
+        # FreeCAD node types, registered by the GUI
+        self.face_type = SoType.fromName("SoBrepFaceSet")
+        self.edge_type = SoType.fromName("SoBrepEdgeSet")
+        self.point_type = SoType.fromName("SoBrepPointSet")
+        self.sg = sg
+        self.doc = doc
+        self.blocks = {}
+        self.rebuild_all = True
+
+    def on_doc_event(self, event, obj, prop):
+        if obj is not None and obj.Document != self.doc:
+            return
+        if event == docObs.DocEvent.CREATED:
+            self.dirty.add(obj.Name)
+        elif event == docObs.DocEvent.DELETED:
+            self.mark_dirty(obj.Name)
+        elif event == docObs.DocEvent.CHANGED and prop in (
+                'Placement', 'Shape', 'Visibility', 'Group'):
+            self.mark_dirty(obj.Name)
+
+    def set_clip(self, lo=None, hi=None):
+        self.clip_lo = lo
+        self.clip_hi = hi
+        self.clip_version += 1
+
+    def clip_mask(self, pnts):
+        # points inside the section box, (n, 3) array
+        if self.clip_lo is None:
+            return np.ones(len(pnts), dtype=bool)
+        return np.all((pnts >= self.clip_lo) & (pnts <= self.clip_hi), axis=1)
+
+    def mark_dirty(self, name):
+        # the object and everything placed inside of it
+        self.dirty.add(name)
+        for key, block in self.blocks.items():
+            if name in block.chain:
+                self.dirty.add(key)
+
+    # building
+
+    def update(self):
+        if self.sg is None or self.doc is None:
+            return
+        if not self.rebuild_all and not self.dirty:
+            return
+        with prof.timed("pick_index_build"):
+            self.roots = {}
+            for obj in self.doc.Objects:
+                vobj = obj.ViewObject
+                if vobj is not None and vobj.RootNode is not None:
+                    self.roots[node_key(vobj.RootNode)] = obj
+            if self.rebuild_all:
+                names = [o.Name for o in self.roots.values()]
+                self.blocks = {}
+            else:
+                names = list(self.dirty)
+            for name in names:
+                self.blocks.pop(name, None)
+                obj = self.doc.getObject(name)
+                if obj is not None:
+                    block = self.read_object(obj)
+                    if block is not None:
+                        self.stamp += 1
+                        block.stamp = self.stamp
+                        self.blocks[name] = block
+            self.dirty = set()
+            self.rebuild_all = False
+            self.merge()
+
+    def read_object(self, obj):
+        vobj = obj.ViewObject
+        if vobj is None or vobj.RootNode is None or not vobj.Visibility:
+            return None
+        search = SoSearchAction()
+        search.setNode(vobj.RootNode)
+        search.setInterest(SoSearchAction.FIRST)
+        search.apply(self.sg)
+        root_path = search.getPath()
+        if root_path is None:
+            # not rendered, e.g. hidden container
+            return None
+        root_path = root_path.copy()
+        root_path.ref()
+        # faces, edges and points of an object share coordinates
+        self.coord_cache = {}
+        block = objBlock()
+        block.chain = tuple(self.roots[node_key(root_path.getNode(i))].Name
+                            for i in range(root_path.getLength())
+                            if node_key(root_path.getNode(i)) in self.roots)
+        tris, tri_ids, segs, seg_ids, pnts, pnt_ids = [], [], [], [], [], []
+        for shape_type in (self.face_type, self.edge_type, self.point_type):
+            search = SoSearchAction()
+            search.setType(shape_type)
+            search.setInterest(SoSearchAction.ALL)
+            search.apply(vobj.RootNode)
+            paths = search.getPaths()
+            for i in range(paths.getLength()):
+                sub_path = paths[i]
+                # nodes of nested objects belong to them
+                if any(node_key(sub_path.getNode(j)) in self.roots
+                       for j in range(1, sub_path.getLength())):
+                    continue
+                path = root_path.copy()
+                path.ref()
+                path.append(sub_path)
+                self.read_shape(path, shape_type, tris, tri_ids, segs, seg_ids, pnts, pnt_ids)
+                path.unref()
+        if self.has_other_shapes(vobj.RootNode):
+            block.unindexed = self.path_box(root_path)
+        root_path.unref()
+        if tris:
+            block.tris = np.concatenate(tris)
+            block.tri_ids = np.concatenate(tri_ids)
+        if segs:
+            block.segs = np.concatenate(segs)
+            block.seg_ids = np.concatenate(seg_ids)
+        if pnts:
+            block.pnts = np.concatenate(pnts)
+            block.pnt_ids = np.concatenate(pnt_ids)
+        return block
+
+    def path_box(self, path):
+        # document coordinates bounding box of the path tail, None if empty
+        bbox_action = SoGetBoundingBoxAction(self.vp_reg)
+        bbox_action.apply(path)
+        box = bbox_action.getBoundingBox()
+        if box.isEmpty():
+            return None
+        return np.array(box.getMin().getValue()), np.array(box.getMax().getValue())
+
+    def has_other_shapes(self, root):
+        # shapes of the object itself which are not read to the arrays
+        search = SoSearchAction()
+        search.setType(SoShape.getClassTypeId())
+        search.setInterest(SoSearchAction.ALL)
+        search.apply(root)
+        paths = search.getPaths()
+        for i in range(paths.getLength()):
+            path = paths[i]
+            tail = path.getTail()
+            if any(tail.isOfType(t) for t in (self.face_type, self.edge_type, self.point_type)):
+                continue
+            if any(node_key(path.getNode(j)) in self.roots for j in range(1, path.getLength())):
+                continue
+            return True
+        return False
+
+    def read_shape(self, path, shape_type, tris, tri_ids, segs, seg_ids, pnts, pnt_ids):
+        node = path.getTail()
+        coords = find_coordinates(path)
+        if coords is None:
+            return
+        key = node_key(coords)
+        if key not in self.coord_cache:
+            self.coord_cache[key] = to_array(coords.point.getValues(0))
+        local = self.coord_cache[key]
+        if not len(local):
+            return
+        matrix_action = SoGetMatrixAction(self.vp_reg)
+        matrix_action.apply(path)
+        # Coin matrices transform row vectors
+        mat = np.array(matrix_action.getMatrix().getValue(), dtype=float)
+        verts = local @ mat[:3, :3] + mat[3, :3]
+        if shape_type == self.face_type:
+            idx = np.asarray(field_values(node, "coordIndex"), dtype=np.int64)
+            parts = np.asarray(field_values(node, "partIndex"), dtype=np.int64)
+            if len(idx) % 4 or not len(idx) or np.any(idx[3::4] != -1):
+                # not a list of triangles, should not happen for SoBrepFaceSet
+                return
+            tri_idx = idx.reshape(-1, 4)[:, :3]
+            if tri_idx.max() >= len(verts):
+                return
+            # partIndex - number of triangles of every face
+            ids = np.repeat(np.arange(1, len(parts) + 1), parts)[:len(tri_idx)]
+            tri_idx = tri_idx[:len(ids)]
+            tris.append(verts[tri_idx])
+            tri_ids.append(ids)
+        elif shape_type == self.edge_type:
+            a, b, numbers = split_polylines(field_values(node, "coordIndex"))
+            if len(a) and max(a.max(), b.max()) < len(verts):
+                segs.append(np.stack((verts[a], verts[b]), axis=1))
+                seg_ids.append(numbers + 1)
+        else:
+            start = node.getField("startIndex").getValue()
+            num = node.getField("numPoints").getValue()
+            end = len(verts) if num < 0 else min(start + num, len(verts))
+            if end > start:
+                pnts.append(verts[start:end])
+                pnt_ids.append(np.arange(1, end - start + 1))
+
+    def merge(self):
+        # flat arrays of all objects, primitives refer to self.names
+        self.names = list(self.blocks)
+        blocks = [self.blocks[n] for n in self.names]
+        boxes = {n: b.unindexed for n, b in self.blocks.items() if b.unindexed is not None}
+        self.unindexed = set(boxes)
+        self.unindexed_lo = np.array([lo for lo, hi in boxes.values()]).reshape(-1, 3)
+        self.unindexed_hi = np.array([hi for lo, hi in boxes.values()]).reshape(-1, 3)
+
+        def owners(attr):
+            return np.concatenate(
+                [np.full(len(getattr(b, attr)), i, dtype=np.int64) for i, b in enumerate(blocks)]
+                + [np.zeros(0, dtype=np.int64)])
+
+        self.tris = np.concatenate([b.tris for b in blocks] + [np.zeros((0, 3, 3))])
+        self.tri_ids = np.concatenate([b.tri_ids for b in blocks] + [np.zeros(0, dtype=np.int64)])
+        self.tri_owners = owners('tris')
+        self.segs = np.concatenate([b.segs for b in blocks] + [np.zeros((0, 2, 3))])
+        self.seg_ids = np.concatenate([b.seg_ids for b in blocks] + [np.zeros(0, dtype=np.int64)])
+        self.seg_owners = owners('segs')
+        self.pnts = np.concatenate([b.pnts for b in blocks] + [np.zeros((0, 3))])
+        self.pnt_ids = np.concatenate([b.pnt_ids for b in blocks] + [np.zeros(0, dtype=np.int64)])
+        self.pnt_owners = owners('pnts')
+        self.tri_index = spatial.chunkIndex(self.tris.min(axis=1), self.tris.max(axis=1))
+        self.seg_index = spatial.chunkIndex(self.segs.min(axis=1), self.segs.max(axis=1))
+        self.pnt_index = spatial.chunkIndex(self.pnts, self.pnts)
+        self.version += 1
+        prof.stats.count("pick_index_merges")
+
+    # queries
+
+    def pick(self, start, direction):
+        # start, direction - App.Vector in the document coordinates
+        # returns a dict like View3DInventor.getObjectInfoRay or None
+        if not self.enabled:
+            return None
+        self.update()
+        if self.sg is None:
+            return None
+        with prof.timed("pick_index_query"):
+            return self.query(np.array(start), np.array(direction), self.tan_angle)
+
+    def unindexed_hit(self, start, direction, max_dist=np.inf):
+        # the ray crosses a box of an object the index does not read
+        # nearer than max_dist from the start, Coin has to pick it then
+        if not self.unindexed:
+            return False
+        start = np.array(start)
+        direction = np.array(direction)
+        direction = direction / np.linalg.norm(direction)
+        # parallel to a slab: huge values keep the sign of the side
+        inv = 1.0 / np.where(direction == 0.0, 1e-30, direction)
+        t1 = (self.unindexed_lo - start) * inv
+        t2 = (self.unindexed_hi - start) * inv
+        entry = np.maximum(np.minimum(t1, t2).max(axis=1), 0.0)
+        leave = np.maximum(t1, t2).min(axis=1)
+        return bool(np.any((leave >= entry) & (entry < max_dist)))
+
+    def pick_cone(self, start, direction, tan_angle, max_t=np.inf, extra_pnts=()):
+        # edges and vertices within the cone of tan_angle around the ray,
+        # faces hit by the ray axis, max_t - maximum distance from the start
+        # extra_pnts - snap points which are not document vertices
+        # (e.g. the polyline being drawn), their hits have only the PickedPoint
+        if not self.enabled:
+            return None
+        self.update()
+        if self.sg is None:
+            return None
+        with prof.timed("pick_index_cone"):
+            return self.query(np.array(start), np.array(direction), tan_angle, max_t,
+                              points_array(extra_pnts))
+
+    def cast_polyline(self, pnts):
+        # the first face hit along a polyline, all segments in one query
+        # pnts - (n, 3) array in the document coordinates
+        # returns (segment number, hit point) or None
+        if not self.enabled:
+            return None
+        self.update()
+        if self.sg is None:
+            return None
+        with prof.timed("pick_index_polyline"):
+            return self.polyline_hit(pnts)
+
+    def snapshot(self):
+        # the index at its current version for a worker thread,
+        # merge() replaces the arrays instead of changing them, so they stay
+        # valid in the copy, the worker may call only the NumPy queries
+        # (query_hit, polyline_hit), never update() or hit_info()
+        return copy.copy(self)
+
+    def polyline_hit(self, pnts):
+        a = pnts[:-1]
+        b = pnts[1:]
+        cand, seg = self.tri_index.segment_candidates(a, b)
+        tri = self.tris[cand]
+        t = spatial.segments_triangles(a[seg], b[seg], tri[:, 0], tri[:, 1], tri[:, 2])
+        hit = np.isfinite(t)
+        if self.clip_lo is not None:
+            hit[hit] = self.clip_mask(a[seg[hit]] + (b[seg[hit]] - a[seg[hit]]) * t[hit, None])
+        if not hit.any():
+            return None
+        # the first segment with a hit, the nearest hit in it
+        k = seg[hit].min()
+        t = t[hit & (seg == k)].min()
+        return k, a[k] + (b[k] - a[k]) * t
+
+    def query(self, origin, direction, tan_angle, max_t=np.inf, extra=None):
+        best = self.query_hit(origin, direction, tan_angle, max_t, extra)
+        self.last_hit = None if best is None else best[1:3]
+        return self.hit_info(best)
+
+    def query_hit(self, origin, direction, tan_angle, max_t=np.inf, extra=None):
+        # returns (distance along the ray, kind, index, point) or None
+        length = np.linalg.norm(direction)
+        if length == 0:
+            return None
+        direction = direction / length
+        best = None  # (distance along the ray, kind, index, point)
+        cand = self.tri_index.ray_candidates(origin, direction)
+        if len(cand):
+            tri = self.tris[cand]
+            t = spatial.ray_triangles(origin, direction, tri[:, 0], tri[:, 1], tri[:, 2])
+            if self.clip_lo is not None:
+                # the first hit inside the section box
+                hit = np.isfinite(t)
+                t[hit & ~self.clip_mask(origin + np.outer(np.where(hit, t, 0.0), direction))] = np.inf
+            i = int(np.argmin(t))
+            if np.isfinite(t[i]) and t[i] <= max_t:
+                best = (t[i], "Face", cand[i], origin + t[i] * direction)
+        # edges and vertices on the visible side of the nearest face
+        # win over the face, as in the desktop views
+        if best:
+            max_t = best[0] * 1.001 + self.min_dist
+        hit = None
+        if extra is not None and len(extra):
+            hit = self.pick_extra(origin, direction, tan_angle, max_t, extra)
+        if hit is None:
+            hit = self.pick_points(origin, direction, tan_angle, max_t)
+        if hit is None:
+            hit = self.pick_segments(origin, direction, tan_angle, max_t)
+        if hit is not None:
+            best = hit
+        return best
+
+    def hit_info(self, best):
+        # a dict like View3DInventor.getObjectInfoRay from a query_hit result
+        if best is None:
+            return None
+        t, kind, i, pnt = best
+        if kind == "Extra":
+            return {'PickedPoint': App.Vector(*pnt)}
+        if kind == "Face":
+            owner, number = self.tri_owners[i], self.tri_ids[i]
+        elif kind == "Edge":
+            owner, number = self.seg_owners[i], self.seg_ids[i]
+        else:
+            owner, number = self.pnt_owners[i], self.pnt_ids[i]
+        return self.make_info(self.names[owner], f"{kind}{number}", pnt)
+
+    def ray_face(self, i, start, direction, max_t=np.inf):
+        # the ray against a single triangle of the merged arrays,
+        # a cheap check if the last hit face is still under the ray,
+        # returns the hit point or None
+        origin = np.array(start)
+        direction = np.array(direction)
+        direction = direction / np.linalg.norm(direction)
+        tri = self.tris[i:i + 1]
+        t = spatial.ray_triangles(origin, direction, tri[:, 0], tri[:, 1], tri[:, 2])[0]
+        if not np.isfinite(t) or t > max_t:
+            return None
+        pnt = origin + t * direction
+        if not self.clip_mask(pnt[None, :])[0]:
+            return None
+        return pnt
+
+    def in_cone(self, dist, t, tan_angle, max_t):
+        return (t > 0) & (t <= max_t) & (dist <= np.maximum(tan_angle * t, self.min_dist))
+
+    def closest_in_cone(self, dist, t, tan_angle, max_t):
+        # index of the hit closest to the ray axis, in angle, or None
+        ok = self.in_cone(dist, t, tan_angle, max_t)
+        if not ok.any():
+            return None
+        return np.flatnonzero(ok)[np.argmin(dist[ok] / t[ok])]
+
+    def pick_extra(self, origin, direction, tan_angle, max_t, extra):
+        dist, t = spatial.ray_points(origin, direction, extra)
+        i = self.closest_in_cone(dist, t, tan_angle, max_t)
+        if i is None:
+            return None
+        return (t[i], "Extra", i, extra[i])
+
+    def pick_points(self, origin, direction, tan_angle, max_t):
+        cand = self.pnt_index.ray_candidates(origin, direction, tan_angle, self.min_dist)
+        if not len(cand):
+            return None
+        dist, t = spatial.ray_points(origin, direction, self.pnts[cand])
+        t[~self.clip_mask(self.pnts[cand])] = -1.0
+        i = self.closest_in_cone(dist, t, tan_angle, max_t)
+        if i is None:
+            return None
+        return (t[i], "Vertex", cand[i], self.pnts[cand[i]])
+
+    def pick_segments(self, origin, direction, tan_angle, max_t):
+        cand = self.seg_index.ray_candidates(origin, direction, tan_angle, self.min_dist)
+        if not len(cand):
+            return None
+        seg = self.segs[cand]
+        dist, t, closest = spatial.ray_segments(origin, direction, seg[:, 0], seg[:, 1])
+        t[~self.clip_mask(closest)] = -1.0
+        i = self.closest_in_cone(dist, t, tan_angle, max_t)
+        if i is None:
+            return None
+        return (t[i], "Edge", cand[i], closest[i])
+
+    def make_info(self, name, component, pnt):
+        chain = self.blocks[name].chain
+        info = {'Document': self.doc.Name,
+                'Object': name,
+                'Component': component,
+                'PickedPoint': App.Vector(*pnt)}
+        if len(chain) > 1:
+            # the same as the desktop view, the outermost container
+            # and the path to the sub-element from it
+            info['ParentObject'] = chain[0]
+            info['SubName'] = ".".join(chain[1:]) + "." + component
+        return info
+
+
+def points_array(pnts):
+    # App.Vector list to a (n, 3) array
+    return np.array([tuple(p) for p in pnts], dtype=float).reshape(-1, 3)
+
+
+# the pick index of the scenegraph shown in the headset
+index = xrPickIndex()
@@ -27,7 +27,7 @@ from freecad.XR.documentInteraction import EditMode
 from pivy.coin import SoSeparator
 from pivy.coin import SoVertexProperty, SoLineSet, SoPointSet
 from pivy.coin import SoSwitch, SoPickStyle, SO_SWITCH_NONE, SO_SWITCH_ALL
-from pivy.coin import SoMaterial, SoCoordinate3, SoIndexedFaceSet
+from pivy.coin import SoMaterial, SoCoordinate3, SoIndexedFaceSet, SoShapeHints
 from pivy.coin import SoTransform, SbRotation, SbVec3f
 from pivy.coin import SO_END_FACE_INDEX
 
@@ -196,6 +196,9 @@ class coinPreview:
     def hide_working_plane(self):
         self.working_plane_switch.whichChild = SO_SWITCH_NONE
 
+    def is_working_plane_hidden(self):
+        return self.working_plane_switch.whichChild.getValue() == SO_SWITCH_NONE
+
     def toggle_working_plane(self):
         if self.working_plane_switch.whichChild.getValue() == SO_SWITCH_NONE:
             self.working_plane_switch.whichChild = SO_SWITCH_ALL
@@ -222,3 +225,63 @@ class coinPreview:
         # place label in the 3/4 between user head and feature
         self.length_label.set_location(
             ((3 * i_sec_xr + self.hmdpos_glob) / 4), self.hmdrot_glob)
+
+
+class coinFeaturePreview:
+    # pad/pocket preview, placed in the document coordinates (mm)
+    # the profile prism of the unit length is tessellated once at the edit start,
+    # dragging changes only the scale along the profile normal
+    def __init__(self):
+        self.prev_switch = SoSwitch()
+        self.prev_switch.whichChild = SO_SWITCH_NONE
+        prev_sep = SoSeparator()
+        self.prev_switch.addChild(prev_sep)
+        unpickable = SoPickStyle()
+        unpickable.style = SoPickStyle.UNPICKABLE
+        prev_sep.addChild(unpickable)
+        # negative scale flips the faces, so light both sides
+        hints = SoShapeHints()
+        hints.vertexOrdering = SoShapeHints.COUNTERCLOCKWISE
+        hints.shapeType = SoShapeHints.UNKNOWN_SHAPE_TYPE
+        prev_sep.addChild(hints)
+        self.material = SoMaterial()
+        self.material.transparency.setValue(0.4)
+        prev_sep.addChild(self.material)
+        self.transform = SoTransform()
+        prev_sep.addChild(self.transform)
+        self.coords = SoCoordinate3()
+        prev_sep.addChild(self.coords)
+        self.faces = SoIndexedFaceSet()
+        prev_sep.addChild(self.faces)
+
+    def get_scenegraph(self):
+        return self.prev_switch
+
+    def set_profile(self, profile, edit_mode):
+        points, triangles, base, normal = profile
+        self.coords.point.setValues(0, len(points), [[p.x, p.y, p.z] for p in points])
+        self.coords.point.setNum(len(points))
+        indices = []
+        for t in triangles:
+            indices.extend((t[0], t[1], t[2], SO_END_FACE_INDEX))
+        self.faces.coordIndex.setValues(0, len(indices), indices)
+        self.faces.coordIndex.setNum(len(indices))
+        if edit_mode == EditMode.POCKET:
+            self.material.diffuseColor.setValue(1.0, 0.0, 0.0)
+        else:
+            self.material.diffuseColor.setValue(0.0, 1.0, 0.0)
+        # scaling in the space where Z is the normal, from the profile plane
+        self.transform.center.setValue(SbVec3f(base.x, base.y, base.z))
+        self.transform.scaleOrientation.setValue(
+            SbRotation(SbVec3f(0, 0, 1), SbVec3f(normal.x, normal.y, normal.z)))
+        self.set_length(0.0)
+        self.prev_switch.whichChild = SO_SWITCH_ALL
+
+    def set_length(self, length):
+        # zero scale would make the transformation singular
+        if abs(length) < 0.1:
+            length = -0.1 if length < 0 else 0.1
+        self.transform.scaleFactor.setValue(1.0, 1.0, length)
+
+    def hide_preview(self):
+        self.prev_switch.whichChild = SO_SWITCH_NONE
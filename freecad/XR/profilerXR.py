@@ -0,0 +1,129 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from collections import deque
+from time import perf_counter
+import os
+
+# lightweight session statistics, shared by all modules of the workbench
+# counters and timings are cheap enough to be updated every frame,
+# readers (HUD, reports) should poll them at a low rate
+
+
+class xrProfiler:
+    def __init__(self, history=90):
+        self.history = history
+        self.reset()
+
+    def reset(self):
+        # CPU time spent in the render loop per frame, milliseconds
+        self.frame_times = deque([0.0] * self.history, maxlen=self.history)
+        self.frame_count = 0
+        self.total_frame_time = 0.0  # seconds
+        self.dropped_frames = 0
+        self.last_frame_time = 0.0
+        self.display_period = 0.0  # seconds, reported by the runtime
+        # counters accumulated since the session start
+        self.totals = {}
+        # timings: name -> [count, total time, max time] in seconds
+        self.timings = {}
+
+    def count(self, name, n=1):
+        self.totals[name] = self.totals.get(name, 0) + n
+
+    def get_count(self, name):
+        return self.totals.get(name, 0)
+
+    def add_time(self, name, secs):
+        timing = self.timings.get(name)
+        if timing is None:
+            self.timings[name] = [1, secs, secs]
+        else:
+            timing[0] += 1
+            timing[1] += secs
+            if secs > timing[2]:
+                timing[2] = secs
+
+    def get_timing(self, name):
+        # returns (count, total, max) in seconds
+        timing = self.timings.get(name, [0, 0.0, 0.0])
+        return timing[0], timing[1], timing[2]
+
+    def get_mean_time(self, name):
+        cnt, total, _ = self.get_timing(name)
+        if cnt == 0:
+            return 0.0
+        return total / cnt
+
+    def end_frame(self, frame_time, frame_interval, display_period):
+        # frame_time - CPU time of the frame in seconds
+        # frame_interval - time between the current and the previous predicted display time
+        # display_period - predicted display period from the OpenXR runtime
+        self.frame_count += 1
+        self.total_frame_time += frame_time
+        self.last_frame_time = frame_time * 1000
+        self.frame_times.append(self.last_frame_time)
+        self.display_period = display_period
+        if display_period > 0 and frame_interval > 1.5 * display_period:
+            # the runtime skipped at least one display refresh
+            self.dropped_frames += round(frame_interval / display_period) - 1
+
+    def summary(self):
+        lines = [f"Frames: {self.frame_count}, dropped: {self.dropped_frames}"]
+        for name in sorted(self.totals):
+            lines.append(f"{name}: {self.totals[name]}")
+        for name in sorted(self.timings):
+            cnt, total, max_t = self.get_timing(name)
+            lines.append(
+                f"{name}: {cnt} calls, mean {total / cnt * 1000:.3f} ms, max {max_t * 1000:.3f} ms")
+        return "\n".join(lines)
+
+
+def get_rss_kb():
+    # resident set size of the process, Linux only, 0 elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class timed:
+    # context manager measuring a block of code
+    # with timed("solve"): ...
+    def __init__(self, name, profiler=None):
+        self.name = name
+        self.profiler = profiler
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = perf_counter() - self.start
+        (self.profiler or stats).add_time(self.name, self.elapsed)
+        return False
+
+
+# the session profiler, reset every time the XR viewer opens
+stats = xrProfiler()
@@ -31,6 +31,8 @@ from PySide.QtCore import Qt, QPoint, QTimer, QObject, SIGNAL
 from math import pi
 import numpy as np
 
+import freecad.XR.profilerXR as prof
+
 from pivy.coin import SoSeparator
 from pivy.coin import SoSwitch, SO_SWITCH_NONE, SO_SWITCH_ALL
 from pivy.coin import SoCoordinate3, SoIndexedFaceSet
@@ -147,6 +149,23 @@ class qtWidgetRender:
     def hide_widget(self):
         self.qt_widget_sep.whichChild = SO_SWITCH_NONE
 
+    def is_hidden(self):
+        if not self.widget:
+            return True
+        return self.qt_widget_sep.whichChild.getValue() == SO_SWITCH_NONE
+
+    def warm_up(self):
+        # shows the widget with an up-to-date texture, so the next scene render
+        # uploads the texture, returns True if the widget was hidden before
+        if not self.widget:
+            return False
+        hidden = self.is_hidden()
+        self.qt_widget_sep.whichChild = SO_SWITCH_ALL
+        self.render_widget()
+        self.texture.image = self.sosf_img
+        self.widget_rendered = False
+        return hidden
+
     def toggle_widget(self):
         if self.qt_widget_sep.whichChild.getValue() == SO_SWITCH_NONE:
             self.show_widget()
@@ -219,6 +238,7 @@ class qtWidgetRender:
         if self.widget_rendered:
             self.texture.image = self.sosf_img
             self.widget_rendered = False
+            prof.stats.count("qt_panel_updates")
             self.render_timer.start(widget_update_interval)
 
     def project_click(self, trigger_state, tex_coords, double_click):
@@ -0,0 +1,201 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD as App
+import FreeCADGui as Gui
+
+import csv
+import os
+from dataclasses import dataclass, fields
+from statistics import median
+from time import perf_counter
+
+from pivy.coin import SoSeparator, SoNode
+from pivy.coin import SoPerspectiveCamera, SoDirectionalLight
+from pivy.coin import SbViewportRegion, SbVec3f
+from pivy.coin import SoGetPrimitiveCountAction, SoGetBoundingBoxAction
+from pivy.coin import SoSearchAction, SoRayPickAction
+from pivy.coin import SoOffscreenRenderer
+
+# Scene complexity report
+# every visible document object is measured in isolation:
+# primitive and node counts, offscreen render time and ray pick traversal time
+# containers (Body, Part...) render their claimed children too,
+# so for them the values of visible children are subtracted
+
+
+@dataclass
+class objectCost:
+    name: str = ""
+    label: str = ""
+    type_id: str = ""
+    triangles: int = 0
+    lines: int = 0
+    points: int = 0
+    nodes: int = 0
+    render_ms: float = 0.0
+    pick_ms: float = 0.0
+
+
+def is_in_scenegraph(node, sg):
+    search = SoSearchAction()
+    search.setNode(node)
+    search.setInterest(SoSearchAction.FIRST)
+    search.setSearchingAll(True)
+    search.apply(sg)
+    return search.getPath() is not None
+
+
+def count_nodes(node):
+    search = SoSearchAction()
+    search.setType(SoNode.getClassTypeId())
+    search.setInterest(SoSearchAction.ALL)
+    search.setSearchingAll(True)
+    search.apply(node)
+    return search.getPaths().getLength()
+
+
+def measure_object(root, vp_reg, render_samples):
+    cost = objectCost()
+    # isolated scene, camera sees the whole object
+    scene = SoSeparator()
+    scene.ref()
+    camera = SoPerspectiveCamera()
+    light = SoDirectionalLight()
+    scene.addChild(camera)
+    scene.addChild(light)
+    scene.addChild(root)
+    camera.viewAll(root, vp_reg)
+
+    count_action = SoGetPrimitiveCountAction(vp_reg)
+    count_action.apply(scene)
+    cost.triangles = count_action.getTriangleCount()
+    cost.lines = count_action.getLineCount()
+    cost.points = count_action.getPointCount()
+    cost.nodes = count_nodes(root)
+
+    renderer = SoOffscreenRenderer(vp_reg)
+    # the first render builds Coin caches, do not measure it
+    renderer.render(scene)
+    times = []
+    for i in range(render_samples):
+        start = perf_counter()
+        renderer.render(scene)
+        times.append(perf_counter() - start)
+    cost.render_ms = median(times) * 1000
+
+    # ray through the middle of the object, as a controller ray would do
+    bbox_action = SoGetBoundingBoxAction(vp_reg)
+    bbox_action.apply(root)
+    bbox = bbox_action.getBoundingBox()
+    if not bbox.isEmpty():
+        center = bbox.getCenter()
+        size = bbox.getMax() - bbox.getMin()
+        start_vec = center + SbVec3f(0, 0, size.length() + 1.0)
+        times = []
+        for i in range(render_samples):
+            pick_action = SoRayPickAction(vp_reg)
+            pick_action.setRay(start_vec, SbVec3f(0, 0, -1))
+            start = perf_counter()
+            pick_action.apply(root)
+            times.append(perf_counter() - start)
+        cost.pick_ms = median(times) * 1000
+    scene.unref()
+    return cost
+
+
+def collect_costs(sg=None, render_samples=5, size=256):
+    gui_doc = Gui.ActiveDocument
+    if gui_doc is None:
+        return []
+    if sg is None:
+        sg = gui_doc.ActiveView.getSceneGraph()
+    vp_reg = SbViewportRegion(size, size)
+    costs = {}
+    children = {}
+    for obj in gui_doc.Document.Objects:
+        vobj = obj.ViewObject
+        if vobj is None or not vobj.Visibility:
+            continue
+        root = vobj.RootNode
+        if root is None or not is_in_scenegraph(root, sg):
+            continue
+        cost = measure_object(root, vp_reg, render_samples)
+        cost.name = obj.Name
+        cost.label = obj.Label
+        cost.type_id = obj.TypeId
+        costs[obj.Name] = cost
+        children[obj.Name] = [c.Name for c in vobj.claimChildren() if c]
+    # keep only own cost of containers
+    inclusive = {name: objectCost(**vars(c)) for name, c in costs.items()}
+    for name, cost in costs.items():
+        for child in children[name]:
+            if child in inclusive:
+                c = inclusive[child]
+                cost.triangles = max(cost.triangles - c.triangles, 0)
+                cost.lines = max(cost.lines - c.lines, 0)
+                cost.points = max(cost.points - c.points, 0)
+                cost.nodes = max(cost.nodes - c.nodes, 0)
+                cost.render_ms = max(cost.render_ms - c.render_ms, 0.0)
+                cost.pick_ms = max(cost.pick_ms - c.pick_ms, 0.0)
+    return list(costs.values())
+
+
+def format_table(costs):
+    header = f"{'Object':<24}{'Triangles':>11}{'Lines':>9}{'Points':>9}{'Nodes':>8}{'Render ms':>11}{'Pick ms':>10}"
+    lines = [header, "-" * len(header)]
+    for c in costs:
+        name = f"{c.label} ({c.name})"[:23]
+        lines.append(
+            f"{name:<24}{c.triangles:>11}{c.lines:>9}{c.points:>9}{c.nodes:>8}"
+            f"{c.render_ms:>11.3f}{c.pick_ms:>10.3f}")
+    return "\n".join(lines)
+
+
+def write_csv(costs, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([fl.name for fl in fields(objectCost)])
+        for c in costs:
+            writer.writerow([getattr(c, fl.name) for fl in fields(objectCost)])
+
+
+def default_csv_path():
+    doc = App.ActiveDocument
+    if doc and doc.FileName:
+        base = os.path.splitext(doc.FileName)[0]
+        return base + "_xr_complexity.csv"
+    return os.path.join(App.getUserAppDataDir(), "xr_complexity.csv")
+
+
+def complexity_report(sg=None, csv_path=None, sort_key="render_ms",
+                      render_samples=5):
+    # sg - scenegraph to walk, by default the active one (as in reload_scenegraph)
+    # sort_key - objectCost field, the most expensive objects go first
+    costs = collect_costs(sg, render_samples)
+    costs.sort(key=lambda c: getattr(c, sort_key), reverse=True)
+    print(format_table(costs))
+    if csv_path is None:
+        csv_path = default_csv_path()
+    write_csv(costs, csv_path)
+    print(f"XR complexity report saved: {csv_path}")
+    return costs
@@ -0,0 +1,140 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+from collections import deque
+from inspect import isgeneratorfunction
+from time import perf_counter
+import traceback
+
+import freecad.XR.profilerXR as prof
+
+# Frame budgeted work queue for document operations triggered from XR
+# jobs run after the frame is submitted, in the time left before the next
+# frame should start, a job can be split into steps by writing it as
+# a generator, each yield ends a step
+# a step which does not fit the slack is postponed, but at most for
+# max_wait_frames, then it runs as the only step in the frame, so a user
+# action costs at most one missed frame per step
+# step costs are kept per job name and step number, a plain function
+# is a single step which also finishes the job
+# a job raising an exception is dropped with its traceback printed,
+# its on_error is called instead of on_done, e.g. to roll back a gesture
+
+
+class xrJob:
+    def __init__(self, name, work, args, on_done, on_error):
+        self.name = name
+        self.work = work
+        self.args = args
+        self.steps = work(*args) if isgeneratorfunction(work) else None
+        self.step = 0  # number of the next step
+        self.on_done = on_done
+        self.on_error = on_error
+        self.waited_frames = 0
+
+    def cost_key(self):
+        return (self.name, self.step)
+
+    def run_step(self):
+        # returns True if the job is finished
+        if self.steps is None:
+            self.work(*self.args)
+            return True
+        try:
+            next(self.steps)
+        except StopIteration:
+            return True
+        return False
+
+
+class xrScheduler:
+    def __init__(self, margin=0.001, max_wait_frames=2):
+        self.jobs = deque()
+        self.margin = margin  # s, kept free for the runtime
+        self.max_wait_frames = max_wait_frames
+        # (job name, step number) -> expected step duration (s),
+        # exponential moving average
+        self.step_costs = {}
+
+    def submit(self, name, work, *args, on_done=None, on_error=None):
+        # jobs run in the submission order
+        self.jobs.append(xrJob(name, work, args, on_done, on_error))
+
+    def pending_count(self):
+        return len(self.jobs)
+
+    def run_step(self, job):
+        key = job.cost_key()
+        start = perf_counter()
+        failed = False
+        try:
+            done = job.run_step()
+        except Exception:
+            print(f"XR job {job.name} failed:")
+            traceback.print_exc()
+            prof.stats.count("job_failures")
+            done = True
+            failed = True
+        duration = perf_counter() - start
+        prof.stats.add_time("job_step", duration)
+        old_cost = self.step_costs.get(key)
+        if old_cost is None:
+            self.step_costs[key] = duration
+        else:
+            self.step_costs[key] = 0.7 * old_cost + 0.3 * duration
+        job.step += 1
+        if done:
+            self.jobs.popleft()
+            if failed:
+                if job.on_error:
+                    job.on_error()
+            elif job.on_done:
+                job.on_done()
+
+    def run(self, budget):
+        # budget - seconds left before the next frame should start
+        deadline = perf_counter() + budget - self.margin
+        steps = 0
+        while self.jobs:
+            job = self.jobs[0]
+            cost = self.step_costs.get(job.cost_key(), 0.0)
+            if perf_counter() + cost > deadline:
+                if steps or job.waited_frames < self.max_wait_frames:
+                    if not steps:
+                        job.waited_frames += 1
+                    break
+            job.waited_frames = 0
+            self.run_step(job)
+            steps += 1
+        return steps
+
+    def flush(self):
+        # finish everything, eg. when the session ends
+        while self.jobs:
+            self.run_step(self.jobs[0])
+
+    def clear(self):
+        self.jobs.clear()
+
+
+# document operations queued from the XR session
+jobs = xrScheduler()
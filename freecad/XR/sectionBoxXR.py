@@ -0,0 +1,208 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import numpy as np
+
+from pivy.coin import SoGroup, SoSeparator, SoSwitch, SoPickStyle, SO_SWITCH_NONE, SO_SWITCH_ALL
+from pivy.coin import SoClipPlane, SbPlane, SbVec3f
+from pivy.coin import SoBaseColor, SoDrawStyle, SoLightModel
+from pivy.coin import SoVertexProperty, SoIndexedLineSet
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.docObserverXR as docObs
+import freecad.XR.objectBoxesXR as boxXR
+import freecad.XR.boxSelectXR as boxSelXR
+import freecad.XR.selectionXR as selXR
+
+# Section box
+# six GL clip planes in the document coordinates cut the scene for every
+# render pass (both eyes and the third-person camera) and for Coin picks,
+# objects entirely outside the box are switched off (their display mode
+# switch, the same as hiding them), so they are neither traversed nor
+# picked, the pick index ignores hits outside the box
+# when the box moves, only objects crossing its sides are switched,
+# the desktop views share the scenegraph, so they skip them too
+# until the section is cleared
+
+# SoClipPlane keeps the half space the normal points to
+plane_normals = ((1, 0, 0), (0, 1, 0), (0, 0, 1), (-1, 0, 0), (0, -1, 0), (0, 0, -1))
+
+
+class xrSectionBox:
+    def __init__(self, boxes):
+        self.boxes = boxes  # xrObjectBoxes
+        self.lo = None  # None - no section
+        self.hi = None
+        self.version = -1
+        # per object box: outside of the section box, can be switched off
+        self.outside = np.zeros(0, dtype=bool)
+        self.prunable = np.zeros(0, dtype=bool)
+        self.pruned = {}  # object name -> (display mode switch, its whichChild)
+        self.sg = None
+
+    def get_scenegraph(self):
+        # has to be placed before the document scenegraph
+        if self.sg is None:
+            self.setup_scenegraph()
+        return self.sg
+
+    def setup_scenegraph(self):
+        self.sg = SoGroup()
+        # the outline is not clipped
+        self.outline = SoSwitch()
+        self.outline.whichChild = SO_SWITCH_NONE
+        sep = SoSeparator()
+        self.outline.addChild(sep)
+        unpickable = SoPickStyle()
+        unpickable.style = SoPickStyle.UNPICKABLE
+        sep.addChild(unpickable)
+        light_model = SoLightModel()
+        light_model.model = SoLightModel.BASE_COLOR
+        sep.addChild(light_model)
+        draw_style = SoDrawStyle()
+        draw_style.lineWidth = 2
+        sep.addChild(draw_style)
+        color = SoBaseColor()
+        color.rgb.setValue(0.9, 0.4, 0.1)
+        sep.addChild(color)
+        self.outline_vtxs = SoVertexProperty()
+        self.outline_set = SoIndexedLineSet()
+        self.outline_set.vertexProperty = self.outline_vtxs
+        sep.addChild(self.outline_set)
+        self.sg.addChild(self.outline)
+        self.planes = []
+        for normal in plane_normals:
+            plane = SoClipPlane()
+            plane.on = False
+            self.planes.append(plane)
+            self.sg.addChild(plane)
+
+    def is_active(self):
+        return self.lo is not None
+
+    def set_box(self, a, b):
+        # a, b - opposite corners in the document coordinates
+        self.get_scenegraph()
+        self.lo = np.minimum(a, b)
+        self.hi = np.maximum(a, b)
+        for plane, normal in zip(self.planes, plane_normals):
+            corner = self.lo if sum(normal) > 0 else self.hi
+            plane.plane.setValue(SbPlane(SbVec3f(*normal), SbVec3f(*corner)))
+            plane.on = True
+        verts, idx = boxSelXR.box_lines(self.lo[None, :], self.hi[None, :])
+        selXR.set_values(self.outline_vtxs.vertex, verts.tolist())
+        selXR.set_values(self.outline_set.coordIndex, idx.tolist())
+        self.boxes.index.set_clip(self.lo, self.hi)
+        self.prune()
+
+    def show_outline(self, show=True):
+        if self.sg:
+            self.outline.whichChild = SO_SWITCH_ALL if show else SO_SWITCH_NONE
+
+    def clear(self):
+        self.lo = None
+        self.hi = None
+        if self.sg:
+            for plane in self.planes:
+                plane.on = False
+            self.show_outline(False)
+        self.boxes.index.set_clip()
+        for name in list(self.pruned):
+            self.restore(name)
+
+    def update(self):
+        # called every frame, before anything reads the pick index
+        if not self.is_active():
+            return
+        self.restore_dirty()
+        self.boxes.update()
+        if self.boxes.version != self.version:
+            self.prune()
+
+    def restore_dirty(self):
+        # objects the pick index is going to re-read have to be visible,
+        # a switched off object would be read without any shape, the dirty
+        # names include the children of changed containers
+        index = self.boxes.index
+        names = list(self.pruned) if index.rebuild_all else index.dirty & self.pruned.keys()
+        for name in names:
+            self.restore(name)
+            # compared again with the switched off objects
+            self.version = -1
+
+    def prune(self):
+        with prof.timed("section_prune"):
+            boxes = self.boxes
+            self.restore_dirty()
+            boxes.update()
+            if boxes.version != self.version:
+                # object boxes were rebuilt, compare with the switched off objects
+                self.version = boxes.version
+                # containers would hide their children too
+                containers = {n for b in boxes.index.blocks.values() for n in b.chain[:-1]}
+                self.prunable = np.array([n not in containers for n in boxes.names], dtype=bool)
+                self.outside = np.array([n in self.pruned for n in boxes.names], dtype=bool)
+                current = set(boxes.names)
+                for name in [n for n in self.pruned if n not in current]:
+                    self.restore(name)
+            outside = self.prunable & np.any((boxes.lo > self.hi) | (boxes.hi < self.lo), axis=1)
+            # only objects crossing the box sides since the last call
+            for k in np.flatnonzero(outside != self.outside):
+                name = boxes.names[k]
+                if outside[k]:
+                    if name not in self.pruned:
+                        self.switch_off(name)
+                elif name in self.pruned:
+                    self.restore(name)
+            self.outside = outside
+
+    def switch_off(self, name):
+        obj = self.boxes.index.doc.getObject(name)
+        vobj = getattr(obj, "ViewObject", None)
+        if vobj is None or not vobj.Visibility:
+            return
+        switch = vobj.SwitchNode
+        switch.ref()
+        self.pruned[name] = (switch, switch.whichChild.getValue())
+        switch.whichChild = SO_SWITCH_NONE
+        prof.stats.count("section_switches")
+
+    def restore(self, name):
+        switch, which = self.pruned.pop(name)
+        obj = self.boxes.index.doc.getObject(name)
+        vobj = getattr(obj, "ViewObject", None)
+        # hidden by the user in the meantime, FreeCAD owns the switch again
+        if (vobj is not None and vobj.Visibility
+                and switch.whichChild.getValue() == SO_SWITCH_NONE):
+            switch.whichChild = which
+        switch.unref()
+        prof.stats.count("section_switches")
+
+    def on_doc_event(self, event, obj, prop):
+        if obj is not None and obj.Name in self.pruned:
+            if event == docObs.DocEvent.DELETED:
+                switch, which = self.pruned.pop(obj.Name)
+                switch.unref()
+
+
+# section box of the pick index scene
+section = xrSectionBox(boxXR.boxes)
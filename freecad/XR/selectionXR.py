@@ -0,0 +1,354 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD as App
+import FreeCADGui as Gui
+
+from PySide.QtCore import QTimer, QObject, SIGNAL
+
+from dataclasses import dataclass
+
+from pivy.coin import SoSeparator, SoSwitch, SoPickStyle, SO_SWITCH_NONE, SO_SWITCH_ALL
+from pivy.coin import SoMaterial, SoDrawStyle, SoPolygonOffset, SoLightModel
+from pivy.coin import SoCoordinate3, SoIndexedFaceSet, SoIndexedLineSet, SoPointSet
+from pivy.coin import SoVertexProperty
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.docObserverXR as docObs
+
+# XR side selection set
+# picking in the headset changes only this set and its own highlight overlay
+# (rendered in the document coordinates), Gui.Selection is updated later,
+# once the selection stays unchanged for the sync delay or when a gesture ends,
+# since every Gui.Selection change updates highlights in all desktop views,
+# the tree view and the property editor on the GUI thread
+# selection changes made outside of XR (desktop, Python console)
+# are pulled into the set lazily, on the next access
+
+
+@dataclass
+class selItem:
+    doc: str = ""
+    obj: str = ""
+    sub: str = ""
+    pnt: App.Vector = None
+    shape: object = None  # sub-element shape, if already known
+
+
+class xrSelection:
+    def __init__(self):
+        self.items = []
+        self.sync_delay = 300  # ms, set from preferences
+        self.sync_timer = None
+        # Gui.Selection contains the same items
+        self.synced = True
+        # set while pushing items to Gui.Selection, own changes are not pulled back
+        self.syncing = False
+        self.pull_pending = True
+        self.highlight_dirty = True
+        self.sg = None
+
+    def start(self, sync_delay):
+        self.sync_delay = sync_delay
+        if self.sync_timer is None:
+            self.sync_timer = QTimer()
+            self.sync_timer.setSingleShot(True)
+            QObject.connect(self.sync_timer, SIGNAL("timeout()"), self.sync)
+        self.pull_pending = True
+        self.highlight_dirty = True
+
+    def stop(self):
+        self.flush()
+        self.sync_timer = None
+
+    # selection set
+
+    def clear(self):
+        self.pull()
+        if self.items:
+            self.items = []
+            self.changed()
+
+    def add(self, doc, obj, sub="", pnt=None, shape=None):
+        self.pull()
+        for item in self.items:
+            if item.doc == doc and item.obj == obj and item.sub == sub:
+                return
+        self.items.append(selItem(doc, obj, sub, pnt, shape))
+        self.changed()
+
+    def set_items(self, items):
+        # replaces the whole set at once, e.g. after a box selection
+        self.pull()
+        self.items = list(items)
+        self.changed()
+
+    def get_items(self):
+        self.pull()
+        return self.items
+
+    def get_first(self):
+        # returns (object, sub-element name) or (None, "")
+        for item in self.get_items():
+            obj = self.get_object(item)
+            if obj:
+                return obj, item.sub
+        return None, ""
+
+    def get_objects(self):
+        objs = []
+        for item in self.get_items():
+            obj = self.get_object(item)
+            if obj and obj not in objs:
+                objs.append(obj)
+        return objs
+
+    def get_object(self, item):
+        doc = App.listDocuments().get(item.doc)
+        return doc.getObject(item.obj) if doc else None
+
+    def changed(self):
+        self.synced = False
+        self.highlight_dirty = True
+        prof.stats.count("xr_selection_changes")
+        if self.sync_timer is None or self.sync_delay <= 0:
+            self.sync()
+        else:
+            # debounce, restarting the timer postpones the sync
+            self.sync_timer.start(self.sync_delay)
+
+    # Gui.Selection synchronisation
+
+    def sync(self):
+        if self.synced:
+            return
+        self.syncing = True
+        try:
+            with prof.timed("selection_sync"):
+                Gui.Selection.clearSelection()
+                # items without a picked point are added per object,
+                # with all their sub-elements in one call
+                subs = {}
+                for item in self.items:
+                    if self.get_object(item) is None:
+                        continue
+                    if item.pnt:
+                        Gui.Selection.addSelection(
+                            item.doc, item.obj, item.sub,
+                            item.pnt.x, item.pnt.y, item.pnt.z)
+                    else:
+                        subs.setdefault((item.doc, item.obj), []).append(item.sub)
+                for (doc, obj), names in subs.items():
+                    Gui.Selection.addSelection(doc, obj, names)
+        finally:
+            self.syncing = False
+        self.synced = True
+        prof.stats.count("selection_syncs")
+
+    def flush(self):
+        # called at gesture end, the desktop sees the final selection
+        if self.sync_timer is not None:
+            self.sync_timer.stop()
+        self.sync()
+
+    def pull(self):
+        if not self.pull_pending:
+            return
+        self.pull_pending = False
+        if not self.synced:
+            # the XR selection is newer, it overwrites the desktop one
+            return
+        items = []
+        for sel in Gui.Selection.getSelectionEx("*"):
+            obj = sel.Object
+            subs = sel.SubElementNames or ("",)
+            shapes = sel.SubObjects
+            pnts = sel.PickedPoints
+            for i, sub in enumerate(subs):
+                items.append(selItem(
+                    obj.Document.Name, obj.Name, sub,
+                    pnts[i] if i < len(pnts) else None,
+                    shapes[i] if i < len(shapes) else None))
+        self.items = items
+        self.highlight_dirty = True
+
+    def on_doc_event(self, event, obj, prop):
+        if event == docObs.DocEvent.SELECTION:
+            if not self.syncing:
+                self.pull_pending = True
+                self.highlight_dirty = True
+        elif event == docObs.DocEvent.DELETED:
+            count = len(self.items)
+            self.items = [i for i in self.items
+                          if not (i.doc == obj.Document.Name and i.obj == obj.Name)]
+            if len(self.items) != count:
+                self.highlight_dirty = True
+        elif event == docObs.DocEvent.RECOMPUTED:
+            # sub-element shapes are outdated
+            for item in self.items:
+                item.shape = None
+            self.highlight_dirty = True
+        elif event == docObs.DocEvent.CHANGED and prop in ('Placement', 'Shape'):
+            for item in self.items:
+                if item.doc == obj.Document.Name and item.obj == obj.Name:
+                    item.shape = None
+                    self.highlight_dirty = True
+
+    # highlight overlay
+
+    def get_scenegraph(self):
+        if self.sg is None:
+            self.setup_scenegraph()
+        return self.sg
+
+    def setup_scenegraph(self):
+        self.sg = SoSwitch()
+        self.sg.whichChild = SO_SWITCH_ALL
+        sep = SoSeparator()
+        self.sg.addChild(sep)
+        unpickable = SoPickStyle()
+        unpickable.style = SoPickStyle.UNPICKABLE
+        sep.addChild(unpickable)
+        light_model = SoLightModel()
+        light_model.model = SoLightModel.BASE_COLOR
+        sep.addChild(light_model)
+        material = SoMaterial()
+        material.diffuseColor.setValue(0.1, 0.8, 0.1)
+        material.transparency.setValue(0.4)
+        sep.addChild(material)
+        draw_style = SoDrawStyle()
+        draw_style.lineWidth = 3
+        draw_style.pointSize = 8
+        sep.addChild(draw_style)
+        # draw highlighted faces over the object ones
+        offset = SoPolygonOffset()
+        offset.factor = -1.0
+        offset.units = -1.0
+        sep.addChild(offset)
+        self.face_coords = SoCoordinate3()
+        sep.addChild(self.face_coords)
+        self.face_set = SoIndexedFaceSet()
+        sep.addChild(self.face_set)
+        self.line_vtxs = SoVertexProperty()
+        self.line_set = SoIndexedLineSet()
+        self.line_set.vertexProperty = self.line_vtxs
+        sep.addChild(self.line_set)
+        self.pnt_vtxs = SoVertexProperty()
+        self.pnt_set = SoPointSet()
+        self.pnt_set.vertexProperty = self.pnt_vtxs
+        sep.addChild(self.pnt_set)
+
+    def show_highlight(self):
+        if self.sg:
+            self.sg.whichChild = SO_SWITCH_ALL
+
+    def hide_highlight(self):
+        # e.g. while dragging, the highlight would stay behind
+        if self.sg:
+            self.sg.whichChild = SO_SWITCH_NONE
+
+    def update_highlight(self):
+        # called every frame, rebuilds the overlay only after a change
+        self.pull()
+        if not self.highlight_dirty or self.sg is None:
+            return
+        self.highlight_dirty = False
+        with prof.timed("selection_highlight"):
+            self.build_highlight()
+
+    def build_highlight(self):
+        face_pnts, face_idx = [], []
+        line_pnts, line_idx = [], []
+        pnts = []
+        for item in self.items:
+            obj = self.get_object(item)
+            if obj is None:
+                continue
+            shape = self.get_shape(obj, item)
+            if shape is None:
+                continue
+            # shapes are in the coordinates of the object's parent
+            plac = self.get_parent_placement(obj)
+            if item.sub.startswith('Face'):
+                tol = max(shape.BoundBox.DiagonalLength / 100, 0.01)
+                verts, tris = shape.tessellate(tol)
+                start = len(face_pnts)
+                face_pnts.extend(plac.multVec(v) for v in verts)
+                for tri in tris:
+                    face_idx.extend((start + tri[0], start + tri[1], start + tri[2], -1))
+            elif item.sub.startswith('Edge'):
+                self.add_polyline(line_pnts, line_idx, plac,
+                                  shape.discretize(Number=32))
+            elif item.sub.startswith('Vertex'):
+                pnts.append(plac.multVec(shape.Point))
+            else:
+                # the whole object, bounding box edges
+                self.add_box(line_pnts, line_idx, plac, shape.BoundBox)
+        set_values(self.face_coords.point, [tuple(p) for p in face_pnts])
+        set_values(self.face_set.coordIndex, face_idx)
+        set_values(self.line_vtxs.vertex, [tuple(p) for p in line_pnts])
+        set_values(self.line_set.coordIndex, line_idx)
+        set_values(self.pnt_vtxs.vertex, [tuple(p) for p in pnts])
+
+    def get_shape(self, obj, item):
+        if item.shape is None:
+            if item.sub:
+                # copies only the sub-element, not the whole shape
+                item.shape = obj.getSubObject(item.sub)
+            elif hasattr(obj, 'Shape'):
+                item.shape = obj.Shape
+        return item.shape
+
+    def get_parent_placement(self, obj):
+        if hasattr(obj, 'Placement'):
+            return obj.getGlobalPlacement().multiply(obj.Placement.inverse())
+        return App.Placement()
+
+    def add_polyline(self, line_pnts, line_idx, plac, verts):
+        start = len(line_pnts)
+        line_pnts.extend(plac.multVec(v) for v in verts)
+        line_idx.extend(range(start, len(line_pnts)))
+        line_idx.append(-1)
+
+    def add_box(self, line_pnts, line_idx, plac, bb):
+        if not bb.isValid():
+            return
+        corners = [App.Vector(x, y, z)
+                   for z in (bb.ZMin, bb.ZMax)
+                   for y in (bb.YMin, bb.YMax)
+                   for x in (bb.XMin, bb.XMax)]
+        start = len(line_pnts)
+        line_pnts.extend(plac.multVec(c) for c in corners)
+        for a, b in ((0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (1, 3),
+                     (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7)):
+            line_idx.extend((start + a, start + b, -1))
+
+
+def set_values(field, values):
+    field.setNum(len(values))
+    if values:
+        field.setValues(0, len(values), values)
+
+
+# the selection set shared by the XR modules
+selection = xrSelection()
@@ -0,0 +1,212 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD as App
+
+from enum import Enum
+from itertools import product
+from time import perf_counter
+import numpy as np
+
+import freecad.XR.profilerXR as prof
+import freecad.XR.pickIndexXR as pickIdx
+
+# Snapping of the line builder points
+# vertices and edge midpoints of visible objects (taken from the XR pick
+# index) are stored in a spatial hash of cubic cells, only objects re-read
+# by the index are replaced, a query scans cells from the nearest one and
+# stops when farther cells cannot contain a closer point or when
+# the time budget runs out, so the cost per frame does not depend
+# on the model size
+
+
+class SnapKind(Enum):
+    NONE = 0
+    VERTEX = 1
+    MIDPOINT = 2
+    GRID = 3
+
+
+def edge_midpoints(segs, ids):
+    # points in the half length of polylines, segments of one edge
+    # share an id and follow each other
+    if not len(segs):
+        return np.zeros((0, 3))
+    order = np.argsort(ids, kind='stable')
+    segs = segs[order]
+    ids = ids[order]
+    lengths = np.linalg.norm(segs[:, 1] - segs[:, 0], axis=1)
+    cum = np.cumsum(lengths)
+    before = cum - lengths
+    _, starts = np.unique(ids, return_index=True)
+    half = before[starts] + np.add.reduceat(lengths, starts) / 2
+    k = np.maximum(np.searchsorted(cum, half, side='left'), starts)
+    k = np.minimum(k, len(segs) - 1)
+    frac = (half - before[k]) / np.where(lengths[k] > 0, lengths[k], 1.0)
+    frac = np.clip(frac, 0.0, 1.0)
+    return segs[k, 0] + (segs[k, 1] - segs[k, 0]) * frac[:, None]
+
+
+class xrSnapper:
+    def __init__(self, cell_size=10.0):
+        self.enabled = True
+        self.budget = 0.0005  # s per query
+        # nearest cells first, rings of the same Chebyshev distance
+        reach = 2
+        self.offsets = sorted(product(range(-reach, reach + 1), repeat=3),
+                              key=lambda o: (max(abs(c) for c in o),
+                                             o[0] ** 2 + o[1] ** 2 + o[2] ** 2))
+        self.set_cell_size(cell_size)
+
+    def set_cell_size(self, cell_size):
+        # the hash is rebuilt on the next update
+        self.cell_size = cell_size  # mm
+        # distance from the central cell, farther cells are skipped
+        # if a closer point is already found
+        self.offset_dists = [max(0.0, (max(abs(c) for c in o) - 1)) * self.cell_size
+                             for o in self.offsets]
+        # cell -> {object name: (points, kinds)}
+        self.cells = {}
+        self.object_cells = {}  # object name -> cells
+        self.stamps = {}  # object name -> pick index block stamp
+        self.index_version = -1
+
+    def fit_cell_size(self, size):
+        # the snap radius follows the scale of the scene, the hash is rebuilt
+        # only if it changes a lot
+        if size > 0 and not (self.cell_size / 2 <= size <= self.cell_size * 2):
+            self.set_cell_size(size)
+
+    def update(self):
+        index = pickIdx.index
+        index.update()
+        if index.version == self.index_version:
+            return
+        self.index_version = index.version
+        with prof.timed("snap_update"):
+            for name in list(self.stamps):
+                block = index.blocks.get(name)
+                if block is None or block.stamp != self.stamps[name]:
+                    self.remove_object(name)
+            for name, block in index.blocks.items():
+                if name not in self.stamps:
+                    self.add_object(name, block)
+
+    def remove_object(self, name):
+        for cell in self.object_cells.pop(name, ()):
+            entries = self.cells.get(cell)
+            if entries is not None:
+                entries.pop(name, None)
+                if not entries:
+                    del self.cells[cell]
+        self.stamps.pop(name, None)
+
+    def add_object(self, name, block):
+        self.stamps[name] = block.stamp
+        mids = edge_midpoints(block.segs, block.seg_ids)
+        pnts = np.concatenate((block.pnts, mids))
+        kinds = np.concatenate((np.full(len(block.pnts), SnapKind.VERTEX.value),
+                                np.full(len(mids), SnapKind.MIDPOINT.value)))
+        if not len(pnts):
+            return
+        keys = np.floor(pnts / self.cell_size).astype(np.int64)
+        uniq, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(uniq) + 1))
+        cells = []
+        for i, key in enumerate(map(tuple, uniq.tolist())):
+            sel = order[bounds[i]:bounds[i + 1]]
+            self.cells.setdefault(key, {})[name] = (pnts[sel], kinds[sel])
+            cells.append(key)
+        self.object_cells[name] = cells
+
+    def snap(self, pnt, radius, plane=None, extra_pnts=()):
+        # pnt - App.Vector in the document coordinates, radius in mm
+        # plane - (origin, x direction, y direction, grid step) for grid points
+        # extra_pnts - e.g. points of the polyline being drawn
+        # returns (snapped App.Vector, SnapKind), pnt is returned unchanged
+        # with SnapKind.NONE if nothing is close enough
+        if not self.enabled or radius <= 0:
+            return pnt, SnapKind.NONE
+        start = perf_counter()
+        # scanned cells cover the radius of one cell
+        radius = min(radius, self.cell_size)
+        self.update()
+        p = np.array(tuple(pnt))
+        best_dist = radius
+        best = None
+        if len(extra_pnts):
+            extra = np.array([tuple(e) for e in extra_pnts], dtype=float)
+            dists = np.linalg.norm(extra - p, axis=1)
+            i = int(np.argmin(dists))
+            if dists[i] <= best_dist:
+                best_dist, best = dists[i], (extra[i], SnapKind.VERTEX)
+        center = tuple(np.floor(p / self.cell_size).astype(np.int64).tolist())
+        # the query does not depend on the model size, only on the radius
+        # in cells, a larger radius is limited by the precomputed offsets
+        for n, (offset, min_dist) in enumerate(zip(self.offsets, self.offset_dists)):
+            if min_dist > best_dist:
+                break
+            if n % 16 == 15 and perf_counter() - start > self.budget:
+                prof.stats.count("snap_budget_exceeded")
+                break
+            entries = self.cells.get((center[0] + offset[0],
+                                      center[1] + offset[1],
+                                      center[2] + offset[2]))
+            if not entries:
+                continue
+            for pnts, kinds in entries.values():
+                dists = np.linalg.norm(pnts - p, axis=1)
+                i = int(np.argmin(dists))
+                if dists[i] <= best_dist:
+                    best_dist, best = dists[i], (pnts[i], SnapKind(kinds[i]))
+        if best is None and plane is not None:
+            best = self.snap_grid(p, radius, *plane)
+        prof.stats.add_time("snap_query", perf_counter() - start)
+        if best is None:
+            return pnt, SnapKind.NONE
+        return App.Vector(*best[0]), best[1]
+
+    def snap_grid(self, p, radius, origin, x_dir, y_dir, step):
+        if step <= 0:
+            return None
+        node = grid_node(p, origin, x_dir, y_dir, step)
+        if np.linalg.norm(node - p) > radius:
+            return None
+        return node, SnapKind.GRID
+
+
+def grid_node(p, origin, x_dir, y_dir, step):
+    # the nearest node of the plane grid, in the plane
+    origin = np.array(tuple(origin))
+    x_dir = np.array(tuple(x_dir))
+    y_dir = np.array(tuple(y_dir))
+    rel = np.array(tuple(p)) - origin
+    u = np.round(rel @ x_dir / step) * step
+    v = np.round(rel @ y_dir / step) * step
+    return origin + u * x_dir + v * y_dir
+
+
+# snapping to the objects of the pick index scene
+snapper = xrSnapper()
@@ -0,0 +1,272 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import numpy as np
+
+# Vectorized geometry queries for XR picking and snapping
+# primitives are kept in flat NumPy arrays, a ray is tested against
+# bounding spheres of chunks of spatially close primitives first
+# (primitives sorted along a Morton curve), then only primitives
+# of the chunks which passed are tested exactly
+
+chunk_size = 32
+
+
+def morton_order(centers):
+    # sorting permutation along the Z-order curve, 10 bits per axis
+    if len(centers) == 0:
+        return np.zeros(0, dtype=np.int64)
+    lo = centers.min(axis=0)
+    extent = max(float((centers.max(axis=0) - lo).max()), 1e-9)
+    q = ((centers - lo) / extent * 1023).astype(np.int64)
+    code = np.zeros(len(centers), dtype=np.int64)
+    for bit in range(10):
+        for axis in range(3):
+            code |= ((q[:, axis] >> bit) & 1) << (3 * bit + axis)
+    return np.argsort(code, kind='stable')
+
+
+class chunkIndex:
+    # lo, hi - (n, 3) bounding boxes of primitives
+    # two levels: chunks of primitives and groups of chunks
+    def __init__(self, lo, hi):
+        n = len(lo)
+        self.order = morton_order((lo + hi) / 2)
+        self.count = n
+        self.starts, chunk_lo, chunk_hi = self.group_boxes(lo[self.order], hi[self.order])
+        self.centers = (chunk_lo + chunk_hi) / 2
+        self.radii = np.linalg.norm(chunk_hi - chunk_lo, axis=1) / 2
+        self.group_starts, group_lo, group_hi = self.group_boxes(chunk_lo, chunk_hi)
+        self.group_centers = (group_lo + group_hi) / 2
+        self.group_radii = np.linalg.norm(group_hi - group_lo, axis=1) / 2
+
+    def group_boxes(self, lo, hi):
+        starts = np.arange(0, len(lo), chunk_size)
+        if len(lo) == 0:
+            return starts, np.zeros((0, 3)), np.zeros((0, 3))
+        return (starts, np.minimum.reduceat(lo, starts, axis=0),
+                np.maximum.reduceat(hi, starts, axis=0))
+
+    def spheres_hit(self, centers, radii, origin, direction, tan_angle, min_dist):
+        rel = centers - origin
+        t = rel @ direction
+        dist = np.linalg.norm(rel - np.outer(t, direction), axis=1)
+        reach = radii + np.maximum(tan_angle * (t + radii), min_dist)
+        return np.nonzero((dist <= reach) & (t + radii >= 0))[0]
+
+    def ranges(self, starts, hit, count):
+        # indices of elements of the hit blocks
+        if len(hit) == 0:
+            return np.zeros(0, dtype=np.int64)
+        first = starts[hit]
+        lengths = np.minimum(first + chunk_size, count) - first
+        # consecutive runs without a Python loop, box queries can hit
+        # thousands of chunks
+        offsets = np.cumsum(lengths) - lengths
+        return np.repeat(first - offsets, lengths) + np.arange(lengths.sum())
+
+    def ray_candidates(self, origin, direction, tan_angle=0.0, min_dist=0.0):
+        # indices of primitives in chunks whose bounding spheres
+        # intersect the cone around the ray (cylinder of min_dist radius
+        # near the apex), direction has to be normalized
+        groups = self.spheres_hit(self.group_centers, self.group_radii,
+                                  origin, direction, tan_angle, min_dist)
+        chunks = self.ranges(self.group_starts, groups, len(self.starts))
+        hit = self.spheres_hit(self.centers[chunks], self.radii[chunks],
+                               origin, direction, tan_angle, min_dist)
+        return self.order[self.ranges(self.starts, chunks[hit], self.count)]
+
+    def box_candidates(self, lo, hi):
+        # indices of primitives in chunks whose bounding spheres
+        # overlap the box lo-hi
+        groups = self.spheres_in_box(self.group_centers, self.group_radii, lo, hi)
+        chunks = self.ranges(self.group_starts, groups, len(self.starts))
+        hit = self.spheres_in_box(self.centers[chunks], self.radii[chunks], lo, hi)
+        return self.order[self.ranges(self.starts, chunks[hit], self.count)]
+
+    def spheres_in_box(self, centers, radii, lo, hi):
+        dist = np.linalg.norm(centers - np.clip(centers, lo, hi), axis=1)
+        return np.nonzero(dist <= radii)[0]
+
+    def segments_hit(self, centers, radii, a, b):
+        # (sphere, segment) pairs of spheres touched by segments a-b
+        d = b - a
+        dd = np.maximum(np.einsum('ij,ij->i', d, d), 1e-12)
+        rel = centers[:, None, :] - a
+        s = np.clip(np.einsum('csk,sk->cs', rel, d) / dd, 0.0, 1.0)
+        dist = np.linalg.norm(rel - d * s[:, :, None], axis=2)
+        return np.nonzero(dist <= radii[:, None])
+
+    def segment_candidates(self, a, b):
+        # (primitive, segment) pairs of primitives in chunks whose bounding
+        # spheres are touched by segments a-b, all segments at once
+        groups = np.unique(self.segments_hit(self.group_centers, self.group_radii, a, b)[0])
+        chunks = self.ranges(self.group_starts, groups, len(self.starts))
+        hit, seg = self.segments_hit(self.centers[chunks], self.radii[chunks], a, b)
+        starts = self.starts[chunks[hit]]
+        lengths = np.minimum(starts + chunk_size, self.count) - starts
+        first = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        prim = np.repeat(starts, lengths) + np.arange(lengths.sum()) - first
+        return self.order[prim], np.repeat(seg, lengths)
+
+
+def segments_triangles(a, b, v0, v1, v2):
+    # Moller-Trumbore of segments a-b against triangles, row by row,
+    # returns parameters along segments (0 - a, 1 - b), inf for misses
+    d = b - a
+    e1 = v1 - v0
+    e2 = v2 - v0
+    p = np.cross(d, e2)
+    det = np.einsum('ij,ij->i', e1, p)
+    valid = np.abs(det) > 1e-12
+    inv_det = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+    s = a - v0
+    u = np.einsum('ij,ij->i', s, p) * inv_det
+    q = np.cross(s, e1)
+    v = np.einsum('ij,ij->i', q, d) * inv_det
+    t = np.einsum('ij,ij->i', e2, q) * inv_det
+    hit = valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0) & (t <= 1)
+    return np.where(hit, t, np.inf)
+
+
+def ray_triangles(origin, direction, v0, v1, v2):
+    # Moller-Trumbore, returns distances along the ray, inf for misses,
+    # both sides of triangles are hit
+    e1 = v1 - v0
+    e2 = v2 - v0
+    p = np.cross(direction, e2)
+    det = np.einsum('ij,ij->i', e1, p)
+    valid = np.abs(det) > 1e-12
+    inv_det = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+    s = origin - v0
+    u = np.einsum('ij,ij->i', s, p) * inv_det
+    q = np.cross(s, e1)
+    v = (q @ direction) * inv_det
+    t = np.einsum('ij,ij->i', e2, q) * inv_det
+    hit = valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 0)
+    return np.where(hit, t, np.inf)
+
+
+def ray_points(origin, direction, pts):
+    # returns (distances from the ray, distances along the ray)
+    rel = pts - origin
+    t = rel @ direction
+    dist = np.linalg.norm(rel - np.outer(t, direction), axis=1)
+    return dist, t
+
+
+def ray_segments(origin, direction, a, b):
+    # closest approach between the ray and segments a-b
+    # returns (distances, distances along the ray, closest points on segments)
+    d = b - a
+    w = a - origin
+    dd = np.einsum('ij,ij->i', d, d)
+    dr = d @ direction
+    wr = w @ direction
+    wd = np.einsum('ij,ij->i', w, d)
+    denom = dd - dr * dr
+    # parameter along the segment, parallel segments use their start
+    s = np.where(denom > 1e-12, (dr * wr - wd) / np.where(denom > 1e-12, denom, 1.0), 0.0)
+    s = np.clip(s, 0.0, 1.0)
+    closest = a + d * s[:, None]
+    dist, t = ray_points(origin, direction, closest)
+    return dist, t, closest
+
+
+def unique_rows(keys):
+    # np.unique(keys, axis=0) of integer rows, much faster with lexsort
+    # returns (unique rows, row number of every key)
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    new = np.ones(len(keys), dtype=bool)
+    new[1:] = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+    inverse = np.empty(len(keys), dtype=np.int64)
+    inverse[order] = np.cumsum(new) - 1
+    return sorted_keys[new], inverse
+
+
+def bin_xy(lo, hi, size, max_cells=256):
+    # (i, j) cell of the XY grid -> indices of the primitives whose
+    # (n, 2) bounding boxes overlap the cell, primitives over more than
+    # max_cells cells are kept only once, under the None key
+    if len(lo) == 0:
+        return {}
+    lo = np.floor(lo / size).astype(np.int64)
+    hi = np.floor(hi / size).astype(np.int64)
+    nx = hi[:, 0] - lo[:, 0] + 1
+    counts = nx * (hi[:, 1] - lo[:, 1] + 1)
+    large = counts > max_cells
+    counts[large] = 0
+    prim = np.repeat(np.arange(len(lo)), counts)
+    # position of every entry in the cell range of its primitive
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ci = lo[prim, 0] + k % nx[prim]
+    cj = lo[prim, 1] + k // nx[prim]
+    keys, inverse = unique_rows(np.stack((ci, cj), axis=1))
+    groups = np.split(prim[np.argsort(inverse, kind='stable')],
+                      np.cumsum(np.bincount(inverse))[:-1])
+    bins = {(i, j): g for (i, j), g in zip(keys.tolist(), groups)}
+    if large.any():
+        bins[None] = np.nonzero(large)[0]
+    return bins
+
+
+def closest_on_triangles(pnt, v0, v1, v2):
+    # closest points of triangles to a point
+    # returns (distances, closest points)
+    e1 = v1 - v0
+    e2 = v2 - v0
+    n = np.cross(e1, e2)
+    nn = np.einsum('ij,ij->i', n, n)
+    valid = nn > 1e-12
+    w = pnt - v0
+    # projection of the point to the triangle plane, barycentric coordinates
+    proj = w - n * (np.einsum('ij,ij->i', w, n) / np.where(valid, nn, 1.0))[:, None]
+    d00 = np.einsum('ij,ij->i', e1, e1)
+    d01 = np.einsum('ij,ij->i', e1, e2)
+    d11 = np.einsum('ij,ij->i', e2, e2)
+    d20 = np.einsum('ij,ij->i', proj, e1)
+    d21 = np.einsum('ij,ij->i', proj, e2)
+    den = np.where(valid, d00 * d11 - d01 * d01, 1.0)
+    v = (d11 * d20 - d01 * d21) / den
+    u = (d00 * d21 - d01 * d20) / den
+    inside = valid & (v >= 0) & (u >= 0) & (u + v <= 1)
+    closest = v0 + proj
+    dist = np.where(inside, np.linalg.norm(pnt - closest, axis=1), np.inf)
+    # outside - the closest point of the edges
+    for a, b in ((v0, v1), (v1, v2), (v2, v0)):
+        c_dist, c = closest_on_segments(pnt, a, b)
+        better = ~inside & (c_dist < dist)
+        closest = np.where(better[:, None], c, closest)
+        dist = np.where(better, c_dist, dist)
+    return dist, closest
+
+
+def closest_on_segments(pnt, a, b):
+    # closest points of segments a-b to a point
+    # returns (distances, closest points)
+    d = b - a
+    dd = np.einsum('ij,ij->i', d, d)
+    s = np.clip(np.einsum('ij,ij->i', pnt - a, d) / np.where(dd > 1e-12, dd, 1.0), 0.0, 1.0)
+    closest = a + d * s[:, None]
+    return np.linalg.norm(pnt - closest, axis=1), closest
@@ -0,0 +1,113 @@
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 Adrian Przekwas adrian.v.przekwas@gmail.com        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 3 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCADGui as Gui
+
+from PySide.QtWidgets import QMdiArea, QDockWidget
+from PySide.QtCore import QTimer, QObject, SIGNAL
+
+from enum import IntEnum
+
+# Desktop views suspension during the XR session
+# every selection, drag or recompute repaints also the main 3D views, which
+# render the same scenegraph as the headset on the same (GUI) thread,
+# their updates are disabled (FREEZE) or limited to a low rate (THROTTLE)
+# Qt drops paint requests of widgets with disabled updates, so there is
+# nothing to replay, the views are repainted once when the session ends
+
+
+class MainViewMode(IntEnum):
+    NORMAL = 0
+    THROTTLE = 1
+    FREEZE = 2
+
+
+# docks with the tree and property views
+panel_names = ("Model", "Property view")
+
+
+class xrViewSuspender:
+    def __init__(self):
+        self.mode = MainViewMode.NORMAL
+        self.widgets = []
+        self.refresh_timer = QTimer()
+        QObject.connect(self.refresh_timer, SIGNAL("timeout()"), self.refresh)
+
+    def find_3d_views(self):
+        views = []
+        mdi = Gui.getMainWindow().findChild(QMdiArea)
+        if not mdi:
+            return views
+        for sub in mdi.subWindowList():
+            w = sub.widget()
+            if w and w.inherits("Gui::View3DInventor"):
+                views.append(w)
+        return views
+
+    def find_panels(self, keep_widgets):
+        # widgets shown in XR have to be repainted, so they are skipped
+        panels = []
+        mw = Gui.getMainWindow()
+        for name in panel_names:
+            dock = mw.findChild(QDockWidget, name)
+            if not dock or not dock.widget():
+                continue
+            if dock.widget() in keep_widgets:
+                continue
+            panels.append(dock.widget())
+        return panels
+
+    def suspend(self, mode, interval=1000, panels=False, keep_widgets=()):
+        # interval - ms between THROTTLE repaints
+        self.resume()
+        self.mode = MainViewMode(mode)
+        if self.mode == MainViewMode.NORMAL:
+            return
+        self.widgets = self.find_3d_views()
+        if panels:
+            self.widgets += self.find_panels(keep_widgets)
+        for w in self.widgets:
+            w.setUpdatesEnabled(False)
+        if self.mode == MainViewMode.THROTTLE:
+            self.refresh_timer.start(interval)
+
+    def refresh(self):
+        # a single synchronous repaint, then the updates are blocked again
+        for w in self.widgets:
+            try:
+                w.setUpdatesEnabled(True)
+                w.repaint()
+                w.setUpdatesEnabled(False)
+            except RuntimeError:
+                pass  # view closed during the session
+
+    def resume(self):
+        self.refresh_timer.stop()
+        for w in self.widgets:
+            # enabling updates schedules a repaint of the whole widget
+            try:
+                w.setUpdatesEnabled(True)
+                w.update()
+            except RuntimeError:
+                pass
+        self.widgets = []
+        self.mode = MainViewMode.NORMAL